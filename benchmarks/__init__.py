@@ -0,0 +1,33 @@
+"""In-process micro-benchmarks.
+
+Benchmarks import application modules directly, so the settings that are
+required at import time get placeholder values unless the environment (or
+``.env``) already provides them. Benchmarks talk to no real services unless
+their docstring says otherwise.
+"""
+
+import os
+
+_PLACEHOLDER_ENV = {
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_NAME": "benchmarks",
+    "DB_USER": "benchmarks",
+    "DB_PASSWORD": "benchmarks",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_PASSWORD": "",
+    "RABBIT_HOST": "localhost",
+    "RABBIT_PORT": "5672",
+    "RABBIT_WEB_PORT": "15672",
+    "RABBIT_USER": "benchmarks",
+    "RABBIT_PASSWORD": "benchmarks",
+    "JWT_SECRET_KEY": "benchmarks",
+    "JWT_ALGORITHM": "HS256",
+    "JWT_ACCESS_TOKEN_EXPIRE_MINUTES": "60",
+    "JWT_REFRESH_TOKEN_EXPIRE_MINUTES": "43200",
+    "TELEGRAM_BOT_TOKEN": "123456:benchmarks",
+}
+
+for _name, _value in _PLACEHOLDER_ENV.items():
+    os.environ.setdefault(_name, _value)
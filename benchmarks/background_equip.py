@@ -0,0 +1,170 @@
+"""Concurrent background equips of a single character.
+
+Needs the PostgreSQL database configured through the ``DB_*`` settings. A
+throwaway user owning ``--backgrounds`` backgrounds is committed before the
+run and deleted after it, because the equips have to run in concurrent
+transactions.
+
+``--workers`` tasks each equip ``--rounds`` random backgrounds of the same
+character, every equip in its own transaction. It reports the equip latency
+and the number of equips rejected by the database, deadlocks included, then
+checks that exactly one background is active. Exits with status 1 if any equip
+was rejected or if not exactly one background is active.
+
+Usage: python -m benchmarks.background_equip [--workers N] [--rounds N]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import DBAPIError
+
+from src.adapters.database.models.catalog import BackgroundModel
+from src.adapters.database.models.characters import (
+    CharacterBackgroundModel,
+    CharacterModel,
+)
+from src.adapters.database.models.user import UserModel
+from src.adapters.database.session import session_manager
+from src.adapters.database.uow import SQLAlchemyUnitOfWork
+from src.adapters.repositories.healthity.characters import (
+    SQLAlchemyCharacterBackgroundsRepository,
+)
+
+BENCHMARK_TG_ID = 9_000_000_000_003
+DEADLOCK_DETECTED = "40P01"
+
+
+async def seed(count: int) -> list[uuid.UUID]:
+    character_id = uuid.uuid4()
+    background_ids = [uuid.uuid4() for _ in range(count)]
+    owned_ids = [uuid.uuid4() for _ in range(count)]
+    async with SQLAlchemyUnitOfWork(session_manager.async_session) as uow:
+        session = uow.session
+        await session.execute(insert(UserModel).values(tg_id=BENCHMARK_TG_ID))
+        await session.execute(
+            insert(CharacterModel).values(id=character_id, user_tg_id=BENCHMARK_TG_ID)
+        )
+        await session.execute(
+            insert(BackgroundModel),
+            [
+                {"id": background_id, "name": f"Benchmark {background_id}", "cost": 0}
+                for background_id in background_ids
+            ],
+        )
+        await session.execute(
+            insert(CharacterBackgroundModel),
+            [
+                {
+                    "id": owned_id,
+                    "character_id": character_id,
+                    "background_id": background_id,
+                }
+                for owned_id, background_id in zip(owned_ids, background_ids)
+            ],
+        )
+    return owned_ids
+
+
+async def cleanup() -> None:
+    async with SQLAlchemyUnitOfWork(session_manager.async_session) as uow:
+        session = uow.session
+        result = await session.execute(
+            select(CharacterBackgroundModel.background_id)
+            .join(
+                CharacterModel,
+                CharacterModel.id == CharacterBackgroundModel.character_id,
+            )
+            .where(CharacterModel.user_tg_id == BENCHMARK_TG_ID)
+        )
+        background_ids = result.scalars().all()
+        # Deleting the user cascades to its character and owned backgrounds.
+        await session.execute(
+            delete(UserModel).where(UserModel.tg_id == BENCHMARK_TG_ID)
+        )
+        await session.execute(
+            delete(BackgroundModel).where(BackgroundModel.id.in_(background_ids))
+        )
+
+
+async def active_count() -> int:
+    async with SQLAlchemyUnitOfWork(session_manager.async_session) as uow:
+        result = await uow.session.execute(
+            select(func.count())
+            .select_from(CharacterBackgroundModel)
+            .join(
+                CharacterModel,
+                CharacterModel.id == CharacterBackgroundModel.character_id,
+            )
+            .where(
+                CharacterModel.user_tg_id == BENCHMARK_TG_ID,
+                CharacterBackgroundModel.is_active,
+            )
+        )
+        return result.scalar_one()
+
+
+async def worker(
+    owned_ids: list[uuid.UUID], rounds: int, timings: list[float]
+) -> list[str]:
+    """SQLSTATE of every equip the database rejected."""
+    repository = SQLAlchemyCharacterBackgroundsRepository(
+        uow_factory=lambda: SQLAlchemyUnitOfWork(session_manager.async_session)
+    )
+    rejected = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        try:
+            await repository.equip(random.choice(owned_ids))
+        except DBAPIError as exc:
+            rejected.append(getattr(exc.orig, "sqlstate", None) or "unknown")
+        timings.append(time.perf_counter() - started)
+    return rejected
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backgrounds", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    owned_ids = await seed(args.backgrounds)
+    try:
+        timings: list[float] = []
+        results = await asyncio.gather(
+            *(worker(owned_ids, args.rounds, timings) for _ in range(args.workers))
+        )
+        rejected = [sqlstate for result in results for sqlstate in result]
+        active = await active_count()
+    finally:
+        await cleanup()
+        await session_manager.close()
+
+    ordered = sorted(timings)
+    p99 = ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)]
+    print(
+        f"equips={len(timings)} rejected={len(rejected)} "
+        f"deadlocks={rejected.count(DEADLOCK_DETECTED)} "
+        f"median={statistics.median(ordered) * 1000:.2f}ms "
+        f"p99={p99 * 1000:.2f}ms "
+        f"active={active}"
+    )
+    failed = False
+    if rejected:
+        print(f"equips rejected by the database: {sorted(set(rejected))}")
+        failed = True
+    if active != 1:
+        print("invariant violated: expected exactly one active background")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
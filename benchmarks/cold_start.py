@@ -0,0 +1,72 @@
+"""Cold start of one worker with and without the migration step in front.
+
+Needs the PostgreSQL database configured through the ``DB_*`` settings, at
+the head revision already: the migration step then applies nothing and costs
+what every replica used to pay on each start (importing Alembic, loading the
+revision scripts, connecting and taking the migration lock).
+
+Each run starts ``python -m src.serve`` with a single worker, optionally
+after ``python -m src.migrate``, and measures the time until ``--path``
+answers. Reports the median over ``--runs`` runs of each variant.
+
+Usage: python -m benchmarks.cold_start [--runs N] [--path /openapi.json]
+"""
+
+import argparse
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.serving_scaling import wait_until_serving
+
+
+def cold_start(args: argparse.Namespace, migrate: bool) -> float:
+    environment = {
+        **os.environ,
+        "SERVER_HOST": args.host,
+        "SERVER_PORT": str(args.port),
+        "WEB_CONCURRENCY": "1",
+        "LOG_LEVEL": "WARNING",
+    }
+    started = time.perf_counter()
+    if migrate:
+        subprocess.run(
+            [sys.executable, "-m", "src.migrate"],
+            env=environment,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    server = subprocess.Popen([sys.executable, "-m", "src.serve"], env=environment)
+    try:
+        wait_until_serving(f"http://{args.host}:{args.port}{args.path}", 60)
+        return time.perf_counter() - started
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", default="/openapi.json")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {}
+    for name, migrate in (("serve", False), ("migrate + serve", True)):
+        results[name] = statistics.median(
+            cold_start(args, migrate) for _ in range(args.runs)
+        )
+        print(f"{name:<16} {results[name] * 1000:8.0f}ms")
+
+    saved = results["migrate + serve"] - results["serve"]
+    print(f"{'migration step':<16} {saved * 1000:8.0f}ms per start")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""Concurrent experience and activity submissions for the same character day.
+
+Needs the PostgreSQL database configured through the ``DB_*`` settings. A
+throwaway user with a character and an activity type is committed before the
+run and deleted after it, because the submissions have to run in concurrent
+transactions.
+
+``--workers`` tasks submit ``--xp`` experience for the same day through
+``CreateDailyProgressUseCase`` while as many tasks add ``--value`` to the same
+daily activity through ``CreateDailyActivityUseCase``, every submission in its
+own request unit of work, as the API runs them. It then checks that nothing
+was lost: the experience of the character and of the day, the level of the
+character and the value of the activity must match the sum of the submissions.
+Exits with status 1 if they do not.
+
+Usage: python -m benchmarks.daily_progress_contention [--workers N] [--xp N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+from sqlalchemy import delete, insert, select
+
+from src.adapters.database.models.activities import (
+    ActivityTypeModel,
+    DailyActivityModel,
+    DailyProgressModel,
+)
+from src.adapters.database.models.characters import CharacterModel
+from src.adapters.database.models.user import UserModel
+from src.adapters.database.session import session_manager
+from src.adapters.database.uow import (
+    AbstractUnitOfWork,
+    RequestUnitOfWork,
+    SQLAlchemyUnitOfWork,
+    create_unit_of_work,
+)
+from src.adapters.repositories.healthity.activities import (
+    SQLAlchemyDailyActivitiesRepository,
+    SQLAlchemyDailyProgressRepository,
+    SQLAlchemyMoodHistoryRepository,
+)
+from src.adapters.repositories.healthity.characters import (
+    SQLAlchemyCharactersRepository,
+)
+from src.use_cases.daily_activities.manage_daily_activities import (
+    CreateDailyActivityInput,
+    CreateDailyActivityUseCase,
+)
+from src.use_cases.daily_progress.manage_daily_progress import (
+    CreateDailyProgressInput,
+    CreateDailyProgressUseCase,
+)
+
+BENCHMARK_TG_ID = 9_000_000_000_004
+DAY = datetime(2020, 1, 1, 12, 0)
+
+
+async def seed() -> tuple[uuid.UUID, uuid.UUID]:
+    character_id = uuid.uuid4()
+    activity_type_id = uuid.uuid4()
+    async with SQLAlchemyUnitOfWork(session_manager.async_session) as uow:
+        session = uow.session
+        await session.execute(insert(UserModel).values(tg_id=BENCHMARK_TG_ID))
+        await session.execute(
+            insert(CharacterModel).values(id=character_id, user_tg_id=BENCHMARK_TG_ID)
+        )
+        await session.execute(
+            insert(ActivityTypeModel).values(
+                id=activity_type_id,
+                name=f"Benchmark {activity_type_id.hex[:8]}",
+                unit="steps",
+                daily_goal_default=10_000,
+            )
+        )
+    return character_id, activity_type_id
+
+
+async def cleanup(activity_type_id: uuid.UUID) -> None:
+    async with SQLAlchemyUnitOfWork(session_manager.async_session) as uow:
+        session = uow.session
+        # Deleting the user cascades to its character, its daily activities,
+        # progress and mood history.
+        await session.execute(
+            delete(UserModel).where(UserModel.tg_id == BENCHMARK_TG_ID)
+        )
+        await session.execute(
+            delete(ActivityTypeModel).where(ActivityTypeModel.id == activity_type_id)
+        )
+
+
+async def stored(
+    character_id: uuid.UUID,
+) -> tuple[CharacterModel, int | None, int | None]:
+    async with SQLAlchemyUnitOfWork(session_manager.async_session) as uow:
+        session = uow.session
+        character = await session.get(CharacterModel, character_id)
+        assert character is not None
+        progress = await session.execute(
+            select(DailyProgressModel.experience_gained).where(
+                DailyProgressModel.character_id == character_id
+            )
+        )
+        activity = await session.execute(
+            select(DailyActivityModel.value).where(
+                DailyActivityModel.character_id == character_id
+            )
+        )
+        return character, progress.scalar_one_or_none(), activity.scalar_one_or_none()
+
+
+async def submit(
+    execute: Callable[[], Awaitable[object]], timings: list[float]
+) -> None:
+    started = time.perf_counter()
+    async with RequestUnitOfWork(session_manager.async_session) as uow:
+        await execute()
+        await uow.commit()
+    timings.append(time.perf_counter() - started)
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=50)
+    parser.add_argument("--xp", type=int, default=10)
+    parser.add_argument("--value", type=int, default=100)
+    args = parser.parse_args()
+
+    def uow_factory() -> AbstractUnitOfWork:
+        return create_unit_of_work(session_manager.async_session)
+
+    progress = CreateDailyProgressUseCase(
+        daily_progress_repository=SQLAlchemyDailyProgressRepository(uow_factory),
+        characters_repository=SQLAlchemyCharactersRepository(uow_factory),
+        mood_history_repository=SQLAlchemyMoodHistoryRepository(uow_factory),
+    )
+    activities = CreateDailyActivityUseCase(
+        SQLAlchemyDailyActivitiesRepository(uow_factory)
+    )
+
+    character_id, activity_type_id = await seed()
+    try:
+        timings: list[float] = []
+        await asyncio.gather(
+            *(
+                submit(
+                    lambda: progress.execute(
+                        CreateDailyProgressInput(
+                            character_id=character_id,
+                            date=DAY,
+                            experience_gained=args.xp,
+                        )
+                    ),
+                    timings,
+                )
+                for _ in range(args.workers)
+            ),
+            *(
+                submit(
+                    lambda: activities.execute(
+                        CreateDailyActivityInput(
+                            character_id=character_id,
+                            activity_type_id=activity_type_id,
+                            date=DAY,
+                            value=args.value,
+                        )
+                    ),
+                    timings,
+                )
+                for _ in range(args.workers)
+            ),
+        )
+        character, experience_gained, value = await stored(character_id)
+    finally:
+        await cleanup(activity_type_id)
+        await session_manager.close()
+
+    expected_experience = args.workers * args.xp
+    expected_level = max(1, expected_experience // 100)
+    ordered = sorted(timings)
+    p99 = ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)]
+    print(
+        f"submissions={len(timings)} "
+        f"median={statistics.median(ordered) * 1000:.2f}ms "
+        f"p99={p99 * 1000:.2f}ms "
+        f"total_experience={character.total_experience} "
+        f"level={character.level} "
+        f"progress={experience_gained} "
+        f"activity={value}"
+    )
+    failures = []
+    if character.total_experience != expected_experience:
+        failures.append(f"total_experience, expected {expected_experience}")
+    if character.level != expected_level:
+        failures.append(f"level, expected {expected_level}")
+    if experience_gained != expected_experience:
+        failures.append(f"progress experience, expected {expected_experience}")
+    if value != args.workers * args.value:
+        failures.append(f"activity value, expected {args.workers * args.value}")
+    for failure in failures:
+        print(f"lost update: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
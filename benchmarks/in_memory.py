@@ -0,0 +1,674 @@
+"""In-memory stand-ins for the ``src/ports`` repository interfaces.
+
+They keep entities in plain dicts and follow the contract of the SQLAlchemy
+adapters closely enough for the use cases to take their normal paths. Every
+repository call counts as one round trip on the shared ``InMemoryStore``.
+"""
+
+import copy
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+
+from src.domain.entities.auth import RefreshToken, TokenGeneration
+from src.domain.entities.healthity.activities import (
+    ActivityType,
+    DailyActivity,
+    DailyProgress,
+    MoodHistory,
+)
+from src.domain.entities.healthity.catalog import Item
+from src.domain.entities.healthity.characters import (
+    Character,
+    CharacterBackground,
+    CharacterItem,
+)
+from src.domain.entities.healthity.statistics import UserStatistics
+from src.domain.entities.healthity.transactions import Transaction
+from src.domain.entities.healthity.users import User
+from src.domain.value_objects.telegram_id import TelegramId
+from src.ports.repositories.auth import (
+    RefreshTokensRepository,
+    TokenGenerationsRepository,
+)
+from src.ports.repositories.healthity import (
+    CharacterItemsRepository,
+    CharactersRepository,
+    DailyActivitiesRepository,
+    DailyProgressRepository,
+    ItemsRepository,
+    MoodHistoryRepository,
+    PurchasesRepository,
+    TransactionsRepository,
+    UserStatisticsRepository,
+)
+from src.ports.repositories.healthity.transactions import TransactionsPosition
+from src.ports.repositories.healthity.users import UsersRepository
+
+
+@dataclass
+class InMemoryStore:
+    users: dict[int, User] = field(default_factory=dict)
+    characters: dict[uuid.UUID, Character] = field(default_factory=dict)
+    items: dict[uuid.UUID, Item] = field(default_factory=dict)
+    character_items: dict[uuid.UUID, CharacterItem] = field(default_factory=dict)
+    activity_types: dict[uuid.UUID, ActivityType] = field(default_factory=dict)
+    daily_activities: dict[uuid.UUID, DailyActivity] = field(default_factory=dict)
+    daily_progress: dict[uuid.UUID, DailyProgress] = field(default_factory=dict)
+    mood_history: dict[uuid.UUID, MoodHistory] = field(default_factory=dict)
+    transactions: dict[uuid.UUID, Transaction] = field(default_factory=dict)
+    refresh_tokens: dict[uuid.UUID, RefreshToken] = field(default_factory=dict)
+    token_generations: dict[int, TokenGeneration] = field(default_factory=dict)
+    round_trips: int = 0
+
+    def round_trip(self) -> None:
+        self.round_trips += 1
+
+    def snapshot(self) -> "InMemoryStore":
+        return copy.deepcopy(self)
+
+    def restore(self, snapshot: "InMemoryStore") -> None:
+        self.__dict__.update(copy.deepcopy(snapshot).__dict__)
+
+
+class _InMemoryRepository:
+    def __init__(self, store: InMemoryStore) -> None:
+        self._store = store
+
+
+class InMemoryUsersRepository(_InMemoryRepository, UsersRepository):
+    async def create(self, user: User) -> User:
+        self._store.round_trip()
+        self._store.users[user.telegram_id.value] = replace(user)
+        return user
+
+    async def get_by_telegram_id(self, telegram_id: TelegramId) -> User | None:
+        self._store.round_trip()
+        user = self._store.users.get(telegram_id.value)
+        return replace(user) if user is not None else None
+
+    async def update(self, user: User) -> User:
+        self._store.round_trip()
+        self._store.users[user.telegram_id.value] = replace(user)
+        return user
+
+    async def list_all(self, limit: int = 100, offset: int = 0) -> list[User]:
+        self._store.round_trip()
+        users = list(self._store.users.values())[offset : offset + limit]
+        return [replace(user) for user in users]
+
+    async def delete(self, telegram_id: TelegramId) -> None:
+        self._store.round_trip()
+        self._store.users.pop(telegram_id.value, None)
+
+
+class InMemoryCharactersRepository(_InMemoryRepository, CharactersRepository):
+    async def get_by_id(self, character_id: uuid.UUID) -> Character | None:
+        self._store.round_trip()
+        character = self._store.characters.get(character_id)
+        return replace(character) if character is not None else None
+
+    async def get_by_user(self, user_tg_id: TelegramId) -> Character | None:
+        self._store.round_trip()
+        for character in self._store.characters.values():
+            if character.user_tg_id == user_tg_id:
+                return replace(character)
+        return None
+
+    async def list_all(self, limit: int = 100, offset: int = 0) -> list[Character]:
+        self._store.round_trip()
+        characters = list(self._store.characters.values())[offset : offset + limit]
+        return [replace(character) for character in characters]
+
+    async def add(self, character: Character) -> Character:
+        self._store.round_trip()
+        self._store.characters[character.id] = replace(character)
+        return character
+
+    async def update(self, character: Character) -> Character:
+        self._store.round_trip()
+        self._store.characters[character.id] = replace(character)
+        return character
+
+    async def add_experience(
+        self, character_id: uuid.UUID, amount: int, mood: str | None = None
+    ) -> Character | None:
+        self._store.round_trip()
+        character = self._store.characters.get(character_id)
+        if character is None:
+            return None
+        character.add_experience(amount)
+        if mood is not None:
+            character.set_mood(mood)
+        return replace(character)
+
+    async def delete(self, character_id: uuid.UUID) -> None:
+        self._store.round_trip()
+        self._store.characters.pop(character_id, None)
+
+
+class InMemoryItemsRepository(_InMemoryRepository, ItemsRepository):
+    async def get(self, item_id: uuid.UUID) -> Item | None:
+        self._store.round_trip()
+        item = self._store.items.get(item_id)
+        return replace(item) if item is not None else None
+
+    async def list_all(self, limit: int = 100, offset: int = 0) -> list[Item]:
+        self._store.round_trip()
+        items = list(self._store.items.values())[offset : offset + limit]
+        return [replace(item) for item in items]
+
+    async def list_by_category(self, category_id: uuid.UUID) -> list[Item]:
+        self._store.round_trip()
+        return [
+            replace(item)
+            for item in self._store.items.values()
+            if item.category_id == category_id
+        ]
+
+    async def list_available(self) -> list[Item]:
+        self._store.round_trip()
+        return [
+            replace(item) for item in self._store.items.values() if item.is_available
+        ]
+
+    async def add(self, item: Item) -> Item:
+        self._store.round_trip()
+        self._store.items[item.id] = replace(item)
+        return item
+
+    async def update(self, item: Item) -> Item:
+        self._store.round_trip()
+        self._store.items[item.id] = replace(item)
+        return item
+
+    async def delete(self, item_id: uuid.UUID) -> None:
+        self._store.round_trip()
+        self._store.items.pop(item_id, None)
+
+
+class InMemoryCharacterItemsRepository(_InMemoryRepository, CharacterItemsRepository):
+    async def get_by_id(self, character_item_id: uuid.UUID) -> CharacterItem | None:
+        self._store.round_trip()
+        owned = self._store.character_items.get(character_item_id)
+        return replace(owned) if owned is not None else None
+
+    async def list_for_character(self, character_id: uuid.UUID) -> list[CharacterItem]:
+        self._store.round_trip()
+        return [
+            replace(owned)
+            for owned in self._store.character_items.values()
+            if owned.character_id == character_id
+        ]
+
+    async def add(self, character_item: CharacterItem) -> CharacterItem:
+        self._store.round_trip()
+        self._store.character_items[character_item.id] = replace(character_item)
+        return character_item
+
+    async def update(self, character_item: CharacterItem) -> CharacterItem:
+        self._store.round_trip()
+        self._store.character_items[character_item.id] = replace(character_item)
+        return character_item
+
+    async def remove(self, character_item_id: uuid.UUID) -> None:
+        self._store.round_trip()
+        self._store.character_items.pop(character_item_id, None)
+
+
+class InMemoryPurchasesRepository(_InMemoryRepository, PurchasesRepository):
+    """Applies a purchase as one round trip, like the single-statement adapter."""
+
+    async def purchase_item(
+        self, user_tg_id: TelegramId, character_id: uuid.UUID, item_id: uuid.UUID
+    ) -> CharacterItem | None:
+        self._store.round_trip()
+        user = self._store.users.get(user_tg_id.value)
+        item = self._store.items.get(item_id)
+        if user is None or item is None or not item.is_available:
+            return None
+        if user.balance < item.cost or any(
+            owned.character_id == character_id and owned.item_id == item_id
+            for owned in self._store.character_items.values()
+        ):
+            return None
+
+        user.balance -= item.cost
+        owned = CharacterItem(
+            id=uuid.uuid4(), character_id=character_id, item_id=item_id
+        )
+        self._store.character_items[owned.id] = owned
+        transaction = Transaction(
+            id=uuid.uuid4(),
+            user_tg_id=user_tg_id,
+            amount=-item.cost,
+            balance_after=user.balance,
+            type="purchase_item",
+            related_item_id=item_id,
+            description=f"Покупка предмета: {item.name}",
+        )
+        self._store.transactions[transaction.id] = transaction
+        return replace(owned)
+
+    async def purchase_background(
+        self,
+        user_tg_id: TelegramId,
+        character_id: uuid.UUID,
+        background_id: uuid.UUID,
+    ) -> CharacterBackground | None:
+        self._store.round_trip()
+        return None
+
+
+class InMemoryDailyActivitiesRepository(
+    _InMemoryRepository, DailyActivitiesRepository
+):
+    async def list_for_day(
+        self, character_id: uuid.UUID, day: datetime
+    ) -> list[DailyActivity]:
+        self._store.round_trip()
+        return [
+            replace(activity)
+            for activity in self._store.daily_activities.values()
+            if activity.character_id == character_id and activity.date == day
+        ]
+
+    async def list_for_date_range(
+        self, character_id: uuid.UUID, start_date: datetime, end_date: datetime
+    ) -> list[DailyActivity]:
+        self._store.round_trip()
+        return [
+            replace(activity)
+            for activity in self._store.daily_activities.values()
+            if activity.character_id == character_id
+            and start_date <= activity.date <= end_date
+        ]
+
+    async def add_value(
+        self,
+        character_id: uuid.UUID,
+        activity_type_id: uuid.UUID,
+        date: datetime,
+        value: int,
+        goal: int | None = None,
+        notes: str | None = None,
+    ) -> DailyActivity | None:
+        self._store.round_trip()
+        activity_type = self._store.activity_types.get(activity_type_id)
+        if activity_type is None:
+            return None
+
+        stored = self._find(character_id, activity_type_id, date)
+        if stored is None:
+            stored = DailyActivity(
+                id=uuid.uuid4(),
+                character_id=character_id,
+                activity_type_id=activity_type_id,
+                date=date,
+                value=value,
+                goal=goal if goal is not None else activity_type.daily_goal_default,
+                notes=notes,
+            )
+            self._store.daily_activities[stored.id] = stored
+        else:
+            stored.value += value
+            if goal is not None:
+                stored.goal = goal
+            stored.notes = notes
+            stored.touch()
+        return replace(stored)
+
+    async def get_by_character_activity_date(
+        self, character_id: uuid.UUID, activity_type_id: uuid.UUID, date: datetime
+    ) -> DailyActivity | None:
+        self._store.round_trip()
+        stored = self._find(character_id, activity_type_id, date)
+        return replace(stored) if stored is not None else None
+
+    def _find(
+        self, character_id: uuid.UUID, activity_type_id: uuid.UUID, date: datetime
+    ) -> DailyActivity | None:
+        for activity in self._store.daily_activities.values():
+            if (
+                activity.character_id == character_id
+                and activity.activity_type_id == activity_type_id
+                and activity.date == date
+            ):
+                return activity
+        return None
+
+
+class InMemoryDailyProgressRepository(_InMemoryRepository, DailyProgressRepository):
+    async def get_for_day(
+        self, character_id: uuid.UUID, day: datetime
+    ) -> DailyProgress | None:
+        self._store.round_trip()
+        stored = self._find(character_id, day)
+        return replace(stored) if stored is not None else None
+
+    async def list_for_date_range(
+        self, character_id: uuid.UUID, start_date: datetime, end_date: datetime
+    ) -> list[DailyProgress]:
+        self._store.round_trip()
+        return [
+            replace(progress)
+            for progress in self._store.daily_progress.values()
+            if progress.character_id == character_id
+            and start_date <= progress.date <= end_date
+        ]
+
+    async def add_experience(
+        self,
+        character_id: uuid.UUID,
+        date: datetime,
+        experience_gained: int,
+        level_at_end: int,
+        mood_average: str | None = None,
+        behavior_index: int | None = None,
+    ) -> DailyProgress:
+        self._store.round_trip()
+        stored = self._find(character_id, date)
+        if stored is None:
+            stored = DailyProgress(
+                id=uuid.uuid4(),
+                character_id=character_id,
+                date=date,
+                experience_gained=experience_gained,
+                level_at_end=level_at_end,
+                mood_average=mood_average,
+                behavior_index=behavior_index,
+            )
+            self._store.daily_progress[stored.id] = stored
+        else:
+            stored.experience_gained += experience_gained
+            stored.level_at_end = level_at_end
+            if mood_average is not None:
+                stored.mood_average = mood_average
+            if behavior_index is not None:
+                stored.behavior_index = behavior_index
+            stored.touch()
+        return replace(stored)
+
+    async def get_by_character_date(
+        self, character_id: uuid.UUID, date: datetime
+    ) -> DailyProgress | None:
+        self._store.round_trip()
+        stored = self._find(character_id, date)
+        return replace(stored) if stored is not None else None
+
+    def _find(self, character_id: uuid.UUID, date: datetime) -> DailyProgress | None:
+        for progress in self._store.daily_progress.values():
+            if progress.character_id == character_id and progress.date == date:
+                return progress
+        return None
+
+
+class InMemoryMoodHistoryRepository(_InMemoryRepository, MoodHistoryRepository):
+    async def list_recent(
+        self, character_id: uuid.UUID, limit: int = 20
+    ) -> list[MoodHistory]:
+        self._store.round_trip()
+        return self._for_character(character_id)[:limit]
+
+    async def list_for_character(
+        self, character_id: uuid.UUID, limit: int = 100
+    ) -> list[MoodHistory]:
+        self._store.round_trip()
+        return self._for_character(character_id)[:limit]
+
+    async def list_for_date_range(
+        self, character_id: uuid.UUID, start_date: datetime, end_date: datetime
+    ) -> list[MoodHistory]:
+        self._store.round_trip()
+        return [
+            mood
+            for mood in self._for_character(character_id)
+            if start_date <= mood.timestamp <= end_date
+        ]
+
+    async def get_by_id(self, mood_id: uuid.UUID) -> MoodHistory | None:
+        self._store.round_trip()
+        mood = self._store.mood_history.get(mood_id)
+        return replace(mood) if mood is not None else None
+
+    async def add(self, mood: MoodHistory) -> MoodHistory:
+        self._store.round_trip()
+        self._store.mood_history[mood.id] = replace(mood)
+        return mood
+
+    async def delete(self, mood_id: uuid.UUID) -> None:
+        self._store.round_trip()
+        self._store.mood_history.pop(mood_id, None)
+
+    def _for_character(self, character_id: uuid.UUID) -> list[MoodHistory]:
+        moods = [
+            replace(mood)
+            for mood in self._store.mood_history.values()
+            if mood.character_id == character_id
+        ]
+        return sorted(moods, key=lambda mood: mood.timestamp, reverse=True)
+
+
+class InMemoryTransactionsRepository(_InMemoryRepository, TransactionsRepository):
+    async def list_for_user(self, user_tg_id: TelegramId) -> list[Transaction]:
+        self._store.round_trip()
+        return self._ledger(user_tg_id)
+
+    async def list_page_for_user(
+        self,
+        user_tg_id: TelegramId,
+        limit: int,
+        after: TransactionsPosition | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        transaction_type: str | None = None,
+    ) -> list[Transaction]:
+        self._store.round_trip()
+        ledger = self._ledger(user_tg_id, start_date, end_date, transaction_type)
+        if after is not None:
+            ledger = [
+                transaction
+                for transaction in ledger
+                if (transaction.timestamp, transaction.id) < (after.timestamp, after.id)
+            ]
+        return ledger[:limit]
+
+    async def stream_for_user(
+        self,
+        user_tg_id: TelegramId,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        transaction_type: str | None = None,
+    ) -> AsyncIterator[Transaction]:
+        self._store.round_trip()
+        for transaction in self._ledger(
+            user_tg_id, start_date, end_date, transaction_type
+        ):
+            yield transaction
+
+    async def list_for_user_by_date_range(
+        self, user_tg_id: TelegramId, start_date: datetime, end_date: datetime
+    ) -> list[Transaction]:
+        self._store.round_trip()
+        return self._ledger(user_tg_id, start_date=start_date, end_date=end_date)
+
+    async def list_for_user_by_type(
+        self, user_tg_id: TelegramId, transaction_type: str
+    ) -> list[Transaction]:
+        self._store.round_trip()
+        return self._ledger(user_tg_id, transaction_type=transaction_type)
+
+    async def add(self, transaction: Transaction) -> Transaction:
+        self._store.round_trip()
+        self._store.transactions[transaction.id] = replace(transaction)
+        return transaction
+
+    async def get(self, transaction_id: uuid.UUID) -> Transaction | None:
+        self._store.round_trip()
+        transaction = self._store.transactions.get(transaction_id)
+        return replace(transaction) if transaction is not None else None
+
+    def _ledger(
+        self,
+        user_tg_id: TelegramId,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        transaction_type: str | None = None,
+    ) -> list[Transaction]:
+        ledger = [
+            replace(transaction)
+            for transaction in self._store.transactions.values()
+            if transaction.user_tg_id == user_tg_id
+            and (start_date is None or transaction.timestamp >= start_date)
+            and (end_date is None or transaction.timestamp <= end_date)
+            and (transaction_type is None or transaction.type == transaction_type)
+        ]
+        ledger.sort(key=lambda t: (t.timestamp, t.id), reverse=True)
+        return ledger
+
+
+class InMemoryUserStatisticsRepository(_InMemoryRepository, UserStatisticsRepository):
+    """Counts what the store keeps; it has no backgrounds or friends."""
+
+    async def get_for_user(self, user_tg_id: TelegramId) -> UserStatistics | None:
+        self._store.round_trip()
+        user = self._store.users.get(user_tg_id.value)
+        if user is None:
+            return None
+        character = next(
+            (
+                character
+                for character in self._store.characters.values()
+                if character.user_tg_id == user_tg_id
+            ),
+            None,
+        )
+        character_id = character.id if character is not None else None
+        return UserStatistics(
+            user_tg_id=user_tg_id.value,
+            balance=user.balance,
+            level=character.level if character is not None else None,
+            total_experience=(
+                character.total_experience if character is not None else None
+            ),
+            character_name=character.name if character is not None else None,
+            character_sex=character.sex if character is not None else None,
+            purchased_items_count=sum(
+                1
+                for item in self._store.character_items.values()
+                if item.character_id == character_id
+            ),
+            purchased_backgrounds_count=0,
+            mood_entries_count=sum(
+                1
+                for mood in self._store.mood_history.values()
+                if mood.character_id == character_id
+            ),
+            transactions_count=sum(
+                1
+                for transaction in self._store.transactions.values()
+                if transaction.user_tg_id == user_tg_id
+            ),
+            friends_count=0,
+        )
+
+
+class InMemoryRefreshTokensRepository(_InMemoryRepository, RefreshTokensRepository):
+    async def create(self, token: RefreshToken) -> RefreshToken:
+        self._store.round_trip()
+        self._store.refresh_tokens[token.jti] = replace(token)
+        return token
+
+    async def get_by_jti(self, jti: uuid.UUID) -> RefreshToken | None:
+        self._store.round_trip()
+        token = self._store.refresh_tokens.get(jti)
+        return replace(token) if token is not None else None
+
+    async def save(self, token: RefreshToken) -> RefreshToken:
+        self._store.round_trip()
+        self._store.refresh_tokens[token.jti] = replace(token)
+        return token
+
+    async def revoke_for_user(self, user_tg_id: TelegramId) -> None:
+        self._store.round_trip()
+        for token in self._store.refresh_tokens.values():
+            if token.user_tg_id == user_tg_id:
+                token.revoke()
+
+    async def replace_for_user(self, token: RefreshToken) -> RefreshToken:
+        self._store.round_trip()
+        for stored in self._store.refresh_tokens.values():
+            if stored.user_tg_id == token.user_tg_id:
+                stored.revoke()
+        self._store.refresh_tokens[token.jti] = replace(token)
+        return token
+
+    async def rotate(
+        self, token: RefreshToken, replacement: RefreshToken
+    ) -> RefreshToken | None:
+        self._store.round_trip()
+        stored = self._store.refresh_tokens.get(token.jti)
+        if stored is None or stored.revoked:
+            return None
+        stored.rotate(replacement.jti)
+        token.rotate(replacement.jti)
+        self._store.refresh_tokens[replacement.jti] = replace(replacement)
+        return replacement
+
+    async def revoke_family(self, family_id: uuid.UUID) -> int:
+        self._store.round_trip()
+        active = [
+            token
+            for token in self._store.refresh_tokens.values()
+            if token.family_id == family_id and not token.revoked
+        ]
+        for token in active:
+            token.revoke()
+        return len(active)
+
+    async def delete_stale(self, revoked_before: datetime, limit: int) -> int:
+        self._store.round_trip()
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        stale = [
+            jti
+            for jti, token in self._store.refresh_tokens.items()
+            if token.expires_at < now
+            or (token.revoked and token.updated_at < revoked_before)
+        ][:limit]
+        for jti in stale:
+            del self._store.refresh_tokens[jti]
+        return len(stale)
+
+
+class InMemoryTokenGenerationsRepository(
+    _InMemoryRepository, TokenGenerationsRepository
+):
+    async def get(self, user_tg_id: int) -> int:
+        self._store.round_trip()
+        known = self._store.token_generations.get(user_tg_id)
+        return known.generation if known is not None else 0
+
+    async def advance(self, user_tg_id: int) -> TokenGeneration:
+        self._store.round_trip()
+        known = self._store.token_generations.get(user_tg_id)
+        generation = TokenGeneration(
+            user_tg_id=user_tg_id,
+            generation=(known.generation if known is not None else 0) + 1,
+            revoked_at=datetime.now(timezone.utc).replace(tzinfo=None),
+        )
+        self._store.token_generations[user_tg_id] = generation
+        return replace(generation)
+
+    async def is_revoked(self, user_tg_id: int, generation: int) -> bool:
+        return generation < await self.get(user_tg_id)
+
+    async def list_revoked(
+        self, revoked_since: datetime | None = None
+    ) -> list[TokenGeneration]:
+        self._store.round_trip()
+        return [
+            replace(generation)
+            for generation in self._store.token_generations.values()
+            if revoked_since is None or generation.revoked_at >= revoked_since
+        ]
@@ -0,0 +1,84 @@
+"""Per-request cost of ``MetricsMiddleware``.
+
+Drives a minimal ASGI application directly, with and without the middleware,
+and reports the difference per request. Exits with status 1 when it exceeds
+``OVERHEAD_BUDGET`` so the check can run in CI.
+
+Usage: python -m benchmarks.metrics_overhead [--requests N] [--routes N]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from types import SimpleNamespace
+
+from src.core.metrics import ApplicationMetrics
+from src.drivers.rest.metrics import MetricsMiddleware
+
+# Seconds per request; documented on MetricsMiddleware.
+OVERHEAD_BUDGET = 20e-6
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message) -> None:
+    pass
+
+
+async def endpoint(scope, receive, send) -> None:
+    scope["route"] = scope["benchmark_route"]
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def run(app, scopes: list[dict], requests: int) -> float:
+    started = time.perf_counter()
+    for index in range(requests):
+        await app(dict(scopes[index % len(scopes)]), receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--routes", type=int, default=50)
+    args = parser.parse_args()
+
+    scopes = [
+        {
+            "type": "http",
+            "method": "GET",
+            "path": f"/api/v1/resource{index}/1",
+            "benchmark_route": SimpleNamespace(path=f"/api/v1/resource{index}/{{id}}"),
+        }
+        for index in range(args.routes)
+    ]
+    metrics = ApplicationMetrics()
+    instrumented = MetricsMiddleware(endpoint, metrics=metrics)
+
+    await run(instrumented, scopes, args.requests // 10)
+    bare = await run(endpoint, scopes, args.requests)
+    with_metrics = await run(instrumented, scopes, args.requests)
+
+    started = time.perf_counter()
+    body = metrics.registry.render()
+    render = time.perf_counter() - started
+
+    overhead = with_metrics - bare
+    print(f"bare     {bare * 1e6:7.2f}us/request")
+    print(f"metrics  {with_metrics * 1e6:7.2f}us/request")
+    print(
+        f"overhead {overhead * 1e6:7.2f}us/request "
+        f"(budget {OVERHEAD_BUDGET * 1e6:.0f}us)"
+    )
+    print(f"scrape   {render * 1000:7.2f}ms for {len(body)} bytes")
+
+    if overhead > OVERHEAD_BUDGET:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
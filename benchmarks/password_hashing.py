@@ -0,0 +1,163 @@
+"""Endpoint latency during a burst of password checks.
+
+Needs the PostgreSQL database configured through the ``DB_*`` settings. A
+throwaway admin user is committed before the run and deleted after it.
+
+The application is built with ``create_app`` and called in process through
+``httpx.ASGITransport``, so the timings include routing, dependencies and
+the database but no network. ``--clients`` clients request the public item
+catalog back to back while ``--logins`` concurrent admin requests present a
+wrong password, as a credential stuffing burst does. Admin HTTP Basic
+authentication is where the API checks passwords, and a wrong password is
+never cached, so every one of them runs bcrypt. Three runs:
+
+- ``idle``: the catalog requests alone;
+- ``inline``: passwords are checked on the event loop (the previous
+  behaviour);
+- ``offload``: passwords are checked through ``AsyncPasswordHasher`` with
+  ``--workers`` threads.
+
+Reports p50/p99/max latency of the catalog requests of each run.
+
+Usage: python -m benchmarks.password_hashing [--logins N] [--clients N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from dependency_injector import providers
+from sqlalchemy import delete, insert
+
+from src.adapters.database.models.user import UserModel
+from src.adapters.database.session import session_manager
+from src.adapters.database.uow import SQLAlchemyUnitOfWork
+from src.app import create_app
+from src.container import ApplicationContainer
+from src.core.security import AsyncPasswordHasher, PasswordHasher
+
+BENCHMARK_TG_ID = 9_000_000_000_006
+PASSWORD = "benchmark-password"
+CATALOG = "/api/v1/items/catalog"
+ADMIN = "/api/v1/users/admin?limit=1"
+
+
+class InlinePasswordHasher(AsyncPasswordHasher):
+    """Checks passwords on the event loop, as the routes used to."""
+
+    async def verify_password(self, plain_pass: str, hashed_pass: str) -> bool:
+        return self._hasher.verify_password(plain_pass, hashed_pass)
+
+
+async def seed(hasher: PasswordHasher) -> None:
+    async with SQLAlchemyUnitOfWork(session_manager.async_session) as uow:
+        await uow.session.execute(
+            insert(UserModel).values(
+                tg_id=BENCHMARK_TG_ID,
+                is_admin=True,
+                password_hash=hasher.get_password_hash(PASSWORD),
+            )
+        )
+
+
+async def cleanup() -> None:
+    async with SQLAlchemyUnitOfWork(session_manager.async_session) as uow:
+        await uow.session.execute(
+            delete(UserModel).where(UserModel.tg_id == BENCHMARK_TG_ID)
+        )
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+async def browse(
+    client: httpx.AsyncClient, stop: asyncio.Event, samples: list[float]
+) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get(CATALOG)
+        response.raise_for_status()
+        samples.append(time.perf_counter() - started)
+
+
+async def run(
+    password_hasher: AsyncPasswordHasher, logins: int, clients: int
+) -> list[float]:
+    """Catalog latencies while ``logins`` wrong admin passwords are checked."""
+    with ApplicationContainer.async_password_hasher.override(
+        providers.Object(password_hasher)
+    ):
+        app = create_app()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://benchmark"
+    ) as client:
+        # Builds the catalog snapshot, so every timed request is served alike.
+        (await client.get(CATALOG)).raise_for_status()
+
+        samples: list[float] = []
+        stop = asyncio.Event()
+        browsers = [
+            asyncio.create_task(browse(client, stop, samples)) for _ in range(clients)
+        ]
+        await asyncio.sleep(0.05)
+        if logins:
+            responses = await asyncio.gather(
+                *(
+                    client.get(ADMIN, auth=(str(BENCHMARK_TG_ID), "wrong-password"))
+                    for _ in range(logins)
+                )
+            )
+            rejected = sum(response.status_code == 401 for response in responses)
+            if rejected != logins:
+                raise RuntimeError(f"{rejected} of {logins} logins were rejected")
+        else:
+            await asyncio.sleep(1.0)
+        stop.set()
+        await asyncio.gather(*browsers)
+    return samples
+
+
+def report(name: str, samples: list[float]) -> None:
+    ms = [sample * 1000 for sample in samples]
+    print(
+        f"{name:<8} p50={statistics.median(ms):8.2f}ms "
+        f"p99={percentile(ms, 0.99):8.2f}ms max={max(ms):8.2f}ms "
+        f"requests={len(ms)}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    hasher = PasswordHasher()
+    inline = InlinePasswordHasher(hasher)
+    offloaded = AsyncPasswordHasher(hasher, max_workers=args.workers)
+    await seed(hasher)
+    try:
+        report("idle", await run(offloaded, 0, args.clients))
+        report("inline", await run(inline, args.logins, args.clients))
+        report("offload", await run(offloaded, args.logins, args.clients))
+    finally:
+        await cleanup()
+        await session_manager.close()
+        inline.close()
+        offloaded.close()
+
+    stats = offloaded.stats
+    print(
+        f"hasher   completed={stats.completed} "
+        f"wait_max={stats.wait_seconds_max * 1000:.1f}ms "
+        f"run_avg={stats.run_seconds_total / stats.completed * 1000:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,240 @@
+"""Recommend connection pool settings for a recorded request mix.
+
+The mix is a scrape of ``GET /metrics`` saved to a file. For every route it
+reads the number of requests and their mean duration
+(``http_request_duration_seconds``) and how often and for how long those
+requests held a database connection (``db_connection_hold_seconds``). It
+talks to no services.
+
+The mix is replayed in a discrete-event simulation of one process:
+``--concurrency`` requests are in flight at all times, split evenly over
+``--processes``. A request picks a route in proportion to its recorded
+traffic, spends the part of its duration that precedes the first statement
+without a connection and then holds one for the hold time. Times are drawn
+from exponential distributions around the recorded means.
+
+It recommends the smallest ``DB_POOL_SIZE`` whose p99 checkout wait stays
+under ``--max-wait``, a ``DB_MAX_OVERFLOW`` that keeps the same bound under
+``--burst`` times the concurrency, and a ``DB_POOL_TIMEOUT`` well above the
+waits seen in that burst.
+
+Usage:
+    curl -s http://localhost:8000/metrics > mix.txt
+    python -m benchmarks.pool_sizing mix.txt --concurrency 200 [--processes 4]
+"""
+
+import argparse
+import heapq
+import math
+import random
+import re
+import sys
+from collections import deque
+from dataclasses import dataclass
+
+_SAMPLE = re.compile(
+    r"^(?P<name>[a-zA-Z_:][\w:]*)(?:\{(?P<labels>.*)\})? (?P<value>\S+)$"
+)
+_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+@dataclass
+class RouteMix:
+    route: str
+    requests: float = 0.0
+    duration_sum: float = 0.0
+    database_requests: float = 0.0
+    hold_sum: float = 0.0
+
+    @property
+    def mean_duration(self) -> float:
+        return self.duration_sum / self.requests if self.requests else 0.0
+
+    @property
+    def mean_hold(self) -> float:
+        if not self.database_requests:
+            return 0.0
+        return self.hold_sum / self.database_requests
+
+    @property
+    def database_share(self) -> float:
+        if not self.requests:
+            return 0.0
+        return min(self.database_requests / self.requests, 1.0)
+
+
+@dataclass(frozen=True)
+class Waits:
+    p50: float
+    p99: float
+    p999: float
+
+
+def parse_mix(text: str) -> list[RouteMix]:
+    routes: dict[str, RouteMix] = {}
+    fields = {
+        "http_request_duration_seconds_count": "requests",
+        "http_request_duration_seconds_sum": "duration_sum",
+        "db_connection_hold_seconds_count": "database_requests",
+        "db_connection_hold_seconds_sum": "hold_sum",
+    }
+    for line in text.splitlines():
+        match = _SAMPLE.match(line)
+        if match is None or match["name"] not in fields:
+            continue
+        labels = dict(_LABEL.findall(match["labels"] or ""))
+        route = labels.get("route", "")
+        mix = routes.setdefault(route, RouteMix(route))
+        field = fields[match["name"]]
+        # Series of the same route with different methods add up.
+        setattr(mix, field, getattr(mix, field) + float(match["value"]))
+    return [mix for mix in routes.values() if mix.requests > 0]
+
+
+def simulate(
+    mix: list[RouteMix],
+    concurrency: int,
+    connections: int,
+    requests: int,
+    seed: int,
+) -> Waits:
+    """Checkout waits with ``connections`` pooled connections."""
+    rng = random.Random(seed)
+    weights = [route.requests for route in mix]
+    waits: list[float] = []
+    free = connections
+    queue: deque[tuple[float, float]] = deque()
+    events: list[tuple[float, int, str, float]] = []
+    sequence = 0
+
+    def schedule(at: float, kind: str, hold: float = 0.0) -> None:
+        nonlocal sequence
+        sequence += 1
+        heapq.heappush(events, (at, sequence, kind, hold))
+
+    def start_request(now: float) -> None:
+        route = rng.choices(mix, weights)[0]
+        if rng.random() < route.database_share:
+            hold = rng.expovariate(1 / route.mean_hold) if route.mean_hold else 0.0
+            before = max(route.mean_duration - route.mean_hold, 0.0)
+            delay = rng.expovariate(1 / before) if before else 0.0
+            schedule(now + delay, "checkout", hold)
+        else:
+            duration = route.mean_duration
+            schedule(now + (rng.expovariate(1 / duration) if duration else 0.0), "done")
+
+    for _ in range(concurrency):
+        start_request(0.0)
+
+    completed = 0
+    while completed < requests:
+        now, _, kind, hold = heapq.heappop(events)
+        if kind == "checkout":
+            if free:
+                free -= 1
+                waits.append(0.0)
+                schedule(now + hold, "checkin")
+            else:
+                queue.append((now, hold))
+            continue
+        if kind == "checkin":
+            if queue:
+                queued_at, queued_hold = queue.popleft()
+                waits.append(now - queued_at)
+                schedule(now + queued_hold, "checkin")
+            else:
+                free += 1
+        completed += 1
+        start_request(now)
+
+    waits.sort()
+    return Waits(
+        p50=_percentile(waits, 0.5),
+        p99=_percentile(waits, 0.99),
+        p999=_percentile(waits, 0.999),
+    )
+
+
+def smallest_pool(
+    mix: list[RouteMix], concurrency: int, max_wait: float, requests: int, seed: int
+) -> tuple[int, Waits]:
+    # The p99 wait only falls as connections are added: bisect.
+    low, high = 1, concurrency
+    best = simulate(mix, concurrency, concurrency, requests, seed)
+    while low < high:
+        middle = (low + high) // 2
+        waits = simulate(mix, concurrency, middle, requests, seed)
+        if waits.p99 <= max_wait:
+            high, best = middle, waits
+        else:
+            low = middle + 1
+    return high, best
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("mix", help="file with a scrape of GET /metrics")
+    parser.add_argument("--concurrency", type=int, required=True)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--burst", type=float, default=2.0)
+    parser.add_argument("--max-wait", type=float, default=0.005)
+    parser.add_argument("--max-connections", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with open(args.mix, encoding="utf-8") as file:
+        mix = parse_mix(file.read())
+    if not any(route.database_requests for route in mix):
+        print("the scrape has no db_connection_hold_seconds samples")
+        return 1
+
+    print(f"{'route':<48} {'share':>6} {'db':>5} {'duration':>9} {'hold':>9}")
+    total = sum(route.requests for route in mix)
+    for route in sorted(mix, key=lambda route: route.requests, reverse=True):
+        print(
+            f"{route.route[:48]:<48} {route.requests / total:>6.1%} "
+            f"{route.database_share:>5.0%} {route.mean_duration * 1000:>7.2f}ms "
+            f"{route.mean_hold * 1000:>7.2f}ms"
+        )
+
+    per_process = math.ceil(args.concurrency / args.processes)
+    burst = math.ceil(per_process * args.burst)
+    pool_size, steady = smallest_pool(
+        mix, per_process, args.max_wait, args.requests, args.seed
+    )
+    capacity, peak = smallest_pool(mix, burst, args.max_wait, args.requests, args.seed)
+    max_overflow = max(capacity - pool_size, 0)
+    pool_timeout = max(1, math.ceil(peak.p999 * 10))
+    connections = args.processes * (pool_size + max_overflow)
+
+    print()
+    print(
+        f"steady {per_process} in flight per process: pool {pool_size}, "
+        f"wait p50={steady.p50 * 1000:.2f}ms p99={steady.p99 * 1000:.2f}ms"
+    )
+    print(
+        f"burst {burst} in flight per process: {capacity} connections, "
+        f"wait p99={peak.p99 * 1000:.2f}ms p99.9={peak.p999 * 1000:.2f}ms"
+    )
+    print()
+    print(f"DB_POOL_SIZE={pool_size}")
+    print(f"DB_MAX_OVERFLOW={max_overflow}")
+    print(f"DB_POOL_TIMEOUT={pool_timeout}")
+    print(f"# up to {connections} connections over {args.processes} processes")
+    if connections > args.max_connections:
+        print(
+            f"# exceeds --max-connections={args.max_connections}: raise it on the "
+            "server or put a connection pooler in front of it"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
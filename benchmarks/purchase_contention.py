@@ -0,0 +1,311 @@
+"""Concurrent purchases of a single user.
+
+Needs the PostgreSQL database configured through the ``DB_*`` settings. A
+throwaway user with a character, ``--purchases`` items costing ``--cost``, one
+more item and a background is committed before the run and deleted after it,
+because the purchases have to run in concurrent transactions.
+
+Two rounds run through ``SQLAlchemyPurchasesRepository``, every purchase in
+its own transaction:
+
+* ``distinct``: the user starts with ``--balance`` and buys every item at
+  once, which it can only afford ``--balance // --cost`` of.
+* ``same``: the user starts with ``--balance`` again and ``--purchases``
+  tasks buy the remaining item while as many buy the background.
+
+It reports the purchase latency and checks each round against the database:
+the balance never goes below zero and drops by exactly what the accepted
+purchases cost, every accepted purchase has one ownership row and one ledger
+row, and nothing is owned twice. Exits with status 1 if any check fails or
+any purchase fails with an error instead of being rejected.
+
+Usage: python -m benchmarks.purchase_contention [--purchases N] [--balance N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Awaitable
+from dataclasses import dataclass
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import DBAPIError
+
+from src.adapters.database.models.catalog import (
+    BackgroundModel,
+    ItemCategoryModel,
+    ItemModel,
+)
+from src.adapters.database.models.characters import (
+    CharacterBackgroundModel,
+    CharacterItemModel,
+    CharacterModel,
+)
+from src.adapters.database.models.transactions import TransactionModel
+from src.adapters.database.models.user import UserModel
+from src.adapters.database.session import session_manager
+from src.adapters.database.uow import SQLAlchemyUnitOfWork
+from src.adapters.repositories.exceptions import RepositoryError
+from src.adapters.repositories.healthity.purchases import (
+    SQLAlchemyPurchasesRepository,
+)
+from src.domain.value_objects.telegram_id import TelegramId
+
+BENCHMARK_TG_ID = 9_000_000_000_005
+
+
+@dataclass
+class Catalog:
+    character_id: uuid.UUID
+    category_id: uuid.UUID
+    item_ids: list[uuid.UUID]
+    contested_item_id: uuid.UUID
+    background_id: uuid.UUID
+
+
+@dataclass
+class Stored:
+    balance: int
+    owned: int
+    owned_twice: int
+    ledger: int
+
+
+async def seed(count: int, cost: int) -> Catalog:
+    catalog = Catalog(
+        character_id=uuid.uuid4(),
+        category_id=uuid.uuid4(),
+        item_ids=[uuid.uuid4() for _ in range(count)],
+        contested_item_id=uuid.uuid4(),
+        background_id=uuid.uuid4(),
+    )
+    async with SQLAlchemyUnitOfWork(session_manager.async_session) as uow:
+        session = uow.session
+        await session.execute(insert(UserModel).values(tg_id=BENCHMARK_TG_ID))
+        await session.execute(
+            insert(CharacterModel).values(
+                id=catalog.character_id, user_tg_id=BENCHMARK_TG_ID
+            )
+        )
+        await session.execute(
+            insert(ItemCategoryModel).values(id=catalog.category_id, name="Benchmark")
+        )
+        await session.execute(
+            insert(ItemModel),
+            [
+                {
+                    "id": item_id,
+                    "category_id": catalog.category_id,
+                    "name": f"Benchmark {item_id}",
+                    "cost": cost,
+                }
+                for item_id in [*catalog.item_ids, catalog.contested_item_id]
+            ],
+        )
+        await session.execute(
+            insert(BackgroundModel).values(
+                id=catalog.background_id,
+                name=f"Benchmark {catalog.background_id}",
+                cost=cost,
+            )
+        )
+    return catalog
+
+
+async def cleanup(catalog: Catalog) -> None:
+    async with SQLAlchemyUnitOfWork(session_manager.async_session) as uow:
+        session = uow.session
+        # Deleting the user cascades to its character, its owned items and
+        # backgrounds and its ledger.
+        await session.execute(
+            delete(UserModel).where(UserModel.tg_id == BENCHMARK_TG_ID)
+        )
+        await session.execute(
+            delete(ItemModel).where(ItemModel.category_id == catalog.category_id)
+        )
+        await session.execute(
+            delete(ItemCategoryModel).where(ItemCategoryModel.id == catalog.category_id)
+        )
+        await session.execute(
+            delete(BackgroundModel).where(BackgroundModel.id == catalog.background_id)
+        )
+
+
+async def reset(catalog: Catalog, balance: int) -> None:
+    """Give the user ``balance`` and take back everything it bought."""
+    async with SQLAlchemyUnitOfWork(session_manager.async_session) as uow:
+        session = uow.session
+        await session.execute(
+            update(UserModel)
+            .where(UserModel.tg_id == BENCHMARK_TG_ID)
+            .values(balance=balance)
+        )
+        for model in (CharacterItemModel, CharacterBackgroundModel):
+            await session.execute(
+                delete(model).where(model.character_id == catalog.character_id)
+            )
+        await session.execute(
+            delete(TransactionModel).where(
+                TransactionModel.user_tg_id == BENCHMARK_TG_ID
+            )
+        )
+
+
+async def stored(catalog: Catalog) -> Stored:
+    async with SQLAlchemyUnitOfWork(session_manager.async_session) as uow:
+        session = uow.session
+        balance = await session.scalar(
+            select(UserModel.balance).where(UserModel.tg_id == BENCHMARK_TG_ID)
+        )
+        owned = owned_twice = 0
+        for model, column in (
+            (CharacterItemModel, CharacterItemModel.item_id),
+            (CharacterBackgroundModel, CharacterBackgroundModel.background_id),
+        ):
+            result = await session.execute(
+                select(func.count())
+                .select_from(model)
+                .where(model.character_id == catalog.character_id)
+                .group_by(column)
+            )
+            counts = result.scalars().all()
+            owned += sum(counts)
+            owned_twice += sum(1 for count in counts if count > 1)
+        ledger = await session.scalar(
+            select(func.count())
+            .select_from(TransactionModel)
+            .where(TransactionModel.user_tg_id == BENCHMARK_TG_ID)
+        )
+        return Stored(
+            balance=balance or 0, owned=owned, owned_twice=owned_twice, ledger=ledger
+        )
+
+
+async def timed(
+    purchase: Awaitable[object | None], timings: list[float], errors: list[str]
+) -> bool:
+    started = time.perf_counter()
+    try:
+        purchased = await purchase
+    except (DBAPIError, RepositoryError) as exc:
+        errors.append(type(exc).__name__)
+        purchased = None
+    timings.append(time.perf_counter() - started)
+    return purchased is not None
+
+
+def check(
+    name: str,
+    state: Stored,
+    accepted: int,
+    expected: int,
+    balance: int,
+    cost: int,
+) -> list[str]:
+    print(
+        f"{name}: accepted={accepted} balance={state.balance} "
+        f"owned={state.owned} ledger={state.ledger}"
+    )
+    failures = []
+    if state.balance < 0:
+        failures.append(f"{name}: overspent, balance {state.balance}")
+    if state.balance != balance - accepted * cost:
+        failures.append(
+            f"{name}: balance {state.balance}, "
+            f"expected {balance - accepted * cost}"
+        )
+    if state.owned_twice:
+        failures.append(f"{name}: {state.owned_twice} entries owned twice")
+    if state.owned != accepted or state.ledger != accepted:
+        failures.append(
+            f"{name}: {accepted} purchases accepted but {state.owned} owned "
+            f"and {state.ledger} ledger rows"
+        )
+    if accepted != expected:
+        failures.append(f"{name}: {accepted} purchases accepted, expected {expected}")
+    return failures
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--purchases", type=int, default=300)
+    parser.add_argument("--balance", type=int, default=1000)
+    parser.add_argument("--cost", type=int, default=10)
+    args = parser.parse_args()
+
+    repository = SQLAlchemyPurchasesRepository(
+        uow_factory=lambda: SQLAlchemyUnitOfWork(session_manager.async_session)
+    )
+    user = TelegramId(BENCHMARK_TG_ID)
+
+    catalog = await seed(args.purchases, args.cost)
+    failures: list[str] = []
+    timings: list[float] = []
+    errors: list[str] = []
+    try:
+        await reset(catalog, args.balance)
+        results = await asyncio.gather(
+            *(
+                timed(
+                    repository.purchase_item(user, catalog.character_id, item_id),
+                    timings,
+                    errors,
+                )
+                for item_id in catalog.item_ids
+            )
+        )
+        failures += check(
+            "distinct",
+            await stored(catalog),
+            accepted=sum(results),
+            expected=min(args.purchases, args.balance // args.cost),
+            balance=args.balance,
+            cost=args.cost,
+        )
+
+        await reset(catalog, args.balance)
+        purchases = [
+            repository.purchase_item(
+                user, catalog.character_id, catalog.contested_item_id
+            )
+            for _ in range(args.purchases)
+        ] + [
+            repository.purchase_background(
+                user, catalog.character_id, catalog.background_id
+            )
+            for _ in range(args.purchases)
+        ]
+        results = await asyncio.gather(
+            *(timed(purchase, timings, errors) for purchase in purchases)
+        )
+        failures += check(
+            "same",
+            await stored(catalog),
+            accepted=sum(results),
+            expected=min(2, args.balance // args.cost),
+            balance=args.balance,
+            cost=args.cost,
+        )
+    finally:
+        await cleanup(catalog)
+        await session_manager.close()
+
+    ordered = sorted(timings)
+    p99 = ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)]
+    print(
+        f"purchases={len(timings)} "
+        f"median={statistics.median(ordered) * 1000:.2f}ms "
+        f"p99={p99 * 1000:.2f}ms errors={len(errors)}"
+    )
+    if errors:
+        failures.append(f"purchases failed with {sorted(set(errors))}")
+    for failure in failures:
+        print(f"invariant violated: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
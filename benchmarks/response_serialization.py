@@ -0,0 +1,421 @@
+"""Serialization cost of the list endpoints.
+
+For every endpoint that answers through ``json_response`` it mounts a route
+with the endpoint's ``response_model`` on each of two throwaway FastAPI apps:
+one returns response models the way the routers used to, which FastAPI
+validates again, converts with ``jsonable_encoder`` and encodes with
+``json.dumps``; the other returns ``json_response``. Both are called in
+process through the ASGI interface with the same ``--rows`` entities, so the
+timings include routing but no network.
+
+``tests/test_responses.py`` checks that both routes answer with the same
+bytes. Float coordinates stay in the range where Python and pydantic-core
+write them alike; see ``json_response``.
+
+Usage: python -m benchmarks.response_serialization [--rows N] [--iterations N]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from src.domain.entities.healthity.activities import (
+    DailyActivity,
+    DailyProgress,
+    MoodHistory,
+)
+from src.domain.entities.healthity.characters import (
+    Character,
+    CharacterBackground,
+    CharacterItem,
+    ItemBackgroundPosition,
+)
+from src.domain.entities.healthity.transactions import Transaction
+from src.domain.entities.healthity.users import User, UserFriend
+from src.domain.value_objects.telegram_id import TelegramId
+from src.drivers.rest.responses import json_response
+from src.drivers.rest.schemas.activities import (
+    DailyActivityResponse,
+    DailyProgressResponse,
+    MoodHistoryResponse,
+)
+from src.drivers.rest.schemas.character_backgrounds import (
+    CharacterBackgroundResponse,
+)
+from src.drivers.rest.schemas.character_items import CharacterItemResponse
+from src.drivers.rest.schemas.characters import CharacterResponse
+from src.drivers.rest.schemas.item_background_positions import (
+    ItemBackgroundPositionResponse,
+)
+from src.drivers.rest.schemas.transactions import (
+    TransactionResponse,
+    TransactionsPageResponse,
+)
+from src.drivers.rest.schemas.user_friends import UserFriendResponse
+from src.drivers.rest.schemas.users import UserResponse
+from src.use_cases.transactions.manage_transactions import TransactionsPage
+
+START = datetime(2024, 1, 1, 9, 30)
+MOODS = ["happy", "neutral", "sad"]
+DESCRIPTIONS = [None, "Покупка предмета", 'quote " and \\ backslash', "emoji 🌱"]
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    path: str
+    schema: Any
+    sample: Callable[[random.Random, int], Any]
+    # Builds the value the router returned before ``json_response``.
+    models: Callable[[Any], Any]
+
+
+def _moment(rng: random.Random) -> datetime:
+    return START + timedelta(
+        seconds=rng.randrange(10**7), microseconds=rng.randrange(10**6)
+    )
+
+
+def _ids(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def transactions(rng: random.Random, rows: int) -> list[Transaction]:
+    return [
+        Transaction(
+            id=_ids(rng),
+            user_tg_id=TelegramId(1001),
+            amount=rng.randrange(-500, 500),
+            balance_after=rng.randrange(10_000),
+            type=rng.choice(["deposit", "purchase"]),
+            related_item_id=rng.choice([None, _ids(rng)]),
+            description=rng.choice(DESCRIPTIONS),
+            timestamp=_moment(rng),
+        )
+        for _ in range(rows)
+    ]
+
+
+def transactions_page(rng: random.Random, rows: int) -> TransactionsPage:
+    return TransactionsPage(items=transactions(rng, rows), next_cursor="MjAyNC0wMS0w")
+
+
+def daily_activities(rng: random.Random, rows: int) -> list[DailyActivity]:
+    return [
+        DailyActivity(
+            id=_ids(rng),
+            character_id=_ids(rng),
+            activity_type_id=_ids(rng),
+            date=_moment(rng),
+            value=rng.randrange(20_000),
+            goal=rng.randrange(1, 10_000),
+            notes=rng.choice(DESCRIPTIONS),
+            created_at=_moment(rng),
+            updated_at=_moment(rng),
+        )
+        for _ in range(rows)
+    ]
+
+
+def daily_progress(rng: random.Random, rows: int) -> list[DailyProgress]:
+    return [
+        DailyProgress(
+            id=_ids(rng),
+            character_id=_ids(rng),
+            date=_moment(rng),
+            experience_gained=rng.randrange(1000),
+            level_at_end=rng.randrange(1, 50),
+            mood_average=rng.choice([None, *MOODS]),
+            behavior_index=rng.choice([None, rng.randrange(100)]),
+            created_at=_moment(rng),
+            updated_at=_moment(rng),
+        )
+        for _ in range(rows)
+    ]
+
+
+def mood_history(rng: random.Random, rows: int) -> list[MoodHistory]:
+    return [
+        MoodHistory(
+            id=_ids(rng),
+            character_id=_ids(rng),
+            mood=rng.choice(MOODS),
+            trigger=rng.choice(DESCRIPTIONS),
+            timestamp=_moment(rng),
+        )
+        for _ in range(rows)
+    ]
+
+
+def characters(rng: random.Random, rows: int) -> list[Character]:
+    return [
+        Character(
+            id=_ids(rng),
+            user_tg_id=TelegramId(rng.randrange(1, 10**10)),
+            name=rng.choice([None, "Листик", "Sprout"]),
+            sex=rng.choice([None, "male", "female"]),
+            current_mood=rng.choice(MOODS),
+            level=rng.randrange(1, 50),
+            total_experience=rng.randrange(100_000),
+            created_at=_moment(rng),
+            updated_at=_moment(rng),
+        )
+        for _ in range(rows)
+    ]
+
+
+def character_items(rng: random.Random, rows: int) -> list[CharacterItem]:
+    return [
+        CharacterItem(
+            id=_ids(rng),
+            character_id=_ids(rng),
+            item_id=_ids(rng),
+            is_active=rng.random() < 0.5,
+            is_favorite=rng.random() < 0.5,
+            purchased_at=_moment(rng),
+        )
+        for _ in range(rows)
+    ]
+
+
+def character_backgrounds(rng: random.Random, rows: int) -> list[CharacterBackground]:
+    return [
+        CharacterBackground(
+            id=_ids(rng),
+            character_id=_ids(rng),
+            background_id=_ids(rng),
+            is_active=rng.random() < 0.5,
+            is_favorite=rng.random() < 0.5,
+            purchased_at=_moment(rng),
+        )
+        for _ in range(rows)
+    ]
+
+
+def positions(rng: random.Random, rows: int) -> list[ItemBackgroundPosition]:
+    return [
+        ItemBackgroundPosition(
+            id=_ids(rng),
+            item_id=_ids(rng),
+            background_id=_ids(rng),
+            position_x=rng.uniform(-1000, 1000),
+            position_y=rng.choice([0.0, 0.1, 1 / 3, 12.5, rng.uniform(0, 1)]),
+            position_z=rng.choice([0.0, -0.0, 1e-4, 123456789.125]),
+        )
+        for _ in range(rows)
+    ]
+
+
+def users(rng: random.Random, rows: int) -> list[User]:
+    return [
+        User(
+            telegram_id=TelegramId(rng.randrange(1, 10**10)),
+            password_hash="$2b$12$" + "x" * 53,
+            is_active=rng.random() < 0.9,
+            is_admin=rng.random() < 0.1,
+            balance=rng.randrange(100_000),
+            created_at=_moment(rng),
+            updated_at=_moment(rng),
+        )
+        for _ in range(rows)
+    ]
+
+
+def user_friends(rng: random.Random, rows: int) -> list[UserFriend]:
+    return [
+        UserFriend(
+            id=_ids(rng),
+            owner_tg_id=TelegramId(1001),
+            friend_tg_id=TelegramId(rng.randrange(1, 10**10)),
+            created_at=_moment(rng),
+        )
+        for _ in range(rows)
+    ]
+
+
+def listed(schema: type[BaseModel]) -> Callable[[Any], Any]:
+    return lambda entities: [schema.model_validate(entity) for entity in entities]
+
+
+def paged(page: TransactionsPage) -> TransactionsPageResponse:
+    return TransactionsPageResponse(
+        items=[TransactionResponse.model_validate(t) for t in page.items],
+        next_cursor=page.next_cursor,
+    )
+
+
+ENDPOINTS = [
+    Endpoint(
+        "/transactions/me",
+        list[TransactionResponse],
+        transactions,
+        listed(TransactionResponse),
+    ),
+    Endpoint(
+        "/transactions/me/page",
+        TransactionsPageResponse,
+        transactions_page,
+        paged,
+    ),
+    Endpoint(
+        "/daily-activities/me",
+        list[DailyActivityResponse],
+        daily_activities,
+        listed(DailyActivityResponse),
+    ),
+    Endpoint(
+        "/daily-progress/me",
+        list[DailyProgressResponse],
+        daily_progress,
+        listed(DailyProgressResponse),
+    ),
+    Endpoint(
+        "/mood-history/me",
+        list[MoodHistoryResponse],
+        mood_history,
+        listed(MoodHistoryResponse),
+    ),
+    Endpoint(
+        "/characters/admin",
+        list[CharacterResponse],
+        characters,
+        listed(CharacterResponse),
+    ),
+    Endpoint(
+        "/character-items/me",
+        list[CharacterItemResponse],
+        character_items,
+        listed(CharacterItemResponse),
+    ),
+    Endpoint(
+        "/character-backgrounds/me",
+        list[CharacterBackgroundResponse],
+        character_backgrounds,
+        listed(CharacterBackgroundResponse),
+    ),
+    Endpoint(
+        "/item-background-positions/admin",
+        list[ItemBackgroundPositionResponse],
+        positions,
+        listed(ItemBackgroundPositionResponse),
+    ),
+    Endpoint("/users/admin", list[UserResponse], users, listed(UserResponse)),
+    Endpoint(
+        "/user-friends/me",
+        list[UserFriendResponse],
+        user_friends,
+        listed(UserFriendResponse),
+    ),
+]
+
+
+def _endpoint(respond: Callable[[], Any]) -> Callable[[], Any]:
+    async def endpoint() -> Any:
+        return respond()
+
+    return endpoint
+
+
+def build_app(
+    contents: dict[str, Any], respond: Callable[[Endpoint, Any], Any]
+) -> FastAPI:
+    """An app serving every endpoint at its path with ``respond``.
+
+    Both variants are built by this function, so their routes share paths and
+    function names, and with them the titles FastAPI generates for schemas.
+    """
+    app = FastAPI()
+    for endpoint in ENDPOINTS:
+        content = contents[endpoint.path]
+        app.add_api_route(
+            endpoint.path,
+            _endpoint(lambda e=endpoint, c=content: respond(e, c)),
+            response_model=endpoint.schema,
+        )
+    return app
+
+
+async def get(app: FastAPI, path: str) -> tuple[int, str, bytes]:
+    """Call ``GET path`` through the ASGI interface."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    status, content_type, body = 0, "", bytearray()
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status, content_type
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            headers = dict(message.get("headers", []))
+            content_type = headers.get(b"content-type", b"").decode()
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, content_type, bytes(body)
+
+
+async def median_call(app: FastAPI, path: str, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await get(app, path)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    contents = {
+        endpoint.path: endpoint.sample(rng, args.rows) for endpoint in ENDPOINTS
+    }
+    default_app = build_app(
+        contents, lambda endpoint, content: endpoint.models(content)
+    )
+    fast_app = build_app(
+        contents, lambda endpoint, content: json_response(content, endpoint.schema)
+    )
+
+    print(
+        f"{'endpoint':36} {'bytes':>8} {'default':>10} {'fast':>10} {'speedup':>8}"
+    )
+    for endpoint in ENDPOINTS:
+        _, _, body = await get(fast_app, endpoint.path)
+        default = await median_call(default_app, endpoint.path, args.iterations)
+        fast = await median_call(fast_app, endpoint.path, args.iterations)
+        print(
+            f"{endpoint.path:36} {len(body):>8} {default * 1e3:>8.2f}ms "
+            f"{fast * 1e3:>8.2f}ms {default / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
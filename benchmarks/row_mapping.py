@@ -0,0 +1,163 @@
+"""Cost of reading a long list of entities through the ORM and as plain rows.
+
+Needs the PostgreSQL database configured through the ``DB_*`` settings. A
+throwaway user with ``--rows`` transactions is inserted inside a transaction
+that is rolled back at the end, so nothing is left behind.
+
+It reads the whole history of that user in two ways:
+
+* ``orm``: what the repositories did before: ``select(TransactionModel)``
+  loads model instances into the session, and each one is copied into an
+  entity with a ``__dict__``.
+* ``rows``: ``SQLAlchemyTransactionsRepository.list_for_user``, which selects
+  the mapped columns as rows and builds the slotted ``Transaction`` entities
+  from them.
+
+The session is emptied before every read, so the ORM path never finds the
+rows in its identity map. It reports the median time of a read and the rows
+mapped per second, the peak memory allocated while reading, and the memory
+the returned entities keep, both per 10,000 rows.
+
+Usage: python -m benchmarks.row_mapping [--rows N] [--repeat N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import fields, make_dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import insert, select
+
+from src.adapters.database.models.transactions import TransactionModel
+from src.adapters.database.models.user import UserModel
+from src.adapters.database.session import session_manager
+from src.adapters.database.uow import RequestUnitOfWork, create_unit_of_work
+from src.adapters.repositories.healthity.transactions import (
+    SQLAlchemyTransactionsRepository,
+)
+from src.domain.entities.healthity.transactions import Transaction
+from src.domain.value_objects.telegram_id import TelegramId
+
+BENCHMARK_TG_ID = 9_000_000_000_002
+PER_ROWS = 10_000
+
+# ``Transaction`` as it was declared before it got slots.
+DictTransaction = make_dataclass(
+    "DictTransaction", [(field.name, field.type) for field in fields(Transaction)]
+)
+
+
+def model_to_domain(model: TransactionModel) -> Any:
+    return DictTransaction(
+        id=model.id,
+        user_tg_id=TelegramId(model.user_tg_id),
+        amount=model.amount,
+        balance_after=model.balance_after,
+        type=model.type,
+        related_item_id=model.related_item_id,
+        related_background_id=model.related_background_id,
+        description=model.description,
+        timestamp=model.timestamp,
+    )
+
+
+async def seed(uow: RequestUnitOfWork, count: int) -> None:
+    session = await uow.ensure_session()
+    await session.execute(
+        insert(UserModel).values(tg_id=BENCHMARK_TG_ID, balance=count)
+    )
+    start = datetime(2020, 1, 1)
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "user_tg_id": BENCHMARK_TG_ID,
+            "amount": 1,
+            "balance_after": index + 1,
+            "type": "deposit",
+            "description": "Пополнение баланса",
+            "timestamp": start + timedelta(seconds=index),
+        }
+        for index in range(count)
+    ]
+    for offset in range(0, count, 5000):
+        await session.execute(insert(TransactionModel), rows[offset : offset + 5000])
+
+
+async def measure(
+    read: Callable[[], Awaitable[list[Any]]], reset: Callable[[], None], repeat: int
+) -> tuple[float, int, int]:
+    """Median duration, peak and retained bytes of ``read``."""
+    timings, peaks, retained = [], [], []
+    for _ in range(repeat):
+        reset()
+        started = time.perf_counter()
+        await read()
+        timings.append(time.perf_counter() - started)
+
+        reset()
+        tracemalloc.start()
+        entities = await read()
+        kept, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+        retained.append(kept)
+        del entities
+    return (
+        statistics.median(timings),
+        int(statistics.median(peaks)),
+        int(statistics.median(retained)),
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=PER_ROWS)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    session_factory = session_manager.async_session
+    repository = SQLAlchemyTransactionsRepository(
+        uow_factory=lambda: create_unit_of_work(session_factory)
+    )
+    user = TelegramId(BENCHMARK_TG_ID)
+
+    # The request unit of work is never committed: leaving it rolls back.
+    async with RequestUnitOfWork(session_factory) as uow:
+        await seed(uow, args.rows)
+        session = await uow.ensure_session()
+
+        async def orm() -> list[Any]:
+            result = await session.execute(
+                select(TransactionModel)
+                .where(TransactionModel.user_tg_id == BENCHMARK_TG_ID)
+                .order_by(TransactionModel.timestamp.desc())
+            )
+            models = result.scalars().all()
+            return [model_to_domain(model) for model in models]
+
+        async def rows() -> list[Any]:
+            return await repository.list_for_user(user)
+
+        scale = PER_ROWS / args.rows
+        for name, read in (("orm", orm), ("rows", rows)):
+            duration, peak, retained = await measure(
+                read, session.expunge_all, args.repeat
+            )
+            print(
+                f"{name:>4}: {duration * 1000:8.2f}ms "
+                f"{args.rows / duration:>10,.0f} rows/s, "
+                f"peak {peak * scale / 1024:8.0f}KiB, "
+                f"kept {retained * scale / 1024:8.0f}KiB per {PER_ROWS:,} rows"
+            )
+
+    await session_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
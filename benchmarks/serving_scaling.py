@@ -0,0 +1,173 @@
+"""Throughput of ``python -m src.serve`` as worker processes are added.
+
+Starts the production entry point on a local port once per worker count and
+drives ``--path`` over keep-alive HTTP/1.1 connections from separate client
+processes for ``--duration`` seconds. The default path serves the OpenAPI
+schema, which every worker builds during its warm-up and which needs no
+database, so the run measures the serving stack itself. The workers still try
+to open their pool; without a database they log that and serve anyway.
+
+On Linux the last ``--client-cpus`` CPUs are reserved for the load generator
+and the server is pinned to the others, so the two do not compete for cores;
+worker counts go up to the number of server CPUs. It reports requests per
+second, the speedup over one worker and the scaling efficiency (speedup per
+worker). Exits with status 1 when the efficiency at the highest worker count
+is under ``--min-efficiency``.
+
+Usage: python -m benchmarks.serving_scaling [--duration S] [--path /openapi.json]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+_CONTENT_LENGTH = re.compile(rb"content-length:\s*(\d+)", re.IGNORECASE)
+
+
+async def _connection(host: str, port: int, request: bytes, deadline: float) -> int:
+    reader, writer = await asyncio.open_connection(host, port)
+    completed = 0
+    try:
+        while time.monotonic() < deadline:
+            writer.write(request)
+            headers = await reader.readuntil(b"\r\n\r\n")
+            if not headers.startswith(b"HTTP/1.1 200"):
+                raise RuntimeError(headers.split(b"\r\n", 1)[0].decode())
+            length = _CONTENT_LENGTH.search(headers)
+            await reader.readexactly(int(length[1]) if length else 0)
+            completed += 1
+    finally:
+        writer.close()
+    return completed
+
+
+def _client(
+    host: str,
+    port: int,
+    path: str,
+    connections: int,
+    duration: float,
+    cpus: set[int] | None,
+) -> int:
+    if cpus:
+        os.sched_setaffinity(0, cpus)
+    request = f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode()
+
+    async def run() -> int:
+        deadline = time.monotonic() + duration
+        counts = await asyncio.gather(
+            *(_connection(host, port, request, deadline) for _ in range(connections))
+        )
+        return sum(counts)
+
+    return asyncio.run(run())
+
+
+def wait_until_serving(url: str, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"{url} did not answer within {timeout}s")
+        time.sleep(0.2)
+
+
+def measure(
+    args: argparse.Namespace,
+    workers: int,
+    server_cpus: set[int] | None,
+    clients: int,
+    client_cpus: set[int] | None,
+) -> float:
+    environment = {
+        **os.environ,
+        "SERVER_HOST": args.host,
+        "SERVER_PORT": str(args.port),
+        "WEB_CONCURRENCY": str(workers),
+        "LOG_LEVEL": "WARNING",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "src.serve"],
+        env=environment,
+        preexec_fn=(
+            (lambda: os.sched_setaffinity(0, server_cpus)) if server_cpus else None
+        ),
+    )
+    try:
+        wait_until_serving(f"http://{args.host}:{args.port}{args.path}", 60)
+        # The socket answers as soon as the first worker is up; let the others
+        # finish their warm-up too.
+        time.sleep(args.settle)
+        connections = max(args.connections // clients, 1)
+        client = (args.host, args.port, args.path, connections, args.duration)
+        with multiprocessing.Pool(clients) as pool:
+            counts = pool.starmap(_client, [(*client, client_cpus)] * clients)
+        return sum(counts) / args.duration
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", default="/openapi.json")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--settle", type=float, default=2.0)
+    parser.add_argument("--connections", type=int, default=256)
+    parser.add_argument("--client-cpus", type=int)
+    parser.add_argument("--min-efficiency", type=float, default=0.7)
+    args = parser.parse_args()
+
+    available = sorted(
+        os.sched_getaffinity(0)
+        if hasattr(os, "sched_getaffinity")
+        else range(os.cpu_count() or 1)
+    )
+    clients = args.client_cpus or max(len(available) // 4, 1)
+    server_cpus: set[int] | None = None
+    client_cpus: set[int] | None = None
+    cores = len(available)
+    if cores > clients and hasattr(os, "sched_setaffinity"):
+        server_cpus = set(available[:-clients])
+        client_cpus = set(available[-clients:])
+        cores = len(server_cpus)
+
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+
+    baseline = 0.0
+    efficiency = 1.0
+    print(f"{'workers':>7} {'req/s':>10} {'speedup':>8} {'efficiency':>10}")
+    for workers in counts:
+        throughput = measure(args, workers, server_cpus, clients, client_cpus)
+        baseline = baseline or throughput
+        speedup = throughput / baseline
+        efficiency = speedup / workers
+        print(f"{workers:>7} {throughput:>10.0f} {speedup:>7.2f}x {efficiency:>10.0%}")
+
+    if efficiency < args.min_efficiency:
+        print(f"efficiency below --min-efficiency={args.min_efficiency:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,622 @@
+"""Use case benchmark suite.
+
+Runs the hot use cases against one of two backends:
+
+* ``memory``: the in-memory repositories of ``benchmarks.in_memory``; measures
+  the cost of the use case code itself. A round trip is a repository call.
+* ``postgres``: the SQLAlchemy repositories on the database configured through
+  the ``DB_*`` settings. Fixtures are committed before the run and deleted
+  after it; every operation runs in a request unit of work that is rolled
+  back, so all iterations see the same state. A round trip is an SQL
+  statement.
+
+For every scenario it reports ops/sec, latency percentiles, round trips per
+operation and the peak memory allocated while the operation runs. ``--output``
+writes the results as JSON; ``compare`` prints the change between two files.
+
+Usage:
+    python -m benchmarks.suite run [--backend memory|postgres] [--output FILE]
+    python -m benchmarks.suite compare BASELINE.json CANDIDATE.json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import cached_property
+from datetime import datetime, timedelta, timezone
+from typing import Any, Protocol
+
+import bcrypt
+from sqlalchemy import delete, insert
+
+from benchmarks.in_memory import (
+    InMemoryCharacterItemsRepository,
+    InMemoryCharactersRepository,
+    InMemoryDailyActivitiesRepository,
+    InMemoryDailyProgressRepository,
+    InMemoryItemsRepository,
+    InMemoryMoodHistoryRepository,
+    InMemoryPurchasesRepository,
+    InMemoryRefreshTokensRepository,
+    InMemoryStore,
+    InMemoryTokenGenerationsRepository,
+    InMemoryTransactionsRepository,
+    InMemoryUserStatisticsRepository,
+    InMemoryUsersRepository,
+)
+from src.core.auth.jwt_service import JwtService
+from src.core.security import AsyncPasswordHasher, PasswordHasher, TokenHasher
+from src.domain.entities.auth import RefreshToken
+from src.domain.entities.healthity.activities import ActivityType
+from src.domain.entities.healthity.catalog import Item
+from src.domain.entities.healthity.characters import Character
+from src.domain.entities.healthity.transactions import Transaction
+from src.domain.entities.healthity.users import User
+from src.domain.value_objects.telegram_id import TelegramId
+from src.use_cases.auth.authenticate import (
+    LoginInput,
+    LoginUseCase,
+    RefreshInput,
+    RefreshUseCase,
+)
+from src.use_cases.character_items.manage_character_items import (
+    PurchaseItemWithBalanceInput,
+    PurchaseItemWithBalanceUseCase,
+)
+from src.use_cases.daily_activities.manage_daily_activities import (
+    CreateDailyActivityInput,
+    CreateDailyActivityUseCase,
+)
+from src.use_cases.daily_progress.manage_daily_progress import (
+    CreateDailyProgressInput,
+    CreateDailyProgressUseCase,
+)
+from src.use_cases.transactions.manage_transactions import (
+    ListTransactionsPageInput,
+    ListTransactionsPageUseCase,
+)
+from src.use_cases.users.statistics import GetUserStatisticsUseCase
+
+LEDGER_SIZE = 500
+
+
+@dataclass
+class Fixture:
+    """Rows every scenario works on."""
+
+    user_tg_id: int = 9_000_000_000_002
+    password: str = "benchmark-password"
+    character_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    item_category_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    item_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    activity_type_id: uuid.UUID = field(default_factory=uuid.uuid4)
+
+    def user(self, bcrypt_rounds: int) -> User:
+        # Hashed like PasswordHasher does, with a configurable cost.
+        prehashed = hashlib.sha256(self.password.encode("utf-8")).digest()
+        password_hash = bcrypt.hashpw(prehashed, bcrypt.gensalt(rounds=bcrypt_rounds))
+        return User(
+            telegram_id=TelegramId(self.user_tg_id),
+            password_hash=password_hash.decode("utf-8"),
+            balance=1_000_000,
+        )
+
+    @cached_property
+    def refresh_session(self) -> tuple[str, RefreshToken]:
+        """A refresh token of the user and the row stored for it."""
+        token, expires_at, jti = JwtService().create_refresh_token(
+            subject=self.user_tg_id
+        )
+        stored = RefreshToken(
+            id=uuid.uuid4(),
+            user_tg_id=TelegramId(self.user_tg_id),
+            token_hash=TokenHasher().hash_token(token),
+            jti=jti,
+            expires_at=expires_at,
+        )
+        return token, stored
+
+    def character(self) -> Character:
+        return Character(id=self.character_id, user_tg_id=TelegramId(self.user_tg_id))
+
+    def item(self) -> Item:
+        return Item(
+            id=self.item_id,
+            category_id=self.item_category_id,
+            name="Benchmark item",
+            cost=10,
+        )
+
+    def activity_type(self) -> ActivityType:
+        return ActivityType(
+            id=self.activity_type_id,
+            name=f"benchmark-{self.activity_type_id.hex[:8]}",
+            unit="steps",
+            color=None,
+            daily_goal_default=10_000,
+        )
+
+    def ledger(self) -> list[Transaction]:
+        start = datetime(2020, 1, 1)
+        return [
+            Transaction(
+                id=uuid.uuid4(),
+                user_tg_id=TelegramId(self.user_tg_id),
+                amount=1,
+                balance_after=index + 1,
+                type="deposit",
+                timestamp=start + timedelta(minutes=index),
+            )
+            for index in range(LEDGER_SIZE)
+        ]
+
+
+class Backend(Protocol):
+    name: str
+    users: Any
+    characters: Any
+    items: Any
+    character_items: Any
+    purchases: Any
+    daily_activities: Any
+    daily_progress: Any
+    mood_history: Any
+    transactions: Any
+    refresh_tokens: Any
+    token_generations: Any
+    user_statistics: Any
+
+    async def setup(self, fixture: Fixture, bcrypt_rounds: int) -> None: ...
+
+    async def teardown(self, fixture: Fixture) -> None: ...
+
+    def operation(self) -> Any:
+        """Async context manager yielding a callable that returns round trips."""
+
+
+class MemoryBackend:
+    name = "memory"
+
+    def __init__(self) -> None:
+        self.store = InMemoryStore()
+        self.users = InMemoryUsersRepository(self.store)
+        self.characters = InMemoryCharactersRepository(self.store)
+        self.items = InMemoryItemsRepository(self.store)
+        self.character_items = InMemoryCharacterItemsRepository(self.store)
+        self.purchases = InMemoryPurchasesRepository(self.store)
+        self.daily_activities = InMemoryDailyActivitiesRepository(self.store)
+        self.daily_progress = InMemoryDailyProgressRepository(self.store)
+        self.mood_history = InMemoryMoodHistoryRepository(self.store)
+        self.transactions = InMemoryTransactionsRepository(self.store)
+        self.refresh_tokens = InMemoryRefreshTokensRepository(self.store)
+        self.token_generations = InMemoryTokenGenerationsRepository(self.store)
+        self.user_statistics = InMemoryUserStatisticsRepository(self.store)
+        self._baseline: InMemoryStore | None = None
+
+    async def setup(self, fixture: Fixture, bcrypt_rounds: int) -> None:
+        user = fixture.user(bcrypt_rounds)
+        self.store.users[user.telegram_id.value] = user
+        _, refresh_token = fixture.refresh_session
+        self.store.refresh_tokens[refresh_token.jti] = refresh_token
+        self.store.characters[fixture.character_id] = fixture.character()
+        self.store.items[fixture.item_id] = fixture.item()
+        self.store.activity_types[fixture.activity_type_id] = fixture.activity_type()
+        for transaction in fixture.ledger():
+            self.store.transactions[transaction.id] = transaction
+        self._baseline = self.store.snapshot()
+
+    async def teardown(self, fixture: Fixture) -> None:
+        pass
+
+    @asynccontextmanager
+    async def operation(self) -> AsyncIterator[Callable[[], int]]:
+        before = self.store.round_trips
+        try:
+            yield lambda: self.store.round_trips - before
+        finally:
+            if self._baseline is not None:
+                self.store.restore(self._baseline)
+
+
+class PostgresBackend:
+    name = "postgres"
+
+    def __init__(self) -> None:
+        from src.adapters.database.session import session_manager
+        from src.adapters.database.uow import create_unit_of_work
+        from src.adapters.repositories import (
+            SQLAlchemyCharacterItemsRepository,
+            SQLAlchemyCharactersRepository,
+            SQLAlchemyDailyActivitiesRepository,
+            SQLAlchemyDailyProgressRepository,
+            SQLAlchemyItemsRepository,
+            SQLAlchemyMoodHistoryRepository,
+            SQLAlchemyPurchasesRepository,
+            SQLAlchemyRefreshTokensRepository,
+            SQLAlchemyTokenGenerationsRepository,
+            SQLAlchemyTransactionsRepository,
+            SQLAlchemyUserStatisticsRepository,
+            SQLAlchemyUsersRepository,
+        )
+
+        self._session_manager = session_manager
+        self._session_factory = session_manager.async_session
+
+        def uow_factory():
+            return create_unit_of_work(self._session_factory)
+
+        self.users = SQLAlchemyUsersRepository(uow_factory)
+        self.characters = SQLAlchemyCharactersRepository(uow_factory)
+        self.items = SQLAlchemyItemsRepository(uow_factory)
+        self.character_items = SQLAlchemyCharacterItemsRepository(uow_factory)
+        self.purchases = SQLAlchemyPurchasesRepository(uow_factory)
+        self.daily_activities = SQLAlchemyDailyActivitiesRepository(uow_factory)
+        self.daily_progress = SQLAlchemyDailyProgressRepository(uow_factory)
+        self.mood_history = SQLAlchemyMoodHistoryRepository(uow_factory)
+        self.transactions = SQLAlchemyTransactionsRepository(uow_factory)
+        self.refresh_tokens = SQLAlchemyRefreshTokensRepository(uow_factory)
+        self.token_generations = SQLAlchemyTokenGenerationsRepository(uow_factory)
+        self.user_statistics = SQLAlchemyUserStatisticsRepository(uow_factory)
+
+    async def setup(self, fixture: Fixture, bcrypt_rounds: int) -> None:
+        from src.adapters.database.models.activities import ActivityTypeModel
+        from src.adapters.database.models.catalog import ItemCategoryModel, ItemModel
+        from src.adapters.database.models.characters import CharacterModel
+        from src.adapters.database.models.refresh_token import RefreshTokenModel
+        from src.adapters.database.models.transactions import TransactionModel
+        from src.adapters.database.models.user import UserModel
+        from src.adapters.database.uow import SQLAlchemyUnitOfWork
+
+        user = fixture.user(bcrypt_rounds)
+        _, refresh_token = fixture.refresh_session
+        item = fixture.item()
+        activity_type = fixture.activity_type()
+        async with SQLAlchemyUnitOfWork(self._session_factory) as uow:
+            session = uow.session
+            await session.execute(
+                insert(UserModel).values(
+                    tg_id=fixture.user_tg_id,
+                    password_hash=user.password_hash,
+                    balance=user.balance,
+                )
+            )
+            await session.execute(
+                insert(CharacterModel).values(
+                    id=fixture.character_id, user_tg_id=fixture.user_tg_id
+                )
+            )
+            await session.execute(
+                insert(ItemCategoryModel).values(
+                    id=fixture.item_category_id,
+                    name=f"Benchmark {fixture.item_category_id}",
+                )
+            )
+            await session.execute(
+                insert(ItemModel).values(
+                    id=item.id,
+                    category_id=item.category_id,
+                    name=item.name,
+                    cost=item.cost,
+                )
+            )
+            await session.execute(
+                insert(ActivityTypeModel).values(
+                    id=activity_type.id,
+                    name=activity_type.name,
+                    unit=activity_type.unit,
+                    daily_goal_default=activity_type.daily_goal_default,
+                )
+            )
+            await session.execute(
+                insert(TransactionModel),
+                [
+                    {
+                        "id": transaction.id,
+                        "user_tg_id": fixture.user_tg_id,
+                        "amount": transaction.amount,
+                        "balance_after": transaction.balance_after,
+                        "type": transaction.type,
+                        "timestamp": transaction.timestamp,
+                    }
+                    for transaction in fixture.ledger()
+                ],
+            )
+            await session.execute(
+                insert(RefreshTokenModel).values(
+                    id=refresh_token.id,
+                    user_tg_id=fixture.user_tg_id,
+                    token_hash=refresh_token.token_hash,
+                    jti=refresh_token.jti,
+                    expires_at=refresh_token.expires_at,
+                    family_id=refresh_token.family_id,
+                )
+            )
+
+    async def teardown(self, fixture: Fixture) -> None:
+        from src.adapters.database.models.activities import ActivityTypeModel
+        from src.adapters.database.models.catalog import ItemCategoryModel, ItemModel
+        from src.adapters.database.models.user import UserModel
+        from src.adapters.database.uow import SQLAlchemyUnitOfWork
+
+        # Deleting the user cascades to its character, ledger and tokens.
+        async with SQLAlchemyUnitOfWork(self._session_factory) as uow:
+            await uow.session.execute(
+                delete(UserModel).where(UserModel.tg_id == fixture.user_tg_id)
+            )
+            await uow.session.execute(
+                delete(ItemModel).where(ItemModel.id == fixture.item_id)
+            )
+            await uow.session.execute(
+                delete(ItemCategoryModel).where(
+                    ItemCategoryModel.id == fixture.item_category_id
+                )
+            )
+            await uow.session.execute(
+                delete(ActivityTypeModel).where(
+                    ActivityTypeModel.id == fixture.activity_type_id
+                )
+            )
+        await self._session_manager.close()
+
+    @asynccontextmanager
+    async def operation(self) -> AsyncIterator[Callable[[], int]]:
+        from src.adapters.database.uow import RequestUnitOfWork
+
+        # Never committed: leaving the scope rolls the operation back.
+        async with RequestUnitOfWork(self._session_factory) as uow:
+            yield lambda: uow.statements
+
+
+Operation = Callable[[], Awaitable[object]]
+
+
+def purchase_item(backend: Backend, fixture: Fixture) -> Operation:
+    use_case = PurchaseItemWithBalanceUseCase(
+        purchases_repository=backend.purchases,
+        character_items_repository=backend.character_items,
+        items_repository=backend.items,
+        users_repository=backend.users,
+    )
+    data = PurchaseItemWithBalanceInput(
+        user_tg_id=fixture.user_tg_id,
+        character_id=fixture.character_id,
+        item_id=fixture.item_id,
+    )
+    return lambda: use_case.execute(data)
+
+
+def create_daily_progress(backend: Backend, fixture: Fixture) -> Operation:
+    use_case = CreateDailyProgressUseCase(
+        daily_progress_repository=backend.daily_progress,
+        characters_repository=backend.characters,
+        mood_history_repository=backend.mood_history,
+    )
+    data = CreateDailyProgressInput(
+        character_id=fixture.character_id,
+        date=datetime.now(timezone.utc).replace(tzinfo=None),
+        experience_gained=25,
+        mood_average="happy",
+    )
+    return lambda: use_case.execute(data)
+
+
+def create_daily_activity(backend: Backend, fixture: Fixture) -> Operation:
+    use_case = CreateDailyActivityUseCase(
+        daily_activities_repository=backend.daily_activities
+    )
+    data = CreateDailyActivityInput(
+        character_id=fixture.character_id,
+        activity_type_id=fixture.activity_type_id,
+        date=datetime.now(timezone.utc).replace(tzinfo=None),
+        value=1000,
+    )
+    return lambda: use_case.execute(data)
+
+
+def login(backend: Backend, fixture: Fixture) -> Operation:
+    use_case = LoginUseCase(
+        users_repository=backend.users,
+        refresh_tokens_repository=backend.refresh_tokens,
+        token_generations_repository=backend.token_generations,
+        password_hasher=AsyncPasswordHasher(PasswordHasher()),
+        token_hasher=TokenHasher(),
+        jwt_service=JwtService(),
+    )
+    data = LoginInput(user_tg_id=fixture.user_tg_id, password=fixture.password)
+    return lambda: use_case.execute(data)
+
+
+def refresh(backend: Backend, fixture: Fixture) -> Operation:
+    use_case = RefreshUseCase(
+        users_repository=backend.users,
+        refresh_tokens_repository=backend.refresh_tokens,
+        token_generations_repository=backend.token_generations,
+        token_hasher=TokenHasher(),
+        jwt_service=JwtService(),
+    )
+    refresh_token, _ = fixture.refresh_session
+    data = RefreshInput(refresh_token=refresh_token)
+    return lambda: use_case.execute(data)
+
+
+def list_transactions_page(backend: Backend, fixture: Fixture) -> Operation:
+    use_case = ListTransactionsPageUseCase(transactions_repository=backend.transactions)
+    data = ListTransactionsPageInput(user_tg_id=fixture.user_tg_id, limit=50)
+    return lambda: use_case.execute(data)
+
+
+def user_statistics(backend: Backend, fixture: Fixture) -> Operation:
+    use_case = GetUserStatisticsUseCase(statistics_repository=backend.user_statistics)
+    return lambda: use_case.execute(fixture.user_tg_id)
+
+
+SCENARIOS: dict[str, Callable[[Backend, Fixture], Operation]] = {
+    "purchase_item": purchase_item,
+    "create_daily_progress": create_daily_progress,
+    "create_daily_activity": create_daily_activity,
+    "login": login,
+    "refresh": refresh,
+    "list_transactions_page": list_transactions_page,
+    "user_statistics": user_statistics,
+}
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+async def run_scenario(
+    backend: Backend, operation: Operation, iterations: int, warmup: int
+) -> dict[str, float]:
+    timings: list[float] = []
+    round_trips: list[int] = []
+    for index in range(warmup + iterations):
+        async with backend.operation() as count_round_trips:
+            started = time.perf_counter()
+            await operation()
+            elapsed = time.perf_counter() - started
+            trips = count_round_trips()
+        if index >= warmup:
+            timings.append(elapsed)
+            round_trips.append(trips)
+
+    # A separate pass: tracing allocations slows the operation down.
+    allocations: list[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(min(iterations, 50)):
+            async with backend.operation():
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                await operation()
+                allocations.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    mean = statistics.fmean(timings)
+    return {
+        "ops_per_sec": round(1 / mean, 1),
+        "mean_us": round(mean * 1e6, 1),
+        "p50_us": round(statistics.median(timings) * 1e6, 1),
+        "p99_us": round(_percentile(timings, 0.99) * 1e6, 1),
+        "round_trips": statistics.median(round_trips),
+        "alloc_peak_kib": round(statistics.median(allocations) / 1024, 1),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> None:
+    backend: Backend
+    if args.backend == "memory":
+        backend = MemoryBackend()
+    else:
+        backend = PostgresBackend()
+    fixture = Fixture()
+    names = args.scenario or list(SCENARIOS)
+
+    await backend.setup(fixture, args.bcrypt_rounds)
+    results: dict[str, dict[str, float]] = {}
+    try:
+        for name in names:
+            operation = SCENARIOS[name](backend, fixture)
+            results[name] = await run_scenario(
+                backend, operation, args.iterations, args.warmup
+            )
+            result = results[name]
+            print(
+                f"{name:<24} {result['ops_per_sec']:>10.1f} ops/s "
+                f"p50={result['p50_us']:>9.1f}us p99={result['p99_us']:>9.1f}us "
+                f"round_trips={result['round_trips']:<4} "
+                f"alloc_peak={result['alloc_peak_kib']:.1f}KiB"
+            )
+    finally:
+        await backend.teardown(fixture)
+
+    if args.output:
+        report = {
+            "commit": _git_commit(),
+            "backend": backend.name,
+            "python": platform.python_version(),
+            "iterations": args.iterations,
+            "bcrypt_rounds": args.bcrypt_rounds,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+
+def compare(args: argparse.Namespace) -> None:
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    with open(args.candidate, encoding="utf-8") as candidate_file:
+        candidate = json.load(candidate_file)
+
+    print(f"baseline  {baseline.get('commit')} ({baseline['backend']})")
+    print(f"candidate {candidate.get('commit')} ({candidate['backend']})")
+    for name, after in candidate["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<24} new")
+            continue
+        change = (after["ops_per_sec"] / before["ops_per_sec"] - 1) * 100
+        print(
+            f"{name:<24} ops/s {before['ops_per_sec']:>10.1f} -> "
+            f"{after['ops_per_sec']:>10.1f} ({change:+6.1f}%) "
+            f"round_trips {before['round_trips']} -> {after['round_trips']} "
+            f"alloc_peak {before['alloc_peak_kib']} -> "
+            f"{after['alloc_peak_kib']}KiB"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run")
+    run_parser.add_argument(
+        "--backend", choices=["memory", "postgres"], default="memory"
+    )
+    run_parser.add_argument("--iterations", type=int, default=500)
+    run_parser.add_argument("--warmup", type=int, default=50)
+    run_parser.add_argument(
+        "--bcrypt-rounds",
+        type=int,
+        default=4,
+        help="cost of the fixture password hash; 12 matches production",
+    )
+    run_parser.add_argument("--scenario", action="append", choices=list(SCENARIOS))
+    run_parser.add_argument("--output", help="write results as JSON to this file")
+
+    compare_parser = commands.add_parser("compare")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        asyncio.run(run(args))
+    else:
+        compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Cost of Telegram Mini App init data validation per request.
+
+Compares the uncached path (parse + HMAC on every call) with the verified
+init data cache of ``TelegramMiniAppAuth``.
+
+Usage: python -m benchmarks.tma_auth [--iterations N]
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import time
+from collections.abc import Callable
+from urllib.parse import urlencode
+
+from src.core.auth.telegram_mini_app_auth import TelegramMiniAppAuth
+
+BOT_TOKEN = "123456:benchmarks"
+
+
+def build_init_data(bot_token: str, user_id: int = 1) -> str:
+    """Build init data signed the same way Telegram signs it."""
+    fields = {
+        "auth_date": str(int(time.time())),
+        "query_id": "AAHdF6IQAAAAAN0XohDhrOrc",
+        "user": json.dumps(
+            {"id": user_id, "first_name": "Bench", "language_code": "en"},
+            separators=(",", ":"),
+        ),
+    }
+    data_check_string = "\n".join(f"{key}={fields[key]}" for key in sorted(fields))
+    secret_key = hmac.new(b"WebAppData", bot_token.encode(), hashlib.sha256).digest()
+    fields["hash"] = hmac.new(
+        secret_key, data_check_string.encode(), hashlib.sha256
+    ).hexdigest()
+    return urlencode(fields)
+
+
+def measure(call: Callable[[], object], iterations: int) -> float:
+    """Return the mean duration of ``call`` in microseconds."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    auth = TelegramMiniAppAuth(bot_token=BOT_TOKEN)
+    init_data = build_init_data(BOT_TOKEN)
+    auth.validate_init_data(init_data)
+
+    uncached = measure(lambda: auth._validate_init_data(init_data), args.iterations)
+    cached = measure(lambda: auth.validate_init_data(init_data), args.iterations)
+
+    print(f"uncached: {uncached:8.2f} us/request")
+    print(f"cached:   {cached:8.2f} us/request")
+    print(f"speedup:  {uncached / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Latency of the first and a deep page of the transaction history.
+
+Needs the PostgreSQL database configured through the ``DB_*`` settings. A
+throwaway user with ``--pages * --limit`` transactions is inserted inside a
+transaction that is rolled back at the end, so nothing is left behind.
+
+For page 1 and page ``--pages`` it reports the latency of the keyset query
+used by ``list_page_for_user`` and, for comparison, of the same page fetched
+with ``OFFSET``.
+
+Usage: python -m benchmarks.transactions_pagination [--pages N] [--limit N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+
+from src.adapters.database.models.transactions import TransactionModel
+from src.adapters.database.models.user import UserModel
+from src.adapters.database.session import session_manager
+from src.adapters.database.uow import RequestUnitOfWork, create_unit_of_work
+from src.adapters.repositories.healthity.transactions import (
+    SQLAlchemyTransactionsRepository,
+)
+from src.domain.value_objects.telegram_id import TelegramId
+from src.ports.repositories.healthity.transactions import TransactionsPosition
+
+BENCHMARK_TG_ID = 9_000_000_000_001
+
+
+async def seed(uow: RequestUnitOfWork, count: int) -> None:
+    session = await uow.ensure_session()
+    await session.execute(
+        insert(UserModel).values(tg_id=BENCHMARK_TG_ID, balance=count)
+    )
+    start = datetime(2020, 1, 1)
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "user_tg_id": BENCHMARK_TG_ID,
+            "amount": 1,
+            "balance_after": index + 1,
+            "type": "deposit",
+            "timestamp": start + timedelta(seconds=index),
+        }
+        for index in range(count)
+    ]
+    for offset in range(0, count, 5000):
+        await session.execute(insert(TransactionModel), rows[offset : offset + 5000])
+
+
+async def measure(call: Callable[[], Awaitable[object]], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    session_factory = session_manager.async_session
+    repository = SQLAlchemyTransactionsRepository(
+        uow_factory=lambda: create_unit_of_work(session_factory)
+    )
+    user = TelegramId(BENCHMARK_TG_ID)
+
+    # The request unit of work is never committed: leaving it rolls back.
+    async with RequestUnitOfWork(session_factory) as uow:
+        await seed(uow, args.pages * args.limit)
+        session = await uow.ensure_session()
+
+        async def offset_page(page: int) -> None:
+            await session.execute(
+                select(TransactionModel)
+                .where(TransactionModel.user_tg_id == BENCHMARK_TG_ID)
+                .order_by(TransactionModel.timestamp.desc(), TransactionModel.id.desc())
+                .offset((page - 1) * args.limit)
+                .limit(args.limit)
+            )
+
+        for page in (1, args.pages):
+            after = None
+            if page > 1:
+                # The cursor a client would hold after reading page - 1.
+                last = await session.execute(
+                    select(TransactionModel.timestamp, TransactionModel.id)
+                    .where(TransactionModel.user_tg_id == BENCHMARK_TG_ID)
+                    .order_by(
+                        TransactionModel.timestamp.desc(), TransactionModel.id.desc()
+                    )
+                    .offset((page - 1) * args.limit - 1)
+                    .limit(1)
+                )
+                timestamp, transaction_id = last.one()
+                after = TransactionsPosition(timestamp=timestamp, id=transaction_id)
+
+            keyset = await measure(
+                lambda: repository.list_page_for_user(
+                    user, limit=args.limit, after=after
+                ),
+                args.repeat,
+            )
+            offset = await measure(lambda: offset_page(page), args.repeat)
+            print(
+                f"page {page:>5}: keyset={keyset * 1000:7.2f}ms "
+                f"offset={offset * 1000:7.2f}ms"
+            )
+
+    await session_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""Locks shared by every process connected to the database."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+
+class AdvisoryLeaderLock:
+    """Elects one process, across workers and replicas, to run each job.
+
+    The first process to take the PostgreSQL session-level advisory lock keyed
+    by a job name keeps it and runs that job from then on; the others find it
+    taken and skip their runs. The locks are held on a connection checked out
+    for that purpose only and kept open between runs. When the leader exits or
+    loses that connection, PostgreSQL releases its locks and another process
+    takes over on its next attempt.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        self._connection: AsyncConnection | None = None
+        self._held: set[str] = set()
+        self._guard = asyncio.Lock()
+
+    @asynccontextmanager
+    async def hold(self, name: str) -> AsyncIterator[bool]:
+        yield await self._acquire(name)
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            self._held.clear()
+            # Session locks would outlive a connection returned to the pool.
+            await connection.invalidate()
+            await connection.close()
+
+    async def _acquire(self, name: str) -> bool:
+        async with self._guard:
+            try:
+                if self._connection is None:
+                    self._connection = await self._engine.connect()
+                if name in self._held:
+                    # The lock lives as long as the connection does.
+                    await self._connection.execute(select(1))
+                    acquired = True
+                else:
+                    acquired = bool(
+                        await self._connection.scalar(
+                            select(
+                                func.pg_try_advisory_lock(
+                                    func.hashtextextended(name, 0)
+                                )
+                            )
+                        )
+                    )
+                # Do not sit idle in a transaction until the next run.
+                await self._connection.commit()
+            except Exception:
+                await self.close()
+                raise
+            if acquired:
+                self._held.add(name)
+            return acquired
@@ -1,9 +1,10 @@
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
 
 from alembic import context
 from src.adapters.database import models
+from src.adapters.database.schema import MIGRATION_LOCK_KEY
 from src.core.settings import settings
 
 config = context.config
@@ -53,6 +54,12 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        # Concurrent runners wait here; the lock is released with the
+        # connection, and later runners find nothing left to apply.
+        connection.execute(
+            text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+        )
+        connection.commit()
         context.configure(connection=connection, target_metadata=target_metadata)
 
         with context.begin_transaction():
@@ -0,0 +1,66 @@
+"""single_active_character_background
+
+Revision ID: f3g4h5i6j7k8
+Revises: e2f3g4h5i6j7
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "f3g4h5i6j7k8"
+down_revision: Union[str, Sequence[str], None] = "e2f3g4h5i6j7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+    # Keep only the most recently purchased active background of a character.
+    op.execute(
+        """
+        UPDATE character_backgrounds AS cb
+        SET is_active = false
+        FROM (
+            SELECT id,
+                   row_number() OVER (
+                       PARTITION BY character_id
+                       ORDER BY purchased_at DESC, id DESC
+                   ) AS position
+            FROM character_backgrounds
+            WHERE is_active
+        ) AS ranked
+        WHERE cb.id = ranked.id AND ranked.position > 1
+        """
+    )
+
+    op.drop_index(
+        "idx_character_backgrounds_active", table_name="character_backgrounds"
+    )
+    # An exclusion constraint rather than a unique index: only constraints can
+    # be deferred, and the check has to run at the end of the equip statement.
+    op.create_exclude_constraint(
+        "uq_character_backgrounds_active",
+        "character_backgrounds",
+        ("character_id", "="),
+        where=sa.text("is_active"),
+        using="btree",
+        deferrable=True,
+        initially="IMMEDIATE",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.drop_constraint("uq_character_backgrounds_active", "character_backgrounds")
+    op.create_index(
+        "idx_character_backgrounds_active",
+        "character_backgrounds",
+        ["character_id", "is_active"],
+        postgresql_where=sa.text("is_active = true"),
+    )
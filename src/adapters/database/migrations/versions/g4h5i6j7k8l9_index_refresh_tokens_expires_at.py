@@ -0,0 +1,29 @@
+"""index_refresh_tokens_expires_at
+
+Revision ID: g4h5i6j7k8l9
+Revises: f3g4h5i6j7k8
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "g4h5i6j7k8l9"
+down_revision: Union[str, Sequence[str], None] = "f3g4h5i6j7k8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Lets the pruning job find expired tokens without scanning the table.
+    op.create_index(
+        "ix_refresh_tokens_expires_at", "refresh_tokens", ["expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_refresh_tokens_expires_at", table_name="refresh_tokens")
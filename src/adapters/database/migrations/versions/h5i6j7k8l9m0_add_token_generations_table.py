@@ -0,0 +1,56 @@
+"""add_token_generations_table
+
+Revision ID: h5i6j7k8l9m0
+Revises: g4h5i6j7k8l9
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "h5i6j7k8l9m0"
+down_revision: Union[str, Sequence[str], None] = "g4h5i6j7k8l9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "token_generations",
+        sa.Column(
+            "user_tg_id",
+            sa.BigInteger(),
+            sa.ForeignKey("users.tg_id", ondelete="CASCADE"),
+            primary_key=True,
+            comment="Telegram ID of the user",
+        ),
+        sa.Column(
+            "generation",
+            sa.Integer(),
+            nullable=False,
+            comment="Tokens issued with a lower generation are revoked",
+        ),
+        sa.Column(
+            "revoked_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+            comment="When the generation was last advanced",
+        ),
+    )
+    op.create_index(
+        "ix_token_generations_revoked_at",
+        "token_generations",
+        ["revoked_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_token_generations_revoked_at", table_name="token_generations")
+    op.drop_table("token_generations")
@@ -0,0 +1,37 @@
+"""add_refresh_token_families
+
+Revision ID: i6j7k8l9m0n1
+Revises: h5i6j7k8l9m0
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "i6j7k8l9m0n1"
+down_revision: Union[str, Sequence[str], None] = "h5i6j7k8l9m0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("family_id", sa.dialects.postgresql.UUID(as_uuid=True)),
+    )
+    # Every existing token starts a family of its own.
+    op.execute("UPDATE refresh_tokens SET family_id = id")
+    op.alter_column("refresh_tokens", "family_id", nullable=False)
+    op.create_index(
+        "ix_refresh_tokens_family_id", "refresh_tokens", ["family_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_refresh_tokens_family_id", table_name="refresh_tokens")
+    op.drop_column("refresh_tokens", "family_id")
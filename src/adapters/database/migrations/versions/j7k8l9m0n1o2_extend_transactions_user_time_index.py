@@ -0,0 +1,41 @@
+"""extend_transactions_user_time_index
+
+Revision ID: j7k8l9m0n1o2
+Revises: i6j7k8l9m0n1
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "j7k8l9m0n1o2"
+down_revision: Union[str, Sequence[str], None] = "i6j7k8l9m0n1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Transaction pages are ordered by (timestamp, id) and continue after the
+    # last row of the previous page; with id in the index the tie-breaker and
+    # the keyset condition are resolved by the index scan instead of a sort.
+    op.drop_index("idx_transactions_user_time", table_name="transactions")
+    op.create_index(
+        "idx_transactions_user_time",
+        "transactions",
+        ["user_tg_id", "timestamp", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_transactions_user_time", table_name="transactions")
+    op.create_index(
+        "idx_transactions_user_time",
+        "transactions",
+        ["user_tg_id", "timestamp"],
+        unique=False,
+    )
@@ -0,0 +1,32 @@
+"""add_refresh_token_replaced_by
+
+Revision ID: k8l9m0n1o2p3
+Revises: j7k8l9m0n1o2
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "k8l9m0n1o2p3"
+down_revision: Union[str, Sequence[str], None] = "j7k8l9m0n1o2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tokens revoked before the upgrade cannot tell a rotation from a logout
+    # and are left NULL: presenting them again is not reported as a reuse.
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("replaced_by", sa.dialects.postgresql.UUID(as_uuid=True)),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("refresh_tokens", "replaced_by")
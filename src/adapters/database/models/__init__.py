@@ -5,6 +5,7 @@ from src.adapters.database.models import (
     catalog,
     characters,
     refresh_token,
+    token_generations,
     transactions,
     user,
     user_friends,
@@ -22,4 +23,5 @@ __all__ = (
     "transactions",
     "refresh_token",
     "blacklisted_tokens",
+    "token_generations",
 )
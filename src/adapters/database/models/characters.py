@@ -11,6 +11,7 @@ from sqlalchemy import (
     Numeric,
     String,
     UniqueConstraint,
+    column,
     func,
     text,
 )
@@ -120,10 +121,15 @@ class CharacterBackgroundModel(Base):
             "character_id", "background_id", name="uq_character_background"
         ),
         Index("idx_character_backgrounds_character", "character_id"),
-        Index(
-            "idx_character_backgrounds_active",
-            "character_id",
-            postgresql_where=text("is_active = true"),
+        # At most one active background per character. Deferred to the end of
+        # the statement so a single UPDATE can move the active flag.
+        postgresql.ExcludeConstraint(
+            (column("character_id"), "="),
+            name="uq_character_backgrounds_active",
+            using="btree",
+            where=text("is_active"),
+            deferrable=True,
+            initially="IMMEDIATE",
         ),
     )
 
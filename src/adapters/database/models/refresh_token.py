@@ -23,10 +23,14 @@ class RefreshTokenModel(TimestampMixin, Base):
     token_hash: Mapped[str] = mapped_column(String(length=128), nullable=False)
     jti: Mapped[UUID] = mapped_column(UUID(as_uuid=True), nullable=False, unique=True)
     expires_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False
+        DateTime(timezone=True), index=True, nullable=False
     )
     revoked: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False,
         server_default=text("false"),
     )
+    family_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), index=True, nullable=False
+    )
+    replaced_by: Mapped[UUID | None] = mapped_column(UUID(as_uuid=True))
@@ -0,0 +1,35 @@
+"""SQLAlchemy model for per-user token generations."""
+
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.adapters.database.base import Base
+
+
+class TokenGenerationModel(Base):
+    """Current token generation of a user who has revoked all sessions."""
+
+    __tablename__ = "token_generations"
+
+    user_tg_id: Mapped[int] = mapped_column(
+        sa.BigInteger(),
+        ForeignKey("users.tg_id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Telegram ID of the user",
+    )
+    generation: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Tokens issued with a lower generation are revoked",
+    )
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="When the generation was last advanced",
+    )
+
+    __table_args__ = (Index("ix_token_generations_revoked_at", "revoked_at"),)
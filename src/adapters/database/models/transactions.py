@@ -19,7 +19,7 @@ from src.adapters.database.base import Base
 class TransactionModel(Base):
     __tablename__ = "transactions"
     __table_args__ = (
-        Index("idx_transactions_user_time", "user_tg_id", "timestamp"),
+        Index("idx_transactions_user_time", "user_tg_id", "timestamp", "id"),
         Index("idx_transactions_type", "type"),
         Index("idx_transactions_timestamp", "timestamp"),
     )
@@ -0,0 +1,89 @@
+"""Relation between the database schema and the migrations shipped with the code."""
+
+import asyncio
+import logging
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Key of the PostgreSQL advisory lock held while migrations run, so that
+# concurrent runners apply them one after another.
+MIGRATION_LOCK_KEY = 7_310_420_115
+
+MIGRATIONS_DIRECTORY = Path(__file__).resolve().parent / "migrations"
+
+logger = logging.getLogger(__name__)
+
+
+def expected_revision() -> str | None:
+    """Head revision of the migrations shipped with this build."""
+    # Alembic is only needed here, keep it off the import path of the app.
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory(str(MIGRATIONS_DIRECTORY)).get_current_head()
+
+
+async def current_revision(engine: AsyncEngine) -> str | None:
+    """Revision the database schema is at, ``None`` before the first migration."""
+    async with engine.connect() as connection:
+        exists = await connection.scalar(
+            text("SELECT to_regclass('alembic_version') IS NOT NULL")
+        )
+        if not exists:
+            return None
+        return await connection.scalar(text("SELECT version_num FROM alembic_version"))
+
+
+class SchemaRevisionGate:
+    """Keeps the application read-only until the schema is at the expected head.
+
+    Migrations run separately from the application (``python -m src.migrate``),
+    so a worker may start before they are applied. ``watch`` polls the
+    revision until it matches and then stops: migrations only move forward
+    while the build is running.
+    """
+
+    def __init__(self, engine: AsyncEngine, interval_seconds: float = 5.0) -> None:
+        self._engine = engine
+        self._interval = interval_seconds
+        self.expected: str | None = None
+        self.current: str | None = None
+        self.ready = False
+
+    async def check(self) -> bool:
+        if self.expected is None:
+            self.expected = await asyncio.to_thread(expected_revision)
+        self.current = await current_revision(self._engine)
+        self.ready = self.current == self.expected
+        return self.ready
+
+    async def watch(self) -> None:
+        while True:
+            try:
+                if await self.check():
+                    break
+                stage, data = "behind", {}
+            except (DBAPIError, OSError) as e:
+                stage, data = "unavailable", {"error": str(e)}
+            logger.warning(
+                {
+                    "action": "SchemaRevisionGate.watch",
+                    "stage": stage,
+                    "data": {
+                        "expected": self.expected,
+                        "current": self.current,
+                        **data,
+                    },
+                }
+            )
+            await asyncio.sleep(self._interval)
+
+        logger.info(
+            {
+                "action": "SchemaRevisionGate.watch",
+                "stage": "ready",
+                "data": {"revision": self.current},
+            }
+        )
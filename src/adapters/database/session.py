@@ -1,8 +1,28 @@
+import asyncio
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from src.adapters.database.uow import record_connection_checkout, record_statement
 from src.core.settings import settings
 
 
+@dataclass(frozen=True)
+class PoolStatistics:
+    """Snapshot of the connection pool of an engine."""
+
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    # Connections dropped because they were found dead, most often by the
+    # pre-ping on checkout.
+    invalidations: int
+
+
 class SessionManager:
     """Класс, предоставляющий сессии для проекта."""
 
@@ -12,7 +32,7 @@ class SessionManager:
         echo: bool = False,
         pool_size: int | None = None,
         max_overflow: int | None = None,
-        pool_timeout: int | None = None,
+        pool_timeout: float | None = None,
     ):
         engine_kwargs: dict[str, object] = {
             "echo": echo,
@@ -32,10 +52,17 @@ class SessionManager:
             url=db_dsn,
             **engine_kwargs,
         )
+        self._checkouts = 0
+        self._invalidations = 0
+        event.listen(self.engine.sync_engine, "checkout", record_connection_checkout)
+        event.listen(self.engine.sync_engine, "checkout", self._count_checkout)
+        event.listen(self.engine.sync_engine, "invalidate", self._count_invalidation)
+        event.listen(self.engine.sync_engine, "before_cursor_execute", record_statement)
+        self._session_factory = self.create_session_factory()
 
     @property
     def async_session(self) -> async_sessionmaker[AsyncSession]:
-        return self.create_session_factory()
+        return self._session_factory
 
     def create_session_factory(self) -> async_sessionmaker[AsyncSession]:
         return async_sessionmaker(
@@ -46,11 +73,49 @@ class SessionManager:
             class_=AsyncSession,
         )
 
+    def pool_statistics(self) -> PoolStatistics:
+        pool: Any = self.engine.pool
+        return PoolStatistics(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            checkouts=self._checkouts,
+            invalidations=self._invalidations,
+        )
+
+    async def open(self) -> int:
+        """Establish the connections the pool keeps open and return their number.
+
+        The connections are checked out together, so each one is a new
+        connection rather than the same one returned and reused.
+        """
+        pool: Any = self.engine.pool
+        size = pool.size()
+        async with AsyncExitStack() as stack:
+            await asyncio.gather(
+                *(stack.enter_async_context(self.engine.connect()) for _ in range(size))
+            )
+        return size
+
+    async def ping(self) -> None:
+        """Run a trivial statement on a pooled connection."""
+        async with self.engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
     async def close(self) -> None:
         await self.engine.dispose()
 
+    def _count_checkout(self, *_: Any) -> None:
+        self._checkouts += 1
+
+    def _count_invalidation(self, *_: Any) -> None:
+        self._invalidations += 1
+
 
 session_manager = SessionManager(
     db_dsn=settings.database.async_url,
     echo=settings.database.echo,
+    pool_size=settings.database.pool_size,
+    max_overflow=settings.database.max_overflow,
+    pool_timeout=settings.database.pool_timeout,
 )
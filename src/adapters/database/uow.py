@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from contextlib import AbstractAsyncContextManager
-from typing import Awaitable, Self
+from contextvars import ContextVar, Token
+import time
+from typing import Any, Awaitable, Self
 
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+SessionFactory = Callable[[], AsyncSession | Awaitable[AsyncSession]]
+
 
 class AbstractUnitOfWork(AbstractAsyncContextManager["AbstractUnitOfWork"], ABC):
     """Defines unit of work contract for SQLAlchemy repositories."""
@@ -49,6 +54,14 @@ class AbstractUnitOfWork(AbstractAsyncContextManager["AbstractUnitOfWork"], ABC)
             await self._session.close()
             self._session = None
 
+    def savepoint(self) -> AbstractAsyncContextManager[Any]:
+        """Scope statements that may fail without aborting the transaction.
+
+        When a statement inside the block fails, only what the block did is
+        rolled back and the exception propagates.
+        """
+        return self.session.begin_nested()
+
     @abstractmethod
     async def _create_session(
         self,
@@ -58,9 +71,7 @@ class AbstractUnitOfWork(AbstractAsyncContextManager["AbstractUnitOfWork"], ABC)
 class SQLAlchemyUnitOfWork(AbstractUnitOfWork):
     """Unit of work implementation backed by an async session factory."""
 
-    def __init__(
-        self, session_factory: Callable[[], AsyncSession | Awaitable[AsyncSession]]
-    ) -> None:
+    def __init__(self, session_factory: SessionFactory) -> None:
         super().__init__()
         self._session_factory = session_factory
 
@@ -71,3 +82,158 @@ class SQLAlchemyUnitOfWork(AbstractUnitOfWork):
         if not isinstance(session_or_awaitable, AsyncSession):
             raise TypeError("Session factory must return an AsyncSession instance")
         return session_or_awaitable
+
+
+_current_request_uow: ContextVar["RequestUnitOfWork | None"] = ContextVar(
+    "current_request_uow", default=None
+)
+
+
+def current_request_unit_of_work() -> "RequestUnitOfWork | None":
+    """Return the request unit of work bound to the current context, if any."""
+    request_uow = _current_request_uow.get()
+    if request_uow is None or request_uow.closed:
+        return None
+    return request_uow
+
+
+class RequestUnitOfWork(SQLAlchemyUnitOfWork):
+    """Unit of work shared by every repository resolved within one request.
+
+    The session is opened lazily on first use, so requests that never touch the
+    database do not check out a connection. Nothing is committed implicitly:
+    the owner of the scope calls ``commit`` once the use case succeeded and
+    anything left uncommitted is rolled back when the scope exits.
+    """
+
+    def __init__(self, session_factory: SessionFactory) -> None:
+        super().__init__(session_factory)
+        self.checkouts = 0
+        self.statements = 0
+        self.checkout_wait: float | None = None
+        self.connection_hold: float | None = None
+        self.closed = False
+        self._connected_at: float | None = None
+        self._token: Token["RequestUnitOfWork | None"] | None = None
+        self._after_commit: list[Callable[[], None]] = []
+
+    async def __aenter__(self) -> Self:
+        self._committed = False
+        self.closed = False
+        self.checkouts = 0
+        self.statements = 0
+        self.checkout_wait = None
+        self.connection_hold = None
+        self._connected_at = None
+        self._after_commit = []
+        self._token = _current_request_uow.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            await self.close()
+        finally:
+            if self._connected_at is not None:
+                # Closing the session returns the connection to the pool.
+                self.connection_hold = time.perf_counter() - self._connected_at
+            self.closed = True
+            if self._token is not None:
+                _current_request_uow.reset(self._token)
+                self._token = None
+
+    async def ensure_session(self) -> AsyncSession:
+        if self._session is None:
+            session = await self._create_session()
+            # The session is only opened right before its first statement, so
+            # acquiring the connection here measures the wait for the pool.
+            started = time.perf_counter()
+            await session.connection()
+            self._connected_at = time.perf_counter()
+            self.checkout_wait = self._connected_at - started
+            self._session = session
+        return self._session
+
+    async def commit(self) -> None:
+        if self._session is not None:
+            await self._session.commit()
+        self._committed = True
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once the request transaction has been committed."""
+        self._after_commit.append(callback)
+
+    def participant(self) -> "RequestParticipantUnitOfWork":
+        return RequestParticipantUnitOfWork(self)
+
+
+class RequestParticipantUnitOfWork(AbstractUnitOfWork):
+    """Lets a repository join the request unit of work instead of opening its own.
+
+    Leaving the block only flushes pending changes; the transaction stays open
+    until the request owner commits. Database errors roll back the shared
+    session because it cannot be used any further otherwise; statements that
+    are expected to fail run in ``savepoint`` so the request's other writes
+    survive them.
+    """
+
+    def __init__(self, owner: RequestUnitOfWork) -> None:
+        super().__init__()
+        self._owner = owner
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if isinstance(exc, SQLAlchemyError):
+                await self.rollback()
+            elif exc is None:
+                await self.session.flush()
+        finally:
+            self._session = None
+
+    async def commit(self) -> None:
+        await self.session.flush()
+        self._committed = True
+
+    async def close(self) -> None:
+        self._session = None
+
+    async def _create_session(self) -> AsyncSession:
+        return await self._owner.ensure_session()
+
+
+def create_unit_of_work(session_factory: SessionFactory) -> AbstractUnitOfWork:
+    """Join the active request unit of work or open a standalone one."""
+    request_uow = current_request_unit_of_work()
+    if request_uow is not None:
+        return request_uow.participant()
+    return SQLAlchemyUnitOfWork(session_factory)
+
+
+def run_after_commit(callback: Callable[[], None]) -> None:
+    """Defer ``callback`` until the request transaction commits.
+
+    Outside of a request scope every unit of work commits on exit, so the
+    callback runs right away.
+    """
+    request_uow = current_request_unit_of_work()
+    if request_uow is not None:
+        request_uow.after_commit(callback)
+    else:
+        callback()
+
+
+def record_connection_checkout(*_: Any) -> None:
+    """Pool ``checkout`` listener counting connections used by the current request."""
+    request_uow = _current_request_uow.get()
+    if request_uow is not None:
+        request_uow.checkouts += 1
+
+
+def record_statement(*_: Any) -> None:
+    """Engine ``before_cursor_execute`` listener counting statements of the request."""
+    request_uow = _current_request_uow.get()
+    if request_uow is not None:
+        request_uow.statements += 1
@@ -1,4 +1,7 @@
-from src.adapters.repositories.auth import SQLAlchemyRefreshTokensRepository
+from src.adapters.repositories.auth import (
+    SQLAlchemyRefreshTokensRepository,
+    SQLAlchemyTokenGenerationsRepository,
+)
 from src.adapters.repositories.healthity import (
     SQLAlchemyActivityTypesRepository,
     SQLAlchemyBackgroundsRepository,
@@ -11,14 +14,17 @@ from src.adapters.repositories.healthity import (
     SQLAlchemyItemCategoriesRepository,
     SQLAlchemyItemsRepository,
     SQLAlchemyMoodHistoryRepository,
+    SQLAlchemyPurchasesRepository,
     SQLAlchemyTransactionsRepository,
     SQLAlchemyUserFriendsRepository,
     SQLAlchemyUserSettingsRepository,
+    SQLAlchemyUserStatisticsRepository,
     SQLAlchemyUsersRepository,
 )
 
 __all__ = [
     "SQLAlchemyRefreshTokensRepository",
+    "SQLAlchemyTokenGenerationsRepository",
     "SQLAlchemyUsersRepository",
     "SQLAlchemyUserSettingsRepository",
     "SQLAlchemyUserFriendsRepository",
@@ -34,4 +40,6 @@ __all__ = [
     "SQLAlchemyDailyProgressRepository",
     "SQLAlchemyMoodHistoryRepository",
     "SQLAlchemyTransactionsRepository",
+    "SQLAlchemyPurchasesRepository",
+    "SQLAlchemyUserStatisticsRepository",
 ]
@@ -1,4 +1,12 @@
 from .blacklisted_tokens import SQLAlchemyBlacklistedTokensRepository
 from .refresh_tokens import SQLAlchemyRefreshTokensRepository
+from .revocation_index import BlacklistRevocationIndex, TokenGenerationIndex
+from .token_generations import SQLAlchemyTokenGenerationsRepository
 
-__all__ = ["SQLAlchemyBlacklistedTokensRepository", "SQLAlchemyRefreshTokensRepository"]
+__all__ = [
+    "SQLAlchemyBlacklistedTokensRepository",
+    "SQLAlchemyRefreshTokensRepository",
+    "SQLAlchemyTokenGenerationsRepository",
+    "BlacklistRevocationIndex",
+    "TokenGenerationIndex",
+]
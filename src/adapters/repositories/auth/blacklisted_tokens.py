@@ -9,7 +9,7 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.database.models.blacklisted_tokens import BlacklistedTokenModel
-from src.adapters.database.uow import SQLAlchemyUnitOfWork
+from src.adapters.database.uow import AbstractUnitOfWork
 from src.domain.entities.auth import BlacklistedToken
 from src.ports.repositories.auth import BlacklistedTokensRepository
 
@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 class SQLAlchemyBlacklistedTokensRepository(BlacklistedTokensRepository):
     """SQLAlchemy implementation of blacklisted tokens repository."""
 
-    def __init__(self, uow_factory: Callable[[], SQLAlchemyUnitOfWork]) -> None:
+    def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork]) -> None:
         self._uow_factory = uow_factory
 
     async def add(self, token: BlacklistedToken) -> BlacklistedToken:
@@ -77,36 +77,51 @@ class SQLAlchemyBlacklistedTokensRepository(BlacklistedTokensRepository):
 
             return exists
 
-    async def blacklist_all_for_user(
-        self, user_tg_id: int, reason: str, expires_at: datetime
-    ) -> None:
-        """
-        Blacklist all active tokens for a user.
-
-        Note: This is a marker operation. In a real implementation with active
-        token tracking, you would blacklist specific tokens here.
-        """
-
-        logger.debug(
-            {
-                "action": "SQLAlchemyBlacklistedTokensRepository.blacklist_all_for_user",
-                "stage": "skipped",
-                "data": {
-                    "user_tg_id": user_tg_id,
-                    "reason": "access tokens not tracked individually",
-                },
-            }
-        )
-
-    async def cleanup_expired(self) -> int:
-        """Remove expired tokens from blacklist."""
+    async def list_active(
+        self, blacklisted_since: datetime | None = None
+    ) -> list[BlacklistedToken]:
+        """List blacklist entries that have not expired yet."""
         async with self._uow_factory() as uow:
             session: AsyncSession = uow.session
 
             now = datetime.now(timezone.utc).replace(tzinfo=None)
-            stmt = delete(BlacklistedTokenModel).where(
-                BlacklistedTokenModel.expires_at < now
+            stmt = select(BlacklistedTokenModel).where(
+                BlacklistedTokenModel.expires_at >= now
             )
+            if blacklisted_since is not None:
+                stmt = stmt.where(
+                    BlacklistedTokenModel.blacklisted_at >= blacklisted_since
+                )
+            result = await session.execute(stmt)
+            models = result.scalars().all()
+
+            return [
+                BlacklistedToken(
+                    jti=model.jti,
+                    user_tg_id=model.user_tg_id,
+                    reason=model.reason,
+                    blacklisted_at=model.blacklisted_at,
+                    expires_at=model.expires_at,
+                )
+                for model in models
+            ]
+
+    async def cleanup_expired(self, limit: int | None = None) -> int:
+        """Remove expired tokens from blacklist."""
+        async with self._uow_factory() as uow:
+            session: AsyncSession = uow.session
+
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            expired = BlacklistedTokenModel.expires_at < now
+            if limit is not None:
+                # Rows locked by a concurrent cleanup are left to it.
+                expired = BlacklistedTokenModel.jti.in_(
+                    select(BlacklistedTokenModel.jti)
+                    .where(expired)
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+            stmt = delete(BlacklistedTokenModel).where(expired)
             result = await session.execute(stmt)
             await uow.commit()
 
@@ -116,7 +131,7 @@ class SQLAlchemyBlacklistedTokensRepository(BlacklistedTokensRepository):
                 {
                     "action": "SQLAlchemyBlacklistedTokensRepository.cleanup_expired",
                     "stage": "success",
-                    "data": {"removed_count": count},
+                    "data": {"removed_count": count, "limit": limit},
                 }
             )
 
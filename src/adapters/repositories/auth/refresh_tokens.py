@@ -1,7 +1,18 @@
 from collections.abc import Callable
+from datetime import datetime, timezone
 from uuid import UUID
 
-from sqlalchemy import update
+from sqlalchemy import (
+    ColumnElement,
+    Insert,
+    Update,
+    and_,
+    delete,
+    insert,
+    or_,
+    select,
+    update,
+)
 
 from src.adapters.database.models.refresh_token import RefreshTokenModel
 from src.adapters.database.uow import AbstractUnitOfWork
@@ -16,8 +27,15 @@ class SQLAlchemyRefreshTokensRepository(
 ):
     model = RefreshTokenModel
 
-    def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork]) -> None:
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractUnitOfWork],
+        revocation_uow_factory: Callable[[], AbstractUnitOfWork] | None = None,
+    ) -> None:
         super().__init__(uow_factory)
+        # A detected reuse fails the request, which rolls back the request unit
+        # of work; revoking the family needs a unit of work of its own.
+        self._revocation_uow_factory = revocation_uow_factory or uow_factory
 
     async def create(self, token: RefreshToken) -> RefreshToken:
         model = RefreshTokenModel(
@@ -27,6 +45,8 @@ class SQLAlchemyRefreshTokensRepository(
             jti=token.jti,
             expires_at=token.expires_at,
             revoked=token.revoked,
+            family_id=token.family_id,
+            replaced_by=token.replaced_by,
         )
         saved = await self.add(model)
         return self._to_domain(saved)
@@ -54,11 +74,90 @@ class SQLAlchemyRefreshTokensRepository(
     async def revoke_for_user(self, user_tg_id: TelegramId) -> None:
         async with self._uow() as uow:
             await uow.session.execute(
-                update(RefreshTokenModel)
-                .where(RefreshTokenModel.user_tg_id == user_tg_id.value)
-                .values(revoked=True)
+                self._revoke_active(RefreshTokenModel.user_tg_id == user_tg_id.value)
             )
 
+    async def replace_for_user(self, token: RefreshToken) -> RefreshToken:
+        async with self._uow() as uow:
+            await uow.session.execute(
+                self._revoke_active(
+                    RefreshTokenModel.user_tg_id == token.user_tg_id.value
+                )
+            )
+            await uow.session.execute(self._insert(token))
+        return token
+
+    async def rotate(
+        self, token: RefreshToken, replacement: RefreshToken
+    ) -> RefreshToken | None:
+        async with self._uow() as uow:
+            # Only one of several concurrent rotations finds the token active.
+            result = await uow.session.execute(
+                self._revoke_active(RefreshTokenModel.id == token.id).values(
+                    replaced_by=replacement.jti
+                )
+            )
+            if not result.rowcount:
+                return None
+            await uow.session.execute(self._insert(replacement))
+        token.rotate(replacement.jti)
+        return replacement
+
+    async def revoke_family(self, family_id: UUID) -> int:
+        async with self._revocation_uow_factory() as uow:
+            result = await uow.session.execute(
+                self._revoke_active(RefreshTokenModel.family_id == family_id)
+            )
+            await uow.commit()
+            return result.rowcount or 0
+
+    async def delete_stale(self, revoked_before: datetime, limit: int) -> int:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        stale = (
+            select(RefreshTokenModel.id)
+            .where(
+                or_(
+                    RefreshTokenModel.expires_at < now,
+                    and_(
+                        RefreshTokenModel.revoked,
+                        RefreshTokenModel.updated_at < revoked_before,
+                    ),
+                )
+            )
+            .limit(limit)
+            # Rows locked by a concurrent refresh or cleanup are left to it.
+            .with_for_update(skip_locked=True)
+        )
+        async with self._uow() as uow:
+            result = await uow.session.execute(
+                delete(RefreshTokenModel).where(RefreshTokenModel.id.in_(stale))
+            )
+            return result.rowcount or 0
+
+    @staticmethod
+    def _revoke_active(criterion: ColumnElement[bool]) -> Update:
+        # Tokens revoked earlier keep their updated_at, which their retention
+        # is counted from.
+        return (
+            update(RefreshTokenModel)
+            .where(criterion, ~RefreshTokenModel.revoked)
+            .values(revoked=True)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _insert(token: RefreshToken) -> Insert:
+        return insert(RefreshTokenModel).values(
+            id=token.id,
+            user_tg_id=token.user_tg_id.value,
+            token_hash=token.token_hash,
+            jti=token.jti,
+            expires_at=token.expires_at,
+            revoked=token.revoked,
+            family_id=token.family_id,
+            replaced_by=token.replaced_by,
+        )
+
     @staticmethod
     def _to_domain(model: RefreshTokenModel) -> RefreshToken:
         return RefreshToken(
@@ -68,6 +167,8 @@ class SQLAlchemyRefreshTokensRepository(
             jti=model.jti,
             expires_at=model.expires_at,
             revoked=model.revoked,
+            family_id=model.family_id,
+            replaced_by=model.replaced_by,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
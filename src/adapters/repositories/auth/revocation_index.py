@@ -0,0 +1,253 @@
+"""In-memory revocation indexes in front of the token repositories."""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+from uuid import UUID
+
+from src.domain.entities.auth import BlacklistedToken, TokenGeneration
+from src.ports.repositories.auth import (
+    BlacklistedTokensRepository,
+    TokenGenerationsRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Entries are pulled by the time they were stamped; a transaction that stamped
+# its row earlier but committed after the previous refresh must still be
+# picked up.
+_COMMIT_LAG = timedelta(seconds=30)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class _RefreshingIndex(ABC):
+    """Pulls entries newer than the last one seen at most every interval."""
+
+    def __init__(self, refresh_interval: float, clock: Callable[[], float]) -> None:
+        self._refresh_interval = refresh_interval
+        self._clock = clock
+        self._watermark: datetime | None = None
+        self._refreshed_at: float | None = None
+        self._refresh_lock = asyncio.Lock()
+
+    async def refresh(self) -> None:
+        """Load the index now, unless it was refreshed within the interval."""
+        await self._refresh_if_stale()
+
+    @abstractmethod
+    async def _pull(self, since: datetime | None) -> int:
+        """Index the entries stamped at or after ``since``; return their count."""
+
+    @abstractmethod
+    def _prune_expired(self) -> None: ...
+
+    @abstractmethod
+    def _size(self) -> int: ...
+
+    def _advance_watermark(self, stamped_at: datetime) -> None:
+        if self._watermark is None or stamped_at > self._watermark:
+            self._watermark = stamped_at
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._refreshed_at is not None
+            and self._clock() - self._refreshed_at < self._refresh_interval
+        )
+
+    async def _refresh_if_stale(self) -> None:
+        if self._is_fresh():
+            return
+
+        async with self._refresh_lock:
+            if self._is_fresh():
+                return
+
+            since = None
+            if self._refreshed_at is not None and self._watermark is not None:
+                since = self._watermark - _COMMIT_LAG
+
+            fetched = await self._pull(since)
+            self._prune_expired()
+            self._refreshed_at = self._clock()
+
+            logger.debug(
+                {
+                    "action": f"{type(self).__name__}.refresh",
+                    "stage": "refreshed",
+                    "data": {
+                        "incremental": since is not None,
+                        "fetched": fetched,
+                        "indexed": self._size(),
+                    },
+                }
+            )
+
+
+class BlacklistRevocationIndex(_RefreshingIndex, BlacklistedTokensRepository):
+    """
+    Answers negative blacklist lookups from memory.
+
+    The index holds the jtis of unexpired blacklist entries. It is preloaded
+    from ``repository`` on first use and then pulls newer entries at most every
+    ``refresh_interval`` seconds. A jti missing from the index is reported as
+    not blacklisted without a database round trip; a jti present in it is
+    confirmed by ``repository``, which stays the source of truth.
+
+    Entries added through this instance are indexed immediately. Entries added
+    by other processes become visible after the next refresh.
+    """
+
+    def __init__(
+        self,
+        repository: BlacklistedTokensRepository,
+        refresh_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(refresh_interval, clock)
+        self._repository = repository
+        self._expires_at: dict[UUID, datetime] = {}
+
+    async def add(self, token: BlacklistedToken) -> BlacklistedToken:
+        """Add a token to the blacklist and index it right away."""
+        stored = await self._repository.add(token)
+        self._index(stored)
+        return stored
+
+    async def is_blacklisted(self, jti: UUID) -> bool:
+        """Check if a token JTI is blacklisted."""
+        await self._refresh_if_stale()
+        if jti not in self._expires_at:
+            return False
+
+        is_blacklisted = await self._repository.is_blacklisted(jti)
+        if not is_blacklisted:
+            # The entry never got committed or has been cleaned up since.
+            self._expires_at.pop(jti, None)
+        return is_blacklisted
+
+    async def list_active(
+        self, blacklisted_since: datetime | None = None
+    ) -> list[BlacklistedToken]:
+        """List blacklist entries that have not expired yet."""
+        return await self._repository.list_active(blacklisted_since)
+
+    async def cleanup_expired(self, limit: int | None = None) -> int:
+        """Remove expired tokens from blacklist and from the index."""
+        removed = await self._repository.cleanup_expired(limit)
+        self._prune_expired()
+        return removed
+
+    def _index(self, token: BlacklistedToken) -> None:
+        self._expires_at[token.jti] = _naive_utc(token.expires_at)
+        self._advance_watermark(_naive_utc(token.blacklisted_at))
+
+    async def _pull(self, since: datetime | None) -> int:
+        tokens = await self._repository.list_active(since)
+        for token in tokens:
+            self._index(token)
+        return len(tokens)
+
+    def _prune_expired(self) -> None:
+        now = _utcnow()
+        expired = [jti for jti, expires in self._expires_at.items() if expires < now]
+        for jti in expired:
+            del self._expires_at[jti]
+
+    def _size(self) -> int:
+        return len(self._expires_at)
+
+
+class TokenGenerationIndex(_RefreshingIndex, TokenGenerationsRepository):
+    """
+    Answers token generation checks from memory.
+
+    The index holds the generations advanced within the last ``retention``,
+    the lifetime of an access token: every token issued before an older
+    revocation has expired since. It is preloaded from ``repository`` on first
+    use and then pulls newer generations at most every ``refresh_interval``
+    seconds, so checking a token never waits on the database.
+
+    Generations advanced through this instance are indexed immediately; ones
+    advanced by other processes become visible after the next refresh. Tokens
+    are issued with the generation read from ``repository``, never from the
+    index, so a lagging index cannot issue tokens that are revoked from birth.
+    """
+
+    def __init__(
+        self,
+        repository: TokenGenerationsRepository,
+        retention: timedelta,
+        refresh_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(refresh_interval, clock)
+        self._repository = repository
+        self._retention = retention
+        self._generations: dict[int, TokenGeneration] = {}
+
+    async def get(self, user_tg_id: int) -> int:
+        """Return the current token generation of a user."""
+        return await self._repository.get(user_tg_id)
+
+    async def advance(self, user_tg_id: int) -> TokenGeneration:
+        """Advance the generation of a user and index it right away."""
+        stored = await self._repository.advance(user_tg_id)
+        self._index(stored)
+        return stored
+
+    async def is_revoked(self, user_tg_id: int, generation: int) -> bool:
+        """Check if tokens of ``generation`` issued to a user are revoked."""
+        await self._refresh_if_stale()
+        known = self._generations.get(user_tg_id)
+        return known is not None and generation < known.generation
+
+    async def list_revoked(
+        self, revoked_since: datetime | None = None
+    ) -> list[TokenGeneration]:
+        """List the generations of users who have revoked their sessions."""
+        return await self._repository.list_revoked(revoked_since)
+
+    def _index(self, generation: TokenGeneration) -> None:
+        revoked_at = _naive_utc(generation.revoked_at)
+        known = self._generations.get(generation.user_tg_id)
+        # Generations only grow; an older row pulled late must not win.
+        if known is None or generation.generation > known.generation:
+            self._generations[generation.user_tg_id] = TokenGeneration(
+                user_tg_id=generation.user_tg_id,
+                generation=generation.generation,
+                revoked_at=revoked_at,
+            )
+        self._advance_watermark(revoked_at)
+
+    async def _pull(self, since: datetime | None) -> int:
+        if since is None:
+            since = _utcnow() - self._retention - _COMMIT_LAG
+        generations = await self._repository.list_revoked(since)
+        for generation in generations:
+            self._index(generation)
+        return len(generations)
+
+    def _prune_expired(self) -> None:
+        horizon = _utcnow() - self._retention - _COMMIT_LAG
+        expired = [
+            user_tg_id
+            for user_tg_id, generation in self._generations.items()
+            if generation.revoked_at < horizon
+        ]
+        for user_tg_id in expired:
+            del self._generations[user_tg_id]
+
+    def _size(self) -> int:
+        return len(self._generations)
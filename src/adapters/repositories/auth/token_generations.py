@@ -0,0 +1,92 @@
+"""SQLAlchemy implementation of token generations repository."""
+
+import logging
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.database.models.token_generations import TokenGenerationModel
+from src.adapters.database.uow import AbstractUnitOfWork
+from src.domain.entities.auth import TokenGeneration
+from src.ports.repositories.auth import TokenGenerationsRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SQLAlchemyTokenGenerationsRepository(TokenGenerationsRepository):
+    """SQLAlchemy implementation of token generations repository."""
+
+    def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork]) -> None:
+        self._uow_factory = uow_factory
+
+    async def get(self, user_tg_id: int) -> int:
+        """Return the current token generation of a user."""
+        async with self._uow_factory() as uow:
+            session: AsyncSession = uow.session
+
+            stmt = select(TokenGenerationModel.generation).where(
+                TokenGenerationModel.user_tg_id == user_tg_id
+            )
+            generation = await session.scalar(stmt)
+            return generation or 0
+
+    async def advance(self, user_tg_id: int) -> TokenGeneration:
+        """Revoke every token issued to a user so far with a single write."""
+        async with self._uow_factory() as uow:
+            session: AsyncSession = uow.session
+
+            stmt = postgresql.insert(TokenGenerationModel).values(
+                user_tg_id=user_tg_id, generation=1, revoked_at=func.now()
+            )
+            # The row lock taken by the upsert orders concurrent revocations.
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[TokenGenerationModel.user_tg_id],
+                set_={
+                    "generation": TokenGenerationModel.generation + 1,
+                    "revoked_at": func.now(),
+                },
+            ).returning(TokenGenerationModel)
+            result = await session.execute(stmt)
+            model = result.scalar_one()
+            await uow.commit()
+
+            logger.info(
+                {
+                    "action": "SQLAlchemyTokenGenerationsRepository.advance",
+                    "stage": "success",
+                    "data": {
+                        "user_tg_id": user_tg_id,
+                        "generation": model.generation,
+                    },
+                }
+            )
+
+            return self._to_domain(model)
+
+    async def is_revoked(self, user_tg_id: int, generation: int) -> bool:
+        """Check if tokens of ``generation`` issued to a user are revoked."""
+        return generation < await self.get(user_tg_id)
+
+    async def list_revoked(
+        self, revoked_since: datetime | None = None
+    ) -> list[TokenGeneration]:
+        """List the generations of users who have revoked their sessions."""
+        async with self._uow_factory() as uow:
+            session: AsyncSession = uow.session
+
+            stmt = select(TokenGenerationModel)
+            if revoked_since is not None:
+                stmt = stmt.where(TokenGenerationModel.revoked_at >= revoked_since)
+            result = await session.execute(stmt)
+            return [self._to_domain(model) for model in result.scalars().all()]
+
+    @staticmethod
+    def _to_domain(model: TokenGenerationModel) -> TokenGeneration:
+        return TokenGeneration(
+            user_tg_id=model.user_tg_id,
+            generation=model.generation,
+            revoked_at=model.revoked_at,
+        )
@@ -1,9 +1,11 @@
 import logging
+import re
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, AsyncIterator, Callable, Generic, TypeVar
+from functools import cache
+from typing import Any, AsyncIterator, Callable, Generic, Sequence, TypeVar
 
-from sqlalchemy import Select, select
+from sqlalchemy import Row, Select, inspect, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from src.adapters.database.base import Base
@@ -19,11 +21,24 @@ logger = logging.getLogger(__name__)
 
 ModelT = TypeVar("ModelT", bound=Base)
 
+FOREIGN_KEY_VIOLATION = "23503"
+# PostgreSQL detail of a foreign key violation: 'Key (item_id)=(...) is not
+# present in table "items".'
+_FOREIGN_KEY_DETAIL = re.compile(r"Key \((?P<column>[^)]+)\)=")
+
+
+@cache
+def _mapped_columns(model: type[Base]) -> tuple[Any, ...]:
+    return tuple(getattr(model, column.key) for column in inspect(model).column_attrs)
+
 
 class SQLAlchemyRepository(Generic[ModelT]):
     """Provides common helpers for repositories backed by SQLAlchemy models."""
 
     model: type[ModelT]
+    # Foreign key column -> entity named in the not-found error raised when
+    # the database rejects a row referencing a missing entity.
+    foreign_key_entities: dict[str, str] = {}
 
     def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork]) -> None:
         self._uow_factory = uow_factory
@@ -48,19 +63,31 @@ class SQLAlchemyRepository(Generic[ModelT]):
 
                     pass
 
-    async def _check_entity_exists(
-        self, model_class: type[Base], entity_id: Any, entity_name: str
-    ) -> None:
-        """Check if entity exists, raise EntityNotFoundException if not"""
-        async with self._uow() as uow:
-            entity = await uow.session.get(model_class, entity_id)
-            if entity is None:
-                raise EntityNotFoundException(f"{entity_name} not found")
-
-    async def _validate_foreign_keys(self, instance: ModelT) -> None:
-        """Validate foreign key constraints before adding instance"""
-
-        pass
+    def _foreign_key_violation(
+        self, exc: IntegrityError
+    ) -> EntityNotFoundException | None:
+        """Translate a foreign key violation into the domain not-found error.
+
+        Referenced rows are not checked up front: the insert itself is the
+        check, so the happy path costs no extra round trips.
+        """
+        error = exc.orig
+        driver_error = getattr(error, "__cause__", None) or error
+        sqlstate = getattr(error, "sqlstate", None) or getattr(
+            driver_error, "sqlstate", None
+        )
+        message = str(error)
+        if (
+            sqlstate != FOREIGN_KEY_VIOLATION
+            and "violates foreign key constraint" not in message
+        ):
+            return None
+
+        match = _FOREIGN_KEY_DETAIL.search(
+            getattr(driver_error, "detail", None) or message
+        )
+        entity_name = self.foreign_key_entities.get(match["column"]) if match else None
+        return EntityNotFoundException(f"{entity_name or 'Related entity'} not found")
 
     async def add(self, instance: ModelT) -> ModelT:
         async with self._uow() as uow:
@@ -68,15 +95,19 @@ class SQLAlchemyRepository(Generic[ModelT]):
 
             self._make_datetime_naive(instance)
 
-            await self._validate_foreign_keys(instance)
-
-            uow.session.add(instance)
             try:
-                await uow.session.flush()
+                # A rejected insert must not roll back the other writes of
+                # the request transaction it may be part of.
+                async with uow.savepoint():
+                    uow.session.add(instance)
+                    await uow.session.flush()
                 await uow.session.refresh(instance)
                 logger.debug(f"Successfully added instance: {instance}")
             except IntegrityError as exc:
-                await uow.rollback()
+                not_found = self._foreign_key_violation(exc)
+                if not_found is not None:
+                    logger.info(f"Foreign key violated: {not_found}")
+                    raise not_found from exc
 
                 error_msg = str(exc.orig) if hasattr(exc, "orig") else str(exc)
                 logger.error(f"IntegrityError: {error_msg}")
@@ -97,8 +128,6 @@ class SQLAlchemyRepository(Generic[ModelT]):
                         "Integrity constraint violated"
                     ) from exc
             except SQLAlchemyError as exc:
-                await uow.rollback()
-
                 if isinstance(exc, IntegrityError):
                     error_msg = str(exc.orig) if hasattr(exc, "orig") else str(exc)
                     logger.error(f"IntegrityError in SQLAlchemyError: {error_msg}")
@@ -158,6 +187,30 @@ class SQLAlchemyRepository(Generic[ModelT]):
             result = await uow.session.execute(stmt)
             return list(result.scalars().all())
 
+    def _select_rows(self) -> Select[Any]:
+        """Select every mapped column of ``model`` as plain rows.
+
+        A row carries the mapped attribute names, so ``_to_domain`` reads it as
+        it reads a model instance. The session builds no instance for it and
+        keeps nothing in its identity map, so use it for read-only queries:
+        the rows are not tracked and changes are never flushed back.
+        """
+        return select(*_mapped_columns(self.model))
+
+    async def list_rows(
+        self,
+        /,
+        *,
+        filters: dict[str, Any] | None = None,
+        statement: Select[Any] | None = None,
+    ) -> Sequence[Row[Any]]:
+        stmt = statement if statement is not None else self._select_rows()
+        if filters:
+            stmt = stmt.filter_by(**filters)
+        async with self._uow() as uow:
+            result = await uow.session.execute(stmt)
+            return result.all()
+
     async def first(
         self,
         /,
@@ -23,6 +23,12 @@ from src.adapters.repositories.healthity.activities import (
 from src.adapters.repositories.healthity.transactions import (
     SQLAlchemyTransactionsRepository,
 )
+from src.adapters.repositories.healthity.purchases import (
+    SQLAlchemyPurchasesRepository,
+)
+from src.adapters.repositories.healthity.statistics import (
+    SQLAlchemyUserStatisticsRepository,
+)
 
 __all__ = [
     "SQLAlchemyUsersRepository",
@@ -40,4 +46,6 @@ __all__ = [
     "SQLAlchemyDailyProgressRepository",
     "SQLAlchemyMoodHistoryRepository",
     "SQLAlchemyTransactionsRepository",
+    "SQLAlchemyPurchasesRepository",
+    "SQLAlchemyUserStatisticsRepository",
 ]
@@ -1,8 +1,10 @@
 from collections.abc import Callable
 import uuid
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import delete, select
+from sqlalchemy import DateTime, Integer, Text, delete, func, literal, select
+from sqlalchemy.dialects import postgresql
 
 from src.adapters.database.models.activities import (
     ActivityTypeModel,
@@ -11,7 +13,7 @@ from src.adapters.database.models.activities import (
     MoodHistoryModel,
 )
 from src.adapters.database.uow import AbstractUnitOfWork
-from src.adapters.repositories.base import SQLAlchemyRepository
+from src.adapters.repositories.base import ModelT, SQLAlchemyRepository
 from src.domain.entities.healthity.activities import (
     ActivityType,
     DailyActivity,
@@ -25,6 +27,24 @@ from src.ports.repositories.healthity.activities import (
     MoodHistoryRepository,
 )
 
+_UUID = postgresql.UUID(as_uuid=True)
+
+
+async def _execute_upsert(
+    uow: AbstractUnitOfWork, model: type[ModelT], statement: Any
+) -> ModelT | None:
+    """Run an ``INSERT ... ON CONFLICT ... RETURNING`` and load the row it returns.
+
+    ``populate_existing`` refreshes an instance of the row that the session may
+    already hold from an earlier read.
+    """
+    result = await uow.session.execute(
+        select(model)
+        .from_statement(statement)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
 
 class SQLAlchemyActivityTypesRepository(
     SQLAlchemyRepository[ActivityTypeModel], ActivityTypesRepository
@@ -35,8 +55,8 @@ class SQLAlchemyActivityTypesRepository(
         super().__init__(uow_factory)
 
     async def list_all(self) -> list[ActivityType]:
-        models = await self.list()
-        return [self._to_domain(model) for model in models]
+        rows = await self.list_rows()
+        return [self._to_domain(row) for row in rows]
 
     async def get_by_name(self, name: str) -> ActivityType | None:
         model = await self.first(filters={"name": name})
@@ -108,15 +128,15 @@ class SQLAlchemyDailyActivitiesRepository(
     async def list_for_day(
         self, character_id: uuid.UUID, day: datetime
     ) -> list[DailyActivity]:
-        models = await self.list(filters={"character_id": character_id, "date": day})
-        return [self._to_domain(model) for model in models]
+        rows = await self.list_rows(filters={"character_id": character_id, "date": day})
+        return [self._to_domain(row) for row in rows]
 
     async def list_for_date_range(
         self, character_id: uuid.UUID, start_date: datetime, end_date: datetime
     ) -> list[DailyActivity]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(DailyActivityModel)
+                self._select_rows()
                 .where(
                     DailyActivityModel.character_id == character_id,
                     DailyActivityModel.date >= start_date,
@@ -124,32 +144,59 @@ class SQLAlchemyDailyActivitiesRepository(
                 )
                 .order_by(DailyActivityModel.date.desc())
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
-
-    async def upsert(self, activity: DailyActivity) -> DailyActivity:
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
+
+    async def add_value(
+        self,
+        character_id: uuid.UUID,
+        activity_type_id: uuid.UUID,
+        date: datetime,
+        value: int,
+        goal: int | None = None,
+        notes: str | None = None,
+    ) -> DailyActivity | None:
+        # Selecting from the activity type both yields its default goal and
+        # inserts nothing when it does not exist. Concurrent calls for the same
+        # day are serialized on the unique key, so no increment is lost.
+        source = select(
+            literal(uuid.uuid4(), _UUID),
+            literal(character_id, _UUID),
+            ActivityTypeModel.id,
+            literal(date, DateTime),
+            literal(value, Integer),
+            func.coalesce(literal(goal, Integer), ActivityTypeModel.daily_goal_default),
+            literal(notes, Text),
+        ).where(ActivityTypeModel.id == activity_type_id)
+        statement = postgresql.insert(DailyActivityModel).from_select(
+            [
+                "id",
+                "character_id",
+                "activity_type_id",
+                "date",
+                "value",
+                "goal",
+                "notes",
+            ],
+            source,
+        )
+        statement = statement.on_conflict_do_update(
+            constraint="uq_daily_activity",
+            set_={
+                "value": DailyActivityModel.value + statement.excluded.value,
+                "goal": (
+                    statement.excluded.goal
+                    if goal is not None
+                    else DailyActivityModel.goal
+                ),
+                "notes": statement.excluded.notes,
+                "updated_at": func.now(),
+            },
+        ).returning(DailyActivityModel)
         async with self._uow() as uow:
-            model = await uow.session.get(DailyActivityModel, activity.id)
+            model = await _execute_upsert(uow, DailyActivityModel, statement)
             if model is None:
-                model = DailyActivityModel(
-                    id=activity.id,
-                    character_id=activity.character_id,
-                    activity_type_id=activity.activity_type_id,
-                    date=activity.date,
-                    value=activity.value,
-                    goal=activity.goal,
-                    notes=activity.notes,
-                    created_at=activity.created_at,
-                    updated_at=activity.updated_at,
-                )
-                uow.session.add(model)
-            else:
-                model.value = activity.value
-                model.goal = activity.goal
-                model.notes = activity.notes
-
-            await uow.session.flush()
-            await uow.session.refresh(model)
+                return None
             return self._to_domain(model)
 
     async def get_by_id(self, activity_id: uuid.UUID) -> DailyActivity | None:
@@ -233,7 +280,7 @@ class SQLAlchemyDailyProgressRepository(
     ) -> list[DailyProgress]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(DailyProgressModel)
+                self._select_rows()
                 .where(
                     DailyProgressModel.character_id == character_id,
                     DailyProgressModel.date >= start_date,
@@ -241,38 +288,51 @@ class SQLAlchemyDailyProgressRepository(
                 )
                 .order_by(DailyProgressModel.date.desc())
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
-
-    async def upsert(self, progress: DailyProgress) -> DailyProgress:
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
+
+    async def add_experience(
+        self,
+        character_id: uuid.UUID,
+        date: datetime,
+        experience_gained: int,
+        level_at_end: int,
+        mood_average: str | None = None,
+        behavior_index: int | None = None,
+    ) -> DailyProgress:
+        statement = postgresql.insert(DailyProgressModel).values(
+            id=uuid.uuid4(),
+            character_id=character_id,
+            date=date,
+            experience_gained=experience_gained,
+            level_at_end=level_at_end,
+            mood_average=mood_average,
+            behavior_index=behavior_index,
+        )
+        excluded = statement.excluded
+        statement = statement.on_conflict_do_update(
+            constraint="uq_daily_progress",
+            set_={
+                "experience_gained": (
+                    DailyProgressModel.experience_gained + excluded.experience_gained
+                ),
+                "level_at_end": excluded.level_at_end,
+                "mood_average": func.coalesce(
+                    excluded.mood_average, DailyProgressModel.mood_average
+                ),
+                "behavior_index": func.coalesce(
+                    excluded.behavior_index, DailyProgressModel.behavior_index
+                ),
+                "updated_at": func.now(),
+            },
+        ).returning(DailyProgressModel)
         async with self._uow() as uow:
-            model = await uow.session.get(DailyProgressModel, progress.id)
-            if model is None:
-                model = DailyProgressModel(
-                    id=progress.id,
-                    character_id=progress.character_id,
-                    date=progress.date,
-                    experience_gained=progress.experience_gained,
-                    level_at_end=progress.level_at_end,
-                    mood_average=progress.mood_average,
-                    behavior_index=progress.behavior_index,
-                    created_at=progress.created_at,
-                    updated_at=progress.updated_at,
-                )
-                uow.session.add(model)
-            else:
-                model.experience_gained = progress.experience_gained
-                model.level_at_end = progress.level_at_end
-                model.mood_average = progress.mood_average
-                model.behavior_index = progress.behavior_index
-
-            await uow.session.flush()
-            await uow.session.refresh(model)
+            model = await _execute_upsert(uow, DailyProgressModel, statement)
             return self._to_domain(model)
 
     async def list_for_character(self, character_id: uuid.UUID) -> list[DailyProgress]:
-        models = await self.list(filters={"character_id": character_id})
-        return [self._to_domain(model) for model in models]
+        rows = await self.list_rows(filters={"character_id": character_id})
+        return [self._to_domain(row) for row in rows]
 
     async def get_by_id(self, progress_id: uuid.UUID) -> DailyProgress | None:
         async with self._uow() as uow:
@@ -342,33 +402,33 @@ class SQLAlchemyMoodHistoryRepository(
     ) -> list[MoodHistory]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(MoodHistoryModel)
+                self._select_rows()
                 .where(MoodHistoryModel.character_id == character_id)
                 .order_by(MoodHistoryModel.timestamp.desc())
                 .limit(limit)
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def list_for_character(
         self, character_id: uuid.UUID, limit: int = 100
     ) -> list[MoodHistory]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(MoodHistoryModel)
+                self._select_rows()
                 .where(MoodHistoryModel.character_id == character_id)
                 .order_by(MoodHistoryModel.timestamp.desc())
                 .limit(limit)
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def list_for_date_range(
         self, character_id: uuid.UUID, start_date: datetime, end_date: datetime
     ) -> list[MoodHistory]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(MoodHistoryModel)
+                self._select_rows()
                 .where(
                     MoodHistoryModel.character_id == character_id,
                     MoodHistoryModel.timestamp >= start_date,
@@ -376,8 +436,8 @@ class SQLAlchemyMoodHistoryRepository(
                 )
                 .order_by(MoodHistoryModel.timestamp.desc())
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def get_by_id(self, mood_id: uuid.UUID) -> MoodHistory | None:
         model = await self.first(filters={"id": mood_id})
@@ -1,7 +1,6 @@
 from collections.abc import Callable
 import uuid
 
-from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from src.adapters.database.models.catalog import (
@@ -32,8 +31,8 @@ class SQLAlchemyItemCategoriesRepository(
         super().__init__(uow_factory)
 
     async def list_all(self) -> list[ItemCategory]:
-        models = await self.list()
-        return [self._to_domain(model) for model in models]
+        rows = await self.list_rows()
+        return [self._to_domain(row) for row in rows]
 
     async def get_by_name(self, name: str) -> ItemCategory | None:
         model = await self.first(filters={"name": name})
@@ -87,20 +86,20 @@ class SQLAlchemyItemsRepository(SQLAlchemyRepository[ItemModel], ItemsRepository
         return self._to_domain(model)
 
     async def list_by_category(self, category_id: uuid.UUID) -> list[Item]:
-        models = await self.list(filters={"category_id": category_id})
-        return [self._to_domain(model) for model in models]
+        rows = await self.list_rows(filters={"category_id": category_id})
+        return [self._to_domain(row) for row in rows]
 
     async def list_all(self, limit: int = 100, offset: int = 0) -> list[Item]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(ItemModel).limit(limit).offset(offset)
+                self._select_rows().limit(limit).offset(offset)
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def list_available(self) -> list[Item]:
-        models = await self.list(filters={"is_available": True})
-        return [self._to_domain(model) for model in models]
+        rows = await self.list_rows(filters={"is_available": True})
+        return [self._to_domain(row) for row in rows]
 
     async def add(self, item: Item) -> Item:
         model = ItemModel(
@@ -131,11 +130,11 @@ class SQLAlchemyItemsRepository(SQLAlchemyRepository[ItemModel], ItemsRepository
             model.is_available = item.is_available
 
             try:
-                await uow.session.flush()
+                async with uow.savepoint():
+                    await uow.session.flush()
                 await uow.session.refresh(model)
                 return self._to_domain(model)
             except IntegrityError as exc:
-                await uow.rollback()
                 error_msg = str(exc.orig) if hasattr(exc, "orig") else str(exc)
                 if (
                     "check constraint" in error_msg.lower()
@@ -149,7 +148,6 @@ class SQLAlchemyItemsRepository(SQLAlchemyRepository[ItemModel], ItemsRepository
                         "Integrity constraint violated"
                     ) from exc
             except SQLAlchemyError as exc:
-                await uow.rollback()
                 raise RepositoryError("Database operation failed") from exc
 
     async def delete(self, item_id: uuid.UUID) -> None:
@@ -191,14 +189,14 @@ class SQLAlchemyBackgroundsRepository(
     async def list_all(self, limit: int = 100, offset: int = 0) -> list[Background]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(BackgroundModel).limit(limit).offset(offset)
+                self._select_rows().limit(limit).offset(offset)
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def list_available(self) -> list[Background]:
-        models = await self.list(filters={"is_available": True})
-        return [self._to_domain(model) for model in models]
+        rows = await self.list_rows(filters={"is_available": True})
+        return [self._to_domain(row) for row in rows]
 
     async def add(self, background: Background) -> Background:
         model = BackgroundModel(
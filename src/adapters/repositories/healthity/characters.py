@@ -1,7 +1,9 @@
 from collections.abc import Callable
 import uuid
 
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import func, select, update
 
 from src.adapters.database.models.characters import (
     CharacterBackgroundModel,
@@ -9,7 +11,6 @@ from src.adapters.database.models.characters import (
     CharacterModel,
     ItemBackgroundPositionModel,
 )
-from src.adapters.database.models.catalog import ItemModel, BackgroundModel
 from src.adapters.database.uow import AbstractUnitOfWork
 from src.adapters.repositories.base import SQLAlchemyRepository
 from src.adapters.repositories.exceptions import RepositoryError
@@ -51,10 +52,10 @@ class SQLAlchemyCharactersRepository(
     async def list_all(self, limit: int = 100, offset: int = 0) -> list[Character]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(CharacterModel).limit(limit).offset(offset)
+                self._select_rows().limit(limit).offset(offset)
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def add(self, character: Character) -> Character:
         model = CharacterModel(
@@ -87,6 +88,35 @@ class SQLAlchemyCharactersRepository(
             await uow.session.refresh(model)
             return self._to_domain(model)
 
+    async def add_experience(
+        self, character_id: uuid.UUID, amount: int, mood: str | None = None
+    ) -> Character | None:
+        total_experience = CharacterModel.total_experience + amount
+        values: dict[str, Any] = {
+            "total_experience": total_experience,
+            # Character._recalculate_level: a level per 100 experience points.
+            "level": func.greatest(1, total_experience // 100),
+            "updated_at": func.now(),
+        }
+        if mood is not None:
+            values["current_mood"] = mood
+        statement = (
+            update(CharacterModel)
+            .where(CharacterModel.id == character_id)
+            .values(values)
+            .returning(CharacterModel)
+        )
+        async with self._uow() as uow:
+            result = await uow.session.execute(
+                select(CharacterModel)
+                .from_statement(statement)
+                .execution_options(populate_existing=True)
+            )
+            model = result.scalar_one_or_none()
+            if model is None:
+                return None
+            return self._to_domain(model)
+
     async def delete(self, character_id: uuid.UUID) -> None:
         async with self._uow() as uow:
             model = await uow.session.get(CharacterModel, character_id)
@@ -113,6 +143,7 @@ class SQLAlchemyCharacterItemsRepository(
     SQLAlchemyRepository[CharacterItemModel], CharacterItemsRepository
 ):
     model = CharacterItemModel
+    foreign_key_entities = {"character_id": "Character", "item_id": "Item"}
 
     def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork]) -> None:
         super().__init__(uow_factory)
@@ -123,24 +154,15 @@ class SQLAlchemyCharacterItemsRepository(
             return None
         return self._to_domain(model)
 
-    async def _validate_foreign_keys(self, instance: CharacterItemModel) -> None:
-        """Validate foreign key constraints for character item"""
-
-        await self._check_entity_exists(
-            CharacterModel, instance.character_id, "Character"
-        )
-
-        await self._check_entity_exists(ItemModel, instance.item_id, "Item")
-
     async def list_for_character(self, character_id: uuid.UUID) -> list[CharacterItem]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(CharacterItemModel).where(
+                self._select_rows().where(
                     CharacterItemModel.character_id == character_id
                 )
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def add(self, character_item: CharacterItem) -> CharacterItem:
         model = CharacterItemModel(
@@ -190,32 +212,22 @@ class SQLAlchemyCharacterBackgroundsRepository(
     SQLAlchemyRepository[CharacterBackgroundModel], CharacterBackgroundsRepository
 ):
     model = CharacterBackgroundModel
+    foreign_key_entities = {"character_id": "Character", "background_id": "Background"}
 
     def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork]) -> None:
         super().__init__(uow_factory)
 
-    async def _validate_foreign_keys(self, instance: CharacterBackgroundModel) -> None:
-        """Validate foreign key constraints for character background"""
-
-        await self._check_entity_exists(
-            CharacterModel, instance.character_id, "Character"
-        )
-
-        await self._check_entity_exists(
-            BackgroundModel, instance.background_id, "Background"
-        )
-
     async def list_for_character(
         self, character_id: uuid.UUID
     ) -> list[CharacterBackground]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(CharacterBackgroundModel).where(
+                self._select_rows().where(
                     CharacterBackgroundModel.character_id == character_id
                 )
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def add(
         self, character_background: CharacterBackground
@@ -256,6 +268,49 @@ class SQLAlchemyCharacterBackgroundsRepository(
             return None
         return self._to_domain(model)
 
+    async def equip(
+        self, character_background_id: uuid.UUID
+    ) -> CharacterBackground | None:
+        # Concurrent equips of a character are serialized on its row first:
+        # updating its backgrounds directly would lock them in no fixed order
+        # and deadlock. NO KEY UPDATE still lets rows referencing the
+        # character be inserted meanwhile.
+        lock = (
+            select(CharacterModel.id)
+            .where(
+                CharacterModel.id
+                == select(CharacterBackgroundModel.character_id)
+                .where(CharacterBackgroundModel.id == character_background_id)
+                .scalar_subquery()
+            )
+            .with_for_update(key_share=True)
+        )
+        async with self._uow() as uow:
+            character_id = (await uow.session.execute(lock)).scalar_one_or_none()
+            if character_id is None:
+                return None
+            # Every background of the character is rewritten, not only the
+            # active ones, so whatever another writer activated meanwhile is
+            # deactivated too.
+            statement = (
+                update(CharacterBackgroundModel)
+                .where(CharacterBackgroundModel.character_id == character_id)
+                .values(
+                    is_active=CharacterBackgroundModel.id == character_background_id
+                )
+                .returning(CharacterBackgroundModel)
+            )
+            result = await uow.session.execute(
+                select(CharacterBackgroundModel)
+                .from_statement(statement)
+                .execution_options(populate_existing=True)
+            )
+            models = result.scalars().all()
+        for model in models:
+            if model.id == character_background_id:
+                return self._to_domain(model)
+        return None
+
     async def remove(self, character_background_id: uuid.UUID) -> None:
         await super().remove(character_background_id)
 
@@ -276,21 +331,11 @@ class SQLAlchemyItemBackgroundPositionsRepository(
     ItemBackgroundPositionsRepository,
 ):
     model = ItemBackgroundPositionModel
+    foreign_key_entities = {"item_id": "Item", "background_id": "Background"}
 
     def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork]) -> None:
         super().__init__(uow_factory)
 
-    async def _validate_foreign_keys(
-        self, instance: ItemBackgroundPositionModel
-    ) -> None:
-        """Validate foreign key constraints for item background position"""
-
-        await self._check_entity_exists(ItemModel, instance.item_id, "Item")
-
-        await self._check_entity_exists(
-            BackgroundModel, instance.background_id, "Background"
-        )
-
     async def get(
         self, item_id: uuid.UUID, background_id: uuid.UUID
     ) -> ItemBackgroundPosition | None:
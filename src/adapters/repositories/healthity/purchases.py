@@ -0,0 +1,241 @@
+from collections.abc import Callable
+from datetime import datetime, timezone
+import logging
+import uuid
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Row,
+    String,
+    exists,
+    false,
+    insert,
+    literal,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from src.adapters.database.base import Base
+from src.adapters.database.models.catalog import BackgroundModel, ItemModel
+from src.adapters.database.models.characters import (
+    CharacterBackgroundModel,
+    CharacterItemModel,
+)
+from src.adapters.database.models.transactions import TransactionModel
+from src.adapters.database.models.user import UserModel
+from src.adapters.database.uow import AbstractUnitOfWork
+from src.adapters.repositories.exceptions import IntegrityConstraintError
+from src.domain.entities.healthity.characters import (
+    CharacterBackground,
+    CharacterItem,
+)
+from src.domain.value_objects.telegram_id import TelegramId
+from src.ports.repositories.healthity.purchases import PurchasesRepository
+
+logger = logging.getLogger(__name__)
+
+_UUID = postgresql.UUID(as_uuid=True)
+
+
+class SQLAlchemyPurchasesRepository(PurchasesRepository):
+    """Runs a whole purchase as one data-modifying statement.
+
+    The balance is decremented with a conditional ``UPDATE ... WHERE balance >=
+    cost``, so the user row is locked for the rest of the transaction and
+    concurrent purchases of the same user are serialized by PostgreSQL. The
+    ownership row and the ledger row are inserted from the CTE of that update:
+    when any precondition does not hold nothing is written at all, and a
+    concurrent duplicate purchase fails on the ownership unique constraint,
+    aborting the debit together with it. Both cases are reported as ``None``.
+    """
+
+    def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork]) -> None:
+        self._uow_factory = uow_factory
+
+    async def purchase_item(
+        self, user_tg_id: TelegramId, character_id: uuid.UUID, item_id: uuid.UUID
+    ) -> CharacterItem | None:
+        row = await self._purchase(
+            user_tg_id=user_tg_id,
+            character_id=character_id,
+            catalog_model=ItemModel,
+            catalog_id=item_id,
+            ownership_model=CharacterItemModel,
+            ownership_column="item_id",
+            transaction_type="purchase_item",
+            transaction_column="related_item_id",
+            description_prefix="Покупка предмета: ",
+        )
+        if row is None:
+            return None
+        return CharacterItem(
+            id=row.id,
+            character_id=row.character_id,
+            item_id=row.item_id,
+            is_active=row.is_active,
+            is_favorite=row.is_favorite,
+            purchased_at=row.purchased_at,
+        )
+
+    async def purchase_background(
+        self,
+        user_tg_id: TelegramId,
+        character_id: uuid.UUID,
+        background_id: uuid.UUID,
+    ) -> CharacterBackground | None:
+        row = await self._purchase(
+            user_tg_id=user_tg_id,
+            character_id=character_id,
+            catalog_model=BackgroundModel,
+            catalog_id=background_id,
+            ownership_model=CharacterBackgroundModel,
+            ownership_column="background_id",
+            transaction_type="purchase_background",
+            transaction_column="related_background_id",
+            description_prefix="Покупка фона: ",
+        )
+        if row is None:
+            return None
+        return CharacterBackground(
+            id=row.id,
+            character_id=row.character_id,
+            background_id=row.background_id,
+            is_active=row.is_active,
+            is_favorite=row.is_favorite,
+            purchased_at=row.purchased_at,
+        )
+
+    async def _purchase(
+        self,
+        *,
+        user_tg_id: TelegramId,
+        character_id: uuid.UUID,
+        catalog_model: type[Base],
+        catalog_id: uuid.UUID,
+        ownership_model: type[Base],
+        ownership_column: str,
+        transaction_type: str,
+        transaction_column: str,
+        description_prefix: str,
+    ) -> Row | None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        owned_fk = getattr(ownership_model, ownership_column)
+
+        catalog_entry = (
+            select(catalog_model.cost, catalog_model.name)
+            .where(
+                catalog_model.id == catalog_id,
+                catalog_model.is_available.is_(True),
+            )
+            .cte("catalog_entry")
+        )
+        debited = (
+            update(UserModel)
+            .where(
+                UserModel.tg_id == user_tg_id.value,
+                UserModel.balance >= catalog_entry.c.cost,
+                ~exists().where(
+                    ownership_model.character_id == character_id,
+                    owned_fk == catalog_id,
+                ),
+            )
+            .values(balance=UserModel.balance - catalog_entry.c.cost)
+            .returning(UserModel.balance, catalog_entry.c.cost, catalog_entry.c.name)
+            .cte("debited")
+        )
+        owned = (
+            insert(ownership_model)
+            .from_select(
+                [
+                    "id",
+                    "character_id",
+                    ownership_column,
+                    "is_active",
+                    "is_favorite",
+                    "purchased_at",
+                ],
+                select(
+                    literal(uuid.uuid4(), _UUID),
+                    literal(character_id, _UUID),
+                    literal(catalog_id, _UUID),
+                    false(),
+                    false(),
+                    literal(now, DateTime),
+                ).select_from(debited),
+            )
+            .returning(
+                ownership_model.id,
+                ownership_model.character_id,
+                owned_fk,
+                ownership_model.is_active,
+                ownership_model.is_favorite,
+                ownership_model.purchased_at,
+            )
+            .cte("owned")
+        )
+        ledger = (
+            insert(TransactionModel)
+            .from_select(
+                [
+                    "id",
+                    "user_tg_id",
+                    "amount",
+                    "balance_after",
+                    "type",
+                    transaction_column,
+                    "description",
+                    "timestamp",
+                ],
+                select(
+                    literal(uuid.uuid4(), _UUID),
+                    literal(user_tg_id.value, BigInteger),
+                    -debited.c.cost,
+                    debited.c.balance,
+                    literal(transaction_type, String),
+                    literal(catalog_id, _UUID),
+                    literal(description_prefix, String) + debited.c.name,
+                    literal(now, DateTime),
+                ).select_from(debited),
+            )
+            .returning(TransactionModel.id)
+            .cte("ledger")
+        )
+        # The ledger CTE has to be referenced, otherwise it is not rendered.
+        statement = select(owned, ledger.c.id.label("transaction_id")).select_from(
+            owned.join(ledger, true())
+        )
+
+        async with self._uow_factory() as uow:
+            try:
+                # A purchase losing the race must not roll back the rest of
+                # the request transaction.
+                async with uow.savepoint():
+                    result = await uow.session.execute(statement)
+                    row = result.one_or_none()
+            except IntegrityError as exc:
+                error_msg = str(exc.orig) if hasattr(exc, "orig") else str(exc)
+                error_msg = error_msg.lower()
+                if "unique" not in error_msg and "duplicate" not in error_msg:
+                    raise IntegrityConstraintError(
+                        "Integrity constraint violated"
+                    ) from exc
+                # A concurrent purchase of the same entry won the race.
+                row = None
+
+        logger.debug(
+            {
+                "action": "SQLAlchemyPurchasesRepository._purchase",
+                "stage": "purchased" if row is not None else "rejected",
+                "data": {
+                    "user_tg_id": user_tg_id.value,
+                    "character_id": str(character_id),
+                    "catalog_id": str(catalog_id),
+                    "type": transaction_type,
+                },
+            }
+        )
+        return row
@@ -0,0 +1,99 @@
+from collections.abc import Callable
+
+from sqlalchemy import ColumnElement, ScalarSelect, func, select
+
+from src.adapters.database.base import Base
+from src.adapters.database.models.activities import MoodHistoryModel
+from src.adapters.database.models.characters import (
+    CharacterBackgroundModel,
+    CharacterItemModel,
+    CharacterModel,
+)
+from src.adapters.database.models.transactions import TransactionModel
+from src.adapters.database.models.user import UserModel
+from src.adapters.database.models.user_friends import UserFriendModel
+from src.adapters.database.uow import AbstractUnitOfWork
+from src.domain.entities.healthity.statistics import UserStatistics
+from src.domain.value_objects.telegram_id import TelegramId
+from src.ports.repositories.healthity.statistics import UserStatisticsRepository
+
+
+def _count(model: type[Base], condition: ColumnElement[bool]) -> ScalarSelect[int]:
+    """Correlated ``count(*)`` of the rows of ``model`` matching ``condition``."""
+    return select(func.count()).select_from(model).where(condition).scalar_subquery()
+
+
+class SQLAlchemyUserStatisticsRepository(UserStatisticsRepository):
+    """Computes all counters of a user in a single aggregate query.
+
+    Each counter is a correlated ``count(*)`` answered from the index on the
+    owning column, so no rows are shipped to the application and the memory
+    used per request does not depend on the size of the user's history.
+    """
+
+    def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork]) -> None:
+        self._uow_factory = uow_factory
+
+    async def get_for_user(self, user_tg_id: TelegramId) -> UserStatistics | None:
+        statement = (
+            select(
+                UserModel.tg_id,
+                UserModel.balance,
+                CharacterModel.level,
+                CharacterModel.total_experience,
+                CharacterModel.name,
+                CharacterModel.sex,
+                _count(
+                    CharacterItemModel,
+                    CharacterItemModel.character_id == CharacterModel.id,
+                ),
+                _count(
+                    CharacterBackgroundModel,
+                    CharacterBackgroundModel.character_id == CharacterModel.id,
+                ),
+                _count(
+                    MoodHistoryModel,
+                    MoodHistoryModel.character_id == CharacterModel.id,
+                ),
+                _count(
+                    TransactionModel, TransactionModel.user_tg_id == UserModel.tg_id
+                ),
+                _count(
+                    UserFriendModel, UserFriendModel.owner_tg_id == UserModel.tg_id
+                ),
+            )
+            .outerjoin(CharacterModel, CharacterModel.user_tg_id == UserModel.tg_id)
+            .where(UserModel.tg_id == user_tg_id.value)
+        )
+        async with self._uow_factory() as uow:
+            result = await uow.session.execute(statement)
+            row = result.one_or_none()
+        if row is None:
+            return None
+
+        (
+            tg_id,
+            balance,
+            level,
+            total_experience,
+            name,
+            sex,
+            items_count,
+            backgrounds_count,
+            mood_entries_count,
+            transactions_count,
+            friends_count,
+        ) = row
+        return UserStatistics(
+            user_tg_id=tg_id,
+            balance=balance,
+            level=level,
+            total_experience=total_experience,
+            character_name=name,
+            character_sex=sex,
+            purchased_items_count=items_count,
+            purchased_backgrounds_count=backgrounds_count,
+            mood_entries_count=mood_entries_count,
+            transactions_count=transactions_count,
+            friends_count=friends_count,
+        )
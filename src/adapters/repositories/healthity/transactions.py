@@ -1,55 +1,119 @@
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
+from typing import Any
 import uuid
 
-from sqlalchemy import delete, select
+from sqlalchemy import Select, delete, tuple_
 
 from src.adapters.database.models.transactions import TransactionModel
-from src.adapters.database.models.catalog import ItemModel, BackgroundModel
-from src.adapters.database.models.user import UserModel
 from src.adapters.database.uow import AbstractUnitOfWork
 from src.adapters.repositories.base import SQLAlchemyRepository
 from src.domain.entities.healthity.transactions import Transaction
 from src.domain.value_objects.telegram_id import TelegramId
-from src.ports.repositories.healthity.transactions import TransactionsRepository
+from src.ports.repositories.healthity.transactions import (
+    TransactionsPosition,
+    TransactionsRepository,
+)
 
 
 class SQLAlchemyTransactionsRepository(
     SQLAlchemyRepository[TransactionModel], TransactionsRepository
 ):
     model = TransactionModel
-
-    def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork]) -> None:
+    foreign_key_entities = {
+        "user_tg_id": "User",
+        "related_item_id": "Item",
+        "related_background_id": "Background",
+    }
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractUnitOfWork],
+        stream_uow_factory: Callable[[], AbstractUnitOfWork] | None = None,
+        stream_batch_size: int = 500,
+    ) -> None:
         super().__init__(uow_factory)
-
-    async def _validate_foreign_keys(self, instance: TransactionModel) -> None:
-        """Validate foreign key constraints for transaction"""
-        await self._check_entity_exists(UserModel, instance.user_tg_id, "User")
-
-        if instance.related_item_id is not None:
-            await self._check_entity_exists(ItemModel, instance.related_item_id, "Item")
-
-        if instance.related_background_id is not None:
-            await self._check_entity_exists(
-                BackgroundModel, instance.related_background_id, "Background"
-            )
+        # A streamed response is sent after the request unit of work has been
+        # closed, so streaming needs a unit of work of its own.
+        self._stream_uow_factory = stream_uow_factory or uow_factory
+        self._stream_batch_size = stream_batch_size
 
     async def list_for_user(self, user_tg_id: TelegramId) -> list[Transaction]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(TransactionModel)
+                self._select_rows()
                 .where(TransactionModel.user_tg_id == user_tg_id.value)
                 .order_by(TransactionModel.timestamp.desc())
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
+
+    async def list_page_for_user(
+        self,
+        user_tg_id: TelegramId,
+        limit: int,
+        after: TransactionsPosition | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        transaction_type: str | None = None,
+    ) -> list[Transaction]:
+        statement = self._ledger_statement(
+            user_tg_id, start_date, end_date, transaction_type
+        )
+        if after is not None:
+            # Keyset condition: continues the (timestamp, id) order, so every
+            # page is a range scan over idx_transactions_user_time.
+            statement = statement.where(
+                tuple_(TransactionModel.timestamp, TransactionModel.id)
+                < tuple_(after.timestamp, after.id)
+            )
+        async with self._uow() as uow:
+            result = await uow.session.execute(statement.limit(limit))
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
+
+    async def stream_for_user(
+        self,
+        user_tg_id: TelegramId,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        transaction_type: str | None = None,
+    ) -> AsyncIterator[Transaction]:
+        statement = self._ledger_statement(
+            user_tg_id, start_date, end_date, transaction_type
+        ).execution_options(yield_per=self._stream_batch_size)
+        async with self._stream_uow_factory() as uow:
+            # A server-side cursor: rows are fetched batch by batch.
+            result = await uow.session.stream(statement)
+            async for row in result:
+                yield self._to_domain(row)
+
+    def _ledger_statement(
+        self,
+        user_tg_id: TelegramId,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        transaction_type: str | None,
+    ) -> Select[Any]:
+        statement = self._select_rows().where(
+            TransactionModel.user_tg_id == user_tg_id.value
+        )
+        if start_date is not None:
+            statement = statement.where(TransactionModel.timestamp >= start_date)
+        if end_date is not None:
+            statement = statement.where(TransactionModel.timestamp <= end_date)
+        if transaction_type is not None:
+            statement = statement.where(TransactionModel.type == transaction_type)
+        return statement.order_by(
+            TransactionModel.timestamp.desc(), TransactionModel.id.desc()
+        )
 
     async def list_for_user_by_date_range(
         self, user_tg_id: TelegramId, start_date: datetime, end_date: datetime
     ) -> list[Transaction]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(TransactionModel)
+                self._select_rows()
                 .where(
                     TransactionModel.user_tg_id == user_tg_id.value,
                     TransactionModel.timestamp >= start_date,
@@ -57,23 +121,23 @@ class SQLAlchemyTransactionsRepository(
                 )
                 .order_by(TransactionModel.timestamp.desc())
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def list_for_user_by_type(
         self, user_tg_id: TelegramId, transaction_type: str
     ) -> list[Transaction]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(TransactionModel)
+                self._select_rows()
                 .where(
                     TransactionModel.user_tg_id == user_tg_id.value,
                     TransactionModel.type == transaction_type,
                 )
                 .order_by(TransactionModel.timestamp.desc())
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def add(self, transaction: Transaction) -> Transaction:
         model = TransactionModel(
@@ -57,9 +57,9 @@ class SQLAlchemyUserSettingsRepository(
 
     async def list_all(self) -> list[UserSettings]:
         async with self._uow() as uow:
-            result = await uow.session.execute(select(UserSettingsModel))
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            result = await uow.session.execute(self._select_rows())
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def delete(self, settings_id) -> None:
         async with self._uow() as uow:
@@ -92,12 +92,12 @@ class SQLAlchemyUserFriendsRepository(
     async def list_for_user(self, owner_tg_id: TelegramId) -> list[UserFriend]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(UserFriendModel).where(
+                self._select_rows().where(
                     UserFriendModel.owner_tg_id == owner_tg_id.value
                 )
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def add(self, friend: UserFriend) -> UserFriend:
         model = UserFriendModel(
@@ -263,10 +263,10 @@ class SQLAlchemyUsersRepository(SQLAlchemyRepository[UserModel], UsersRepository
     async def list_all(self, limit: int = 100, offset: int = 0) -> list[User]:
         async with self._uow() as uow:
             result = await uow.session.execute(
-                select(UserModel).limit(limit).offset(offset)
+                self._select_rows().limit(limit).offset(offset)
             )
-            models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+            rows = result.all()
+        return [self._to_domain(row) for row in rows]
 
     async def delete(self, telegram_id: TelegramId) -> None:
         async with self._uow() as uow:
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -8,6 +9,7 @@ from fastapi.openapi.utils import get_openapi
 
 from src.adapters.database.session import session_manager
 from src.container import ApplicationContainer
+from src.core.settings import settings
 from src.drivers.rest import (
     auth,
     users,
@@ -25,14 +27,21 @@ from src.drivers.rest import (
     character_backgrounds,
     item_categories,
     item_background_positions,
+    metrics,
+    health,
+    debug,
 )
+from src.drivers.maintenance import register_maintenance_jobs
+from src.drivers.rest.warmup import warm_up
 
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=settings.log_level.upper(),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
 
 def create_app() -> FastAPI:
     container = ApplicationContainer()
@@ -44,14 +53,44 @@ def create_app() -> FastAPI:
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         app.container = container
+        event_loop_watchdog.start()
+        schema_watch = asyncio.create_task(schema_revision_gate.watch())
+        await warm_up(app, container, session_manager)
+        if settings.maintenance_enabled:
+            job_scheduler.start()
         try:
             yield
         finally:
+            await job_scheduler.stop()
+            await container.leader_lock().close()
+            schema_watch.cancel()
+            event_loop_watchdog.stop()
             container.unwire()
+            container.async_password_hasher().close()
             await session_manager.close()
 
     app = FastAPI(title="Healthity backend", lifespan=lifespan, version="1.0.0")
 
+    application_metrics = container.metrics()
+    schema_revision_gate = container.schema_revision_gate()
+    event_loop_watchdog = container.event_loop_watchdog()
+    job_scheduler = container.job_scheduler()
+    register_maintenance_jobs(
+        job_scheduler, container, settings.token_pruning_interval_seconds
+    )
+    health.register_readiness_checks(
+        container.health_probes(),
+        container,
+        session_manager,
+        schema_revision_gate,
+        event_loop_watchdog,
+        settings.health_max_loop_lag_seconds,
+    )
+    application_metrics.watch_password_hashing(container.async_password_hasher())
+    application_metrics.watch_database_pool(session_manager.pool_statistics)
+    application_metrics.watch_event_loop(event_loop_watchdog)
+    application_metrics.watch_scheduler(job_scheduler)
+
     # Custom OpenAPI schema with security schemes
     def custom_openapi():
         if app.openapi_schema:
@@ -108,17 +147,51 @@ def create_app() -> FastAPI:
     app.openapi = custom_openapi
 
     @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        logger.debug(f"Request: {request.method} {request.url}")
-        try:
+    async def request_unit_of_work(request: Request, call_next):
+        # Every repository resolved while handling the request joins this unit
+        # of work; it is committed only when the use case finished successfully.
+        async with container.request_unit_of_work() as uow:
             response = await call_next(request)
-            logger.debug(f"Response status: {response.status_code}")
-            return response
-        except Exception as e:
-            logger.exception(f"Request failed: {e}")
+            if response.status_code < 400:
+                await uow.commit()
+        if uow.checkout_wait is not None:
+            application_metrics.database_used(
+                metrics.route_label(request.scope),
+                uow.checkout_wait,
+                uow.statements,
+                uow.connection_hold,
+            )
+        return response
+
+    @app.middleware("http")
+    async def read_only_until_migrated(request: Request, call_next):
+        # Until the migrations of this build are applied, only reads are
+        # served: writes could hit columns or constraints that do not exist yet.
+        if not schema_revision_gate.ready and request.method not in SAFE_METHODS:
+            return JSONResponse(
+                status_code=503,
+                content={"detail": "Database schema is being migrated"},
+                headers={"Retry-After": "5"},
+            )
+        return await call_next(request)
+
+    @app.middleware("http")
+    async def unhandled_exceptions(request: Request, call_next):
+        # A middleware rather than an Exception handler: those run outside
+        # CORSMiddleware, so browsers would not be shown the 500 response.
+        try:
+            return await call_next(request)
+        except Exception as exc:
+            logger.exception(
+                {
+                    "action": "unhandled_exception",
+                    "stage": "failed",
+                    "data": {"method": request.method, "path": request.url.path},
+                }
+            )
             return JSONResponse(
                 status_code=500,
-                content={"detail": f"Internal server error: {str(e)}"},
+                content={"detail": f"Internal server error: {str(exc)}"},
             )
 
     app.add_middleware(
@@ -127,7 +200,14 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[transactions.NEXT_CURSOR_HEADER],
     )
+    app.add_middleware(metrics.MetricsMiddleware, metrics=application_metrics)
+
+    app.include_router(metrics.router)
+    app.include_router(health.router)
+    if settings.debug_routes_enabled:
+        app.include_router(debug.router)
 
     app.include_router(auth.router, prefix="/api/v1")
     app.include_router(users.router, prefix="/api/v1")
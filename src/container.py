@@ -1,10 +1,22 @@
+from datetime import timedelta
+
 from dependency_injector import containers, providers
 
+from src.adapters.database.locks import AdvisoryLeaderLock
+from src.adapters.database.schema import SchemaRevisionGate
 from src.adapters.database.session import session_manager
-from src.adapters.database.uow import SQLAlchemyUnitOfWork
+from src.adapters.database.uow import (
+    RequestUnitOfWork,
+    SQLAlchemyUnitOfWork,
+    create_unit_of_work,
+    run_after_commit,
+)
 from src.adapters.repositories.auth import (
+    BlacklistRevocationIndex,
     SQLAlchemyBlacklistedTokensRepository,
     SQLAlchemyRefreshTokensRepository,
+    SQLAlchemyTokenGenerationsRepository,
+    TokenGenerationIndex,
 )
 from src.adapters.repositories.healthity import (
     SQLAlchemyActivityTypesRepository,
@@ -18,11 +30,14 @@ from src.adapters.repositories.healthity import (
     SQLAlchemyItemCategoriesRepository,
     SQLAlchemyItemsRepository,
     SQLAlchemyMoodHistoryRepository,
+    SQLAlchemyPurchasesRepository,
     SQLAlchemyTransactionsRepository,
     SQLAlchemyUserFriendsRepository,
     SQLAlchemyUserSettingsRepository,
+    SQLAlchemyUserStatisticsRepository,
     SQLAlchemyUsersRepository,
 )
+from src.core.auth.admin_credentials import AdminCredentialsCache
 from src.core.auth.jwt_service import JwtService
 from src.core.auth.telegram_mini_app_auth import TelegramMiniAppAuth
 from src.core.auth.providers import (
@@ -31,8 +46,14 @@ from src.core.auth.providers import (
     TelegramMiniAppAuthProvider,
     TelegramMiniAppCurrentUserProvider,
 )
+from src.core.catalog_snapshots import CatalogSnapshots
+from src.core.character_identity import CharacterIdentityCache
+from src.core.event_loop_watchdog import EventLoopWatchdog
+from src.core.health import HealthProbes
+from src.core.metrics import ApplicationMetrics
+from src.core.scheduler import JobScheduler
 from src.core.settings import settings
-from src.core.security import PasswordHasher, TokenHasher
+from src.core.security import AsyncPasswordHasher, PasswordHasher, TokenHasher
 from src.use_cases.users.manage_users import (
     GetUserUseCase,
     CreateUserUseCase,
@@ -43,12 +64,20 @@ from src.use_cases.users.manage_users import (
     WithdrawUseCase,
     ChangePasswordUseCase,
 )
-from src.use_cases.auth import LoginUseCase, LogoutUseCase, RefreshUseCase
+from src.use_cases.users.statistics import GetUserStatisticsUseCase
+from src.use_cases.auth import (
+    LoginUseCase,
+    LogoutUseCase,
+    PruneBlacklistedTokensUseCase,
+    PruneRefreshTokensUseCase,
+    RefreshUseCase,
+)
 from src.use_cases.characters.create_character import CreateCharacterUseCase
 from src.use_cases.characters.get_character import (
     GetCharacterByIdUseCase,
     GetCharacterByUserUseCase,
     ListCharactersUseCase,
+    ResolveCharacterIdUseCase,
 )
 from src.use_cases.characters.update_character import UpdateCharacterUseCase
 from src.use_cases.characters.delete_character import DeleteCharacterUseCase
@@ -71,8 +100,10 @@ from src.use_cases.backgrounds.manage_backgrounds import (
 from src.use_cases.transactions.manage_transactions import (
     CreateTransactionUseCase,
     DeleteTransactionUseCase,
+    ExportTransactionsUseCase,
     GetTransactionUseCase,
     ListTransactionsForUserUseCase,
+    ListTransactionsPageUseCase,
     UpdateTransactionUseCase,
 )
 from src.use_cases.user_settings.manage_settings import (
@@ -169,14 +200,64 @@ class ApplicationContainer(containers.DeclarativeContainer):
 
     settings_provider = providers.Object(settings)
     password_hasher = providers.Singleton(PasswordHasher)
+    async_password_hasher = providers.Singleton(
+        AsyncPasswordHasher,
+        hasher=password_hasher,
+        max_workers=settings_provider.provided.password_hashing_workers,
+    )
     token_hasher = providers.Singleton(TokenHasher)
     jwt_service = providers.Singleton(JwtService)
     telegram_mini_app_auth = providers.Singleton(
-        TelegramMiniAppAuth, bot_token=settings_provider.provided.telegram.bot_token
+        TelegramMiniAppAuth,
+        bot_token=settings_provider.provided.telegram.bot_token,
+        lifetime=settings_provider.provided.telegram.init_data_lifetime,
+        cache_size=settings_provider.provided.telegram.init_data_cache_size,
+    )
+
+    admin_credentials_cache = providers.Singleton(
+        AdminCredentialsCache,
+        ttl_seconds=settings_provider.provided.admin_auth_cache_ttl_seconds,
+        after_commit=providers.Object(run_after_commit),
+    )
+    character_identity_cache = providers.Singleton(
+        CharacterIdentityCache,
+        ttl_seconds=settings_provider.provided.character_cache_ttl_seconds,
+        after_commit=providers.Object(run_after_commit),
+    )
+    catalog_snapshots = providers.Singleton(
+        CatalogSnapshots,
+        ttl_seconds=settings_provider.provided.catalog_cache_ttl_seconds,
+        after_commit=providers.Object(run_after_commit),
+    )
+    metrics = providers.Singleton(ApplicationMetrics)
+    event_loop_watchdog = providers.Singleton(
+        EventLoopWatchdog,
+        interval_seconds=settings_provider.provided.event_loop_interval_seconds,
+        slow_callback_seconds=settings_provider.provided.event_loop_slow_seconds,
+    )
+    leader_lock = providers.Singleton(
+        AdvisoryLeaderLock, engine=providers.Object(session_manager.engine)
+    )
+    job_scheduler = providers.Singleton(JobScheduler, lock=leader_lock.provided.hold)
+    health_probes = providers.Singleton(
+        HealthProbes,
+        cache_seconds=settings_provider.provided.health_cache_seconds,
+        timeout_seconds=settings_provider.provided.health_timeout_seconds,
     )
 
     session_factory = providers.Object(session_manager.async_session)
+    schema_revision_gate = providers.Singleton(
+        SchemaRevisionGate,
+        engine=providers.Object(session_manager.engine),
+        interval_seconds=settings_provider.provided.db_schema_check_interval_seconds,
+    )
     unit_of_work = providers.Factory(
+        create_unit_of_work, session_factory=session_factory
+    )
+    request_unit_of_work = providers.Factory(
+        RequestUnitOfWork, session_factory=session_factory
+    )
+    standalone_unit_of_work = providers.Factory(
         SQLAlchemyUnitOfWork, session_factory=session_factory
     )
 
@@ -184,11 +265,30 @@ class ApplicationContainer(containers.DeclarativeContainer):
         SQLAlchemyUsersRepository, uow_factory=unit_of_work.provider
     )
     refresh_tokens_repository = providers.Factory(
-        SQLAlchemyRefreshTokensRepository, uow_factory=unit_of_work.provider
+        SQLAlchemyRefreshTokensRepository,
+        uow_factory=unit_of_work.provider,
+        revocation_uow_factory=standalone_unit_of_work.provider,
     )
     blacklisted_tokens_repository = providers.Factory(
         SQLAlchemyBlacklistedTokensRepository, uow_factory=unit_of_work.provider
     )
+    blacklist_revocation_index = providers.Singleton(
+        BlacklistRevocationIndex,
+        repository=blacklisted_tokens_repository,
+        refresh_interval=settings_provider.provided.jwt.revocation_refresh_seconds,
+    )
+    token_generations_repository = providers.Factory(
+        SQLAlchemyTokenGenerationsRepository, uow_factory=unit_of_work.provider
+    )
+    token_generation_index = providers.Singleton(
+        TokenGenerationIndex,
+        repository=token_generations_repository,
+        retention=providers.Factory(
+            timedelta,
+            minutes=settings_provider.provided.jwt.access_token_expire_minutes,
+        ),
+        refresh_interval=settings_provider.provided.jwt.revocation_refresh_seconds,
+    )
     user_settings_repository = providers.Factory(
         SQLAlchemyUserSettingsRepository, uow_factory=unit_of_work.provider
     )
@@ -229,7 +329,15 @@ class ApplicationContainer(containers.DeclarativeContainer):
         SQLAlchemyMoodHistoryRepository, uow_factory=unit_of_work.provider
     )
     transactions_repository = providers.Factory(
-        SQLAlchemyTransactionsRepository, uow_factory=unit_of_work.provider
+        SQLAlchemyTransactionsRepository,
+        uow_factory=unit_of_work.provider,
+        stream_uow_factory=standalone_unit_of_work.provider,
+    )
+    purchases_repository = providers.Factory(
+        SQLAlchemyPurchasesRepository, uow_factory=unit_of_work.provider
+    )
+    user_statistics_repository = providers.Factory(
+        SQLAlchemyUserStatisticsRepository, uow_factory=unit_of_work.provider
     )
 
     get_user_use_case = providers.Factory(
@@ -238,7 +346,7 @@ class ApplicationContainer(containers.DeclarativeContainer):
     create_user_use_case = providers.Factory(
         CreateUserUseCase,
         users_repository=users_repository,
-        password_hasher=password_hasher,
+        password_hasher=async_password_hasher,
     )
     list_users_use_case = providers.Factory(
         ListUsersUseCase, users_repository=users_repository
@@ -246,10 +354,14 @@ class ApplicationContainer(containers.DeclarativeContainer):
     update_user_use_case = providers.Factory(
         UpdateUserUseCase,
         users_repository=users_repository,
-        password_hasher=password_hasher,
+        password_hasher=async_password_hasher,
+        admin_credentials_cache=admin_credentials_cache,
     )
     delete_user_use_case = providers.Factory(
-        DeleteUserUseCase, users_repository=users_repository
+        DeleteUserUseCase,
+        users_repository=users_repository,
+        admin_credentials_cache=admin_credentials_cache,
+        character_identity_cache=character_identity_cache,
     )
     deposit_use_case = providers.Factory(
         DepositUseCase,
@@ -261,38 +373,40 @@ class ApplicationContainer(containers.DeclarativeContainer):
         users_repository=users_repository,
         transactions_repository=transactions_repository,
     )
+    get_user_statistics_use_case = providers.Factory(
+        GetUserStatisticsUseCase, statistics_repository=user_statistics_repository
+    )
     change_password_use_case = providers.Factory(
         ChangePasswordUseCase,
         users_repository=users_repository,
-        password_hasher=password_hasher,
+        password_hasher=async_password_hasher,
+        admin_credentials_cache=admin_credentials_cache,
     )
 
     access_token_payload_provider = providers.Factory(
         AccessTokenPayloadProvider,
         jwt_service=jwt_service,
-        blacklisted_tokens_repository=blacklisted_tokens_repository,
+        blacklisted_tokens_repository=blacklist_revocation_index,
+        token_generations_repository=token_generation_index,
     )
     current_user_provider = providers.Factory(
         CurrentUserProvider, payload_provider=access_token_payload_provider
     )
 
     # Telegram Mini App auth providers
-    telegram_mini_app_auth_provider = providers.Factory(
+    telegram_mini_app_auth_provider = providers.Singleton(
         TelegramMiniAppAuthProvider, tma_auth=telegram_mini_app_auth
     )
     telegram_mini_app_current_user_provider = providers.Factory(
         TelegramMiniAppCurrentUserProvider, tma_auth=telegram_mini_app_auth
     )
-    tma_auth = providers.Singleton(
-        TelegramMiniAppAuth,
-        bot_token=settings.telegram_bot_token,
-    )
 
     login_use_case = providers.Factory(
         LoginUseCase,
         users_repository=users_repository,
         refresh_tokens_repository=refresh_tokens_repository,
-        password_hasher=password_hasher,
+        token_generations_repository=token_generation_index,
+        password_hasher=async_password_hasher,
         token_hasher=token_hasher,
         jwt_service=jwt_service,
     )
@@ -300,19 +414,39 @@ class ApplicationContainer(containers.DeclarativeContainer):
         RefreshUseCase,
         users_repository=users_repository,
         refresh_tokens_repository=refresh_tokens_repository,
+        token_generations_repository=token_generation_index,
         token_hasher=token_hasher,
         jwt_service=jwt_service,
     )
     logout_use_case = providers.Factory(
         LogoutUseCase,
         refresh_tokens_repository=refresh_tokens_repository,
-        blacklisted_tokens_repository=blacklisted_tokens_repository,
+        blacklisted_tokens_repository=blacklist_revocation_index,
+        token_generations_repository=token_generation_index,
         token_hasher=token_hasher,
         jwt_service=jwt_service,
     )
+    prune_blacklisted_tokens_use_case = providers.Factory(
+        PruneBlacklistedTokensUseCase,
+        blacklisted_tokens_repository=blacklist_revocation_index,
+        batch_size=settings_provider.provided.token_pruning_batch_size,
+        max_rows=settings_provider.provided.token_pruning_max_rows,
+    )
+    prune_refresh_tokens_use_case = providers.Factory(
+        PruneRefreshTokensUseCase,
+        refresh_tokens_repository=refresh_tokens_repository,
+        revoked_retention=providers.Factory(
+            timedelta,
+            hours=settings_provider.provided.refresh_token_revoked_retention_hours,
+        ),
+        batch_size=settings_provider.provided.token_pruning_batch_size,
+        max_rows=settings_provider.provided.token_pruning_max_rows,
+    )
 
     create_character_use_case = providers.Factory(
-        CreateCharacterUseCase, characters_repository=characters_repository
+        CreateCharacterUseCase,
+        characters_repository=characters_repository,
+        identity_cache=character_identity_cache,
     )
     get_character_by_id_use_case = providers.Factory(
         GetCharacterByIdUseCase, characters_repository=characters_repository
@@ -320,6 +454,11 @@ class ApplicationContainer(containers.DeclarativeContainer):
     get_character_by_user_use_case = providers.Factory(
         GetCharacterByUserUseCase, characters_repository=characters_repository
     )
+    resolve_character_id_use_case = providers.Factory(
+        ResolveCharacterIdUseCase,
+        characters_repository=characters_repository,
+        identity_cache=character_identity_cache,
+    )
     list_characters_use_case = providers.Factory(
         ListCharactersUseCase, characters_repository=characters_repository
     )
@@ -329,11 +468,15 @@ class ApplicationContainer(containers.DeclarativeContainer):
         mood_history_repository=mood_history_repository,
     )
     delete_character_use_case = providers.Factory(
-        DeleteCharacterUseCase, characters_repository=characters_repository
+        DeleteCharacterUseCase,
+        characters_repository=characters_repository,
+        identity_cache=character_identity_cache,
     )
 
     create_item_use_case = providers.Factory(
-        CreateItemUseCase, items_repository=items_repository
+        CreateItemUseCase,
+        items_repository=items_repository,
+        catalog_snapshots=catalog_snapshots,
     )
     get_item_use_case = providers.Factory(
         GetItemUseCase, items_repository=items_repository
@@ -345,14 +488,20 @@ class ApplicationContainer(containers.DeclarativeContainer):
         ListAvailableItemsUseCase, items_repository=items_repository
     )
     update_item_use_case = providers.Factory(
-        UpdateItemUseCase, items_repository=items_repository
+        UpdateItemUseCase,
+        items_repository=items_repository,
+        catalog_snapshots=catalog_snapshots,
     )
     delete_item_use_case = providers.Factory(
-        DeleteItemUseCase, items_repository=items_repository
+        DeleteItemUseCase,
+        items_repository=items_repository,
+        catalog_snapshots=catalog_snapshots,
     )
 
     create_background_use_case = providers.Factory(
-        CreateBackgroundUseCase, backgrounds_repository=backgrounds_repository
+        CreateBackgroundUseCase,
+        backgrounds_repository=backgrounds_repository,
+        catalog_snapshots=catalog_snapshots,
     )
     get_background_use_case = providers.Factory(
         GetBackgroundUseCase, backgrounds_repository=backgrounds_repository
@@ -364,10 +513,14 @@ class ApplicationContainer(containers.DeclarativeContainer):
         ListAvailableBackgroundsUseCase, backgrounds_repository=backgrounds_repository
     )
     update_background_use_case = providers.Factory(
-        UpdateBackgroundUseCase, backgrounds_repository=backgrounds_repository
+        UpdateBackgroundUseCase,
+        backgrounds_repository=backgrounds_repository,
+        catalog_snapshots=catalog_snapshots,
     )
     delete_background_use_case = providers.Factory(
-        DeleteBackgroundUseCase, backgrounds_repository=backgrounds_repository
+        DeleteBackgroundUseCase,
+        backgrounds_repository=backgrounds_repository,
+        catalog_snapshots=catalog_snapshots,
     )
 
     create_transaction_use_case = providers.Factory(
@@ -381,6 +534,12 @@ class ApplicationContainer(containers.DeclarativeContainer):
     list_transactions_for_user_use_case = providers.Factory(
         ListTransactionsForUserUseCase, transactions_repository=transactions_repository
     )
+    list_transactions_page_use_case = providers.Factory(
+        ListTransactionsPageUseCase, transactions_repository=transactions_repository
+    )
+    export_transactions_use_case = providers.Factory(
+        ExportTransactionsUseCase, transactions_repository=transactions_repository
+    )
     update_transaction_use_case = providers.Factory(
         UpdateTransactionUseCase, transactions_repository=transactions_repository
     )
@@ -417,7 +576,9 @@ class ApplicationContainer(containers.DeclarativeContainer):
     )
 
     create_activity_type_use_case = providers.Factory(
-        CreateActivityTypeUseCase, activity_types_repository=activity_types_repository
+        CreateActivityTypeUseCase,
+        activity_types_repository=activity_types_repository,
+        catalog_snapshots=catalog_snapshots,
     )
     get_activity_type_use_case = providers.Factory(
         GetActivityTypeUseCase, activity_types_repository=activity_types_repository
@@ -430,16 +591,19 @@ class ApplicationContainer(containers.DeclarativeContainer):
         ListActivityTypesUseCase, activity_types_repository=activity_types_repository
     )
     update_activity_type_use_case = providers.Factory(
-        UpdateActivityTypeUseCase, activity_types_repository=activity_types_repository
+        UpdateActivityTypeUseCase,
+        activity_types_repository=activity_types_repository,
+        catalog_snapshots=catalog_snapshots,
     )
     delete_activity_type_use_case = providers.Factory(
-        DeleteActivityTypeUseCase, activity_types_repository=activity_types_repository
+        DeleteActivityTypeUseCase,
+        activity_types_repository=activity_types_repository,
+        catalog_snapshots=catalog_snapshots,
     )
 
     create_daily_activity_use_case = providers.Factory(
         CreateDailyActivityUseCase,
         daily_activities_repository=daily_activities_repository,
-        activity_types_repository=activity_types_repository,
     )
     list_daily_activities_for_day_use_case = providers.Factory(
         ListDailyActivitiesForDayUseCase,
@@ -554,10 +718,10 @@ class ApplicationContainer(containers.DeclarativeContainer):
     )
     purchase_item_with_balance_use_case = providers.Factory(
         PurchaseItemWithBalanceUseCase,
+        purchases_repository=purchases_repository,
         character_items_repository=character_items_repository,
         items_repository=items_repository,
         users_repository=users_repository,
-        transactions_repository=transactions_repository,
     )
 
     list_character_backgrounds_use_case = providers.Factory(
@@ -594,10 +758,10 @@ class ApplicationContainer(containers.DeclarativeContainer):
     )
     purchase_background_with_balance_use_case = providers.Factory(
         PurchaseBackgroundWithBalanceUseCase,
+        purchases_repository=purchases_repository,
         character_backgrounds_repository=character_backgrounds_repository,
         backgrounds_repository=backgrounds_repository,
         users_repository=users_repository,
-        transactions_repository=transactions_repository,
     )
 
     list_item_categories_use_case = providers.Factory(
@@ -607,13 +771,19 @@ class ApplicationContainer(containers.DeclarativeContainer):
         GetItemCategoryUseCase, item_categories_repository=item_categories_repository
     )
     create_item_category_use_case = providers.Factory(
-        CreateItemCategoryUseCase, item_categories_repository=item_categories_repository
+        CreateItemCategoryUseCase,
+        item_categories_repository=item_categories_repository,
+        catalog_snapshots=catalog_snapshots,
     )
     update_item_category_use_case = providers.Factory(
-        UpdateItemCategoryUseCase, item_categories_repository=item_categories_repository
+        UpdateItemCategoryUseCase,
+        item_categories_repository=item_categories_repository,
+        catalog_snapshots=catalog_snapshots,
     )
     delete_item_category_use_case = providers.Factory(
-        DeleteItemCategoryUseCase, item_categories_repository=item_categories_repository
+        DeleteItemCategoryUseCase,
+        item_categories_repository=item_categories_repository,
+        catalog_snapshots=catalog_snapshots,
     )
 
     list_positions_for_item_use_case = providers.Factory(
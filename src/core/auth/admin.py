@@ -8,7 +8,8 @@ from fastapi import Depends
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 
 from src.container import ApplicationContainer
-from src.core.security import PasswordHasher
+from src.core.auth.admin_credentials import AdminCredentialsCache
+from src.core.security import AsyncPasswordHasher
 from src.domain.value_objects.telegram_id import TelegramId
 from src.drivers.rest.exceptions import ForbiddenException, UnauthorizedException
 from src.ports.repositories.healthity.users import UsersRepository
@@ -24,8 +25,11 @@ async def admin_user_provider(
     users_repository: UsersRepository = Depends(
         Provide[ApplicationContainer.users_repository]
     ),
-    password_hasher: PasswordHasher = Depends(
-        Provide[ApplicationContainer.password_hasher]
+    password_hasher: AsyncPasswordHasher = Depends(
+        Provide[ApplicationContainer.async_password_hasher]
+    ),
+    credentials_cache: AdminCredentialsCache = Depends(
+        Provide[ApplicationContainer.admin_credentials_cache]
     ),
 ) -> int:
     try:
@@ -43,6 +47,18 @@ async def admin_user_provider(
             headers={"WWW-Authenticate": "Basic"},
         )
 
+    digest = credentials_cache.digest(credentials.username, credentials.password)
+    if credentials_cache.verified(telegram_id, digest):
+        logger.debug(
+            {
+                "action": "admin_auth",
+                "stage": "cache_hit",
+                "data": {"telegram_id": telegram_id},
+            }
+        )
+        return telegram_id
+
+    generation = credentials_cache.generation()
     try:
         user = await users_repository.get_by_telegram_id(TelegramId(telegram_id))
     except Exception:
@@ -81,7 +97,9 @@ async def admin_user_provider(
             headers={"WWW-Authenticate": "Basic"},
         )
 
-    if not password_hasher.verify_password(credentials.password, user.password_hash):
+    if not await password_hasher.verify_password(
+        credentials.password, user.password_hash
+    ):
         logger.warning(
             {
                 "action": "admin_auth",
@@ -94,6 +112,8 @@ async def admin_user_provider(
             headers={"WWW-Authenticate": "Basic"},
         )
 
+    credentials_cache.add(telegram_id, digest, generation)
+
     logger.info(
         {
             "action": "admin_auth",
@@ -0,0 +1,42 @@
+"""Cache of successful admin HTTP Basic verifications."""
+
+import hashlib
+import hmac
+import secrets
+import time
+from collections.abc import Callable
+
+from src.core.cache import GenerationCache
+
+
+class AdminCredentialsCache(GenerationCache[int, bytes]):
+    """
+    Short-lived cache of successful admin credential checks.
+
+    Maps the Telegram ID of an admin to an HMAC-SHA256 digest of the
+    credentials it was verified with, under a random per-process key, so
+    neither passwords nor offline-guessable hashes of them are kept. A hit
+    lets ``admin_user_provider`` skip the user lookup and bcrypt.
+
+    The entry of a user is invalidated when the user's password, status or
+    role changes.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        max_size: int = 1024,
+        after_commit: Callable[[Callable[[], None]], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(ttl_seconds, max_size, after_commit, clock)
+        self._key = secrets.token_bytes(32)
+
+    def digest(self, username: str, password: str) -> bytes:
+        message = f"{len(username)}:{username}:{password}".encode("utf-8")
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def verified(self, telegram_id: int, digest: bytes) -> bool:
+        """Whether the admin was recently verified with these credentials."""
+        cached = self.get(telegram_id)
+        return cached is not None and hmac.compare_digest(cached, digest)
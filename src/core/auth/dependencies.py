@@ -1,24 +1,29 @@
 """FastAPI dependencies for authentication."""
 
+import uuid
+
 from dependency_injector.wiring import Provide, inject
 from fastapi import Depends, Request
 from src.core.auth.providers import TelegramMiniAppAuthProvider
 from src.container import ApplicationContainer
 from src.core.auth.schemas.tma import TelegramAuthData
-from src.domain.exceptions import InvalidTokenException
+from src.domain.exceptions import EntityNotFoundException, InvalidTokenException
 from src.domain.value_objects.telegram_id import TelegramId
+from src.drivers.rest.exceptions import NotFoundException
+from src.use_cases.characters.get_character import ResolveCharacterIdUseCase
 
 
 @inject
 async def get_telegram_auth_data(
     request: Request,
-    tma_auth=Depends(Provide[ApplicationContainer.tma_auth]),  # провайдер из контейнера
+    provider: TelegramMiniAppAuthProvider = Depends(
+        Provide[ApplicationContainer.telegram_mini_app_auth_provider]
+    ),
 ) -> TelegramAuthData:
     """
     Валидирует Authorization: (tma|Bearer)? <initDataRaw>
     Возвращает TelegramAuthData или 401.
     """
-    provider = TelegramMiniAppAuthProvider(tma_auth)
     return await provider(request)
 
 
@@ -29,3 +34,21 @@ async def get_telegram_current_user(
     if not auth_data.user:
         raise InvalidTokenException("No user data in Telegram Mini App init data")
     return TelegramId(auth_data.user.id)
+
+
+@inject
+async def get_current_character_id(
+    telegram_id: TelegramId = Depends(get_telegram_current_user),
+    use_case: ResolveCharacterIdUseCase = Depends(
+        Provide[ApplicationContainer.resolve_character_id_use_case]
+    ),
+) -> uuid.UUID:
+    """
+    ID персонажа текущего пользователя или 404.
+    FastAPI вычисляет зависимость один раз за запрос, между запросами ID
+    берётся из CharacterIdentityCache.
+    """
+    try:
+        return await use_case.execute(telegram_id.value)
+    except EntityNotFoundException as e:
+        raise NotFoundException(detail=str(e))
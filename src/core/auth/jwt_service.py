@@ -12,6 +12,9 @@ from src.domain.exceptions import InvalidTokenException, TokenExpiredException
 
 logger = logging.getLogger(__name__)
 
+# Token generation of the subject when the token was issued.
+GENERATION_CLAIM = "gen"
+
 
 class TokenType(str, Enum):
     ACCESS = "access"
@@ -27,6 +30,11 @@ class TokenPayload:
     issued_at: datetime
     claims: dict[str, Any]
 
+    @property
+    def generation(self) -> int:
+        # Tokens issued before generations existed count as the first one.
+        return int(self.claims.get(GENERATION_CLAIM, 0))
+
 
 class JwtService:
     def __init__(self) -> None:
@@ -82,8 +90,7 @@ class JwtService:
             raise InvalidTokenException("Missing exp claim")
 
         exp = datetime.fromtimestamp(exp_ts, tz=timezone.utc)
-        now = datetime.now(timezone.utc).replace(tzinfo=None)
-        if exp < now:
+        if exp < datetime.now(timezone.utc):
             raise TokenExpiredException()
 
         jti_value = payload.get("jti")
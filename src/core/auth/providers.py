@@ -10,7 +10,10 @@ from src.core.auth.schemas.tma import TelegramAuthData
 from src.domain.exceptions import InvalidTokenException, TokenExpiredException
 from src.domain.value_objects.telegram_id import TelegramId
 from src.drivers.rest.exceptions import UnauthorizedException
-from src.ports.repositories.auth import BlacklistedTokensRepository
+from src.ports.repositories.auth import (
+    BlacklistedTokensRepository,
+    TokenGenerationsRepository,
+)
 
 logger = logging.getLogger(__name__)
 http_bearer = HTTPBearer(auto_error=False)
@@ -31,15 +34,18 @@ class AccessTokenPayloadProvider:
     2. Token is valid JWT
     3. Token is not expired
     4. Token is not blacklisted (if repository provided)
+    5. Token generation is not revoked (if repository provided)
     """
 
     def __init__(
         self,
         jwt_service: JwtService,
         blacklisted_tokens_repository: BlacklistedTokensRepository | None = None,
+        token_generations_repository: TokenGenerationsRepository | None = None,
     ) -> None:
         self._jwt_service = jwt_service
         self._blacklisted_tokens_repository = blacklisted_tokens_repository
+        self._token_generations_repository = token_generations_repository
 
     async def __call__(
         self,
@@ -74,6 +80,27 @@ class AccessTokenPayloadProvider:
                 )
                 raise _unauthorized("Token has been revoked")
 
+        if self._token_generations_repository:
+            try:
+                user_tg_id = int(payload.sub)
+            except (TypeError, ValueError) as exc:
+                raise _unauthorized("Invalid subject claim") from exc
+
+            if await self._token_generations_repository.is_revoked(
+                user_tg_id, payload.generation
+            ):
+                logger.warning(
+                    {
+                        "action": "AccessTokenPayloadProvider",
+                        "stage": "generation_revoked",
+                        "data": {
+                            "jti": str(payload.jti),
+                            "generation": payload.generation,
+                        },
+                    }
+                )
+                raise _unauthorized("Token has been revoked")
+
         return payload
 
 
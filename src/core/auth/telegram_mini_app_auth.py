@@ -1,4 +1,6 @@
+import hashlib
 import logging
+from datetime import datetime
 
 from init_data_py import InitData
 from init_data_py import errors as init_data_errors
@@ -7,6 +9,7 @@ from src.core.auth.schemas.tma import (
     TelegramAuthData,
     TelegramUser,
 )
+from src.core.cache import TTLCache
 from src.domain.exceptions import InvalidTokenException
 from src.domain.value_objects.telegram_id import TelegramId
 
@@ -14,15 +17,42 @@ logger = logging.getLogger(__name__)
 
 
 class TelegramMiniAppAuth:
-    """Telegram Mini App authentication service."""
+    """Telegram Mini App authentication service.
 
-    def __init__(self, bot_token: str):
+    Successfully validated init data is cached by the digest of the raw string
+    until ``auth_date + lifetime``, the moment the signature check itself would
+    start rejecting it, so repeated requests skip parsing and the HMAC.
+    """
+
+    def __init__(self, bot_token: str, lifetime: int = 86400, cache_size: int = 10000):
         self.bot_token = bot_token
+        self.lifetime = lifetime
+        self._cache: TTLCache[bytes, TelegramAuthData] = TTLCache(max_size=cache_size)
 
     def validate_init_data(self, init_data_raw: str) -> TelegramAuthData:
+        cache_key = hashlib.sha256(init_data_raw.encode()).digest()
+        auth_data = self._cache.get(cache_key)
+        if auth_data is not None:
+            return auth_data
+
+        auth_data = self._validate_init_data(init_data_raw)
+
+        expires_at = self._expires_at(auth_data.auth_date)
+        if expires_at is not None:
+            self._cache.set(cache_key, auth_data, expires_at=expires_at)
+        return auth_data
+
+    def _expires_at(self, auth_date: int | datetime | None) -> float | None:
+        if auth_date is None:
+            return None
+        if isinstance(auth_date, datetime):
+            return auth_date.timestamp() + self.lifetime
+        return float(auth_date) + self.lifetime
+
+    def _validate_init_data(self, init_data_raw: str) -> TelegramAuthData:
         try:
             init_data = InitData.parse(init_data_raw)
-            init_data.validate(self.bot_token, lifetime=86400)
+            init_data.validate(self.bot_token, lifetime=self.lifetime)
 
             # ---------- USER ----------
             user_obj = getattr(init_data, "user", None)
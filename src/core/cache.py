@@ -0,0 +1,111 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class TTLCache(Generic[KeyT, ValueT]):
+    """Bounded in-process cache whose entries carry their own expiry time.
+
+    Entries are evicted in least-recently-used order once ``max_size`` is
+    reached. Expiry is checked lazily on read. The cache is meant to be used
+    from the event loop thread only and does no locking.
+    """
+
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.time) -> None:
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[KeyT, tuple[float, ValueT]] = OrderedDict()
+
+    def get(self, key: KeyT) -> ValueT | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: KeyT, value: ValueT, expires_at: float) -> None:
+        if self._max_size <= 0 or expires_at <= self._clock():
+            return
+
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: KeyT) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class GenerationCache(Generic[KeyT, ValueT]):
+    """TTL cache of values read from the database, dropped when they change.
+
+    A reader takes ``generation()`` before loading a value and passes it to
+    ``add``, which ignores the value when its key was invalidated meanwhile.
+    ``invalidate`` drops keys right away and once more through
+    ``after_commit``: a value loaded between a change and its commit would
+    otherwise be kept.
+
+    The generation counts invalidations. Each invalidated key remembers the
+    generation of its last invalidation, for at most ``max_size`` keys; once
+    a key is forgotten, values loaded before the forgotten invalidation are
+    ignored for every key, so a load is never kept when it may be stale.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_size: int,
+        after_commit: Callable[[Callable[[], None]], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._after_commit = after_commit
+        self._clock = clock
+        self._entries: TTLCache[KeyT, ValueT] = TTLCache(max_size, clock=clock)
+        self._generation = 0
+        self._invalidated: OrderedDict[KeyT, int] = OrderedDict()
+        self._forgotten = 0
+
+    def get(self, key: KeyT) -> ValueT | None:
+        return self._entries.get(key)
+
+    def generation(self) -> int:
+        return self._generation
+
+    def add(self, key: KeyT, value: ValueT, generation: int) -> None:
+        """Remember ``value`` loaded after ``generation()`` returned ``generation``."""
+        if generation < self._invalidated.get(key, self._forgotten):
+            return
+
+        self._entries.set(key, value, expires_at=self._clock() + self._ttl_seconds)
+
+    def invalidate(self, *keys: KeyT) -> None:
+        self._drop(keys)
+        if self._after_commit is not None:
+            self._after_commit(lambda: self._drop(keys))
+
+    def _drop(self, keys: tuple[KeyT, ...]) -> None:
+        self._generation += 1
+        for key in keys:
+            self._entries.pop(key)
+            self._invalidated[key] = self._generation
+            self._invalidated.move_to_end(key)
+        while len(self._invalidated) > self._max_size:
+            _, self._forgotten = self._invalidated.popitem(last=False)
@@ -0,0 +1,70 @@
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from src.core.cache import GenerationCache
+
+ITEMS_CATALOG = "items"
+BACKGROUNDS_CATALOG = "backgrounds"
+ITEM_CATEGORIES_CATALOG = "item_categories"
+ACTIVITY_TYPES_CATALOG = "activity_types"
+CATALOGS = (
+    ITEMS_CATALOG,
+    BACKGROUNDS_CATALOG,
+    ITEM_CATEGORIES_CATALOG,
+    ACTIVITY_TYPES_CATALOG,
+)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    body: bytes
+    etag: str
+
+
+class CatalogSnapshots:
+    """Serialized public catalogs shared by every request of the process.
+
+    A catalog is built once by the caller-supplied ``build`` coroutine and kept
+    until an admin change invalidates it.
+
+    Invalidation only reaches the process that made the change. The TTL bounds
+    how long the other worker processes keep serving the previous catalog; a
+    rebuilt catalog that did not change keeps its ETag.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 10.0,
+        after_commit: Callable[[Callable[[], None]], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._snapshots: GenerationCache[str, CatalogSnapshot] = GenerationCache(
+            ttl_seconds, max_size=len(CATALOGS), after_commit=after_commit, clock=clock
+        )
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def get(
+        self, name: str, build: Callable[[], Awaitable[bytes]]
+    ) -> CatalogSnapshot:
+        snapshot = self._snapshots.get(name)
+        if snapshot is not None:
+            return snapshot
+
+        async with self._locks.setdefault(name, asyncio.Lock()):
+            snapshot = self._snapshots.get(name)
+            if snapshot is not None:
+                return snapshot
+
+            generation = self._snapshots.generation()
+            body = await build()
+            snapshot = CatalogSnapshot(
+                body=body, etag=f'"{hashlib.sha256(body).hexdigest()}"'
+            )
+            self._snapshots.add(name, snapshot, generation)
+            return snapshot
+
+    def invalidate(self, *names: str) -> None:
+        self._snapshots.invalidate(*names)
@@ -0,0 +1,27 @@
+"""Process-wide cache of the character owned by each user."""
+
+import time
+import uuid
+from collections.abc import Callable
+
+from src.core.cache import GenerationCache
+
+
+class CharacterIdentityCache(GenerationCache[int, uuid.UUID]):
+    """
+    Short-lived mapping of Telegram IDs to the IDs of their characters.
+
+    Only existing characters are remembered, so a user who has just created
+    a character is never told that it is missing. An entry is invalidated
+    when the character of its user is created or deleted. The TTL bounds how
+    long another process may serve an ID that was deleted elsewhere.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        max_size: int = 10_000,
+        after_commit: Callable[[Callable[[], None]], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(ttl_seconds, max_size, after_commit, clock)
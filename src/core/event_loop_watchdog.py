@@ -0,0 +1,132 @@
+"""Event loop lag sampling and stack capture of callbacks that block the loop."""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BlockedLoop:
+    """A callback that kept the event loop from running anything else."""
+
+    detected_at: float
+    blocked_seconds: float
+    # Stack of the event loop thread while it was blocked; empty when the
+    # callback finished before the monitor thread looked.
+    stack: tuple[str, ...]
+
+
+@dataclass
+class EventLoopStats:
+    samples: int = 0
+    lag_seconds: float = 0.0
+    lag_seconds_max: float = 0.0
+    slow_callbacks: int = 0
+    blocked_seconds_total: float = 0.0
+
+
+class EventLoopWatchdog:
+    """Measures how late the event loop runs its callbacks.
+
+    A task sleeps for ``interval_seconds`` in a loop; how much later than
+    requested it wakes up is the lag every other callback sees at that time.
+    A sample of ``slow_callback_seconds`` or more counts as a slow callback.
+
+    The lag only tells that the loop was blocked, not by what: a daemon
+    thread watches the heartbeat of the sampling task and, once it is overdue
+    by ``slow_callback_seconds``, records the stack of the event loop thread,
+    which is then still inside the blocking call. The last ``history`` slow
+    callbacks are kept with their stacks.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.1,
+        slow_callback_seconds: float = 0.1,
+        history: int = 20,
+    ) -> None:
+        self._interval = interval_seconds
+        self._slow = slow_callback_seconds
+        self.stats = EventLoopStats()
+        self._blocked: deque[BlockedLoop] = deque(maxlen=history)
+        self._listeners: list[Callable[[float], None]] = []
+        self._heartbeat = time.monotonic()
+        self._captured_heartbeat: float | None = None
+        self._captured_stack: tuple[str, ...] = ()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+        self._loop_thread_id = 0
+
+    def subscribe(self, listener: Callable[[float], None]) -> None:
+        """Call ``listener`` with every lag sample, on the event loop thread."""
+        self._listeners.append(listener)
+
+    def blocked(self) -> list[BlockedLoop]:
+        """Recent slow callbacks, the latest first."""
+        return list(reversed(self._blocked))
+
+    def start(self) -> None:
+        """Start watching the running event loop."""
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        self._thread = threading.Thread(
+            target=self._monitor, name="event-loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._heartbeat = time.monotonic()
+            due = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            self._record(max(loop.time() - due, 0.0))
+
+    def _record(self, lag: float) -> None:
+        stats = self.stats
+        stats.samples += 1
+        stats.lag_seconds = lag
+        stats.lag_seconds_max = max(stats.lag_seconds_max, lag)
+        if lag >= self._slow:
+            with self._lock:
+                stack, self._captured_stack = self._captured_stack, ()
+            stats.slow_callbacks += 1
+            stats.blocked_seconds_total += lag
+            self._blocked.append(BlockedLoop(time.time(), lag, stack))
+        for listener in self._listeners:
+            listener(lag)
+
+    def _monitor(self) -> None:
+        # Overdue means the sampling task missed its wake-up by the threshold.
+        overdue = self._interval + self._slow
+        while not self._stopped.wait(min(self._slow / 2, self._interval)):
+            heartbeat = self._heartbeat
+            if heartbeat == self._captured_heartbeat:
+                continue
+            if time.monotonic() - heartbeat < overdue:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = tuple(traceback.format_stack(frame))
+            with self._lock:
+                self._captured_heartbeat = heartbeat
+                self._captured_stack = stack
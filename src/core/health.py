@@ -0,0 +1,81 @@
+"""Readiness probes of the service with short-lived cached results."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    healthy: bool
+    detail: str = ""
+
+
+@dataclass(frozen=True)
+class Readiness:
+    ready: bool
+    checks: dict[str, CheckResult]
+
+
+Check = Callable[[], Awaitable[CheckResult]]
+
+
+class HealthProbes:
+    """Runs the registered readiness checks and caches the outcome.
+
+    Orchestrators and load balancers probe every worker every few seconds;
+    within ``cache_seconds`` they all get the same result, and concurrent
+    probes wait for the one run in flight instead of starting their own, so
+    probing adds at most one round of checks per interval. A check that raises
+    or takes longer than ``timeout_seconds`` counts as failed.
+    """
+
+    def __init__(
+        self,
+        cache_seconds: float = 2.0,
+        timeout_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._cache_seconds = cache_seconds
+        self._timeout_seconds = timeout_seconds
+        self._clock = clock
+        self._checks: dict[str, Check] = {}
+        self._readiness: Readiness | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def add(self, name: str, check: Check) -> None:
+        self._checks[name] = check
+
+    async def readiness(self) -> Readiness:
+        readiness = self._cached()
+        if readiness is not None:
+            return readiness
+        async with self._lock:
+            readiness = self._cached()
+            if readiness is not None:
+                return readiness
+            results = await asyncio.gather(
+                *(self._run(check) for check in self._checks.values())
+            )
+            readiness = Readiness(
+                ready=all(result.healthy for result in results),
+                checks=dict(zip(self._checks, results)),
+            )
+            self._readiness, self._checked_at = readiness, self._clock()
+            return readiness
+
+    def _cached(self) -> Readiness | None:
+        if self._clock() - self._checked_at < self._cache_seconds:
+            return self._readiness
+        return None
+
+    async def _run(self, check: Check) -> CheckResult:
+        try:
+            return await asyncio.wait_for(check(), self._timeout_seconds)
+        except asyncio.TimeoutError:
+            return CheckResult(False, f"timed out after {self._timeout_seconds}s")
+        except Exception as e:
+            return CheckResult(False, f"{type(e).__name__}: {e}")
+
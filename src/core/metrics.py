@@ -0,0 +1,386 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+Recording a sample is a dict lookup and a few additions under the GIL, so
+metrics can be updated on every request. The registry keeps one series per
+label combination; labels must therefore have a bounded set of values (route
+templates, not raw paths).
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, TypeVar
+
+from src.core.event_loop_watchdog import EventLoopWatchdog
+from src.core.scheduler import JobRun, JobScheduler
+from src.core.security import AsyncPasswordHasher
+
+if TYPE_CHECKING:
+    from src.adapters.database.session import PoolStatistics
+
+LabelValues = tuple[str, ...]
+
+# Seconds; covers fast cached endpoints up to requests stuck behind the pool.
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+JOB_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+# Seconds the event loop ran a callback late; a healthy loop stays in the first.
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Iterable[str]) -> str:
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return f"{{{pairs}}}" if pairs else ""
+
+
+class _Metric(ABC):
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._samples())
+        return lines
+
+    @abstractmethod
+    def _samples(self) -> list[str]: ...
+
+
+MetricT = TypeVar("MetricT", bound=_Metric)
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def set(self, value: float, labels: LabelValues = ()) -> None:
+        """Publish a total that is counted elsewhere."""
+        self._values[labels] = value
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, labels)} "
+            f"{_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) - amount
+
+    def set(self, value: float, labels: LabelValues = ()) -> None:
+        self._values[labels] = value
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, labels)} "
+            f"{_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per series: non-cumulative bucket counts (the last one is +Inf), sum.
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        counts = self._counts.get(labels)
+        if counts is None:
+            counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+            self._sums[labels] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[labels] += value
+
+    def _samples(self) -> list[str]:
+        lines = []
+        bucket_labels = (*self.label_names, "le")
+        for labels, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                label_text = _format_labels(
+                    bucket_labels, (*labels, _format_value(bound))
+                )
+                lines.append(f"{self.name}_bucket{label_text} {cumulative}")
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(
+                f"{self.name}_sum{label_text} {_format_value(self._sums[labels])}"
+            )
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Owns metrics and renders them for the scrape endpoint.
+
+    Collectors are called right before rendering; they copy values that are
+    kept elsewhere (pool sizes, executor statistics) into gauges.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def counter(
+        self, name: str, documentation: str, labels: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labels))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            collector()
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: MetricT) -> MetricT:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+
+class ApplicationMetrics:
+    """Metrics recorded by the HTTP and database layers of the service."""
+
+    def __init__(self, registry: MetricsRegistry | None = None) -> None:
+        self.registry = registry or MetricsRegistry()
+        self.requests_in_flight = self.registry.gauge(
+            "http_requests_in_flight",
+            "HTTP requests currently being handled.",
+            ["method"],
+        )
+        self.requests_total = self.registry.counter(
+            "http_requests_total",
+            "HTTP requests handled, by route template and status code.",
+            ["method", "route", "status"],
+        )
+        self.request_duration = self.registry.histogram(
+            "http_request_duration_seconds",
+            "Time to handle a request and send its response, by route template.",
+            ["method", "route"],
+        )
+        self.db_checkout_wait = self.registry.histogram(
+            "db_pool_checkout_wait_seconds",
+            "Time a request waited for its first database connection.",
+            ["route"],
+        )
+        self.db_connection_hold = self.registry.histogram(
+            "db_connection_hold_seconds",
+            "Time a request kept its database connection checked out.",
+            ["route"],
+        )
+        self.db_statements = self.registry.histogram(
+            "db_statements_per_request",
+            "SQL statements executed by a request.",
+            ["route"],
+            buckets=STATEMENT_BUCKETS,
+        )
+
+    def request_started(self, method: str) -> None:
+        self.requests_in_flight.inc((method,))
+
+    def request_finished(
+        self, method: str, route: str, status: int, duration: float
+    ) -> None:
+        self.requests_in_flight.dec((method,))
+        self.requests_total.inc((method, route, str(status)))
+        self.request_duration.observe(duration, (method, route))
+
+    def database_used(
+        self,
+        route: str,
+        checkout_wait: float,
+        statements: int,
+        connection_hold: float | None = None,
+    ) -> None:
+        self.db_checkout_wait.observe(checkout_wait, (route,))
+        self.db_statements.observe(statements, (route,))
+        if connection_hold is not None:
+            self.db_connection_hold.observe(connection_hold, (route,))
+
+    def watch_database_pool(self, statistics: Callable[[], "PoolStatistics"]) -> None:
+        """Publish the connection pool statistics on every scrape."""
+        size = self.registry.gauge("db_pool_size", "Connections kept open by the pool.")
+        checked_out = self.registry.gauge(
+            "db_pool_checked_out", "Connections currently checked out of the pool."
+        )
+        overflow = self.registry.gauge(
+            "db_pool_overflow", "Connections opened beyond the pool size."
+        )
+        checkouts = self.registry.counter(
+            "db_pool_checkouts_total", "Connections checked out of the pool."
+        )
+        invalidations = self.registry.counter(
+            "db_pool_invalidations_total",
+            "Connections dropped as dead, mostly by the pre-ping on checkout.",
+        )
+
+        def collect() -> None:
+            stats = statistics()
+            size.set(stats.size)
+            checked_out.set(stats.checked_out)
+            overflow.set(stats.overflow)
+            checkouts.set(stats.checkouts)
+            invalidations.set(stats.invalidations)
+
+        self.registry.add_collector(collect)
+
+    def watch_event_loop(self, watchdog: EventLoopWatchdog) -> None:
+        """Publish the event loop lag samples and slow callbacks of ``watchdog``."""
+        lag = self.registry.histogram(
+            "event_loop_lag_seconds",
+            "How late the event loop ran a callback scheduled to run now.",
+            buckets=LOOP_LAG_BUCKETS,
+        )
+        slow_callbacks = self.registry.counter(
+            "event_loop_slow_callbacks_total",
+            "Callbacks that blocked the event loop beyond the threshold.",
+        )
+        blocked_seconds = self.registry.counter(
+            "event_loop_blocked_seconds_total",
+            "Time the event loop spent blocked in slow callbacks.",
+        )
+        watchdog.subscribe(lag.observe)
+
+        def collect() -> None:
+            stats = watchdog.stats
+            slow_callbacks.set(stats.slow_callbacks)
+            blocked_seconds.set(stats.blocked_seconds_total)
+
+        self.registry.add_collector(collect)
+
+    def watch_scheduler(self, scheduler: JobScheduler) -> None:
+        """Record the runtime, outcome and processed rows of scheduled jobs."""
+        runs = self.registry.counter(
+            "scheduled_job_runs_total",
+            "Scheduled job runs, by outcome; skipped when another process leads.",
+            ["job", "outcome"],
+        )
+        duration = self.registry.histogram(
+            "scheduled_job_duration_seconds",
+            "Time a scheduled job run took.",
+            ["job"],
+            buckets=JOB_BUCKETS,
+        )
+        rows = self.registry.counter(
+            "scheduled_job_rows_total", "Rows processed by scheduled jobs.", ["job"]
+        )
+
+        def record(run: JobRun) -> None:
+            runs.inc((run.job, run.outcome))
+            if run.outcome != "skipped":
+                duration.observe(run.duration_seconds, (run.job,))
+                rows.inc((run.job,), run.rows)
+
+        scheduler.subscribe(record)
+
+    def watch_password_hashing(self, hasher: AsyncPasswordHasher) -> None:
+        """Publish the statistics of ``hasher`` on every scrape."""
+        queue_depth = self.registry.gauge(
+            "password_hashing_queue_depth",
+            "Password hashing calls waiting for a worker.",
+        )
+        in_flight = self.registry.gauge(
+            "password_hashing_in_flight", "Password hashing calls being run."
+        )
+        completed = self.registry.counter(
+            "password_hashing_completed_total", "Password hashing calls completed."
+        )
+        wait_seconds = self.registry.counter(
+            "password_hashing_wait_seconds_total",
+            "Time password hashing calls waited for a worker.",
+        )
+        run_seconds = self.registry.counter(
+            "password_hashing_run_seconds_total",
+            "Time spent hashing and verifying passwords.",
+        )
+
+        def collect() -> None:
+            stats = hasher.stats
+            queue_depth.set(stats.queue_depth)
+            in_flight.set(stats.in_flight)
+            completed.set(stats.completed)
+            wait_seconds.set(stats.wait_seconds_total)
+            run_seconds.set(stats.run_seconds_total)
+
+        self.registry.add_collector(collect)
@@ -0,0 +1,104 @@
+"""Periodic maintenance jobs run inside the application processes."""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Enters with whether this process may run the named job now.
+JobLock = Callable[[str], AbstractAsyncContextManager[bool]]
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    name: str
+    run: Callable[[], Awaitable[int]]
+    interval_seconds: float
+    jitter: float
+
+
+@dataclass(frozen=True)
+class JobRun:
+    job: str
+    # "succeeded", "failed", or "skipped" when another process held the lock.
+    outcome: str
+    duration_seconds: float
+    rows: int
+
+
+class JobScheduler:
+    """Runs every added job about every ``interval_seconds`` in the background.
+
+    Each worker process of each replica runs a scheduler. Before a run the job
+    takes ``lock``; when another process holds it the run is skipped, so one
+    process at a time does the work. Intervals are stretched or shortened by
+    up to ``jitter`` of their length, and the first run comes after a random
+    part of the interval, so the processes started by one deploy do not all
+    try at the same moment. A job returns the number of rows it processed.
+    """
+
+    def __init__(self, lock: JobLock, rng: random.Random | None = None) -> None:
+        self._lock = lock
+        self._rng = rng or random.Random()
+        self._jobs: list[ScheduledJob] = []
+        self._tasks: list[asyncio.Task[None]] = []
+        self._listeners: list[Callable[[JobRun], None]] = []
+
+    def add(
+        self,
+        name: str,
+        run: Callable[[], Awaitable[int]],
+        interval_seconds: float,
+        jitter: float = 0.1,
+    ) -> None:
+        self._jobs.append(ScheduledJob(name, run, interval_seconds, jitter))
+
+    def subscribe(self, listener: Callable[[JobRun], None]) -> None:
+        """Call ``listener`` with the outcome of every run."""
+        self._listeners.append(listener)
+
+    def start(self) -> None:
+        for job in self._jobs:
+            self._tasks.append(asyncio.create_task(self._loop(job)))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def run_once(self, job: ScheduledJob) -> JobRun:
+        started = time.perf_counter()
+        outcome, rows = "skipped", 0
+        try:
+            async with self._lock(job.name) as acquired:
+                if acquired:
+                    rows = await job.run()
+                    outcome = "succeeded"
+        except Exception:
+            outcome = "failed"
+            logger.exception(
+                {
+                    "action": "JobScheduler.run_once",
+                    "stage": "failed",
+                    "data": {"job": job.name},
+                }
+            )
+        run = JobRun(job.name, outcome, time.perf_counter() - started, rows)
+        for listener in self._listeners:
+            listener(run)
+        return run
+
+    async def _loop(self, job: ScheduledJob) -> None:
+        await asyncio.sleep(self._rng.uniform(0, job.interval_seconds))
+        while True:
+            await self.run_once(job)
+            spread = job.interval_seconds * job.jitter
+            await asyncio.sleep(
+                job.interval_seconds + self._rng.uniform(-spread, spread)
+            )
@@ -1,11 +1,19 @@
+import asyncio
 import hashlib
 import hmac
 import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
 
 import bcrypt
 
 logger = logging.getLogger(__name__)
 
+ResultT = TypeVar("ResultT")
+
 
 class PasswordHasher:
     """Класс для хэширования паролей.
@@ -42,6 +50,74 @@ class PasswordHasher:
         return hashed.decode("utf-8")
 
 
+@dataclass
+class PasswordHashingStats:
+    """Счётчики асинхронного хеширования паролей."""
+
+    queue_depth: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    run_seconds_total: float = 0.0
+    run_seconds_max: float = 0.0
+
+
+class AsyncPasswordHasher:
+    """Асинхронная обёртка над PasswordHasher.
+
+    bcrypt выполняется в отдельном пуле из ``max_workers`` потоков, поэтому
+    проверка пароля не блокирует event loop. Вызовы сверх числа воркеров ждут
+    свободный слот в event loop, а не копятся в очереди пула; глубина этой
+    очереди и время ожидания/выполнения доступны в ``stats``.
+    """
+
+    def __init__(self, hasher: PasswordHasher, max_workers: int = 2) -> None:
+        self._hasher = hasher
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._slots = asyncio.Semaphore(max_workers)
+        self.stats = PasswordHashingStats()
+
+    async def verify_password(self, plain_pass: str, hashed_pass: str) -> bool:
+        """Проверяет, соответствует ли пароль хэшу."""
+        return await self._run(self._hasher.verify_password, plain_pass, hashed_pass)
+
+    async def get_password_hash(self, password: str) -> str:
+        """Хэширует пароль. Поддерживает пароли любой длины."""
+        return await self._run(self._hasher.get_password_hash, password)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., ResultT], *args: str) -> ResultT:
+        stats = self.stats
+        queued_at = time.perf_counter()
+
+        stats.queue_depth += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            stats.queue_depth -= 1
+
+        started_at = time.perf_counter()
+        waited = started_at - queued_at
+        stats.wait_seconds_total += waited
+        stats.wait_seconds_max = max(stats.wait_seconds_max, waited)
+        stats.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._slots.release()
+            elapsed = time.perf_counter() - started_at
+            stats.in_flight -= 1
+            stats.completed += 1
+            stats.run_seconds_total += elapsed
+            stats.run_seconds_max = max(stats.run_seconds_max, elapsed)
+
+
 class TokenHasher:
     """Provides deterministic hashing for token values (e.g., refresh tokens)."""
 
@@ -1,3 +1,4 @@
+import os
 from functools import lru_cache
 
 from pydantic import BaseModel
@@ -11,6 +12,9 @@ class DatabaseSettings(BaseModel):
     user: str
     password: str
     echo: bool = False
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
 
     @property
     def async_url(self) -> str:
@@ -44,10 +48,13 @@ class JWTSettings(BaseModel):
     algorithm: str
     access_token_expire_minutes: int
     refresh_token_expire_minutes: int
+    revocation_refresh_seconds: float = 5.0
 
 
 class TelegramSettings(BaseModel):
     bot_token: str
+    init_data_lifetime: int = 86400
+    init_data_cache_size: int = 10000
 
 
 class Settings(BaseSettings):
@@ -57,6 +64,13 @@ class Settings(BaseSettings):
     db_user: str
     db_password: str
     db_echo: bool = False
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    # Connections all worker processes together may open; splits into the
+    # per-process pool when set.
+    db_connection_budget: int | None = None
+    db_schema_check_interval_seconds: float = 5.0
 
     redis_host: str
     redis_port: int
@@ -74,18 +88,57 @@ class Settings(BaseSettings):
     jwt_algorithm: str
     jwt_access_token_expire_minutes: int
     jwt_refresh_token_expire_minutes: int
+    jwt_revocation_refresh_seconds: float = 5.0
 
     telegram_bot_token: str
+    telegram_init_data_lifetime: int = 86400
+    telegram_init_data_cache_size: int = 10000
 
     application_admin_telegram_ids: str = ""
 
+    log_level: str = "INFO"
+
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    web_concurrency: int | None = None
+    server_graceful_timeout: float = 30.0
+
+    password_hashing_workers: int = 2
+    admin_auth_cache_ttl_seconds: float = 60.0
+    character_cache_ttl_seconds: float = 30.0
+    catalog_cache_ttl_seconds: float = 10.0
+
+    health_cache_seconds: float = 2.0
+    health_timeout_seconds: float = 1.0
+    health_max_loop_lag_seconds: float = 0.25
+
+    event_loop_interval_seconds: float = 0.1
+    event_loop_slow_seconds: float = 0.1
+    debug_routes_enabled: bool = False
+
+    maintenance_enabled: bool = True
+    token_pruning_interval_seconds: float = 600.0
+    token_pruning_batch_size: int = 1000
+    token_pruning_max_rows: int = 20000
+    refresh_token_revoked_retention_hours: float = 24.0
+
     model_config = SettingsConfigDict(
         env_file=".env",
         case_sensitive=False,
     )
 
+    @property
+    def workers(self) -> int:
+        """Worker processes to serve with; one per CPU core by default."""
+        return self.web_concurrency or os.cpu_count() or 1
+
     @property
     def database(self) -> DatabaseSettings:
+        pool_size, max_overflow = self.db_pool_size, self.db_max_overflow
+        if self.db_connection_budget is not None:
+            per_process = max(self.db_connection_budget // self.workers, 1)
+            pool_size = min(pool_size, per_process)
+            max_overflow = per_process - pool_size
         return DatabaseSettings(
             host=self.db_host,
             port=self.db_port,
@@ -93,6 +146,9 @@ class Settings(BaseSettings):
             user=self.db_user,
             password=self.db_password,
             echo=self.db_echo,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=self.db_pool_timeout,
         )
 
     @property
@@ -120,12 +176,15 @@ class Settings(BaseSettings):
             algorithm=self.jwt_algorithm,
             access_token_expire_minutes=self.jwt_access_token_expire_minutes,
             refresh_token_expire_minutes=self.jwt_refresh_token_expire_minutes,
+            revocation_refresh_seconds=self.jwt_revocation_refresh_seconds,
         )
 
     @property
     def telegram(self) -> TelegramSettings:
         return TelegramSettings(
             bot_token=self.telegram_bot_token,
+            init_data_lifetime=self.telegram_init_data_lifetime,
+            init_data_cache_size=self.telegram_init_data_cache_size,
         )
 
     @property
@@ -2,5 +2,6 @@
 
 from .blacklisted_token import BlacklistedToken
 from .refresh_token import RefreshToken
+from .token_generation import TokenGeneration
 
-__all__ = ["BlacklistedToken", "RefreshToken"]
+__all__ = ["BlacklistedToken", "RefreshToken", "TokenGeneration"]
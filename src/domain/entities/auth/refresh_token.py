@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from src.domain.value_objects.telegram_id import TelegramId
 
@@ -13,6 +13,12 @@ class RefreshToken:
     jti: UUID
     expires_at: datetime
     revoked: bool = False
+    # Tokens rotated from one login share a family; reusing a rotated token
+    # revokes the whole family.
+    family_id: UUID = field(default_factory=uuid4)
+    # JTI of the token this one was rotated into. Only a rotated token is
+    # reused when presented again; logout and a new login revoke without it.
+    replaced_by: UUID | None = None
     created_at: datetime = field(
         default_factory=lambda: datetime.now(timezone.utc).replace(tzinfo=None)
     )
@@ -25,5 +31,9 @@ class RefreshToken:
             self.revoked = True
             self.touch()
 
+    def rotate(self, replaced_by: UUID) -> None:
+        self.replaced_by = replaced_by
+        self.revoke()
+
     def touch(self) -> None:
         self.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,19 @@
+"""Per-user token generation domain entity."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class TokenGeneration:
+    """
+    Generation of the tokens issued to a user.
+
+    Every token carries the generation that was current when it was issued.
+    Revoking all of a user's sessions advances the generation, which
+    invalidates every token issued before.
+    """
+
+    user_tg_id: int
+    generation: int
+    revoked_at: datetime
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityType:
     id: uuid.UUID
     name: str
@@ -15,7 +15,7 @@ class ActivityType:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyActivity:
     id: uuid.UUID
     character_id: uuid.UUID
@@ -35,7 +35,7 @@ class DailyActivity:
         self.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyProgress:
     id: uuid.UUID
     character_id: uuid.UUID
@@ -55,7 +55,7 @@ class DailyProgress:
         self.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class MoodHistory:
     id: uuid.UUID
     character_id: uuid.UUID
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemCategory:
     id: uuid.UUID
     name: str
@@ -13,7 +13,7 @@ class ItemCategory:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     id: uuid.UUID
     category_id: uuid.UUID
@@ -37,7 +37,7 @@ class Item:
         self.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class Background:
     id: uuid.UUID
     name: str
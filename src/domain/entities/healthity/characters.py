@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from src.domain.value_objects.telegram_id import TelegramId
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     id: uuid.UUID
     user_tg_id: TelegramId
@@ -41,7 +41,7 @@ class Character:
         self.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterItem:
     id: uuid.UUID
     character_id: uuid.UUID
@@ -62,7 +62,7 @@ class CharacterItem:
         self.is_favorite = not self.is_favorite
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterBackground:
     id: uuid.UUID
     character_id: uuid.UUID
@@ -83,7 +83,7 @@ class CharacterBackground:
         self.is_favorite = not self.is_favorite
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemBackgroundPosition:
     id: uuid.UUID
     item_id: uuid.UUID
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class UserStatistics:
+    """Counters shown on the statistics screen of a user."""
+
+    user_tg_id: int
+    balance: int
+    level: int | None
+    total_experience: int | None
+    character_name: str | None
+    character_sex: str | None
+    purchased_items_count: int
+    purchased_backgrounds_count: int
+    mood_entries_count: int
+    transactions_count: int
+    friends_count: int
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from src.domain.value_objects.telegram_id import TelegramId
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     id: uuid.UUID
     user_tg_id: TelegramId
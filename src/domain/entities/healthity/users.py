@@ -6,7 +6,7 @@ import uuid
 from src.domain.value_objects.telegram_id import TelegramId
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     telegram_id: TelegramId
     password_hash: str | None = None
@@ -54,7 +54,7 @@ class User:
         self.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSettings:
     id: uuid.UUID
     user_tg_id: TelegramId
@@ -86,7 +86,7 @@ class UserSettings:
         self.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserFriend:
     id: uuid.UUID
     owner_tg_id: TelegramId
@@ -0,0 +1,20 @@
+"""Maintenance jobs run by the in-process scheduler."""
+
+from src.container import ApplicationContainer
+from src.core.scheduler import JobScheduler
+
+
+def register_maintenance_jobs(
+    scheduler: JobScheduler, container: ApplicationContainer, interval_seconds: float
+) -> None:
+    async def prune_blacklisted_tokens() -> int:
+        return await container.prune_blacklisted_tokens_use_case().execute()
+
+    async def prune_refresh_tokens() -> int:
+        return await container.prune_refresh_tokens_use_case().execute()
+
+    for name, job in (
+        ("prune_blacklisted_tokens", prune_blacklisted_tokens),
+        ("prune_refresh_tokens", prune_refresh_tokens),
+    ):
+        scheduler.add(name, job, interval_seconds)
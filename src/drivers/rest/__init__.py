@@ -10,9 +10,12 @@ __all__ = [
     "character_items",
     "daily_activities",
     "daily_progress",
+    "debug",
+    "health",
     "items",
     "item_categories",
     "item_background_positions",
+    "metrics",
     "mood_history",
     "transactions",
     "user_friends",
@@ -1,13 +1,16 @@
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 
 from src.container import ApplicationContainer
 from src.core.auth.admin import admin_user_provider
+from src.core.catalog_snapshots import ACTIVITY_TYPES_CATALOG, CatalogSnapshots
 from src.domain.exceptions import EntityNotFoundException
 from src.adapters.repositories.exceptions import RepositoryError
+from src.drivers.rest.catalog_snapshots import catalog_response
 from src.drivers.rest.exceptions import NotFoundException, BadRequestException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.activities import (
     ActivityTypeCreate,
     ActivityTypeResponse,
@@ -39,7 +42,7 @@ async def list_activity_types(
     """Получить список всех типов активностей (требуется админ-доступ)"""
     try:
         activity_types = await use_case.execute()
-        return [ActivityTypeResponse.model_validate(at) for at in activity_types]
+        return json_response(activity_types, list[ActivityTypeResponse])
     except RepositoryError as e:
         raise BadRequestException(detail=str(e))
 
@@ -138,10 +141,22 @@ async def delete_activity_type(
 @router.get("/catalog", response_model=list[ActivityTypeResponse])
 @inject
 async def list_activity_types_catalog(
+    request: Request,
     use_case: ListActivityTypesUseCase = Depends(
         Provide[ApplicationContainer.list_activity_types_use_case]
     ),
+    snapshots: CatalogSnapshots = Depends(
+        Provide[ApplicationContainer.catalog_snapshots]
+    ),
 ):
-    """Получить каталог типов активностей (открытый endpoint)"""
-    activity_types = await use_case.execute()
-    return [ActivityTypeResponse.model_validate(at) for at in activity_types]
+    """Получить каталог типов активностей (открытый endpoint)
+
+    Поддерживает `If-None-Match`: при совпадении ETag возвращается 304.
+    """
+    return await catalog_response(
+        request,
+        snapshots,
+        ACTIVITY_TYPES_CATALOG,
+        use_case.execute,
+        ActivityTypeResponse,
+    )
@@ -1,13 +1,16 @@
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
 from src.container import ApplicationContainer
 from src.core.auth.admin import admin_user_provider
+from src.core.catalog_snapshots import BACKGROUNDS_CATALOG, CatalogSnapshots
 from src.domain.exceptions import EntityNotFoundException
 from src.adapters.repositories.exceptions import RepositoryError
+from src.drivers.rest.catalog_snapshots import catalog_response
 from src.drivers.rest.exceptions import NotFoundException, BadRequestException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.catalog import (
     BackgroundCreate,
     BackgroundResponse,
@@ -40,7 +43,7 @@ async def list_backgrounds(
     """Получить список всех фонов (требуется админ-доступ)"""
     try:
         backgrounds = await use_case.execute(limit=limit, offset=offset)
-        return [BackgroundResponse.model_validate(bg) for bg in backgrounds]
+        return json_response(backgrounds, list[BackgroundResponse])
     except RepositoryError as e:
         raise BadRequestException(detail=str(e))
 
@@ -141,13 +144,25 @@ async def delete_background(
 @router.get("/catalog", response_model=list[BackgroundResponse])
 @inject
 async def list_backgrounds_catalog(
+    request: Request,
     use_case: ListAvailableBackgroundsUseCase = Depends(
         Provide[ApplicationContainer.list_available_backgrounds_use_case]
     ),
+    snapshots: CatalogSnapshots = Depends(
+        Provide[ApplicationContainer.catalog_snapshots]
+    ),
 ):
-    """Получить каталог доступных фонов (открытый endpoint)"""
+    """Получить каталог доступных фонов (открытый endpoint)
+
+    Поддерживает `If-None-Match`: при совпадении ETag возвращается 304.
+    """
     try:
-        backgrounds = await use_case.execute()
-        return [BackgroundResponse.model_validate(bg) for bg in backgrounds]
+        return await catalog_response(
+            request,
+            snapshots,
+            BACKGROUNDS_CATALOG,
+            use_case.execute,
+            BackgroundResponse,
+        )
     except RepositoryError as e:
         raise BadRequestException(detail=str(e))
@@ -0,0 +1,57 @@
+"""Serving catalog snapshots with strong ETags."""
+
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from src.core.catalog_snapshots import CatalogSnapshot, CatalogSnapshots
+from src.drivers.rest.responses import dump_json
+
+# Clients may keep the body but have to revalidate it on every use.
+CATALOG_CACHE_CONTROL = "public, no-cache"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def snapshot_response(request: Request, snapshot: CatalogSnapshot) -> Response:
+    headers = {"ETag": snapshot.etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=snapshot.body, media_type="application/json", headers=headers
+    )
+
+
+async def load_catalog(
+    snapshots: CatalogSnapshots,
+    name: str,
+    load: Callable[[], Awaitable[Sequence[Any]]],
+    schema: type[BaseModel],
+) -> CatalogSnapshot:
+    """Return the snapshot of catalog ``name``, building it when not cached."""
+
+    async def build() -> bytes:
+        return dump_json(await load(), list[schema])
+
+    return await snapshots.get(name, build)
+
+
+async def catalog_response(
+    request: Request,
+    snapshots: CatalogSnapshots,
+    name: str,
+    load: Callable[[], Awaitable[Sequence[Any]]],
+    schema: type[BaseModel],
+) -> Response:
+    """Serve catalog ``name``, loading and serializing it only when not cached."""
+    snapshot = await load_catalog(snapshots, name, load, schema)
+    return snapshot_response(request, snapshot)
@@ -5,11 +5,15 @@ from fastapi import APIRouter, Depends, Query, status
 
 from src.container import ApplicationContainer
 from src.core.auth.admin import admin_user_provider
-from src.core.auth.dependencies import get_telegram_current_user
+from src.core.auth.dependencies import (
+    get_current_character_id,
+    get_telegram_current_user,
+)
 from src.domain.value_objects.telegram_id import TelegramId
 from src.domain.exceptions import EntityNotFoundException
 from src.adapters.repositories.exceptions import RepositoryError
 from src.drivers.rest.exceptions import NotFoundException, BadRequestException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.character_backgrounds import (
     CharacterBackgroundPurchase,
     CharacterBackgroundResponse,
@@ -30,7 +34,6 @@ from src.use_cases.character_backgrounds.manage_character_backgrounds import (
     UpdateCharacterBackgroundInput,
     UpdateCharacterBackgroundUseCase,
 )
-from src.use_cases.characters.get_character import GetCharacterByUserUseCase
 
 router = APIRouter(prefix="/character-backgrounds", tags=["Character Backgrounds"])
 
@@ -47,10 +50,7 @@ async def list_character_backgrounds(
     """Получить список фонов персонажа (требуется админ-доступ)"""
     try:
         backgrounds = await use_case.execute(character_id)
-        return [
-            CharacterBackgroundResponse.model_validate(background)
-            for background in backgrounds
-        ]
+        return json_response(backgrounds, list[CharacterBackgroundResponse])
     except RepositoryError as e:
         raise BadRequestException(f"Database error: {str(e)}")
 
@@ -208,22 +208,15 @@ async def toggle_favorite_background(
 @router.get("/me", response_model=list[CharacterBackgroundResponse])
 @inject
 async def list_user_character_backgrounds(
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
     use_case: ListCharacterBackgroundsUseCase = Depends(
         Provide[ApplicationContainer.list_character_backgrounds_use_case]
     ),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
 ):
     """Получить список фонов персонажа пользователя"""
     try:
-        character = await get_character_use_case.execute(telegram_id.value)
-        backgrounds = await use_case.execute(character.id)
-        return [
-            CharacterBackgroundResponse.model_validate(background)
-            for background in backgrounds
-        ]
+        backgrounds = await use_case.execute(character_id)
+        return json_response(backgrounds, list[CharacterBackgroundResponse])
     except EntityNotFoundException:
         raise NotFoundException("Character not found")
     except RepositoryError as e:
@@ -234,24 +227,17 @@ async def list_user_character_backgrounds(
 @inject
 async def get_user_character_background(
     background_id: UUID,
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
     use_case: GetCharacterBackgroundUseCase = Depends(
         Provide[ApplicationContainer.get_character_background_use_case]
     ),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
 ):
     """Получить фон персонажа пользователя по ID"""
     try:
-        # Сначала получаем персонажа пользователя
-        character = await get_character_use_case.execute(telegram_id.value)
-
-        # Затем получаем фон и проверяем, что он принадлежит этому персонажу
         background = await use_case.execute(background_id)
 
         # Проверяем, что фон принадлежит персонажу пользователя
-        if background.character_id != character.id:
+        if background.character_id != character_id:
             raise NotFoundException("Character background not found")
 
         return CharacterBackgroundResponse.model_validate(background)
@@ -273,16 +259,13 @@ async def purchase_background(
     use_case: PurchaseBackgroundWithBalanceUseCase = Depends(
         Provide[ApplicationContainer.purchase_background_with_balance_use_case]
     ),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
 ):
     """Купить фон для персонажа"""
     try:
-        character = await get_character_use_case.execute(telegram_id.value)
         input_data = PurchaseBackgroundWithBalanceInput(
             user_tg_id=telegram_id.value,
-            character_id=character.id,
+            character_id=character_id,
             background_id=background_data.background_id,
         )
         background = await use_case.execute(input_data)
@@ -300,25 +283,19 @@ async def purchase_background(
 async def update_user_character_background(
     background_id: UUID,
     background_data: CharacterBackgroundUpdate,
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
     use_case: UpdateCharacterBackgroundUseCase = Depends(
         Provide[ApplicationContainer.update_character_background_use_case]
     ),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     get_background_use_case: GetCharacterBackgroundUseCase = Depends(
         Provide[ApplicationContainer.get_character_background_use_case]
     ),
 ):
     """Обновить фон персонажа пользователя"""
     try:
-        # Сначала получаем персонажа пользователя
-        character = await get_character_use_case.execute(telegram_id.value)
-
         # Проверяем, что фон принадлежит персонажу пользователя
         background = await get_background_use_case.execute(background_id)
-        if background.character_id != character.id:
+        if background.character_id != character_id:
             raise NotFoundException("Character background not found")
 
         input_data = UpdateCharacterBackgroundInput(
@@ -338,25 +315,19 @@ async def update_user_character_background(
 @inject
 async def equip_user_background(
     background_id: UUID,
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
     use_case: EquipBackgroundUseCase = Depends(
         Provide[ApplicationContainer.equip_background_use_case]
     ),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     get_background_use_case: GetCharacterBackgroundUseCase = Depends(
         Provide[ApplicationContainer.get_character_background_use_case]
     ),
 ):
     """Экипировать фон"""
     try:
-        # Сначала получаем персонажа пользователя
-        character = await get_character_use_case.execute(telegram_id.value)
-
         # Проверяем, что фон принадлежит персонажу пользователя
         background = await get_background_use_case.execute(background_id)
-        if background.character_id != character.id:
+        if background.character_id != character_id:
             raise NotFoundException("Character background not found")
 
         background = await use_case.execute(background_id)
@@ -371,25 +342,19 @@ async def equip_user_background(
 @inject
 async def unequip_user_background(
     background_id: UUID,
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
     use_case: UnequipBackgroundUseCase = Depends(
         Provide[ApplicationContainer.unequip_background_use_case]
     ),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     get_background_use_case: GetCharacterBackgroundUseCase = Depends(
         Provide[ApplicationContainer.get_character_background_use_case]
     ),
 ):
     """Снять фон"""
     try:
-        # Сначала получаем персонажа пользователя
-        character = await get_character_use_case.execute(telegram_id.value)
-
         # Проверяем, что фон принадлежит персонажу пользователя
         background = await get_background_use_case.execute(background_id)
-        if background.character_id != character.id:
+        if background.character_id != character_id:
             raise NotFoundException("Character background not found")
 
         background = await use_case.execute(background_id)
@@ -406,25 +371,19 @@ async def unequip_user_background(
 @inject
 async def toggle_favorite_user_background(
     background_id: UUID,
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
     use_case: ToggleFavouriteBackgroundUseCase = Depends(
         Provide[ApplicationContainer.toggle_favourite_background_use_case]
     ),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     get_background_use_case: GetCharacterBackgroundUseCase = Depends(
         Provide[ApplicationContainer.get_character_background_use_case]
     ),
 ):
     """Переключить избранное для фона"""
     try:
-        # Сначала получаем персонажа пользователя
-        character = await get_character_use_case.execute(telegram_id.value)
-
         # Проверяем, что фон принадлежит персонажу пользователя
         background = await get_background_use_case.execute(background_id)
-        if background.character_id != character.id:
+        if background.character_id != character_id:
             raise NotFoundException("Character background not found")
 
         background = await use_case.execute(background_id)
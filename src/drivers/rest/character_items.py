@@ -5,11 +5,15 @@ from fastapi import APIRouter, Depends, Query, status
 
 from src.container import ApplicationContainer
 from src.core.auth.admin import admin_user_provider
-from src.core.auth.dependencies import get_telegram_current_user
+from src.core.auth.dependencies import (
+    get_current_character_id,
+    get_telegram_current_user,
+)
 from src.domain.value_objects.telegram_id import TelegramId
 from src.domain.exceptions import EntityNotFoundException
 from src.adapters.repositories.exceptions import RepositoryError
 from src.drivers.rest.exceptions import NotFoundException, BadRequestException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.character_items import (
     CharacterItemPurchase,
     CharacterItemResponse,
@@ -29,7 +33,6 @@ from src.use_cases.character_items.manage_character_items import (
     UpdateCharacterItemInput,
     UpdateCharacterItemUseCase,
 )
-from src.use_cases.characters.get_character import GetCharacterByUserUseCase
 
 router = APIRouter(prefix="/character-items", tags=["Character Items"])
 
@@ -46,7 +49,7 @@ async def list_character_items(
     """Получить список предметов персонажа (требуется админ-доступ)"""
     try:
         items = await use_case.execute(character_id)
-        return [CharacterItemResponse.model_validate(item) for item in items]
+        return json_response(items, list[CharacterItemResponse])
     except RepositoryError as e:
         raise BadRequestException(detail=str(e))
 
@@ -133,10 +136,7 @@ async def delete_character_item(
 @inject
 async def equip_my_item(
     character_item_id: UUID,
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     get_item_use_case: GetCharacterItemUseCase = Depends(
         Provide[ApplicationContainer.get_character_item_use_case]
     ),
@@ -147,10 +147,9 @@ async def equip_my_item(
     """Активировать предмет"""
 
     try:
-        character = await get_character_use_case.execute(telegram_id.value)
         item = await get_item_use_case.execute(character_item_id)
 
-        if item.character_id != character.id:
+        if item.character_id != character_id:
             raise NotFoundException(detail="Item does not belong to your character")
 
         updated_item = await use_case.execute(character_item_id)
@@ -163,10 +162,7 @@ async def equip_my_item(
 @inject
 async def unequip_my_item(
     character_item_id: UUID,
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     get_item_use_case: GetCharacterItemUseCase = Depends(
         Provide[ApplicationContainer.get_character_item_use_case]
     ),
@@ -177,10 +173,9 @@ async def unequip_my_item(
     """Деактивировать предмет"""
 
     try:
-        character = await get_character_use_case.execute(telegram_id.value)
         item = await get_item_use_case.execute(character_item_id)
 
-        if item.character_id != character.id:
+        if item.character_id != character_id:
             raise NotFoundException(detail="Item does not belong to your character")
 
         updated_item = await use_case.execute(character_item_id)
@@ -193,10 +188,7 @@ async def unequip_my_item(
 @inject
 async def toggle_favourite_item(
     character_item_id: UUID,
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     get_item_use_case: GetCharacterItemUseCase = Depends(
         Provide[ApplicationContainer.get_character_item_use_case]
     ),
@@ -207,10 +199,9 @@ async def toggle_favourite_item(
     """Добавить/убрать предмет из избранного"""
 
     try:
-        character = await get_character_use_case.execute(telegram_id.value)
         item = await get_item_use_case.execute(character_item_id)
 
-        if item.character_id != character.id:
+        if item.character_id != character_id:
             raise NotFoundException(detail="Item does not belong to your character")
 
         updated_item = await use_case.execute(character_item_id)
@@ -222,10 +213,7 @@ async def toggle_favourite_item(
 @router.get("/me", response_model=list[CharacterItemResponse])
 @inject
 async def list_my_items(
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     use_case: ListCharacterItemsUseCase = Depends(
         Provide[ApplicationContainer.list_character_items_use_case]
     ),
@@ -233,9 +221,8 @@ async def list_my_items(
     """Получить список купленных предметов текущего пользователя"""
 
     try:
-        character = await get_character_use_case.execute(telegram_id.value)
-        items = await use_case.execute(character.id)
-        return [CharacterItemResponse.model_validate(item) for item in items]
+        items = await use_case.execute(character_id)
+        return json_response(items, list[CharacterItemResponse])
     except EntityNotFoundException as e:
         raise NotFoundException(detail=str(e))
 
@@ -249,9 +236,7 @@ async def list_my_items(
 async def purchase_item(
     item_id: UUID = Query(..., description="ID предмета для покупки"),
     telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     use_case: PurchaseItemWithBalanceUseCase = Depends(
         Provide[ApplicationContainer.purchase_item_with_balance_use_case]
     ),
@@ -259,11 +244,10 @@ async def purchase_item(
     """Купить предмет (списываются монетки с баланса)"""
 
     try:
-        character = await get_character_use_case.execute(telegram_id.value)
 
         input_data = PurchaseItemWithBalanceInput(
             user_tg_id=telegram_id.value,
-            character_id=character.id,
+            character_id=character_id,
             item_id=item_id,
         )
         purchased_item = await use_case.execute(input_data)
@@ -6,7 +6,10 @@ from fastapi import APIRouter, Depends, Query, status
 
 from src.container import ApplicationContainer
 from src.core.auth.admin import admin_user_provider
-from src.core.auth.dependencies import get_telegram_current_user
+from src.core.auth.dependencies import (
+    get_current_character_id,
+    get_telegram_current_user,
+)
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.value_objects.telegram_id import TelegramId
 from src.adapters.repositories.exceptions import (
@@ -15,6 +18,7 @@ from src.adapters.repositories.exceptions import (
     DuplicateEntityError,
 )
 from src.drivers.rest.exceptions import NotFoundException, BadRequestException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.characters import (
     CharacterCreate,
     CharacterResponse,
@@ -53,7 +57,7 @@ async def list_characters(
 ):
     """Получить список всех персонажей (требуется админ-доступ)"""
     characters = await use_case.execute(limit=limit, offset=offset)
-    return [CharacterResponse.model_validate(char) for char in characters]
+    return json_response(characters, list[CharacterResponse])
 
 
 @router.get("/{character_id}/admin", response_model=CharacterResponse)
@@ -198,10 +202,7 @@ async def create_my_character(
 @inject
 async def update_my_character(
     data: CharacterUserUpdate,
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     update_use_case: UpdateCharacterUseCase = Depends(
         Provide[ApplicationContainer.update_character_use_case]
     ),
@@ -209,10 +210,8 @@ async def update_my_character(
     """Обновить персонажа текущего пользователя (только name и sex)"""
     try:
 
-        character = await get_character_use_case.execute(telegram_id.value)
-
         input_data = UpdateCharacterInput(
-            character_id=character.id,
+            character_id=character_id,
             name=data.name,
             sex=data.sex,
             current_mood=None,
@@ -226,10 +225,7 @@ async def update_my_character(
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 @inject
 async def delete_my_character(
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     delete_use_case: DeleteCharacterUseCase = Depends(
         Provide[ApplicationContainer.delete_character_use_case]
     ),
@@ -237,8 +233,6 @@ async def delete_my_character(
     """Удалить персонажа текущего пользователя"""
     try:
 
-        character = await get_character_use_case.execute(telegram_id.value)
-
-        await delete_use_case.execute(character.id)
+        await delete_use_case.execute(character_id)
     except EntityNotFoundException as e:
         raise NotFoundException(detail=str(e))
@@ -6,18 +6,17 @@ from fastapi import APIRouter, Depends, Query, status
 
 from src.container import ApplicationContainer
 from src.core.auth.admin import admin_user_provider
-from src.core.auth.dependencies import get_telegram_current_user
-from src.domain.value_objects.telegram_id import TelegramId
+from src.core.auth.dependencies import get_current_character_id
 from src.domain.exceptions import EntityNotFoundException
 from src.adapters.repositories.exceptions import RepositoryError
 from src.drivers.rest.exceptions import BadRequestException, NotFoundException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.activities import (
     DailyActivityCreate,
     DailyActivityResponse,
     DailyActivityUpdate,
 )
 from src.ports.repositories.healthity.activities import DailyActivitiesRepository
-from src.use_cases.characters.get_character import GetCharacterByUserUseCase
 from src.use_cases.daily_activities.manage_daily_activities import (
     CreateDailyActivityInput,
     CreateDailyActivityUseCase,
@@ -50,7 +49,7 @@ async def list_daily_activities_for_day(
     """Получить все активности персонажа за конкретный день (требуется админ-доступ)"""
     try:
         activities = await use_case.execute(character_id, day)
-        return [DailyActivityResponse.model_validate(a) for a in activities]
+        return json_response(activities, list[DailyActivityResponse])
     except RepositoryError as e:
         raise BadRequestException(detail=str(e))
     except EntityNotFoundException as e:
@@ -161,10 +160,7 @@ async def list_my_daily_activities(
     end_date: datetime | None = Query(
         None, description="Конечная дата диапазона", example="2025-10-31 23:59:59"
     ),
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     use_case: ListDailyActivitiesForDayUseCase = Depends(
         Provide[ApplicationContainer.list_daily_activities_for_day_use_case]
     ),
@@ -176,20 +172,18 @@ async def list_my_daily_activities(
 
     try:
 
-        character = await get_character_use_case.execute(telegram_id.value)
-
         if start_date and end_date:
             activities = await activities_repo.list_for_date_range(
-                character.id, start_date, end_date
+                character_id, start_date, end_date
             )
         elif day:
-            activities = await use_case.execute(character.id, day)
+            activities = await use_case.execute(character_id, day)
         else:
             raise BadRequestException(
                 detail="Укажите либо day, либо start_date и end_date"
             )
 
-        return [DailyActivityResponse.model_validate(a) for a in activities]
+        return json_response(activities, list[DailyActivityResponse])
     except EntityNotFoundException as e:
         raise NotFoundException(detail=str(e))
 
@@ -210,10 +204,7 @@ async def create_my_daily_activity(
         description="Цель активности (если не указана, будет использована цель из типа активности)",
     ),
     notes: str | None = Query(None, description="Заметки"),
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     use_case: CreateDailyActivityUseCase = Depends(
         Provide[ApplicationContainer.create_daily_activity_use_case]
     ),
@@ -222,10 +213,8 @@ async def create_my_daily_activity(
 
     try:
 
-        character = await get_character_use_case.execute(telegram_id.value)
-
         input_data = CreateDailyActivityInput(
-            character_id=character.id,
+            character_id=character_id,
             activity_type_id=activity_type_id,
             date=date,
             value=value,
@@ -245,10 +234,7 @@ async def create_my_daily_activity(
 async def update_my_daily_activity(
     activity_id: UUID,
     data: DailyActivityUpdate,
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     get_activity_use_case: GetDailyActivityUseCase = Depends(
         Provide[ApplicationContainer.get_daily_activity_use_case]
     ),
@@ -260,10 +246,8 @@ async def update_my_daily_activity(
 
     try:
 
-        character = await get_character_use_case.execute(telegram_id.value)
-
         activity = await get_activity_use_case.execute(activity_id)
-        if activity.character_id != character.id:
+        if activity.character_id != character_id:
             raise BadRequestException(detail="You can only update your own activities")
 
         input_data = UpdateDailyActivityInput(
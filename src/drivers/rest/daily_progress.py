@@ -6,17 +6,16 @@ from fastapi import APIRouter, Depends, Query, status
 
 from src.container import ApplicationContainer
 from src.core.auth.admin import admin_user_provider
-from src.core.auth.dependencies import get_telegram_current_user
-from src.domain.value_objects.telegram_id import TelegramId
+from src.core.auth.dependencies import get_current_character_id
 from src.domain.exceptions import EntityNotFoundException
 from src.adapters.repositories.exceptions import RepositoryError
 from src.drivers.rest.exceptions import NotFoundException, BadRequestException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.activities import (
     DailyProgressCreate,
     DailyProgressResponse,
     DailyProgressUpdate,
 )
-from src.use_cases.characters.get_character import GetCharacterByUserUseCase
 from src.use_cases.daily_progress.manage_daily_progress import (
     CreateDailyProgressInput,
     CreateDailyProgressUseCase,
@@ -48,7 +47,7 @@ async def list_daily_progress_for_character(
     """Получить весь прогресс персонажа (требуется админ-доступ)"""
     try:
         progress_list = await use_case.execute(character_id)
-        return [DailyProgressResponse.model_validate(p) for p in progress_list]
+        return json_response(progress_list, list[DailyProgressResponse])
     except RepositoryError as e:
         raise BadRequestException(detail=str(e))
 
@@ -99,7 +98,7 @@ async def get_daily_progress_for_date_range(
     """Получить прогресс персонажа за диапазон дат (требуется админ-доступ)"""
     try:
         progress_list = await use_case.execute(character_id, start_date, end_date)
-        return [DailyProgressResponse.model_validate(p) for p in progress_list]
+        return json_response(progress_list, list[DailyProgressResponse])
     except EntityNotFoundException as e:
         raise NotFoundException(detail=str(e))
 
@@ -196,10 +195,7 @@ async def get_my_progress(
     end_date: datetime | None = Query(
         None, description="Конечная дата диапазона", example="2025-10-31 23:59:59"
     ),
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     get_day_use_case: GetDailyProgressForDayUseCase = Depends(
         Provide[ApplicationContainer.get_daily_progress_for_day_use_case]
     ),
@@ -229,21 +225,19 @@ async def get_my_progress(
         )
 
     try:
-        character = await get_character_use_case.execute(telegram_id.value)
 
         if day is not None:
             # Получаем прогресс за конкретный день
-            progress = await get_day_use_case.execute(character.id, day)
-            return [DailyProgressResponse.model_validate(progress)] if progress else []
+            progress = await get_day_use_case.execute(character_id, day)
+            return json_response(
+                [progress] if progress else [], list[DailyProgressResponse]
+            )
         else:
             # Получаем прогресс за диапазон дат
             progress_list = await list_range_use_case.execute(
-                character.id, start_date, end_date
+                character_id, start_date, end_date
             )
-            return [
-                DailyProgressResponse.model_validate(progress)
-                for progress in progress_list
-            ]
+            return json_response(progress_list, list[DailyProgressResponse])
 
     except EntityNotFoundException as e:
         raise NotFoundException(detail=str(e))
@@ -264,10 +258,7 @@ async def create_or_update_daily_progress(
     behavior_index: int | None = Query(
         None, ge=0, le=100, description="Индекс поведения (0-100)"
     ),
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     use_case: CreateDailyProgressUseCase = Depends(
         Provide[ApplicationContainer.create_daily_progress_use_case]
     ),
@@ -275,10 +266,9 @@ async def create_or_update_daily_progress(
     """Создать или обновить дневной прогресс для текущего пользователя"""
 
     try:
-        character = await get_character_use_case.execute(telegram_id.value)
 
         input_data = CreateDailyProgressInput(
-            character_id=character.id,
+            character_id=character_id,
             date=date,
             experience_gained=experience_gained,
             mood_average=mood_average,
@@ -0,0 +1,35 @@
+"""Diagnostics endpoints, mounted only when ``DEBUG_ROUTES_ENABLED`` is set."""
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from src.container import ApplicationContainer
+from src.core.event_loop_watchdog import EventLoopWatchdog
+
+router = APIRouter(prefix="/debug", tags=["Debug"])
+
+
+@router.get("/event-loop", include_in_schema=False)
+@inject
+async def event_loop_report(
+    watchdog: EventLoopWatchdog = Depends(
+        Provide[ApplicationContainer.event_loop_watchdog]
+    ),
+):
+    """Задержка цикла событий и стеки последних блокирующих вызовов"""
+    stats = watchdog.stats
+    return {
+        "samples": stats.samples,
+        "lag_seconds": stats.lag_seconds,
+        "lag_seconds_max": stats.lag_seconds_max,
+        "slow_callbacks": stats.slow_callbacks,
+        "blocked_seconds_total": stats.blocked_seconds_total,
+        "blocked": [
+            {
+                "detected_at": blocked.detected_at,
+                "blocked_seconds": blocked.blocked_seconds,
+                "stack": "".join(blocked.stack),
+            }
+            for blocked in watchdog.blocked()
+        ],
+    }
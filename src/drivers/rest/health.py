@@ -0,0 +1,87 @@
+"""Liveness and readiness endpoints for orchestrators and load balancers."""
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+
+from src.adapters.database.schema import SchemaRevisionGate
+from src.adapters.database.session import SessionManager
+from src.container import ApplicationContainer
+from src.core.event_loop_watchdog import EventLoopWatchdog
+from src.core.health import Check, CheckResult, HealthProbes
+from src.drivers.rest.warmup import load_catalogs
+
+router = APIRouter(tags=["Health"])
+
+
+def database_check(session_manager: SessionManager) -> Check:
+    async def check() -> CheckResult:
+        await session_manager.ping()
+        pool = session_manager.pool_statistics()
+        return CheckResult(
+            True, f"{pool.checked_out} of {pool.size} connections checked out"
+        )
+
+    return check
+
+
+def event_loop_check(watchdog: EventLoopWatchdog, max_lag_seconds: float) -> Check:
+    async def check() -> CheckResult:
+        lag = watchdog.stats.lag_seconds
+        return CheckResult(lag <= max_lag_seconds, f"lag {lag * 1000:.1f}ms")
+
+    return check
+
+
+def register_readiness_checks(
+    probes: HealthProbes,
+    container: ApplicationContainer,
+    session_manager: SessionManager,
+    schema_revision_gate: SchemaRevisionGate,
+    watchdog: EventLoopWatchdog,
+    max_loop_lag_seconds: float,
+) -> None:
+    async def schema() -> CheckResult:
+        # Kept up to date by the gate's own watch task; costs no query here.
+        return CheckResult(
+            schema_revision_gate.ready,
+            f"at {schema_revision_gate.current}, "
+            f"expected {schema_revision_gate.expected}",
+        )
+
+    async def catalogs() -> CheckResult:
+        # Cached catalogs are a lookup; missed or expired ones get built.
+        loaded = await load_catalogs(container)
+        return CheckResult(True, f"{loaded} catalogs cached")
+
+    probes.add("database", database_check(session_manager))
+    probes.add("schema", schema)
+    probes.add("catalogs", catalogs)
+    probes.add("event_loop", event_loop_check(watchdog, max_loop_lag_seconds))
+
+
+@router.get("/health/live", include_in_schema=False)
+async def liveness():
+    """Процесс жив: ответ не зависит от базы данных и других сервисов"""
+    return {"status": "alive"}
+
+
+@router.get("/health/ready", include_in_schema=False)
+@inject
+async def readiness(
+    probes: HealthProbes = Depends(Provide[ApplicationContainer.health_probes]),
+):
+    """Готовность воркера принимать трафик; 503, если какая-либо проверка не прошла"""
+    result = await probes.readiness()
+    return JSONResponse(
+        status_code=(
+            status.HTTP_200_OK if result.ready else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+        content={
+            "status": "ready" if result.ready else "not_ready",
+            "checks": {
+                name: {"healthy": check.healthy, "detail": check.detail}
+                for name, check in result.checks.items()
+            },
+        },
+    )
@@ -8,6 +8,7 @@ from src.core.auth.admin import admin_user_provider
 from src.domain.exceptions import EntityNotFoundException
 from src.adapters.repositories.exceptions import RepositoryError
 from src.drivers.rest.exceptions import NotFoundException, BadRequestException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.item_background_positions import (
     ItemBackgroundPositionCreate,
     ItemBackgroundPositionResponse,
@@ -45,7 +46,7 @@ async def list_positions_for_item(
     """Получить все позиции предмета на фоне (требуется админ-доступ)"""
     try:
         positions = await use_case.execute(item_id, background_id)
-        return [ItemBackgroundPositionResponse.model_validate(pos) for pos in positions]
+        return json_response(positions, list[ItemBackgroundPositionResponse])
     except RepositoryError as e:
         raise BadRequestException(detail=str(e))
 
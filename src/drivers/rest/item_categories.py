@@ -1,13 +1,16 @@
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 
 from src.container import ApplicationContainer
 from src.core.auth.admin import admin_user_provider
+from src.core.catalog_snapshots import ITEM_CATEGORIES_CATALOG, CatalogSnapshots
 from src.domain.exceptions import EntityNotFoundException
 from src.adapters.repositories.exceptions import RepositoryError
+from src.drivers.rest.catalog_snapshots import catalog_response
 from src.drivers.rest.exceptions import NotFoundException, BadRequestException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.item_categories import (
     ItemCategoryCreate,
     ItemCategoryResponse,
@@ -39,7 +42,7 @@ async def list_item_categories(
     """Получить список всех категорий предметов (требуется админ-доступ)"""
     try:
         categories = await use_case.execute()
-        return [ItemCategoryResponse.model_validate(cat) for cat in categories]
+        return json_response(categories, list[ItemCategoryResponse])
     except RepositoryError as e:
         raise BadRequestException(detail=str(e))
 
@@ -124,10 +127,22 @@ async def delete_item_category(
 @router.get("/catalog", response_model=list[ItemCategoryResponse])
 @inject
 async def list_item_categories_catalog(
+    request: Request,
     use_case: ListItemCategoriesUseCase = Depends(
         Provide[ApplicationContainer.list_item_categories_use_case]
     ),
+    snapshots: CatalogSnapshots = Depends(
+        Provide[ApplicationContainer.catalog_snapshots]
+    ),
 ):
-    """Получить каталог категорий предметов (открытый endpoint)"""
-    categories = await use_case.execute()
-    return [ItemCategoryResponse.model_validate(cat) for cat in categories]
+    """Получить каталог категорий предметов (открытый endpoint)
+
+    Поддерживает `If-None-Match`: при совпадении ETag возвращается 304.
+    """
+    return await catalog_response(
+        request,
+        snapshots,
+        ITEM_CATEGORIES_CATALOG,
+        use_case.execute,
+        ItemCategoryResponse,
+    )
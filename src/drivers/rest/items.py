@@ -1,16 +1,19 @@
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
 from src.container import ApplicationContainer
 from src.core.auth.admin import admin_user_provider
+from src.core.catalog_snapshots import ITEMS_CATALOG, CatalogSnapshots
 from src.domain.exceptions import EntityNotFoundException
 from src.adapters.repositories.exceptions import (
     RepositoryError,
     IntegrityConstraintError,
 )
+from src.drivers.rest.catalog_snapshots import catalog_response
 from src.drivers.rest.exceptions import NotFoundException, BadRequestException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.catalog import ItemCreate, ItemResponse, ItemUpdate
 from src.use_cases.items.manage_items import (
     CreateItemInput,
@@ -39,7 +42,7 @@ async def list_items(
     """Получить список всех предметов (требуется админ-доступ)"""
     try:
         items = await use_case.execute(limit=limit, offset=offset)
-        return [ItemResponse.model_validate(item) for item in items]
+        return json_response(items, list[ItemResponse])
     except RepositoryError as e:
         raise BadRequestException(detail=str(e))
 
@@ -137,13 +140,21 @@ async def delete_item(
 @router.get("/catalog", response_model=list[ItemResponse])
 @inject
 async def list_items_catalog(
+    request: Request,
     use_case: ListAvailableItemsUseCase = Depends(
         Provide[ApplicationContainer.list_available_items_use_case]
     ),
+    snapshots: CatalogSnapshots = Depends(
+        Provide[ApplicationContainer.catalog_snapshots]
+    ),
 ):
-    """Получить каталог доступных предметов (открытый endpoint)"""
+    """Получить каталог доступных предметов (открытый endpoint)
+
+    Поддерживает `If-None-Match`: при совпадении ETag возвращается 304.
+    """
     try:
-        items = await use_case.execute()
-        return [ItemResponse.model_validate(item) for item in items]
+        return await catalog_response(
+            request, snapshots, ITEMS_CATALOG, use_case.execute, ItemResponse
+        )
     except RepositoryError as e:
         raise BadRequestException(detail=str(e))
@@ -6,16 +6,15 @@ from fastapi import APIRouter, Depends, Query, status
 
 from src.container import ApplicationContainer
 from src.core.auth.admin import admin_user_provider
-from src.core.auth.dependencies import get_telegram_current_user
-from src.domain.value_objects.telegram_id import TelegramId
+from src.core.auth.dependencies import get_current_character_id
 from src.domain.exceptions import EntityNotFoundException
 from src.drivers.rest.exceptions import BadRequestException, NotFoundException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.activities import (
     MoodHistoryCreate,
     MoodHistoryResponse,
     MoodHistoryUpdate,
 )
-from src.use_cases.characters.get_character import GetCharacterByUserUseCase
 from src.ports.repositories.healthity.activities import MoodHistoryRepository
 from src.use_cases.mood_history.manage_mood_history import (
     CreateMoodHistoryInput,
@@ -46,7 +45,7 @@ async def list_mood_history(
 ):
     """Получить историю настроения для персонажа (требуется админ-доступ)"""
     mood_history = await use_case.execute(character_id, limit=limit)
-    return [MoodHistoryResponse.model_validate(mh) for mh in mood_history]
+    return json_response(mood_history, list[MoodHistoryResponse])
 
 
 @router.get(
@@ -148,10 +147,7 @@ async def get_my_mood_history(
     end_date: datetime | None = Query(
         None, description="Конечная дата диапазона", example="2025-10-31 23:59:59"
     ),
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     use_case: ListMoodHistoryForCharacterUseCase = Depends(
         Provide[ApplicationContainer.list_mood_history_for_character_use_case]
     ),
@@ -181,18 +177,17 @@ async def get_my_mood_history(
         )
 
     try:
-        character = await get_character_use_case.execute(telegram_id.value)
 
         if day is not None:
             # Получаем историю настроения за конкретный день
-            mood_history = await mood_repo.list_for_date_range(character.id, day, day)
+            mood_history = await mood_repo.list_for_date_range(character_id, day, day)
         else:
             # Получаем историю настроения за диапазон дат
             mood_history = await mood_repo.list_for_date_range(
-                character.id, start_date, end_date
+                character_id, start_date, end_date
             )
 
-        return [MoodHistoryResponse.model_validate(mh) for mh in mood_history]
+        return json_response(mood_history, list[MoodHistoryResponse])
     except EntityNotFoundException as e:
         raise NotFoundException(detail=str(e))
 
@@ -204,10 +199,7 @@ async def get_my_mood_history(
 async def create_my_mood_entry(
     mood: str = Query(..., description="Настроение"),
     trigger: str | None = Query(None, description="Триггер"),
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
+    character_id: UUID = Depends(get_current_character_id),
     use_case: CreateMoodHistoryUseCase = Depends(
         Provide[ApplicationContainer.create_mood_history_use_case]
     ),
@@ -215,10 +207,9 @@ async def create_my_mood_entry(
     """Создать запись о настроении для текущего пользователя"""
 
     try:
-        character = await get_character_use_case.execute(telegram_id.value)
 
         input_data = CreateMoodHistoryInput(
-            character_id=character.id,
+            character_id=character_id,
             mood=mood,
             trigger=trigger,
         )
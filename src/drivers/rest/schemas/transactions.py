@@ -41,3 +41,10 @@ class TransactionResponse(TransactionBase):
         if isinstance(v, TelegramId):
             return v.value
         return v
+
+
+class TransactionsPageResponse(BaseModel):
+    items: list[TransactionResponse]
+    next_cursor: str | None = Field(
+        None, description="Курсор следующей страницы; null на последней странице"
+    )
@@ -3,31 +3,39 @@ from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 
 from src.container import ApplicationContainer
 from src.core.auth.admin import admin_user_provider
 from src.core.auth.dependencies import get_telegram_current_user
 from src.domain.value_objects.telegram_id import TelegramId
 from src.domain.exceptions import EntityNotFoundException
-from src.drivers.rest.exceptions import NotFoundException
+from src.drivers.rest.exceptions import BadRequestException, NotFoundException
+from src.drivers.rest.responses import dump_json, json_response
 from src.drivers.rest.schemas.transactions import (
     TransactionCreate,
     TransactionResponse,
+    TransactionsPageResponse,
     TransactionUpdate,
 )
-from src.ports.repositories.healthity.transactions import TransactionsRepository
 from src.use_cases.transactions.manage_transactions import (
     CreateTransactionInput,
     CreateTransactionUseCase,
     DeleteTransactionUseCase,
+    ExportTransactionsUseCase,
     GetTransactionUseCase,
     ListTransactionsForUserUseCase,
+    ListTransactionsPageInput,
+    ListTransactionsPageUseCase,
+    TransactionsFilter,
     UpdateTransactionInput,
     UpdateTransactionUseCase,
 )
 
 router = APIRouter(prefix="/transactions", tags=["Transactions"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @router.get("/admin", response_model=list[TransactionResponse])
 @inject
@@ -40,7 +48,7 @@ async def list_transactions(
 ):
     """Получить список транзакций пользователя (требуется админ-доступ)"""
     transactions = await use_case.execute(user_tg_id)
-    return [TransactionResponse.model_validate(t) for t in transactions]
+    return json_response(transactions, list[TransactionResponse])
 
 
 @router.get("/{transaction_id}/admin", response_model=TransactionResponse)
@@ -137,30 +145,113 @@ async def list_my_transactions(
         None,
         description="Тип транзакции (deposit, withdrawal, purchase_item, purchase_background)",
     ),
-    telegram_id: TelegramId = Depends(get_telegram_current_user),
-    use_case: ListTransactionsForUserUseCase = Depends(
-        Provide[ApplicationContainer.list_transactions_for_user_use_case]
+    limit: int = Query(50, ge=1, le=200, description="Размер страницы"),
+    cursor: str | None = Query(
+        None, description=f"Курсор из заголовка {NEXT_CURSOR_HEADER} предыдущего ответа"
     ),
-    transactions_repo: TransactionsRepository = Depends(
-        Provide[ApplicationContainer.transactions_repository]
+    telegram_id: TelegramId = Depends(get_telegram_current_user),
+    use_case: ListTransactionsPageUseCase = Depends(
+        Provide[ApplicationContainer.list_transactions_page_use_case]
     ),
 ):
-    """Получить список транзакций текущего пользователя с фильтрацией
+    """Получить транзакции текущего пользователя с фильтрацией, от новых к старым
 
     Можно фильтровать по:
     - Диапазону дат (start_date, end_date)
     - Типу транзакции (transaction_type)
-    Если фильтры не указаны, возвращаются все транзакции.
+
+    Возвращается не больше limit транзакций. Если есть ещё, ответ содержит
+    заголовок X-Next-Cursor: следующая страница запрашивается с
+    cursor=<его значение> и теми же фильтрами.
     """
-    if start_date and end_date:
-        transactions = await transactions_repo.list_for_user_by_date_range(
-            telegram_id, start_date, end_date
+    try:
+        page = await use_case.execute(
+            ListTransactionsPageInput(
+                user_tg_id=telegram_id.value,
+                limit=limit,
+                cursor=cursor,
+                filters=TransactionsFilter(
+                    start_date=start_date,
+                    end_date=end_date,
+                    transaction_type=transaction_type,
+                ),
+            )
         )
-    elif transaction_type:
-        transactions = await transactions_repo.list_for_user_by_type(
-            telegram_id, transaction_type
+    except ValueError as e:
+        raise BadRequestException(detail=str(e))
+
+    response = json_response(page.items, list[TransactionResponse])
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
+
+
+@router.get("/me/page", response_model=TransactionsPageResponse)
+@inject
+async def list_my_transactions_page(
+    limit: int = Query(50, ge=1, le=200, description="Размер страницы"),
+    cursor: str | None = Query(
+        None, description="Курсор из next_cursor предыдущей страницы"
+    ),
+    start_date: datetime | None = Query(None, description="Начальная дата диапазона"),
+    end_date: datetime | None = Query(None, description="Конечная дата диапазона"),
+    transaction_type: str | None = Query(None, description="Тип транзакции"),
+    telegram_id: TelegramId = Depends(get_telegram_current_user),
+    use_case: ListTransactionsPageUseCase = Depends(
+        Provide[ApplicationContainer.list_transactions_page_use_case]
+    ),
+):
+    """Получить страницу транзакций текущего пользователя, от новых к старым
+
+    Следующая страница запрашивается с cursor=next_cursor; фильтры должны
+    совпадать с фильтрами первой страницы.
+    """
+    try:
+        page = await use_case.execute(
+            ListTransactionsPageInput(
+                user_tg_id=telegram_id.value,
+                limit=limit,
+                cursor=cursor,
+                filters=TransactionsFilter(
+                    start_date=start_date,
+                    end_date=end_date,
+                    transaction_type=transaction_type,
+                ),
+            )
         )
-    else:
-        transactions = await use_case.execute(telegram_id.value)
+    except ValueError as e:
+        raise BadRequestException(detail=str(e))
+
+    return json_response(page, TransactionsPageResponse)
+
+
+@router.get("/me/export")
+@inject
+async def export_my_transactions(
+    start_date: datetime | None = Query(None, description="Начальная дата диапазона"),
+    end_date: datetime | None = Query(None, description="Конечная дата диапазона"),
+    transaction_type: str | None = Query(None, description="Тип транзакции"),
+    telegram_id: TelegramId = Depends(get_telegram_current_user),
+    use_case: ExportTransactionsUseCase = Depends(
+        Provide[ApplicationContainer.export_transactions_use_case]
+    ),
+):
+    """Выгрузить все транзакции текущего пользователя в формате NDJSON
+
+    Строки читаются из базы курсором и отправляются по мере получения,
+    поэтому объём истории не влияет на потребление памяти.
+    """
+    transactions = use_case.execute(
+        telegram_id.value,
+        TransactionsFilter(
+            start_date=start_date,
+            end_date=end_date,
+            transaction_type=transaction_type,
+        ),
+    )
+
+    async def lines():
+        async for transaction in transactions:
+            yield dump_json(transaction, TransactionResponse) + b"\n"
 
-    return [TransactionResponse.model_validate(t) for t in transactions]
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
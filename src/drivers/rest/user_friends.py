@@ -10,6 +10,7 @@ from src.adapters.repositories.exceptions import RepositoryError
 from src.container import ApplicationContainer
 from src.domain.exceptions import EntityNotFoundException
 from src.drivers.rest.exceptions import BadRequestException, NotFoundException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.user_friends import (
     UserFriendCreate,
     UserFriendResponse,
@@ -43,15 +44,7 @@ async def list_user_friends(
 ):
     """Получить список друзей пользователя (требуется админ-доступ)"""
     friends = await use_case.execute(owner_tg_id)
-    return [
-        UserFriendResponse(
-            id=f.id,
-            owner_tg_id=f.owner_tg_id.value,
-            friend_tg_id=f.friend_tg_id.value,
-            created_at=f.created_at,
-        )
-        for f in friends
-    ]
+    return json_response(friends, list[UserFriendResponse])
 
 
 @router.get("/id/{friend_id}/admin", response_model=UserFriendResponse)
@@ -163,15 +156,7 @@ async def list_my_friends(
     """Получить список своих друзей"""
 
     friends = await use_case.execute(telegram_id.value)
-    return [
-        UserFriendResponse(
-            id=friend.id,
-            owner_tg_id=friend.owner_tg_id.value,
-            friend_tg_id=friend.friend_tg_id.value,
-            created_at=friend.created_at,
-        )
-        for friend in friends
-    ]
+    return json_response(friends, list[UserFriendResponse])
 
 
 @router.post(
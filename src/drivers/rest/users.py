@@ -6,10 +6,11 @@ from fastapi import APIRouter, Depends, Query, status
 from src.container import ApplicationContainer
 from src.core.auth.admin import admin_user_provider
 from src.core.auth.dependencies import get_telegram_current_user
-from src.domain.exceptions import EntityNotFoundException, UserNotFoundException
+from src.domain.exceptions import UserNotFoundException
 from src.domain.value_objects.telegram_id import TelegramId
 from src.adapters.repositories.exceptions import RepositoryError, DuplicateEntityError
 from src.drivers.rest.exceptions import BadRequestException, NotFoundException
+from src.drivers.rest.responses import json_response
 from src.drivers.rest.schemas.users import (
     BalanceResponse,
     ChangePasswordRequest,
@@ -21,14 +22,6 @@ from src.drivers.rest.schemas.users import (
     UserUpdate,
     WithdrawRequest,
 )
-from src.ports.repositories.healthity.activities import MoodHistoryRepository
-from src.ports.repositories.healthity.characters import (
-    CharacterBackgroundsRepository,
-    CharacterItemsRepository,
-)
-from src.ports.repositories.healthity.transactions import TransactionsRepository
-from src.ports.repositories.healthity.users import UserFriendsRepository
-from src.use_cases.characters.get_character import GetCharacterByUserUseCase
 from src.use_cases.users.manage_users import (
     ChangePasswordInput,
     ChangePasswordUseCase,
@@ -44,6 +37,7 @@ from src.use_cases.users.manage_users import (
     WithdrawInput,
     WithdrawUseCase,
 )
+from src.use_cases.users.statistics import GetUserStatisticsUseCase
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -138,7 +132,7 @@ async def list_users(
 ):
     """Получить список всех пользователей (требуется админ-доступ)"""
     users = await use_case.execute(limit=limit, offset=offset)
-    return [UserResponse.model_validate(u) for u in users]
+    return json_response(users, list[UserResponse])
 
 
 @router.get(
@@ -385,76 +379,27 @@ async def change_password(
 @inject
 async def get_my_statistics(
     telegram_id: TelegramId = Depends(get_telegram_current_user),
-    get_user_use_case: GetUserUseCase = Depends(
-        Provide[ApplicationContainer.get_user_use_case]
-    ),
-    get_character_use_case: GetCharacterByUserUseCase = Depends(
-        Provide[ApplicationContainer.get_character_by_user_use_case]
-    ),
-    items_repo: CharacterItemsRepository = Depends(
-        Provide[ApplicationContainer.character_items_repository]
-    ),
-    backgrounds_repo: CharacterBackgroundsRepository = Depends(
-        Provide[ApplicationContainer.character_backgrounds_repository]
-    ),
-    mood_repo: MoodHistoryRepository = Depends(
-        Provide[ApplicationContainer.mood_history_repository]
-    ),
-    transactions_repo: TransactionsRepository = Depends(
-        Provide[ApplicationContainer.transactions_repository]
-    ),
-    friends_repo: UserFriendsRepository = Depends(
-        Provide[ApplicationContainer.user_friends_repository]
+    use_case: GetUserStatisticsUseCase = Depends(
+        Provide[ApplicationContainer.get_user_statistics_use_case]
     ),
 ):
     """Получить статистику текущего пользователя"""
     try:
-
-        user = await get_user_use_case.execute(telegram_id.value)
-
-        try:
-            character = await get_character_use_case.execute(telegram_id.value)
-            character_name = character.name
-            character_sex = character.sex
-            level = character.level
-            total_experience = character.total_experience
-            character_id = character.id
-        except EntityNotFoundException:
-            character_name = None
-            character_sex = None
-            level = None
-            total_experience = None
-            character_id = None
-
-        if character_id:
-            purchased_items = await items_repo.list_for_character(character_id)
-            purchased_backgrounds = await backgrounds_repo.list_for_character(
-                character_id
-            )
-            mood_entries = await mood_repo.list_for_character(character_id, limit=10000)
-        else:
-            purchased_items = []
-            purchased_backgrounds = []
-            mood_entries = []
-
-        transactions = await transactions_repo.list_for_user(telegram_id)
-        friends = await friends_repo.list_for_user(telegram_id)
-
-        activities_count = len(mood_entries)
-
-        return UserStatisticsResponse(
-            user_id=telegram_id.value,
-            balance=user.balance,
-            level=level,
-            total_experience=total_experience,
-            character_name=character_name,
-            character_sex=character_sex,
-            purchased_items_count=len(purchased_items),
-            purchased_backgrounds_count=len(purchased_backgrounds),
-            mood_entries_count=len(mood_entries),
-            activities_count=activities_count,
-            total_transactions=len(transactions),
-            friends_count=len(friends),
-        )
+        statistics = await use_case.execute(telegram_id.value)
     except UserNotFoundException as e:
         raise NotFoundException(detail=str(e))
+
+    return UserStatisticsResponse(
+        user_id=statistics.user_tg_id,
+        balance=statistics.balance,
+        level=statistics.level,
+        total_experience=statistics.total_experience,
+        character_name=statistics.character_name,
+        character_sex=statistics.character_sex,
+        purchased_items_count=statistics.purchased_items_count,
+        purchased_backgrounds_count=statistics.purchased_backgrounds_count,
+        mood_entries_count=statistics.mood_entries_count,
+        activities_count=statistics.mood_entries_count,
+        total_transactions=statistics.transactions_count,
+        friends_count=statistics.friends_count,
+    )
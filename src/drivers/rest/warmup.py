@@ -0,0 +1,92 @@
+"""Work a worker process does before it accepts traffic."""
+
+import logging
+import os
+import time
+
+from fastapi import FastAPI
+
+from src.adapters.database.session import SessionManager
+from src.container import ApplicationContainer
+from src.core.catalog_snapshots import (
+    ACTIVITY_TYPES_CATALOG,
+    BACKGROUNDS_CATALOG,
+    ITEM_CATEGORIES_CATALOG,
+    ITEMS_CATALOG,
+)
+from src.drivers.rest.catalog_snapshots import load_catalog
+from src.drivers.rest.schemas.activities import ActivityTypeResponse
+from src.drivers.rest.schemas.catalog import BackgroundResponse, ItemResponse
+from src.drivers.rest.schemas.item_categories import ItemCategoryResponse
+
+logger = logging.getLogger(__name__)
+
+
+async def load_catalogs(container: ApplicationContainer) -> int:
+    """Build the public catalog snapshots that are not cached yet."""
+    snapshots = container.catalog_snapshots()
+    catalogs = (
+        (ITEMS_CATALOG, container.list_available_items_use_case(), ItemResponse),
+        (
+            BACKGROUNDS_CATALOG,
+            container.list_available_backgrounds_use_case(),
+            BackgroundResponse,
+        ),
+        (
+            ITEM_CATEGORIES_CATALOG,
+            container.list_item_categories_use_case(),
+            ItemCategoryResponse,
+        ),
+        (
+            ACTIVITY_TYPES_CATALOG,
+            container.list_activity_types_use_case(),
+            ActivityTypeResponse,
+        ),
+    )
+    for name, use_case, schema in catalogs:
+        await load_catalog(snapshots, name, use_case.execute, schema)
+    return len(catalogs)
+
+
+async def warm_up(
+    app: FastAPI, container: ApplicationContainer, session_manager: SessionManager
+) -> None:
+    """Pay the first-request costs of the process up front.
+
+    Runs from the lifespan startup, which uvicorn completes before the worker
+    starts accepting connections. It builds the OpenAPI schema, opens the
+    connection pool, and loads the public catalog snapshots and the token
+    revocation indexes. Database steps are best-effort: a worker started while
+    the database is unreachable still serves, and builds whatever it missed on
+    first use.
+    """
+    started = time.perf_counter()
+    app.openapi()
+
+    try:
+        connections = await session_manager.open()
+        catalogs = await load_catalogs(container)
+        await container.blacklist_revocation_index().refresh()
+        await container.token_generation_index().refresh()
+    except Exception as e:
+        logger.warning(
+            {
+                "action": "warm_up",
+                "stage": "database_unavailable",
+                "data": {"pid": os.getpid(), "error": str(e)},
+            }
+        )
+        return
+
+    logger.info(
+        {
+            "action": "warm_up",
+            "stage": "end",
+            "data": {
+                "pid": os.getpid(),
+                "connections": connections,
+                "catalogs": catalogs,
+                "seconds": round(time.perf_counter() - started, 3),
+            },
+        }
+    )
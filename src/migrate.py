@@ -0,0 +1,28 @@
+"""Migration runner: ``python -m src.migrate``.
+
+Applies the pending Alembic migrations and exits. It runs once per deploy,
+separately from the application: workers started before it finishes stay
+read-only until the schema reaches their expected revision (see
+``SchemaRevisionGate``). Runners started concurrently take turns on a
+PostgreSQL advisory lock, so only the first one applies anything.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+
+def main() -> int:
+    started = time.perf_counter()
+    command.upgrade(Config(str(ALEMBIC_INI)), "head")
+    print(f"schema at head in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,9 @@
 from .blacklisted_tokens import BlacklistedTokensRepository
 from .refresh_tokens import RefreshTokensRepository
+from .token_generations import TokenGenerationsRepository
 
-__all__ = ["BlacklistedTokensRepository", "RefreshTokensRepository"]
+__all__ = [
+    "BlacklistedTokensRepository",
+    "RefreshTokensRepository",
+    "TokenGenerationsRepository",
+]
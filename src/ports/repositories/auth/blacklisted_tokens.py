@@ -21,18 +21,23 @@ class BlacklistedTokensRepository(ABC):
         ...
 
     @abstractmethod
-    async def blacklist_all_for_user(
-        self, user_tg_id: int, reason: str, expires_at: datetime
-    ) -> None:
+    async def list_active(
+        self, blacklisted_since: datetime | None = None
+    ) -> list[BlacklistedToken]:
         """
-        Blacklist all active tokens for a user.
+        List blacklist entries that have not expired yet.
 
-        Note: This is a simplified approach. In production, you might want to
-        store active tokens and blacklist them individually.
+        When ``blacklisted_since`` is given, only entries blacklisted at or after
+        that moment are returned.
         """
         ...
 
     @abstractmethod
-    async def cleanup_expired(self) -> int:
-        """Remove expired tokens from blacklist. Returns count of removed tokens."""
+    async def cleanup_expired(self, limit: int | None = None) -> int:
+        """
+        Remove expired tokens from blacklist. Returns count of removed tokens.
+
+        When ``limit`` is given, at most that many entries are removed, so a
+        large backlog can be pruned in short transactions.
+        """
         ...
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.entities.auth import RefreshToken
@@ -23,3 +24,38 @@ class RefreshTokensRepository(ABC):
     async def revoke_for_user(self, user_tg_id: TelegramId) -> None:
         """Revoke all refresh tokens for user (e.g., on logout everywhere)."""
         raise NotImplementedError
+
+    @abstractmethod
+    async def replace_for_user(self, token: RefreshToken) -> RefreshToken:
+        """Revoke all refresh tokens of the token's user and store ``token``
+        atomically.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rotate(
+        self, token: RefreshToken, replacement: RefreshToken
+    ) -> RefreshToken | None:
+        """Revoke ``token`` as replaced by ``replacement`` and store
+        ``replacement`` atomically.
+
+        Returns ``None`` and stores nothing when ``token`` is no longer active
+        because a concurrent rotation or revocation got to it first.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def revoke_family(self, family_id: UUID) -> int:
+        """Revoke every active token of a family. Returns their number.
+
+        The revocation is committed on its own: it must hold even when the
+        surrounding transaction is rolled back because the caller failed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_stale(self, revoked_before: datetime, limit: int) -> int:
+        """Delete up to ``limit`` expired tokens and tokens revoked before
+        ``revoked_before``. Returns the number of deleted tokens.
+        """
+        raise NotImplementedError
@@ -0,0 +1,42 @@
+"""Port for per-user token generations repository."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.domain.entities.auth import TokenGeneration
+
+
+class TokenGenerationsRepository(ABC):
+    """Repository for the generation of the tokens issued to each user."""
+
+    @abstractmethod
+    async def get(self, user_tg_id: int) -> int:
+        """
+        Return the current token generation of a user.
+
+        Users who have never revoked their sessions are at generation 0. New
+        tokens must be issued with the value read here.
+        """
+        ...
+
+    @abstractmethod
+    async def advance(self, user_tg_id: int) -> TokenGeneration:
+        """Revoke every token issued to a user so far with a single write."""
+        ...
+
+    @abstractmethod
+    async def is_revoked(self, user_tg_id: int, generation: int) -> bool:
+        """Check if tokens of ``generation`` issued to a user are revoked."""
+        ...
+
+    @abstractmethod
+    async def list_revoked(
+        self, revoked_since: datetime | None = None
+    ) -> list[TokenGeneration]:
+        """
+        List the generations of users who have revoked their sessions.
+
+        When ``revoked_since`` is given, only generations advanced at or after
+        that moment are returned.
+        """
+        ...
@@ -20,6 +20,8 @@ from src.ports.repositories.healthity.activities import (
     MoodHistoryRepository,
 )
 from src.ports.repositories.healthity.transactions import TransactionsRepository
+from src.ports.repositories.healthity.purchases import PurchasesRepository
+from src.ports.repositories.healthity.statistics import UserStatisticsRepository
 
 __all__ = [
     "UserSettingsRepository",
@@ -36,4 +38,6 @@ __all__ = [
     "DailyProgressRepository",
     "MoodHistoryRepository",
     "TransactionsRepository",
+    "PurchasesRepository",
+    "UserStatisticsRepository",
 ]
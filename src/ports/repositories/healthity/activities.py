@@ -38,7 +38,21 @@ class DailyActivitiesRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def upsert(self, activity: DailyActivity) -> DailyActivity:
+    async def add_value(
+        self,
+        character_id: uuid.UUID,
+        activity_type_id: uuid.UUID,
+        date: datetime,
+        value: int,
+        goal: int | None = None,
+        notes: str | None = None,
+    ) -> DailyActivity | None:
+        """Add ``value`` to the activity of the day, creating it if needed.
+
+        ``goal`` replaces the stored goal when given; otherwise the stored goal
+        is kept and a new activity gets the activity type default. Returns
+        ``None`` when the activity type does not exist.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -62,7 +76,20 @@ class DailyProgressRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def upsert(self, progress: DailyProgress) -> DailyProgress:
+    async def add_experience(
+        self,
+        character_id: uuid.UUID,
+        date: datetime,
+        experience_gained: int,
+        level_at_end: int,
+        mood_average: str | None = None,
+        behavior_index: int | None = None,
+    ) -> DailyProgress:
+        """Add ``experience_gained`` to the progress of the day, creating it if needed.
+
+        ``mood_average`` and ``behavior_index`` replace the stored values only
+        when given.
+        """
         raise NotImplementedError
 
     @abstractmethod
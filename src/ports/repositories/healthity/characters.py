@@ -31,6 +31,18 @@ class CharactersRepository(ABC):
     async def update(self, character: Character) -> Character:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_experience(
+        self, character_id: uuid.UUID, amount: int, mood: str | None = None
+    ) -> Character | None:
+        """Add ``amount`` to the experience of a character and level it up.
+
+        The stored total is incremented in place, so concurrent calls add up.
+        ``mood`` replaces the current mood when given. Returns ``None`` when
+        the character does not exist.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def delete(self, character_id: uuid.UUID) -> None:
         raise NotImplementedError
@@ -83,6 +95,16 @@ class CharacterBackgroundsRepository(ABC):
     ) -> CharacterBackground:
         raise NotImplementedError
 
+    @abstractmethod
+    async def equip(
+        self, character_background_id: uuid.UUID
+    ) -> CharacterBackground | None:
+        """Make it the only active background of its character.
+
+        Returns None if the character background does not exist.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def remove(self, character_background_id: uuid.UUID) -> None:
         raise NotImplementedError
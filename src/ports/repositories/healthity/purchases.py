@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+import uuid
+
+from src.domain.entities.healthity.characters import (
+    CharacterBackground,
+    CharacterItem,
+)
+from src.domain.value_objects.telegram_id import TelegramId
+
+
+class PurchasesRepository(ABC):
+    @abstractmethod
+    async def purchase_item(
+        self, user_tg_id: TelegramId, character_id: uuid.UUID, item_id: uuid.UUID
+    ) -> CharacterItem | None:
+        """Debit the balance, grant the item and record the ledger row atomically.
+
+        Returns ``None`` when nothing was purchased because the item is missing or
+        unavailable, already owned (possibly by a concurrent purchase), or the
+        balance is insufficient.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def purchase_background(
+        self,
+        user_tg_id: TelegramId,
+        character_id: uuid.UUID,
+        background_id: uuid.UUID,
+    ) -> CharacterBackground | None:
+        """Debit the balance, grant the background and record the ledger row atomically.
+
+        Returns ``None`` when nothing was purchased because the background is
+        missing or unavailable, already owned (possibly by a concurrent
+        purchase), or the balance is insufficient.
+        """
+        raise NotImplementedError
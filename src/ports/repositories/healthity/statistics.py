@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.healthity.statistics import UserStatistics
+from src.domain.value_objects.telegram_id import TelegramId
+
+
+class UserStatisticsRepository(ABC):
+    @abstractmethod
+    async def get_for_user(self, user_tg_id: TelegramId) -> UserStatistics | None:
+        """Return the statistics of a user, or None if the user does not exist."""
+        raise NotImplementedError
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime
 import uuid
 
@@ -6,11 +8,43 @@ from src.domain.entities.healthity.transactions import Transaction
 from src.domain.value_objects.telegram_id import TelegramId
 
 
+@dataclass(frozen=True)
+class TransactionsPosition:
+    """Position of a transaction in the newest-first ledger order."""
+
+    timestamp: datetime
+    id: uuid.UUID
+
+
 class TransactionsRepository(ABC):
     @abstractmethod
     async def list_for_user(self, user_tg_id: TelegramId) -> list[Transaction]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_page_for_user(
+        self,
+        user_tg_id: TelegramId,
+        limit: int,
+        after: TransactionsPosition | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        transaction_type: str | None = None,
+    ) -> list[Transaction]:
+        """Return up to ``limit`` transactions, newest first, following ``after``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_for_user(
+        self,
+        user_tg_id: TelegramId,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        transaction_type: str | None = None,
+    ) -> AsyncIterator[Transaction]:
+        """Iterate over the whole ledger of a user, newest first, in batches."""
+        raise NotImplementedError
+
     @abstractmethod
     async def list_for_user_by_date_range(
         self, user_tg_id: TelegramId, start_date: datetime, end_date: datetime
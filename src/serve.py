@@ -0,0 +1,35 @@
+"""Production entry point: ``python -m src.serve``.
+
+Runs ``settings.workers`` uvicorn worker processes that share the listening
+socket. The processes share nothing else: each one builds its own application,
+warms it up (see ``src.drivers.rest.warmup``) and opens its own share of the
+database connection budget. Their in-process caches are invalidated only in
+the worker that made a change; the others converge within the cache TTLs
+(see the README).
+
+The supervisor restarts the workers one at a time on ``SIGHUP``, so a reload
+never leaves the socket without a worker, and adds or removes a worker on
+``SIGTTIN`` and ``SIGTTOU``. On ``SIGTERM`` and ``SIGINT`` every worker stops
+accepting connections and gets ``SERVER_GRACEFUL_TIMEOUT`` seconds to finish
+the requests in flight.
+"""
+
+import uvicorn
+
+from src.core.settings import settings
+
+
+def main() -> None:
+    uvicorn.run(
+        "src.app:app",
+        host=settings.server_host,
+        port=settings.server_port,
+        workers=settings.workers,
+        log_level=settings.log_level.lower(),
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import uuid
 from dataclasses import dataclass
 
+from src.core.catalog_snapshots import ACTIVITY_TYPES_CATALOG, CatalogSnapshots
 from src.domain.entities.healthity.activities import ActivityType
 from src.domain.exceptions import EntityNotFoundException
 from src.ports.repositories.healthity.activities import ActivityTypesRepository
@@ -15,8 +16,13 @@ class CreateActivityTypeInput:
 
 
 class CreateActivityTypeUseCase:
-    def __init__(self, activity_types_repository: ActivityTypesRepository) -> None:
+    def __init__(
+        self,
+        activity_types_repository: ActivityTypesRepository,
+        catalog_snapshots: CatalogSnapshots,
+    ) -> None:
         self._activity_types_repository = activity_types_repository
+        self._catalog_snapshots = catalog_snapshots
 
     async def execute(self, data: CreateActivityTypeInput) -> ActivityType:
         activity_type = ActivityType(
@@ -26,7 +32,9 @@ class CreateActivityTypeUseCase:
             color=data.color,
             daily_goal_default=data.daily_goal_default,
         )
-        return await self._activity_types_repository.add(activity_type)
+        created = await self._activity_types_repository.add(activity_type)
+        self._catalog_snapshots.invalidate(ACTIVITY_TYPES_CATALOG)
+        return created
 
 
 class GetActivityTypeUseCase:
@@ -71,8 +79,13 @@ class UpdateActivityTypeInput:
 
 
 class UpdateActivityTypeUseCase:
-    def __init__(self, activity_types_repository: ActivityTypesRepository) -> None:
+    def __init__(
+        self,
+        activity_types_repository: ActivityTypesRepository,
+        catalog_snapshots: CatalogSnapshots,
+    ) -> None:
         self._activity_types_repository = activity_types_repository
+        self._catalog_snapshots = catalog_snapshots
 
     async def execute(self, data: UpdateActivityTypeInput) -> ActivityType:
         activity_type = await self._activity_types_repository.get_by_id(
@@ -92,12 +105,19 @@ class UpdateActivityTypeUseCase:
         if data.daily_goal_default is not None:
             activity_type.daily_goal_default = data.daily_goal_default
 
-        return await self._activity_types_repository.update(activity_type)
+        updated = await self._activity_types_repository.update(activity_type)
+        self._catalog_snapshots.invalidate(ACTIVITY_TYPES_CATALOG)
+        return updated
 
 
 class DeleteActivityTypeUseCase:
-    def __init__(self, activity_types_repository: ActivityTypesRepository) -> None:
+    def __init__(
+        self,
+        activity_types_repository: ActivityTypesRepository,
+        catalog_snapshots: CatalogSnapshots,
+    ) -> None:
         self._activity_types_repository = activity_types_repository
+        self._catalog_snapshots = catalog_snapshots
 
     async def execute(self, activity_type_id: uuid.UUID) -> None:
         activity_type = await self._activity_types_repository.get_by_id(
@@ -106,3 +126,4 @@ class DeleteActivityTypeUseCase:
         if activity_type is None:
             raise EntityNotFoundException(f"ActivityType {activity_type_id} not found")
         await self._activity_types_repository.delete(activity_type_id)
+        self._catalog_snapshots.invalidate(ACTIVITY_TYPES_CATALOG)
@@ -7,6 +7,7 @@ from .authenticate import (
     RefreshInput,
     RefreshUseCase,
 )
+from .maintenance import PruneBlacklistedTokensUseCase, PruneRefreshTokensUseCase
 
 __all__ = [
     "AuthTokens",
@@ -14,6 +15,8 @@ __all__ = [
     "LoginUseCase",
     "LogoutInput",
     "LogoutUseCase",
+    "PruneBlacklistedTokensUseCase",
+    "PruneRefreshTokensUseCase",
     "RefreshInput",
     "RefreshUseCase",
 ]
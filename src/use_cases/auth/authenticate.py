@@ -5,8 +5,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
-from src.core.auth.jwt_service import JwtService, TokenType
-from src.core.security import PasswordHasher, TokenHasher
+from src.core.auth.jwt_service import GENERATION_CLAIM, JwtService, TokenType
+from src.core.security import AsyncPasswordHasher, TokenHasher
 from src.domain.entities.auth import RefreshToken
 from src.domain.entities.healthity.users import User
 from src.domain.exceptions import (
@@ -22,6 +22,7 @@ from src.domain.value_objects.telegram_id import TelegramId
 from src.ports.repositories.auth import (
     BlacklistedTokensRepository,
     RefreshTokensRepository,
+    TokenGenerationsRepository,
 )
 from src.ports.repositories.healthity.users import UsersRepository
 
@@ -92,41 +93,109 @@ class _RefreshTokenManager:
     def __init__(
         self,
         repository: RefreshTokensRepository,
+        token_generations: TokenGenerationsRepository,
         token_hasher: TokenHasher,
         jwt_service: JwtService,
     ) -> None:
         self._repository = repository
+        self._token_generations = token_generations
         self._token_hasher = token_hasher
         self._jwt_service = jwt_service
 
-    async def persist_new(
-        self,
-        *,
-        user: User,
-        refresh_token: str,
-        expires_at: datetime,
-        jti: UUID,
+    async def generation(self, user_tg_id: int) -> int:
+        # Read from the source of truth: a token issued with a stale generation
+        # would be revoked from the start.
+        return await self._token_generations.get(user_tg_id)
+
+    @staticmethod
+    def claims(user: User, generation: int) -> dict[str, object]:
+        return {"is_admin": user.is_admin, GENERATION_CLAIM: generation}
+
+    def _new_token(
+        self, user: User, tokens: AuthTokens, family_id: UUID | None = None
     ) -> RefreshToken:
-        entity = RefreshToken(
+        return RefreshToken(
             id=uuid4(),
             user_tg_id=user.telegram_id,
-            token_hash=self._token_hasher.hash_token(refresh_token),
-            jti=jti,
-            expires_at=expires_at,
+            token_hash=self._token_hasher.hash_token(tokens.refresh_token),
+            jti=tokens.refresh_token_jti,
+            expires_at=tokens.refresh_token_expires_at,
+            family_id=family_id or uuid4(),
         )
-        stored = await self._repository.create(entity)
+
+    async def start_family(self, user: User, tokens: AuthTokens) -> RefreshToken:
+        """Store the refresh token of a new login, revoking the previous ones."""
+        stored = await self._repository.replace_for_user(self._new_token(user, tokens))
         logger.debug(
             {
-                "action": "RefreshTokenManager.persist_new",
+                "action": "RefreshTokenManager.start_family",
                 "stage": "stored",
                 "data": {
                     "user_tg_id": user.telegram_id.value,
-                    "refresh_jti": str(jti),
+                    "refresh_jti": str(stored.jti),
+                    "family_id": str(stored.family_id),
                 },
             }
         )
         return stored
 
+    async def rotate(
+        self, token: RefreshToken, user: User, tokens: AuthTokens
+    ) -> RefreshToken:
+        """Replace ``token`` with the refresh token of ``tokens`` in its family."""
+        replacement = self._new_token(user, tokens, family_id=token.family_id)
+        stored = await self._repository.rotate(token, replacement)
+        if stored is None:
+            # Revoked since it was validated. Presented twice concurrently,
+            # only one rotation may win; a logout is not a reuse.
+            current = await self._repository.get_by_jti(token.jti)
+            await self._handle_revoked(current or token)
+            raise RefreshTokenRevokedException(str(token.jti))
+
+        logger.debug(
+            {
+                "action": "RefreshTokenManager.rotate",
+                "stage": "rotated",
+                "data": {
+                    "refresh_jti": str(token.jti),
+                    "replaced_by": str(stored.jti),
+                    "family_id": str(stored.family_id),
+                },
+            }
+        )
+        return stored
+
+    async def _handle_revoked(self, token: RefreshToken) -> None:
+        if token.replaced_by is None:
+            # Revoked by a logout or a newer login: the session is over.
+            logger.debug(
+                {
+                    "action": "RefreshTokenManager.validate",
+                    "stage": "revoked",
+                    "data": {"refresh_jti": str(token.jti)},
+                }
+            )
+        else:
+            await self._reuse_detected(token)
+
+    async def _reuse_detected(self, token: RefreshToken) -> None:
+        # A rotated token is only presented again when it leaked: whoever holds
+        # the current token of the family may be the attacker.
+        revoked = await self._repository.revoke_family(token.family_id)
+        logger.warning(
+            {
+                "action": "RefreshTokenManager.reuse_detected",
+                "stage": "family_revoked",
+                "data": {
+                    "user_tg_id": token.user_tg_id.value,
+                    "refresh_jti": str(token.jti),
+                    "family_id": str(token.family_id),
+                    "replaced_by": str(token.replaced_by),
+                    "revoked": revoked,
+                },
+            }
+        )
+
     async def revoke(self, token: RefreshToken) -> RefreshToken:
         token.revoke()
         updated = await self._repository.save(token)
@@ -150,7 +219,15 @@ class _RefreshTokenManager:
             }
         )
 
-    async def validate(self, *, refresh_token: str) -> tuple[RefreshToken, int]:
+    async def revoke_sessions(self, telegram_id: TelegramId) -> None:
+        """Revoke every refresh and access token issued to the user so far."""
+        await self._token_generations.advance(telegram_id.value)
+        await self.revoke_all(telegram_id)
+
+    async def validate(
+        self, *, refresh_token: str
+    ) -> tuple[RefreshToken, int, int]:
+        """Return the stored token, its user and their current token generation."""
         payload = self._jwt_service.decode(
             refresh_token, expected_type=TokenType.REFRESH
         )
@@ -167,9 +244,14 @@ class _RefreshTokenManager:
             raise RefreshTokenNotFoundException(str(payload.jti))
 
         if token.revoked:
+            await self._handle_revoked(token)
             raise RefreshTokenRevokedException(str(payload.jti))
 
-        if token.expires_at < datetime.now(timezone.utc).replace(tzinfo=None):
+        expires_at = token.expires_at
+        if expires_at.tzinfo is not None:
+            # Stored as timestamptz; entities built in memory are naive UTC.
+            expires_at = expires_at.astimezone(timezone.utc).replace(tzinfo=None)
+        if expires_at < datetime.now(timezone.utc).replace(tzinfo=None):
             raise TokenExpiredException()
 
         if not self._token_hasher.verify(refresh_token, token.token_hash):
@@ -183,7 +265,12 @@ class _RefreshTokenManager:
         if token.user_tg_id.value != user_id:
             raise InvalidTokenException("Token subject mismatch")
 
-        return token, user_id
+        # Covers tokens stored by a refresh that raced with revoke_sessions.
+        generation = await self.generation(user_id)
+        if payload.generation < generation:
+            raise RefreshTokenRevokedException(str(payload.jti))
+
+        return token, user_id, generation
 
 
 class LoginUseCase:
@@ -191,7 +278,8 @@ class LoginUseCase:
         self,
         users_repository: UsersRepository,
         refresh_tokens_repository: RefreshTokensRepository,
-        password_hasher: PasswordHasher,
+        token_generations_repository: TokenGenerationsRepository,
+        password_hasher: AsyncPasswordHasher,
         token_hasher: TokenHasher,
         jwt_service: JwtService,
     ) -> None:
@@ -200,6 +288,7 @@ class LoginUseCase:
         self._token_factory = _TokenFactory(jwt_service)
         self._token_manager = _RefreshTokenManager(
             refresh_tokens_repository,
+            token_generations_repository,
             token_hasher,
             jwt_service,
         )
@@ -211,26 +300,23 @@ class LoginUseCase:
         if user is None or not user.password_hash:
             raise InvalidCredentialsException()
 
-        if not self._password_hasher.verify_password(data.password, user.password_hash):
+        if not await self._password_hasher.verify_password(
+            data.password, user.password_hash
+        ):
             raise InvalidCredentialsException()
 
         if not user.is_active:
             raise InactiveUserException(data.user_tg_id)
 
-        await self._token_manager.revoke_all(user.telegram_id)
-
-        claims = {"is_admin": user.is_admin}
+        generation = await self._token_manager.generation(user.telegram_id.value)
         tokens = self._token_factory.create_tokens(
             subject=user.telegram_id.value,
-            claims=claims,
+            claims=self._token_manager.claims(user, generation),
         )
 
-        await self._token_manager.persist_new(
-            user=user,
-            refresh_token=tokens.refresh_token,
-            expires_at=tokens.refresh_token_expires_at,
-            jti=tokens.refresh_token_jti,
-        )
+        # One transaction: the user ends up with exactly one valid refresh
+        # token, the new one, or keeps the previous ones if anything fails.
+        await self._token_manager.start_family(user, tokens)
 
         logger.info(
             {
@@ -248,6 +334,7 @@ class RefreshUseCase:
         self,
         users_repository: UsersRepository,
         refresh_tokens_repository: RefreshTokensRepository,
+        token_generations_repository: TokenGenerationsRepository,
         token_hasher: TokenHasher,
         jwt_service: JwtService,
     ) -> None:
@@ -255,12 +342,13 @@ class RefreshUseCase:
         self._token_factory = _TokenFactory(jwt_service)
         self._token_manager = _RefreshTokenManager(
             refresh_tokens_repository,
+            token_generations_repository,
             token_hasher,
             jwt_service,
         )
 
     async def execute(self, data: RefreshInput) -> AuthTokens:
-        token, user_id = await self._token_manager.validate(
+        token, user_id, generation = await self._token_manager.validate(
             refresh_token=data.refresh_token
         )
 
@@ -270,20 +358,13 @@ class RefreshUseCase:
         if not user.is_active:
             raise InactiveUserException(user_id)
 
-        await self._token_manager.revoke(token)
-
-        claims = {"is_admin": user.is_admin}
         tokens = self._token_factory.create_tokens(
             subject=user.telegram_id.value,
-            claims=claims,
+            claims=self._token_manager.claims(user, generation),
         )
 
-        await self._token_manager.persist_new(
-            user=user,
-            refresh_token=tokens.refresh_token,
-            expires_at=tokens.refresh_token_expires_at,
-            jti=tokens.refresh_token_jti,
-        )
+        # Revokes the presented token and stores its replacement atomically.
+        await self._token_manager.rotate(token, user, tokens)
 
         return tokens
 
@@ -293,11 +374,13 @@ class LogoutUseCase:
         self,
         refresh_tokens_repository: RefreshTokensRepository,
         blacklisted_tokens_repository: "BlacklistedTokensRepository",
+        token_generations_repository: TokenGenerationsRepository,
         token_hasher: TokenHasher,
         jwt_service: JwtService,
     ) -> None:
         self._token_manager = _RefreshTokenManager(
             refresh_tokens_repository,
+            token_generations_repository,
             token_hasher,
             jwt_service,
         )
@@ -305,16 +388,17 @@ class LogoutUseCase:
         self._jwt_service = jwt_service
 
     async def execute(self, data: LogoutInput) -> None:
-        token, user_id = await self._token_manager.validate(
+        token, user_id, _ = await self._token_manager.validate(
             refresh_token=data.refresh_token
         )
 
         if data.revoke_all:
-            await self._token_manager.revoke_all(TelegramId(user_id))
+            # Takes the access tokens of every session, this one included.
+            await self._token_manager.revoke_sessions(TelegramId(user_id))
         else:
             await self._token_manager.revoke(token)
 
-        if data.access_token:
+        if data.access_token and not data.revoke_all:
             try:
                 payload = self._jwt_service.decode(
                     data.access_token, expected_type=TokenType.ACCESS
@@ -324,7 +408,7 @@ class LogoutUseCase:
                 blacklisted = BlacklistedToken(
                     jti=payload.jti,
                     user_tg_id=user_id,
-                    reason="logout" if not data.revoke_all else "revoke_all",
+                    reason="logout",
                     blacklisted_at=datetime.now(timezone.utc).replace(tzinfo=None),
                     expires_at=payload.expires_at,
                 )
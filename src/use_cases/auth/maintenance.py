@@ -0,0 +1,90 @@
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+
+from src.ports.repositories.auth import (
+    BlacklistedTokensRepository,
+    RefreshTokensRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _delete_in_batches(
+    delete_batch: Callable[[int], Awaitable[int]], batch_size: int, max_rows: int
+) -> int:
+    """Call ``delete_batch`` until it runs dry or ``max_rows`` rows are gone.
+
+    Every batch is its own short transaction, so pruning a large backlog never
+    holds locks on many rows at once; what is left over goes to the next pass.
+    """
+    removed = 0
+    while removed < max_rows:
+        deleted = await delete_batch(min(batch_size, max_rows - removed))
+        removed += deleted
+        if deleted < batch_size:
+            break
+    return removed
+
+
+class PruneBlacklistedTokensUseCase:
+    """Удаляет из чёрного списка записи об истёкших access-токенах."""
+
+    def __init__(
+        self,
+        blacklisted_tokens_repository: BlacklistedTokensRepository,
+        batch_size: int = 1000,
+        max_rows: int = 20000,
+    ) -> None:
+        self._repository = blacklisted_tokens_repository
+        self._batch_size = batch_size
+        self._max_rows = max_rows
+
+    async def execute(self) -> int:
+        removed = await _delete_in_batches(
+            self._repository.cleanup_expired, self._batch_size, self._max_rows
+        )
+        logger.info(
+            {
+                "action": "PruneBlacklistedTokensUseCase.execute",
+                "stage": "end",
+                "data": {"removed": removed},
+            }
+        )
+        return removed
+
+
+class PruneRefreshTokensUseCase:
+    """Удаляет истёкшие refresh-токены и отозванные раньше ``revoked_retention``."""
+
+    def __init__(
+        self,
+        refresh_tokens_repository: RefreshTokensRepository,
+        revoked_retention: timedelta,
+        batch_size: int = 1000,
+        max_rows: int = 20000,
+    ) -> None:
+        self._repository = refresh_tokens_repository
+        self._revoked_retention = revoked_retention
+        self._batch_size = batch_size
+        self._max_rows = max_rows
+
+    async def execute(self) -> int:
+        revoked_before = (
+            datetime.now(timezone.utc).replace(tzinfo=None) - self._revoked_retention
+        )
+
+        async def delete_batch(limit: int) -> int:
+            return await self._repository.delete_stale(revoked_before, limit)
+
+        removed = await _delete_in_batches(
+            delete_batch, self._batch_size, self._max_rows
+        )
+        logger.info(
+            {
+                "action": "PruneRefreshTokensUseCase.execute",
+                "stage": "end",
+                "data": {"removed": removed},
+            }
+        )
+        return removed
@@ -1,6 +1,7 @@
 import uuid
 from dataclasses import dataclass
 
+from src.core.catalog_snapshots import BACKGROUNDS_CATALOG, CatalogSnapshots
 from src.domain.entities.healthity.catalog import Background
 from src.domain.exceptions import EntityNotFoundException
 from src.ports.repositories.healthity.catalog import BackgroundsRepository
@@ -28,8 +29,13 @@ class UpdateBackgroundInput:
 
 
 class CreateBackgroundUseCase:
-    def __init__(self, backgrounds_repository: BackgroundsRepository) -> None:
+    def __init__(
+        self,
+        backgrounds_repository: BackgroundsRepository,
+        catalog_snapshots: CatalogSnapshots,
+    ) -> None:
         self._backgrounds_repository = backgrounds_repository
+        self._catalog_snapshots = catalog_snapshots
 
     async def execute(self, data: CreateBackgroundInput) -> Background:
         background = Background(
@@ -41,7 +47,9 @@ class CreateBackgroundUseCase:
             required_level=data.required_level,
             is_available=data.is_available,
         )
-        return await self._backgrounds_repository.add(background)
+        created = await self._backgrounds_repository.add(background)
+        self._catalog_snapshots.invalidate(BACKGROUNDS_CATALOG)
+        return created
 
 
 class GetBackgroundUseCase:
@@ -72,8 +80,13 @@ class ListAvailableBackgroundsUseCase:
 
 
 class UpdateBackgroundUseCase:
-    def __init__(self, backgrounds_repository: BackgroundsRepository) -> None:
+    def __init__(
+        self,
+        backgrounds_repository: BackgroundsRepository,
+        catalog_snapshots: CatalogSnapshots,
+    ) -> None:
         self._backgrounds_repository = backgrounds_repository
+        self._catalog_snapshots = catalog_snapshots
 
     async def execute(self, data: UpdateBackgroundInput) -> Background:
         background = await self._backgrounds_repository.get(data.background_id)
@@ -93,15 +106,23 @@ class UpdateBackgroundUseCase:
         if data.is_available is not None:
             background.is_available = data.is_available
 
-        return await self._backgrounds_repository.update(background)
+        updated = await self._backgrounds_repository.update(background)
+        self._catalog_snapshots.invalidate(BACKGROUNDS_CATALOG)
+        return updated
 
 
 class DeleteBackgroundUseCase:
-    def __init__(self, backgrounds_repository: BackgroundsRepository) -> None:
+    def __init__(
+        self,
+        backgrounds_repository: BackgroundsRepository,
+        catalog_snapshots: CatalogSnapshots,
+    ) -> None:
         self._backgrounds_repository = backgrounds_repository
+        self._catalog_snapshots = catalog_snapshots
 
     async def execute(self, background_id: uuid.UUID) -> None:
         background = await self._backgrounds_repository.get(background_id)
         if background is None:
             raise EntityNotFoundException(f"Background {background_id} not found")
         await self._backgrounds_repository.delete(background_id)
+        self._catalog_snapshots.invalidate(BACKGROUNDS_CATALOG)
@@ -1,14 +1,12 @@
 import uuid
 from dataclasses import dataclass
-from datetime import datetime, timezone
 
 from src.domain.entities.healthity.characters import CharacterBackground
-from src.domain.entities.healthity.transactions import Transaction
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.value_objects.telegram_id import TelegramId
 from src.ports.repositories.healthity.catalog import BackgroundsRepository
 from src.ports.repositories.healthity.characters import CharacterBackgroundsRepository
-from src.ports.repositories.healthity.transactions import TransactionsRepository
+from src.ports.repositories.healthity.purchases import PurchasesRepository
 from src.ports.repositories.healthity.users import UsersRepository
 
 
@@ -60,10 +58,17 @@ class PurchaseBackgroundUseCase:
             id=uuid.uuid4(),
             character_id=data.character_id,
             background_id=data.background_id,
-            is_active=data.is_active,
             is_favorite=data.is_favorite,
         )
-        return await self._character_backgrounds_repository.add(background)
+        background = await self._character_backgrounds_repository.add(background)
+        if data.is_active:
+            # Equipping also deactivates the background that was active so far.
+            equipped = await self._character_backgrounds_repository.equip(
+                background.id
+            )
+            if equipped is not None:
+                background = equipped
+        return background
 
 
 class EquipBackgroundUseCase:
@@ -73,29 +78,14 @@ class EquipBackgroundUseCase:
         self._character_backgrounds_repository = character_backgrounds_repository
 
     async def execute(self, character_background_id: uuid.UUID) -> CharacterBackground:
-        background = await self._character_backgrounds_repository.get_by_id(
+        background = await self._character_backgrounds_repository.equip(
             character_background_id
         )
         if background is None:
             raise EntityNotFoundException(
                 f"CharacterBackground {character_background_id} not found"
             )
-
-        existing_backgrounds = (
-            await self._character_backgrounds_repository.list_for_character(
-                background.character_id
-            )
-        )
-        for existing_background in existing_backgrounds:
-            if (
-                existing_background.id != background.id
-                and existing_background.is_active
-            ):
-                existing_background.deactivate()
-                await self._character_backgrounds_repository.update(existing_background)
-
-        background.activate()
-        return await self._character_backgrounds_repository.update(background)
+        return background
 
 
 class UnequipBackgroundUseCase:
@@ -142,23 +132,15 @@ class UpdateCharacterBackgroundUseCase:
 
         if data.is_active is not None:
             if data.is_active:
-
-                existing_backgrounds = (
-                    await self._character_backgrounds_repository.list_for_character(
-                        background.character_id
-                    )
+                background = await self._character_backgrounds_repository.equip(
+                    background.id
                 )
-                for existing_background in existing_backgrounds:
-                    if (
-                        existing_background.id != background.id
-                        and existing_background.is_active
-                    ):
-                        existing_background.deactivate()
-                        await self._character_backgrounds_repository.update(
-                            existing_background
-                        )
-
-                background.activate()
+                if background is None:
+                    raise EntityNotFoundException(
+                        f"CharacterBackground {data.character_background_id} not found"
+                    )
+                if data.is_favorite is None:
+                    return background
             else:
                 background.deactivate()
 
@@ -211,24 +193,40 @@ class PurchaseBackgroundWithBalanceInput:
 
 
 class PurchaseBackgroundWithBalanceUseCase:
-    """Покупка фона с проверкой баланса и списанием средств."""
+    """Покупка фона с проверкой баланса и списанием средств.
+
+    Списание, выдача фона и запись транзакции выполняются одной атомарной
+    операцией репозитория покупок; проверки ниже нужны только для того, чтобы
+    объяснить причину отказа.
+    """
 
     def __init__(
         self,
+        purchases_repository: PurchasesRepository,
         character_backgrounds_repository: CharacterBackgroundsRepository,
         backgrounds_repository: BackgroundsRepository,
         users_repository: UsersRepository,
-        transactions_repository: TransactionsRepository,
     ) -> None:
+        self._purchases_repository = purchases_repository
         self._character_backgrounds_repository = character_backgrounds_repository
         self._backgrounds_repository = backgrounds_repository
         self._users_repository = users_repository
-        self._transactions_repository = transactions_repository
 
     async def execute(
         self, data: PurchaseBackgroundWithBalanceInput
     ) -> CharacterBackground:
+        purchased = await self._purchases_repository.purchase_background(
+            TelegramId(data.user_tg_id), data.character_id, data.background_id
+        )
+        if purchased is not None:
+            return purchased
 
+        await self._raise_rejection_reason(data)
+        raise ValueError("Background purchase was rejected")
+
+    async def _raise_rejection_reason(
+        self, data: PurchaseBackgroundWithBalanceInput
+    ) -> None:
         background = await self._backgrounds_repository.get(data.background_id)
         if background is None:
             raise EntityNotFoundException(f"Background {data.background_id} not found")
@@ -244,35 +242,11 @@ class PurchaseBackgroundWithBalanceUseCase:
         if any(cb.background_id == data.background_id for cb in existing_backgrounds):
             raise ValueError("Background already purchased")
 
-        telegram_id = TelegramId(data.user_tg_id)
-        user = await self._users_repository.get_by_telegram_id(telegram_id)
+        user = await self._users_repository.get_by_telegram_id(
+            TelegramId(data.user_tg_id)
+        )
         if user is None:
             raise EntityNotFoundException(f"User {data.user_tg_id} not found")
 
-        user.withdraw(background.cost)
-        updated_user = await self._users_repository.update(user)
-
-        character_background = CharacterBackground(
-            id=uuid.uuid4(),
-            character_id=data.character_id,
-            background_id=data.background_id,
-            is_active=False,
-            is_favorite=False,
-            purchased_at=datetime.now(timezone.utc).replace(tzinfo=None),
-        )
-        created_background = await self._character_backgrounds_repository.add(
-            character_background
-        )
-
-        transaction = Transaction(
-            id=uuid.uuid4(),
-            user_tg_id=telegram_id,
-            amount=-background.cost,
-            balance_after=updated_user.balance,
-            type="purchase_background",
-            related_background_id=data.background_id,
-            description=f"Покупка фона: {background.name}",
-        )
-        await self._transactions_repository.add(transaction)
-
-        return created_background
+        if user.balance < background.cost:
+            raise ValueError("Insufficient balance")
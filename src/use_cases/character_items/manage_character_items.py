@@ -2,12 +2,11 @@ import uuid
 from dataclasses import dataclass
 
 from src.domain.entities.healthity.characters import CharacterItem
-from src.domain.entities.healthity.transactions import Transaction
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.value_objects.telegram_id import TelegramId
 from src.ports.repositories.healthity.catalog import ItemsRepository
 from src.ports.repositories.healthity.characters import CharacterItemsRepository
-from src.ports.repositories.healthity.transactions import TransactionsRepository
+from src.ports.repositories.healthity.purchases import PurchasesRepository
 from src.ports.repositories.healthity.users import UsersRepository
 
 
@@ -148,23 +147,36 @@ class PurchaseItemWithBalanceInput:
 
 
 class PurchaseItemWithBalanceUseCase:
-    """Покупка предмета с проверкой баланса и списанием средств."""
+    """Покупка предмета с проверкой баланса и списанием средств.
+
+    Списание, выдача предмета и запись транзакции выполняются одной атомарной
+    операцией репозитория покупок; проверки ниже нужны только для того, чтобы
+    объяснить причину отказа.
+    """
 
     def __init__(
         self,
+        purchases_repository: PurchasesRepository,
         character_items_repository: CharacterItemsRepository,
         items_repository: ItemsRepository,
         users_repository: UsersRepository,
-        transactions_repository: TransactionsRepository,
     ) -> None:
+        self._purchases_repository = purchases_repository
         self._character_items_repository = character_items_repository
         self._items_repository = items_repository
         self._users_repository = users_repository
-        self._transactions_repository = transactions_repository
 
     async def execute(self, data: PurchaseItemWithBalanceInput) -> CharacterItem:
+        purchased = await self._purchases_repository.purchase_item(
+            TelegramId(data.user_tg_id), data.character_id, data.item_id
+        )
+        if purchased is not None:
+            return purchased
 
-        # Получаем предмет
+        await self._raise_rejection_reason(data)
+        raise ValueError("Item purchase was rejected")
+
+    async def _raise_rejection_reason(self, data: PurchaseItemWithBalanceInput) -> None:
         item = await self._items_repository.get(data.item_id)
         if item is None:
             raise EntityNotFoundException(f"Item {data.item_id} not found")
@@ -172,48 +184,19 @@ class PurchaseItemWithBalanceUseCase:
         if not item.is_available:
             raise ValueError("Item is not available for purchase")
 
-        # Проверяем, что предмет еще не куплен
         existing_items = await self._character_items_repository.list_for_character(
             data.character_id
         )
         if any(ci.item_id == data.item_id for ci in existing_items):
             raise ValueError("Item already purchased")
 
-        # Получаем пользователя и проверяем баланс
         user = await self._users_repository.get_by_telegram_id(
             TelegramId(data.user_tg_id)
         )
         if user is None:
             raise EntityNotFoundException(f"User {data.user_tg_id} not found")
 
-        # Проверяем достаточность средств
         if user.balance < item.cost:
             raise ValueError(
                 f"Insufficient funds. Required: {item.cost}, Available: {user.balance}"
             )
-
-        # Списываем деньги с баланса пользователя
-        user.withdraw(item.cost)
-        updated_user = await self._users_repository.update(user)
-
-        character_item = CharacterItem(
-            id=uuid.uuid4(),
-            character_id=data.character_id,
-            item_id=data.item_id,
-            is_active=False,
-            is_favorite=False,
-        )
-        created_item = await self._character_items_repository.add(character_item)
-
-        transaction = Transaction(
-            id=uuid.uuid4(),
-            user_tg_id=TelegramId(data.user_tg_id),
-            amount=-item.cost,
-            balance_after=updated_user.balance,
-            type="purchase_item",
-            related_item_id=data.item_id,
-            description=f"Покупка предмета: {item.name}",
-        )
-        await self._transactions_repository.add(transaction)
-
-        return created_item
@@ -2,6 +2,7 @@ import logging
 import uuid
 from dataclasses import dataclass
 
+from src.core.character_identity import CharacterIdentityCache
 from src.domain.entities.healthity.characters import Character
 from src.domain.value_objects.telegram_id import TelegramId
 from src.ports.repositories.healthity.characters import CharactersRepository
@@ -20,8 +21,13 @@ class CreateCharacterInput:
 
 
 class CreateCharacterUseCase:
-    def __init__(self, characters_repository: CharactersRepository) -> None:
+    def __init__(
+        self,
+        characters_repository: CharactersRepository,
+        identity_cache: CharacterIdentityCache,
+    ) -> None:
         self._characters_repository = characters_repository
+        self._identity_cache = identity_cache
 
     async def execute(self, data: CreateCharacterInput) -> Character:
         logger.debug(f"Creating character for user {data.user_tg_id}")
@@ -37,4 +43,5 @@ class CreateCharacterUseCase:
         logger.debug(f"Character created: {character}")
         result = await self._characters_repository.add(character)
         logger.debug(f"Character added to repository: {result}")
+        self._identity_cache.invalidate(data.user_tg_id)
         return result
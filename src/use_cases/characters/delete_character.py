@@ -1,12 +1,18 @@
 import uuid
 
+from src.core.character_identity import CharacterIdentityCache
 from src.domain.exceptions import EntityNotFoundException
 from src.ports.repositories.healthity.characters import CharactersRepository
 
 
 class DeleteCharacterUseCase:
-    def __init__(self, characters_repository: CharactersRepository) -> None:
+    def __init__(
+        self,
+        characters_repository: CharactersRepository,
+        identity_cache: CharacterIdentityCache,
+    ) -> None:
         self._characters_repository = characters_repository
+        self._identity_cache = identity_cache
 
     async def execute(self, character_id: uuid.UUID) -> None:
 
@@ -15,3 +21,4 @@ class DeleteCharacterUseCase:
             raise EntityNotFoundException(f"Character {character_id} not found")
 
         await self._characters_repository.delete(character_id)
+        self._identity_cache.invalidate(character.user_tg_id.value)
@@ -1,5 +1,6 @@
 import uuid
 
+from src.core.character_identity import CharacterIdentityCache
 from src.domain.entities.healthity.characters import Character
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.value_objects.telegram_id import TelegramId
@@ -30,6 +31,33 @@ class GetCharacterByUserUseCase:
         return character
 
 
+class ResolveCharacterIdUseCase:
+    """Возвращает ID персонажа пользователя, по возможности из кэша."""
+
+    def __init__(
+        self,
+        characters_repository: CharactersRepository,
+        identity_cache: CharacterIdentityCache,
+    ) -> None:
+        self._characters_repository = characters_repository
+        self._identity_cache = identity_cache
+
+    async def execute(self, user_tg_id: int) -> uuid.UUID:
+        character_id = self._identity_cache.get(user_tg_id)
+        if character_id is not None:
+            return character_id
+
+        generation = self._identity_cache.generation()
+        character = await self._characters_repository.get_by_user(
+            TelegramId(user_tg_id)
+        )
+        if character is None:
+            raise EntityNotFoundException(f"Character for user {user_tg_id} not found")
+
+        self._identity_cache.add(user_tg_id, character.id, generation)
+        return character.id
+
+
 class ListCharactersUseCase:
     def __init__(self, characters_repository: CharactersRepository) -> None:
         self._characters_repository = characters_repository
@@ -29,13 +29,8 @@ class UpdateDailyActivityInput:
 
 
 class CreateDailyActivityUseCase:
-    def __init__(
-        self,
-        daily_activities_repository: DailyActivitiesRepository,
-        activity_types_repository: ActivityTypesRepository,
-    ) -> None:
+    def __init__(self, daily_activities_repository: DailyActivitiesRepository) -> None:
         self._daily_activities_repository = daily_activities_repository
-        self._activity_types_repository = activity_types_repository
 
     async def execute(self, data: CreateDailyActivityInput) -> DailyActivity:
 
@@ -45,50 +40,22 @@ class CreateDailyActivityUseCase:
 
         date_only = date.replace(hour=0, minute=0, second=0, microsecond=0)
 
-        existing_activity = (
-            await self._daily_activities_repository.get_by_character_activity_date(
-                data.character_id, data.activity_type_id, date_only
-            )
+        # Goal: the one provided by the user, else the one already stored for
+        # the day, else the activity type default. The value is added to the
+        # stored one in a single upsert, so concurrent submissions add up.
+        activity = await self._daily_activities_repository.add_value(
+            character_id=data.character_id,
+            activity_type_id=data.activity_type_id,
+            date=date_only,
+            value=data.value,
+            goal=data.goal,
+            notes=data.notes,
         )
-
-        # Determine goal value based on logic:
-        # 1. If user provided goal, use it
-        # 2. If existing activity has goal, keep it
-        # 3. Otherwise, use default from activity type
-        goal_value = data.goal
-        if goal_value is None:
-            if existing_activity:
-                goal_value = existing_activity.goal
-            else:
-                # Get default goal from activity type
-                activity_type = await self._activity_types_repository.get_by_id(
-                    data.activity_type_id
-                )
-                if activity_type is None:
-                    raise EntityNotFoundException(
-                        f"ActivityType {data.activity_type_id} not found"
-                    )
-                goal_value = activity_type.daily_goal_default
-
-        if existing_activity:
-
-            existing_activity.value += data.value
-            existing_activity.goal = goal_value
-            existing_activity.notes = data.notes
-            existing_activity.touch()
-            return await self._daily_activities_repository.update(existing_activity)
-        else:
-
-            activity = DailyActivity(
-                id=uuid.uuid4(),
-                character_id=data.character_id,
-                activity_type_id=data.activity_type_id,
-                date=date_only,
-                value=data.value,
-                goal=goal_value,
-                notes=data.notes,
+        if activity is None:
+            raise EntityNotFoundException(
+                f"ActivityType {data.activity_type_id} not found"
             )
-            return await self._daily_activities_repository.upsert(activity)
+        return activity
 
 
 class ListDailyActivitiesForDayUseCase:
@@ -47,15 +47,20 @@ class CreateDailyProgressUseCase:
 
         date_only = date.replace(hour=0, minute=0, second=0, microsecond=0)
 
-        character = await self._characters_repository.get_by_id(data.character_id)
+        if data.experience_gained < 0:
+            raise ValueError("Experience amount must be non-negative")
+
+        # Experience and level are incremented by a single UPDATE, so
+        # concurrent submissions add up. It locks the character row until the
+        # request commits, which also orders their upserts of the day's
+        # progress: level_at_end is always the level after this submission.
+        character = await self._characters_repository.add_experience(
+            data.character_id, data.experience_gained, mood=data.mood_average
+        )
         if character is None:
             raise EntityNotFoundException(f"Character {data.character_id} not found")
 
-        character.add_experience(data.experience_gained)
-
         if data.mood_average is not None:
-            character.set_mood(data.mood_average)
-
             mood_history = MoodHistory(
                 id=uuid.uuid4(),
                 character_id=character.id,
@@ -64,54 +69,15 @@ class CreateDailyProgressUseCase:
             )
             await self._mood_history_repository.add(mood_history)
 
-        await self._characters_repository.update(character)
-
-        existing_progress = await self._daily_progress_repository.get_by_character_date(
-            data.character_id, date_only
+        return await self._daily_progress_repository.add_experience(
+            character_id=data.character_id,
+            date=date_only,
+            experience_gained=data.experience_gained,
+            level_at_end=character.level,
+            mood_average=data.mood_average,
+            behavior_index=data.behavior_index,
         )
 
-        if existing_progress:
-
-            existing_progress.experience_gained += data.experience_gained
-            existing_progress.level_at_end = character.level
-
-            # Обновляем только не-None значения
-            if data.mood_average is not None:
-                existing_progress.mood_average = data.mood_average
-            if data.behavior_index is not None:
-                existing_progress.behavior_index = data.behavior_index
-
-            existing_progress.touch()
-
-            if (
-                data.mood_average is not None
-                and data.mood_average != existing_progress.mood_average
-            ):
-                character.set_mood(data.mood_average)
-
-                mood_history = MoodHistory(
-                    id=uuid.uuid4(),
-                    character_id=character.id,
-                    mood=data.mood_average,
-                    trigger="daily_progress_update",
-                )
-                await self._mood_history_repository.add(mood_history)
-                await self._characters_repository.update(character)
-
-            return await self._daily_progress_repository.update(existing_progress)
-        else:
-
-            progress = DailyProgress(
-                id=uuid.uuid4(),
-                character_id=data.character_id,
-                date=date_only,
-                experience_gained=data.experience_gained,
-                level_at_end=character.level,
-                mood_average=data.mood_average,
-                behavior_index=data.behavior_index,
-            )
-            return await self._daily_progress_repository.upsert(progress)
-
 
 class ListDailyProgressForCharacterUseCase:
     def __init__(self, daily_progress_repository: DailyProgressRepository) -> None:
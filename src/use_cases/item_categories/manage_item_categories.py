@@ -1,6 +1,7 @@
 import uuid
 from dataclasses import dataclass
 
+from src.core.catalog_snapshots import ITEM_CATEGORIES_CATALOG, CatalogSnapshots
 from src.domain.entities.healthity.catalog import ItemCategory
 from src.domain.exceptions import EntityNotFoundException
 from src.ports.repositories.healthity.catalog import ItemCategoriesRepository
@@ -37,20 +38,32 @@ class GetItemCategoryUseCase:
 
 
 class CreateItemCategoryUseCase:
-    def __init__(self, item_categories_repository: ItemCategoriesRepository) -> None:
+    def __init__(
+        self,
+        item_categories_repository: ItemCategoriesRepository,
+        catalog_snapshots: CatalogSnapshots,
+    ) -> None:
         self._item_categories_repository = item_categories_repository
+        self._catalog_snapshots = catalog_snapshots
 
     async def execute(self, data: CreateItemCategoryInput) -> ItemCategory:
         category = ItemCategory(
             id=uuid.uuid4(),
             name=data.name,
         )
-        return await self._item_categories_repository.add(category)
+        created = await self._item_categories_repository.add(category)
+        self._catalog_snapshots.invalidate(ITEM_CATEGORIES_CATALOG)
+        return created
 
 
 class UpdateItemCategoryUseCase:
-    def __init__(self, item_categories_repository: ItemCategoriesRepository) -> None:
+    def __init__(
+        self,
+        item_categories_repository: ItemCategoriesRepository,
+        catalog_snapshots: CatalogSnapshots,
+    ) -> None:
         self._item_categories_repository = item_categories_repository
+        self._catalog_snapshots = catalog_snapshots
 
     async def execute(self, data: UpdateItemCategoryInput) -> ItemCategory:
         category = await self._item_categories_repository.get_by_id(data.category_id)
@@ -59,15 +72,23 @@ class UpdateItemCategoryUseCase:
 
         category.name = data.name
         category.touch()
-        return await self._item_categories_repository.update(category)
+        updated = await self._item_categories_repository.update(category)
+        self._catalog_snapshots.invalidate(ITEM_CATEGORIES_CATALOG)
+        return updated
 
 
 class DeleteItemCategoryUseCase:
-    def __init__(self, item_categories_repository: ItemCategoriesRepository) -> None:
+    def __init__(
+        self,
+        item_categories_repository: ItemCategoriesRepository,
+        catalog_snapshots: CatalogSnapshots,
+    ) -> None:
         self._item_categories_repository = item_categories_repository
+        self._catalog_snapshots = catalog_snapshots
 
     async def execute(self, category_id: uuid.UUID) -> None:
         category = await self._item_categories_repository.get_by_id(category_id)
         if category is None:
             raise EntityNotFoundException(f"ItemCategory {category_id} not found")
         await self._item_categories_repository.delete(category_id)
+        self._catalog_snapshots.invalidate(ITEM_CATEGORIES_CATALOG)
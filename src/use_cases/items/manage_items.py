@@ -1,6 +1,7 @@
 import uuid
 from dataclasses import dataclass
 
+from src.core.catalog_snapshots import ITEMS_CATALOG, CatalogSnapshots
 from src.domain.entities.healthity.catalog import Item
 from src.domain.exceptions import EntityNotFoundException
 from src.ports.repositories.healthity.catalog import ItemsRepository
@@ -27,8 +28,11 @@ class UpdateItemInput:
 
 
 class CreateItemUseCase:
-    def __init__(self, items_repository: ItemsRepository) -> None:
+    def __init__(
+        self, items_repository: ItemsRepository, catalog_snapshots: CatalogSnapshots
+    ) -> None:
         self._items_repository = items_repository
+        self._catalog_snapshots = catalog_snapshots
 
     async def execute(self, data: CreateItemInput) -> Item:
         item = Item(
@@ -40,7 +44,9 @@ class CreateItemUseCase:
             required_level=data.required_level,
             is_available=data.is_available,
         )
-        return await self._items_repository.add(item)
+        created = await self._items_repository.add(item)
+        self._catalog_snapshots.invalidate(ITEMS_CATALOG)
+        return created
 
 
 class GetItemUseCase:
@@ -71,8 +77,11 @@ class ListAvailableItemsUseCase:
 
 
 class UpdateItemUseCase:
-    def __init__(self, items_repository: ItemsRepository) -> None:
+    def __init__(
+        self, items_repository: ItemsRepository, catalog_snapshots: CatalogSnapshots
+    ) -> None:
         self._items_repository = items_repository
+        self._catalog_snapshots = catalog_snapshots
 
     async def execute(self, data: UpdateItemInput) -> Item:
         item = await self._items_repository.get(data.item_id)
@@ -90,15 +99,21 @@ class UpdateItemUseCase:
         if data.is_available is not None:
             item.set_availability(data.is_available)
 
-        return await self._items_repository.update(item)
+        updated = await self._items_repository.update(item)
+        self._catalog_snapshots.invalidate(ITEMS_CATALOG)
+        return updated
 
 
 class DeleteItemUseCase:
-    def __init__(self, items_repository: ItemsRepository) -> None:
+    def __init__(
+        self, items_repository: ItemsRepository, catalog_snapshots: CatalogSnapshots
+    ) -> None:
         self._items_repository = items_repository
+        self._catalog_snapshots = catalog_snapshots
 
     async def execute(self, item_id: uuid.UUID) -> None:
         item = await self._items_repository.get(item_id)
         if item is None:
             raise EntityNotFoundException(f"Item {item_id} not found")
         await self._items_repository.delete(item_id)
+        self._catalog_snapshots.invalidate(ITEMS_CATALOG)
@@ -1,10 +1,17 @@
+import base64
+import binascii
 import uuid
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from datetime import datetime
 
 from src.domain.entities.healthity.transactions import Transaction
 from src.domain.exceptions import EntityNotFoundException
 from src.domain.value_objects.telegram_id import TelegramId
-from src.ports.repositories.healthity.transactions import TransactionsRepository
+from src.ports.repositories.healthity.transactions import (
+    TransactionsPosition,
+    TransactionsRepository,
+)
 from src.ports.repositories.healthity.users import UsersRepository
 
 
@@ -87,6 +94,87 @@ class ListTransactionsForUserUseCase:
         return await self._transactions_repository.list_for_user(TelegramId(user_tg_id))
 
 
+def encode_transactions_cursor(transaction: Transaction) -> str:
+    """Opaque cursor pointing right after ``transaction``."""
+    raw = f"{transaction.timestamp.isoformat()}|{transaction.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_transactions_cursor(cursor: str) -> TransactionsPosition:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, transaction_id = raw.split("|")
+        return TransactionsPosition(
+            timestamp=datetime.fromisoformat(timestamp),
+            id=uuid.UUID(transaction_id),
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+@dataclass
+class TransactionsFilter:
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+    transaction_type: str | None = None
+
+
+@dataclass
+class ListTransactionsPageInput:
+    user_tg_id: int
+    limit: int
+    cursor: str | None = None
+    filters: TransactionsFilter | None = None
+
+
+@dataclass
+class TransactionsPage:
+    items: list[Transaction]
+    next_cursor: str | None
+
+
+class ListTransactionsPageUseCase:
+    def __init__(self, transactions_repository: TransactionsRepository) -> None:
+        self._transactions_repository = transactions_repository
+
+    async def execute(self, data: ListTransactionsPageInput) -> TransactionsPage:
+        after = None
+        if data.cursor is not None:
+            after = decode_transactions_cursor(data.cursor)
+        filters = data.filters or TransactionsFilter()
+
+        # One extra row tells whether another page follows.
+        transactions = await self._transactions_repository.list_page_for_user(
+            TelegramId(data.user_tg_id),
+            limit=data.limit + 1,
+            after=after,
+            start_date=filters.start_date,
+            end_date=filters.end_date,
+            transaction_type=filters.transaction_type,
+        )
+        items = transactions[: data.limit]
+        next_cursor = None
+        if len(transactions) > data.limit:
+            next_cursor = encode_transactions_cursor(items[-1])
+        return TransactionsPage(items=items, next_cursor=next_cursor)
+
+
+class ExportTransactionsUseCase:
+    def __init__(self, transactions_repository: TransactionsRepository) -> None:
+        self._transactions_repository = transactions_repository
+
+    def execute(
+        self, user_tg_id: int, filters: TransactionsFilter | None = None
+    ) -> AsyncIterator[Transaction]:
+        filters = filters or TransactionsFilter()
+        return self._transactions_repository.stream_for_user(
+            TelegramId(user_tg_id),
+            start_date=filters.start_date,
+            end_date=filters.end_date,
+            transaction_type=filters.transaction_type,
+        )
+
+
 @dataclass
 class UpdateTransactionInput:
     transaction_id: uuid.UUID
@@ -2,7 +2,9 @@ import logging
 import uuid
 from dataclasses import dataclass
 
-from src.core.security import PasswordHasher
+from src.core.auth.admin_credentials import AdminCredentialsCache
+from src.core.character_identity import CharacterIdentityCache
+from src.core.security import AsyncPasswordHasher
 from src.core.settings import get_settings
 from src.domain.entities.healthity.transactions import Transaction
 from src.domain.entities.healthity.users import User
@@ -70,7 +72,7 @@ class GetUserUseCase:
 
 class CreateUserUseCase:
     def __init__(
-        self, users_repository: UsersRepository, password_hasher: PasswordHasher
+        self, users_repository: UsersRepository, password_hasher: AsyncPasswordHasher
     ) -> None:
         self._users_repository = users_repository
         self._password_hasher = password_hasher
@@ -112,7 +114,7 @@ class CreateUserUseCase:
             raise ValueError(f"User with telegram_id {data.telegram_id} already exists")
 
         password_hash = (
-            self._password_hasher.get_password_hash(data.password)
+            await self._password_hasher.get_password_hash(data.password)
             if data.password
             else None
         )
@@ -183,10 +185,14 @@ class ListUsersUseCase:
 
 class UpdateUserUseCase:
     def __init__(
-        self, users_repository: UsersRepository, password_hasher: PasswordHasher
+        self,
+        users_repository: UsersRepository,
+        password_hasher: AsyncPasswordHasher,
+        admin_credentials_cache: AdminCredentialsCache,
     ) -> None:
         self._users_repository = users_repository
         self._password_hasher = password_hasher
+        self._admin_credentials_cache = admin_credentials_cache
 
     async def execute(self, data: UpdateUserInput) -> User:
         telegram_id = TelegramId(data.telegram_id)
@@ -196,7 +202,9 @@ class UpdateUserUseCase:
             raise UserNotFoundException(data.telegram_id)
 
         if data.password is not None:
-            password_hash = self._password_hasher.get_password_hash(data.password)
+            password_hash = await self._password_hasher.get_password_hash(
+                data.password
+            )
             user.update_password(password_hash)
         if data.is_active is not None:
             if data.is_active:
@@ -209,18 +217,31 @@ class UpdateUserUseCase:
             user.balance = data.balance
             user.touch()
 
-        return await self._users_repository.update(user)
+        updated_user = await self._users_repository.update(user)
+        if data.password is not None or data.is_active is not None:
+            self._admin_credentials_cache.invalidate(data.telegram_id)
+        return updated_user
 
 
 class DeleteUserUseCase:
-    def __init__(self, users_repository: UsersRepository) -> None:
+    def __init__(
+        self,
+        users_repository: UsersRepository,
+        admin_credentials_cache: AdminCredentialsCache,
+        character_identity_cache: CharacterIdentityCache,
+    ) -> None:
         self._users_repository = users_repository
+        self._admin_credentials_cache = admin_credentials_cache
+        self._character_identity_cache = character_identity_cache
 
     async def execute(self, telegram_id: int) -> None:
         user = await self._users_repository.get_by_telegram_id(TelegramId(telegram_id))
         if user is None:
             raise UserNotFoundException(telegram_id)
         await self._users_repository.delete(TelegramId(telegram_id))
+        self._admin_credentials_cache.invalidate(telegram_id)
+        # The character of the user is deleted with it.
+        self._character_identity_cache.invalidate(telegram_id)
 
 
 @dataclass
@@ -352,10 +373,12 @@ class ChangePasswordUseCase:
     def __init__(
         self,
         users_repository: UsersRepository,
-        password_hasher: PasswordHasher,
+        password_hasher: AsyncPasswordHasher,
+        admin_credentials_cache: AdminCredentialsCache,
     ) -> None:
         self._users_repository = users_repository
         self._password_hasher = password_hasher
+        self._admin_credentials_cache = admin_credentials_cache
         self.logger = logging.getLogger(self.__class__.__name__)
 
     async def execute(self, data: ChangePasswordInput) -> User:
@@ -376,14 +399,17 @@ class ChangePasswordUseCase:
         if user.password_hash is None:
             raise ValueError("User does not have a password set")
 
-        if not self._password_hasher.verify_password(
+        if not await self._password_hasher.verify_password(
             data.old_password, user.password_hash
         ):
             raise ValueError("Old password is incorrect")
 
-        new_password_hash = self._password_hasher.get_password_hash(data.new_password)
+        new_password_hash = await self._password_hasher.get_password_hash(
+            data.new_password
+        )
         user.update_password(new_password_hash)
         updated_user = await self._users_repository.update(user)
+        self._admin_credentials_cache.invalidate(data.telegram_id)
 
         self.logger.info(
             {
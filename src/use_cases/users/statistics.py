@@ -0,0 +1,31 @@
+import logging
+
+from src.domain.entities.healthity.statistics import UserStatistics
+from src.domain.exceptions import UserNotFoundException
+from src.domain.value_objects.telegram_id import TelegramId
+from src.ports.repositories.healthity.statistics import UserStatisticsRepository
+
+
+class GetUserStatisticsUseCase:
+    """Статистика пользователя, собранная одним агрегирующим запросом."""
+
+    def __init__(self, statistics_repository: UserStatisticsRepository) -> None:
+        self._statistics_repository = statistics_repository
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def execute(self, telegram_id: int) -> UserStatistics:
+        statistics = await self._statistics_repository.get_for_user(
+            TelegramId(telegram_id)
+        )
+
+        if statistics is None:
+            self.logger.warning(
+                {
+                    "action": "GetUserStatisticsUseCase.execute",
+                    "stage": "not_found",
+                    "data": {"telegram_id": telegram_id},
+                }
+            )
+            raise UserNotFoundException(telegram_id)
+
+        return statistics
@@ -0,0 +1,49 @@
+"""Fixtures shared by the tests.
+
+Tests that need PostgreSQL use the ``database`` fixture, which connects
+through the ``DB_*`` settings and skips the test when the server cannot be
+reached.
+"""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.exc import DBAPIError
+
+from src.adapters.database.models.user import UserModel
+from src.adapters.database.session import SessionManager, session_manager
+from src.adapters.database.uow import SQLAlchemyUnitOfWork
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[SessionManager]:
+    try:
+        await session_manager.ping()
+    except (OSError, DBAPIError) as exc:
+        await session_manager.close()
+        pytest.skip(f"PostgreSQL is not reachable: {exc}")
+    try:
+        yield session_manager
+    finally:
+        # Pooled connections belong to the event loop of this test.
+        await session_manager.close()
+
+
+@pytest.fixture
+async def created_users(database: SessionManager) -> AsyncIterator[list[int]]:
+    """Telegram ids of users the test creates, deleted once it finished.
+
+    Deleting a user cascades to its character, purchases and ledger.
+    """
+    tg_ids: list[int] = []
+    yield tg_ids
+    async with SQLAlchemyUnitOfWork(database.async_session) as uow:
+        await uow.session.execute(
+            delete(UserModel).where(UserModel.tg_id.in_(tg_ids))
+        )
@@ -0,0 +1,124 @@
+import uuid
+from collections.abc import Callable
+
+import pytest
+
+from src.core.auth.admin_credentials import AdminCredentialsCache
+from src.core.cache import GenerationCache
+from src.core.catalog_snapshots import ITEMS_CATALOG, CatalogSnapshots
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Transaction:
+    """Collects ``after_commit`` callbacks and runs them on ``commit``."""
+
+    def __init__(self) -> None:
+        self.callbacks: list[Callable[[], None]] = []
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self.callbacks.append(callback)
+
+    def commit(self) -> None:
+        for callback in self.callbacks:
+            callback()
+        self.callbacks.clear()
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+def test_value_expires_after_the_ttl(clock: Clock) -> None:
+    cache: GenerationCache[int, str] = GenerationCache(10.0, 8, clock=clock)
+    cache.add(1, "one", cache.generation())
+
+    clock.now += 9.9
+    assert cache.get(1) == "one"
+    clock.now += 0.1
+    assert cache.get(1) is None
+
+
+def test_load_racing_an_invalidation_is_not_kept(clock: Clock) -> None:
+    cache: GenerationCache[int, str] = GenerationCache(10.0, 8, clock=clock)
+    generation = cache.generation()
+
+    cache.invalidate(1)
+    cache.add(1, "stale", generation)
+    cache.add(2, "unrelated", generation)
+
+    assert cache.get(1) is None
+    assert cache.get(2) == "unrelated"
+
+
+def test_load_between_a_change_and_its_commit_is_dropped(clock: Clock) -> None:
+    transaction = Transaction()
+    cache: GenerationCache[int, str] = GenerationCache(
+        10.0, 8, after_commit=transaction.after_commit, clock=clock
+    )
+    cache.add(1, "old", cache.generation())
+
+    cache.invalidate(1)
+    assert cache.get(1) is None
+    # Reads the row as it was before the change, which is not committed yet.
+    cache.add(1, "old", cache.generation())
+    transaction.commit()
+
+    assert cache.get(1) is None
+    cache.add(1, "new", cache.generation())
+    assert cache.get(1) == "new"
+
+
+def test_invalidations_are_bounded_and_never_let_a_stale_load_in(
+    clock: Clock,
+) -> None:
+    cache: GenerationCache[int, str] = GenerationCache(10.0, 4, clock=clock)
+    generation = cache.generation()
+
+    for key in range(1000):
+        cache.invalidate(key)
+
+    assert len(cache._invalidated) == 4
+    # The invalidation of key 0 was forgotten, but the load started before it.
+    cache.add(0, "stale", generation)
+    assert cache.get(0) is None
+    cache.add(0, "fresh", cache.generation())
+    assert cache.get(0) == "fresh"
+
+
+def test_admin_credentials_match_only_the_verified_password(clock: Clock) -> None:
+    cache = AdminCredentialsCache(clock=clock)
+    digest = cache.digest("1001", "secret")
+    cache.add(1001, digest, cache.generation())
+
+    assert cache.verified(1001, cache.digest("1001", "secret"))
+    assert not cache.verified(1001, cache.digest("1001", "other"))
+    assert not cache.verified(1002, digest)
+
+    cache.invalidate(1001)
+    assert not cache.verified(1001, digest)
+
+
+@pytest.mark.anyio
+async def test_catalog_invalidated_while_building_is_rebuilt(clock: Clock) -> None:
+    snapshots = CatalogSnapshots(ttl_seconds=10.0, clock=clock)
+
+    async def build_and_invalidate() -> bytes:
+        snapshots.invalidate(ITEMS_CATALOG)
+        return uuid.uuid4().bytes
+
+    first = await snapshots.get(ITEMS_CATALOG, build_and_invalidate)
+
+    async def build() -> bytes:
+        return b"[]"
+
+    second = await snapshots.get(ITEMS_CATALOG, build)
+    assert second.body == b"[]" != first.body
+    assert await snapshots.get(ITEMS_CATALOG, build) is second
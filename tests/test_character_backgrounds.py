@@ -0,0 +1,102 @@
+import asyncio
+import random
+import uuid
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import delete, func, insert, select
+
+from src.adapters.database.models.catalog import BackgroundModel
+from src.adapters.database.models.characters import (
+    CharacterBackgroundModel,
+    CharacterModel,
+)
+from src.adapters.database.models.user import UserModel
+from src.adapters.database.session import SessionManager
+from src.adapters.database.uow import SQLAlchemyUnitOfWork
+from src.adapters.repositories.healthity.characters import (
+    SQLAlchemyCharacterBackgroundsRepository,
+)
+
+pytestmark = pytest.mark.anyio
+
+USER_TG_ID = 9_000_000_003_001
+BACKGROUNDS = 10
+WORKERS = 16
+ROUNDS = 50
+
+
+@pytest.fixture
+async def owned_backgrounds(
+    database: SessionManager,
+) -> AsyncIterator[tuple[uuid.UUID, list[uuid.UUID]]]:
+    """A committed character and the ids of the backgrounds it owns."""
+    character_id = uuid.uuid4()
+    background_ids = [uuid.uuid4() for _ in range(BACKGROUNDS)]
+    owned_ids = [uuid.uuid4() for _ in range(BACKGROUNDS)]
+    async with SQLAlchemyUnitOfWork(database.async_session) as uow:
+        session = uow.session
+        await session.execute(insert(UserModel).values(tg_id=USER_TG_ID))
+        await session.execute(
+            insert(CharacterModel).values(id=character_id, user_tg_id=USER_TG_ID)
+        )
+        await session.execute(
+            insert(BackgroundModel),
+            [
+                {"id": background_id, "name": f"Test {background_id}", "cost": 0}
+                for background_id in background_ids
+            ],
+        )
+        await session.execute(
+            insert(CharacterBackgroundModel),
+            [
+                {
+                    "id": owned_id,
+                    "character_id": character_id,
+                    "background_id": background_id,
+                }
+                for owned_id, background_id in zip(owned_ids, background_ids)
+            ],
+        )
+    yield character_id, owned_ids
+    async with SQLAlchemyUnitOfWork(database.async_session) as uow:
+        # Deleting the user cascades to its character and owned backgrounds.
+        await uow.session.execute(
+            delete(UserModel).where(UserModel.tg_id == USER_TG_ID)
+        )
+        await uow.session.execute(
+            delete(BackgroundModel).where(BackgroundModel.id.in_(background_ids))
+        )
+
+
+async def test_parallel_equips_leave_one_active_background(
+    database: SessionManager,
+    owned_backgrounds: tuple[uuid.UUID, list[uuid.UUID]],
+) -> None:
+    character_id, owned_ids = owned_backgrounds
+    repository = SQLAlchemyCharacterBackgroundsRepository(
+        uow_factory=lambda: SQLAlchemyUnitOfWork(database.async_session)
+    )
+
+    async def equip_randomly() -> None:
+        for _ in range(ROUNDS):
+            await repository.equip(random.choice(owned_ids))
+
+    # Every equip runs in its own transaction. All of them finish before the
+    # check, so a deadlock or any other rejection by the database is reported
+    # instead of cutting the run short.
+    results = await asyncio.gather(
+        *(equip_randomly() for _ in range(WORKERS)), return_exceptions=True
+    )
+    assert [result for result in results if result is not None] == []
+
+    async with SQLAlchemyUnitOfWork(database.async_session) as uow:
+        active = await uow.session.scalar(
+            select(func.count())
+            .select_from(CharacterBackgroundModel)
+            .where(
+                CharacterBackgroundModel.character_id == character_id,
+                CharacterBackgroundModel.is_active,
+            )
+        )
+    assert active == 1
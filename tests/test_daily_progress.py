@@ -0,0 +1,154 @@
+import asyncio
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import datetime
+
+import pytest
+from sqlalchemy import delete, insert, select
+
+from src.adapters.database.models.activities import (
+    ActivityTypeModel,
+    DailyActivityModel,
+    DailyProgressModel,
+)
+from src.adapters.database.models.characters import CharacterModel
+from src.adapters.database.models.user import UserModel
+from src.adapters.database.session import SessionManager
+from src.adapters.database.uow import (
+    AbstractUnitOfWork,
+    RequestUnitOfWork,
+    SQLAlchemyUnitOfWork,
+    create_unit_of_work,
+)
+from src.adapters.repositories.healthity.activities import (
+    SQLAlchemyDailyActivitiesRepository,
+    SQLAlchemyDailyProgressRepository,
+    SQLAlchemyMoodHistoryRepository,
+)
+from src.adapters.repositories.healthity.characters import (
+    SQLAlchemyCharactersRepository,
+)
+from src.use_cases.daily_activities.manage_daily_activities import (
+    CreateDailyActivityInput,
+    CreateDailyActivityUseCase,
+)
+from src.use_cases.daily_progress.manage_daily_progress import (
+    CreateDailyProgressInput,
+    CreateDailyProgressUseCase,
+)
+
+pytestmark = pytest.mark.anyio
+
+USER_TG_ID = 9_000_000_002_001
+DAY = datetime(2020, 1, 1, 12, 0)
+WORKERS = 20
+EXPERIENCE = 10
+VALUE = 100
+
+
+@pytest.fixture
+async def character(
+    database: SessionManager,
+) -> AsyncIterator[tuple[uuid.UUID, uuid.UUID]]:
+    """A committed character and activity type, as concurrent requests see them."""
+    character_id = uuid.uuid4()
+    activity_type_id = uuid.uuid4()
+    async with SQLAlchemyUnitOfWork(database.async_session) as uow:
+        session = uow.session
+        await session.execute(insert(UserModel).values(tg_id=USER_TG_ID))
+        await session.execute(
+            insert(CharacterModel).values(id=character_id, user_tg_id=USER_TG_ID)
+        )
+        await session.execute(
+            insert(ActivityTypeModel).values(
+                id=activity_type_id,
+                name=f"Test {activity_type_id.hex[:8]}",
+                unit="steps",
+                daily_goal_default=10_000,
+            )
+        )
+    yield character_id, activity_type_id
+    async with SQLAlchemyUnitOfWork(database.async_session) as uow:
+        # Deleting the user cascades to its character and its daily
+        # activities, which reference the activity type.
+        await uow.session.execute(
+            delete(UserModel).where(UserModel.tg_id == USER_TG_ID)
+        )
+        await uow.session.execute(
+            delete(ActivityTypeModel).where(ActivityTypeModel.id == activity_type_id)
+        )
+
+
+async def test_concurrent_submissions_lose_no_increment(
+    database: SessionManager, character: tuple[uuid.UUID, uuid.UUID]
+) -> None:
+    character_id, activity_type_id = character
+
+    def uow_factory() -> AbstractUnitOfWork:
+        return create_unit_of_work(database.async_session)
+
+    progress = CreateDailyProgressUseCase(
+        daily_progress_repository=SQLAlchemyDailyProgressRepository(uow_factory),
+        characters_repository=SQLAlchemyCharactersRepository(uow_factory),
+        mood_history_repository=SQLAlchemyMoodHistoryRepository(uow_factory),
+    )
+    activities = CreateDailyActivityUseCase(
+        SQLAlchemyDailyActivitiesRepository(uow_factory)
+    )
+
+    async def submit(execute: Callable[[], Awaitable[object]]) -> None:
+        async with RequestUnitOfWork(database.async_session) as uow:
+            await execute()
+            await uow.commit()
+
+    # Every submission runs in its own request transaction, as the API runs
+    # them, and all of them finish before the checks.
+    results = await asyncio.gather(
+        *(
+            submit(
+                lambda: progress.execute(
+                    CreateDailyProgressInput(
+                        character_id=character_id,
+                        date=DAY,
+                        experience_gained=EXPERIENCE,
+                    )
+                )
+            )
+            for _ in range(WORKERS)
+        ),
+        *(
+            submit(
+                lambda: activities.execute(
+                    CreateDailyActivityInput(
+                        character_id=character_id,
+                        activity_type_id=activity_type_id,
+                        date=DAY,
+                        value=VALUE,
+                    )
+                )
+            )
+            for _ in range(WORKERS)
+        ),
+        return_exceptions=True,
+    )
+    assert [result for result in results if result is not None] == []
+
+    async with SQLAlchemyUnitOfWork(database.async_session) as uow:
+        session = uow.session
+        stored = await session.get(CharacterModel, character_id)
+        experience_gained = await session.scalar(
+            select(DailyProgressModel.experience_gained).where(
+                DailyProgressModel.character_id == character_id
+            )
+        )
+        value = await session.scalar(
+            select(DailyActivityModel.value).where(
+                DailyActivityModel.character_id == character_id
+            )
+        )
+
+    assert stored is not None
+    assert stored.total_experience == WORKERS * EXPERIENCE
+    assert stored.level == max(1, WORKERS * EXPERIENCE // 100)
+    assert experience_gained == WORKERS * EXPERIENCE
+    assert value == WORKERS * VALUE
@@ -0,0 +1,60 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+
+from src.core.event_loop_watchdog import EventLoopWatchdog
+
+pytestmark = pytest.mark.anyio
+
+BLOCK_SECONDS = 0.5
+
+
+def hash_password_inline(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def blocking_handler() -> None:
+    # Blocks the loop in a synchronous call, the way an inline bcrypt or a
+    # long serialization loop does.
+    hash_password_inline(BLOCK_SECONDS)
+
+
+async def awaiting_handler() -> None:
+    await asyncio.sleep(BLOCK_SECONDS)
+
+
+@pytest.fixture
+async def watchdog() -> AsyncIterator[EventLoopWatchdog]:
+    watchdog = EventLoopWatchdog()
+    watchdog.start()
+    # The sampling task has to be waiting for its wake-up before the loop is
+    # blocked, as it is on a running server.
+    await asyncio.sleep(0.2)
+    yield watchdog
+    watchdog.stop()
+
+
+async def test_blocking_handler_is_reported_with_its_stack(
+    watchdog: EventLoopWatchdog,
+) -> None:
+    await blocking_handler()
+    # Lets the sampling task record the late wake-up.
+    await asyncio.sleep(0.3)
+
+    blocked = watchdog.blocked()
+    assert len(blocked) == 1
+    assert blocked[0].blocked_seconds >= BLOCK_SECONDS * 0.5
+    assert "hash_password_inline" in "".join(blocked[0].stack)
+    assert watchdog.stats.slow_callbacks == 1
+
+
+async def test_awaiting_handler_is_not_reported(
+    watchdog: EventLoopWatchdog,
+) -> None:
+    await awaiting_handler()
+    await asyncio.sleep(0.3)
+
+    assert watchdog.blocked() == []
+    assert watchdog.stats.slow_callbacks == 0
@@ -0,0 +1,73 @@
+import logging
+
+import pytest
+
+from src.adapters.database.session import SessionManager
+from src.adapters.database.uow import SQLAlchemyUnitOfWork
+from src.adapters.repositories.healthity.users import SQLAlchemyUsersRepository
+from src.container import ApplicationContainer
+from src.core.security import PasswordHasher
+from src.domain.entities.healthity.users import User
+from src.domain.exceptions import RefreshTokenRevokedException
+from src.domain.value_objects.telegram_id import TelegramId
+from src.use_cases.auth.authenticate import LoginInput, LogoutInput, RefreshInput
+
+pytestmark = pytest.mark.anyio
+
+USER_TG_ID = 9_000_000_005_001
+PASSWORD = "test-password"
+
+
+@pytest.fixture
+async def container(
+    database: SessionManager, created_users: list[int]
+) -> ApplicationContainer:
+    created_users.append(USER_TG_ID)
+    users = SQLAlchemyUsersRepository(
+        lambda: SQLAlchemyUnitOfWork(database.async_session)
+    )
+    await users.create(
+        User(
+            telegram_id=TelegramId(USER_TG_ID),
+            password_hash=PasswordHasher().get_password_hash(PASSWORD),
+        )
+    )
+    return ApplicationContainer()
+
+
+def reuse_warnings(caplog: pytest.LogCaptureFixture) -> list[logging.LogRecord]:
+    return [
+        record
+        for record in caplog.records
+        if record.levelno == logging.WARNING and "reuse_detected" in str(record.msg)
+    ]
+
+
+async def test_only_a_rotated_token_is_reported_as_reused(
+    container: ApplicationContainer, caplog: pytest.LogCaptureFixture
+) -> None:
+    login = container.login_use_case()
+    refresh = container.refresh_use_case()
+    logout = container.logout_use_case()
+    credentials = LoginInput(user_tg_id=USER_TG_ID, password=PASSWORD)
+
+    logged_out = await login.execute(credentials)
+    await logout.execute(LogoutInput(refresh_token=logged_out.refresh_token))
+    # A new login revokes the tokens of the previous one.
+    replaced = await login.execute(credentials)
+    current = await login.execute(credentials)
+
+    for revoked in (logged_out, replaced):
+        with pytest.raises(RefreshTokenRevokedException):
+            await refresh.execute(RefreshInput(refresh_token=revoked.refresh_token))
+    assert reuse_warnings(caplog) == []
+
+    rotated = await refresh.execute(RefreshInput(refresh_token=current.refresh_token))
+    with pytest.raises(RefreshTokenRevokedException):
+        await refresh.execute(RefreshInput(refresh_token=current.refresh_token))
+    assert len(reuse_warnings(caplog)) == 1
+
+    # The whole family was revoked, the token the reuse raced with included.
+    with pytest.raises(RefreshTokenRevokedException):
+        await refresh.execute(RefreshInput(refresh_token=rotated.refresh_token))
+    assert len(reuse_warnings(caplog)) == 1
@@ -0,0 +1,49 @@
+"""Equivalence of ``json_response`` with FastAPI's own serialization.
+
+For every endpoint that answers through ``json_response``, the body FastAPI
+produces from the endpoint's response models is the golden output: the route
+answering through ``json_response`` must return the same bytes.
+"""
+
+import random
+
+import pytest
+from fastapi import FastAPI
+
+from benchmarks.response_serialization import ENDPOINTS, Endpoint, build_app, get
+from src.drivers.rest.responses import json_response
+
+pytestmark = pytest.mark.anyio
+
+ROWS = 50
+
+
+@pytest.fixture(scope="module")
+def apps() -> tuple[FastAPI, FastAPI]:
+    rng = random.Random(0)
+    contents = {endpoint.path: endpoint.sample(rng, ROWS) for endpoint in ENDPOINTS}
+    default_app = build_app(
+        contents, lambda endpoint, content: endpoint.models(content)
+    )
+    fast_app = build_app(
+        contents, lambda endpoint, content: json_response(content, endpoint.schema)
+    )
+    return default_app, fast_app
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS, ids=lambda endpoint: endpoint.path)
+async def test_body_matches_the_default_serialization(
+    apps: tuple[FastAPI, FastAPI], endpoint: Endpoint
+) -> None:
+    default_app, fast_app = apps
+
+    status, content_type, body = await get(fast_app, endpoint.path)
+
+    assert (status, content_type, body) == await get(default_app, endpoint.path)
+    assert body.startswith((b"[{", b'{"'))
+
+
+def test_openapi_schema_is_unchanged(apps: tuple[FastAPI, FastAPI]) -> None:
+    default_app, fast_app = apps
+
+    assert fast_app.openapi() == default_app.openapi()
@@ -0,0 +1,135 @@
+"""Races between issuing and revoking access tokens.
+
+Two ``TokenGenerationIndex`` instances stand for two worker processes that
+share one in-memory store, with a manual clock driving their refreshes. The
+store yields to the event loop at random points, so issuing and revoking
+interleave differently for every seed.
+"""
+
+import asyncio
+import random
+from datetime import timedelta
+
+import pytest
+
+from benchmarks.in_memory import InMemoryStore, InMemoryTokenGenerationsRepository
+from src.adapters.repositories.auth import TokenGenerationIndex
+from src.domain.entities.auth import TokenGeneration
+
+pytestmark = pytest.mark.anyio
+
+USER_TG_ID = 1001
+REFRESH_INTERVAL = 5.0
+RETENTION = timedelta(minutes=15)
+
+
+class ManualClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class YieldingTokenGenerationsRepository(InMemoryTokenGenerationsRepository):
+    """Yields to the loop around every call, as a network round trip does."""
+
+    def __init__(self, store: InMemoryStore, rng: random.Random) -> None:
+        super().__init__(store)
+        self._rng = rng
+
+    async def _yield(self) -> None:
+        for _ in range(self._rng.randrange(4)):
+            await asyncio.sleep(0)
+
+    async def get(self, user_tg_id: int) -> int:
+        await self._yield()
+        generation = await super().get(user_tg_id)
+        await self._yield()
+        return generation
+
+    async def advance(self, user_tg_id: int) -> TokenGeneration:
+        await self._yield()
+        generation = await super().advance(user_tg_id)
+        await self._yield()
+        return generation
+
+
+class Process:
+    def __init__(
+        self, store: InMemoryStore, clock: ManualClock, rng: random.Random
+    ) -> None:
+        self.index = TokenGenerationIndex(
+            YieldingTokenGenerationsRepository(store, rng),
+            retention=RETENTION,
+            refresh_interval=REFRESH_INTERVAL,
+            clock=clock,
+        )
+
+    async def issue(self) -> int:
+        """Generation a token issued now would carry."""
+        return await self.index.get(USER_TG_ID)
+
+    async def accepts(self, generation: int) -> bool:
+        return not await self.index.is_revoked(USER_TG_ID, generation)
+
+
+async def test_revocation_reaches_other_processes_within_a_refresh() -> None:
+    store, clock = InMemoryStore(), ManualClock()
+    rng = random.Random(0)
+    revoking, other = Process(store, clock, rng), Process(store, clock, rng)
+    token = await revoking.issue()
+    await other.accepts(token)
+
+    await revoking.index.advance(USER_TG_ID)
+
+    assert not await revoking.accepts(token)
+    clock.now += REFRESH_INTERVAL
+    assert not await other.accepts(token)
+
+
+@pytest.mark.parametrize("seed", range(100))
+async def test_token_issued_during_a_revocation(seed: int) -> None:
+    store, clock = InMemoryStore(), ManualClock()
+    rng = random.Random(seed)
+    revoking, issuing = Process(store, clock, rng), Process(store, clock, rng)
+    # Both indexes are loaded and fresh before the race starts.
+    await revoking.accepts(0)
+    await issuing.accepts(0)
+
+    racing, _ = await asyncio.gather(
+        issuing.issue(), revoking.index.advance(USER_TG_ID)
+    )
+    after = await issuing.issue()
+    clock.now += REFRESH_INTERVAL
+    current = await issuing.index.get(USER_TG_ID)
+
+    for process in (revoking, issuing):
+        # A token racing the revocation is accepted only when it carries the
+        # new generation; a lagging index never issues revoked tokens.
+        assert await process.accepts(racing) == (racing == current)
+        assert await process.accepts(after)
+
+
+async def test_concurrent_revocations_each_advance_once() -> None:
+    store, clock = InMemoryStore(), ManualClock()
+    processes = [Process(store, clock, random.Random(seed)) for seed in range(8)]
+
+    await asyncio.gather(
+        *(process.index.advance(USER_TG_ID) for process in processes)
+    )
+
+    assert await processes[0].issue() == len(processes)
+
+
+async def test_checks_on_a_fresh_index_skip_the_store() -> None:
+    store, clock = InMemoryStore(), ManualClock()
+    process = Process(store, clock, random.Random(0))
+    await process.index.advance(USER_TG_ID)
+    await process.accepts(1)
+
+    round_trips = store.round_trips
+    for _ in range(1000):
+        assert await process.accepts(1)
+
+    assert store.round_trips == round_trips
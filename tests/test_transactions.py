@@ -0,0 +1,74 @@
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import insert
+
+from benchmarks.tma_auth import build_init_data
+from src.adapters.database.models.transactions import TransactionModel
+from src.adapters.database.models.user import UserModel
+from src.adapters.database.session import SessionManager
+from src.adapters.database.uow import SQLAlchemyUnitOfWork
+from src.app import create_app
+from src.core.settings import settings
+from src.drivers.rest.transactions import NEXT_CURSOR_HEADER
+
+pytestmark = pytest.mark.anyio
+
+USER_TG_ID = 9_000_000_004_001
+
+
+async def test_my_transactions_are_paged_through_the_cursor_header(
+    database: SessionManager, created_users: list[int]
+) -> None:
+    created_users.append(USER_TG_ID)
+    start = datetime(2025, 1, 1)
+    # Three transactions share a timestamp, so pages must break ties by id.
+    timestamps = [start, start, start, start + timedelta(1), start + timedelta(2)]
+    async with SQLAlchemyUnitOfWork(database.async_session) as uow:
+        await uow.session.execute(insert(UserModel).values(tg_id=USER_TG_ID))
+        await uow.session.execute(
+            insert(TransactionModel),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "user_tg_id": USER_TG_ID,
+                    "amount": 1,
+                    "balance_after": index + 1,
+                    "type": "deposit",
+                    "timestamp": timestamp,
+                }
+                for index, timestamp in enumerate(timestamps)
+            ],
+        )
+
+    init_data = build_init_data(settings.telegram_bot_token, USER_TG_ID)
+    pages = []
+    params: dict[str, str | int] = {"limit": 2}
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=create_app()), base_url="http://test"
+    ) as client:
+        while True:
+            response = await client.get(
+                "/api/v1/transactions/me",
+                params=params,
+                headers={"Authorization": f"tma {init_data}"},
+            )
+            assert response.status_code == 200
+            pages.append([row["balance_after"] for row in response.json()])
+            if NEXT_CURSOR_HEADER not in response.headers:
+                break
+            params["cursor"] = response.headers[NEXT_CURSOR_HEADER]
+
+        rejected = await client.get(
+            "/api/v1/transactions/me",
+            params={"cursor": "not-a-cursor"},
+            headers={"Authorization": f"tma {init_data}"},
+        )
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    balances = [balance for page in pages for balance in page]
+    assert sorted(balances) == [1, 2, 3, 4, 5]
+    assert balances[:2] == [5, 4]
+    assert rejected.status_code == 400
@@ -0,0 +1,79 @@
+import uuid
+
+import httpx
+import pytest
+
+from benchmarks.tma_auth import build_init_data
+from src.adapters.database.session import SessionManager
+from src.adapters.database.uow import (
+    AbstractUnitOfWork,
+    RequestUnitOfWork,
+    SQLAlchemyUnitOfWork,
+    create_unit_of_work,
+)
+from src.adapters.repositories.healthity.characters import (
+    SQLAlchemyCharactersRepository,
+)
+from src.adapters.repositories.healthity.users import SQLAlchemyUsersRepository
+from src.app import create_app
+from src.core.settings import settings
+from src.domain.entities.healthity.characters import Character
+from src.domain.entities.healthity.users import User
+from src.domain.exceptions import EntityNotFoundException
+from src.domain.value_objects.telegram_id import TelegramId
+
+pytestmark = pytest.mark.anyio
+
+USER_TG_ID = 9_000_000_001_001
+MISSING_TG_ID = 9_000_000_001_002
+
+
+async def test_rejected_insert_keeps_the_request_transaction(
+    database: SessionManager, created_users: list[int]
+) -> None:
+    created_users.append(USER_TG_ID)
+
+    def uow_factory() -> AbstractUnitOfWork:
+        return create_unit_of_work(database.async_session)
+
+    users = SQLAlchemyUsersRepository(uow_factory)
+    characters = SQLAlchemyCharactersRepository(uow_factory)
+
+    async with RequestUnitOfWork(database.async_session) as uow:
+        await users.create(User(telegram_id=TelegramId(USER_TG_ID)))
+        with pytest.raises(EntityNotFoundException):
+            await characters.add(
+                Character(id=uuid.uuid4(), user_tg_id=TelegramId(MISSING_TG_ID))
+            )
+        character = await characters.add(
+            Character(id=uuid.uuid4(), user_tg_id=TelegramId(USER_TG_ID))
+        )
+        await uow.commit()
+
+    assert uow.checkouts == 1
+    assert await users.get_by_telegram_id(TelegramId(USER_TG_ID)) is not None
+    assert await characters.get_by_id(character.id) is not None
+
+
+async def test_me_request_checks_out_one_connection(
+    database: SessionManager, created_users: list[int]
+) -> None:
+    created_users.append(USER_TG_ID)
+    users = SQLAlchemyUsersRepository(
+        lambda: SQLAlchemyUnitOfWork(database.async_session)
+    )
+    await users.create(User(telegram_id=TelegramId(USER_TG_ID)))
+
+    app = create_app()
+    init_data = build_init_data(settings.telegram_bot_token, USER_TG_ID)
+    checkouts = database.pool_statistics().checkouts
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(
+            "/api/v1/users/me", headers={"Authorization": f"tma {init_data}"}
+        )
+
+    assert response.status_code == 200
+    assert response.json()["telegram_id"] == USER_TG_ID
+    assert database.pool_statistics().checkouts - checkouts == 1